@@ -39,6 +39,7 @@ import six as _six
 import sys as _sys
 
 from tensorflow.python.tools import module_util as _module_util
+from tensorflow.python.util import lazy_loader as _lazy_loader
 from tensorflow.python.util.lazy_loader import LazyLoader as _LazyLoader
 
 # Make sure code inside the TensorFlow codebase can use tf2.enabled() at import.
@@ -84,13 +85,22 @@ if _module_dir:
   _current_module.__path__ = [_module_dir] + _current_module.__path__
 setattr(_current_module, "estimator", estimator)
 
-try:
-  from .python.keras.api._v2 import keras
-  _current_module.__path__ = (
-      [_module_util.get_parent_dir(keras)] + _current_module.__path__)
+_keras_module = "tensorflow.python.keras.api._v2.keras"
+if _lazy_loader.lazy_api_loading_enabled():
+  # Only import keras when it is used; see lazy_loader for details.
+  keras = _LazyLoader("keras", globals(), _keras_module)
+  _module_dir = _module_util.get_parent_dir_for_name(_keras_module)
+  if _module_dir:
+    _current_module.__path__ = [_module_dir] + _current_module.__path__
   setattr(_current_module, "keras", keras)
-except ImportError:
-  pass
+else:
+  try:
+    from .python.keras.api._v2 import keras
+    _current_module.__path__ = (
+        [_module_util.get_parent_dir(keras)] + _current_module.__path__)
+    setattr(_current_module, "keras", keras)
+  except ImportError:
+    pass
 
 # Explicitly import lazy-loaded modules to support autocompletion.
 # pylint: disable=g-import-not-at-top
@@ -147,7 +157,11 @@ if _running_from_pip_package():
       _ll.load_library(_plugin_dir)
 
 # Add module aliases
-if hasattr(_current_module, 'keras'):
+if _lazy_loader.lazy_api_loading_enabled():
+  for _alias in ("losses", "metrics", "optimizers", "initializers"):
+    setattr(_current_module, _alias,
+            _LazyLoader(_alias, globals(), _keras_module + "." + _alias))
+elif hasattr(_current_module, 'keras'):
   losses = keras.losses
   metrics = keras.metrics
   optimizers = keras.optimizers
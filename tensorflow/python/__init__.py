@@ -38,79 +38,153 @@ import traceback
 # pylint: disable=wildcard-import,g-bad-import-order,g-import-not-at-top
 
 from tensorflow.python.eager import context
+from tensorflow.python.util import lazy_loader as _lazy_loader
 
 # pylint: enable=wildcard-import
 
-# Bring in subpackages.
-from tensorflow.python import data
-from tensorflow.python import distribute
-from tensorflow.python import keras
-from tensorflow.python.feature_column import feature_column_lib as feature_column
-from tensorflow.python.layers import layers
-from tensorflow.python.module import module
-from tensorflow.python.ops import bincount_ops
-from tensorflow.python.ops import bitwise_ops as bitwise
-from tensorflow.python.ops import gradient_checker_v2
-from tensorflow.python.ops import image_ops as image
-from tensorflow.python.ops import manip_ops as manip
-from tensorflow.python.ops import metrics
-from tensorflow.python.ops import nn
-from tensorflow.python.ops import ragged
-from tensorflow.python.ops import sets
-from tensorflow.python.ops import stateful_random_ops
-from tensorflow.python.ops.distributions import distributions
-from tensorflow.python.ops.linalg import linalg
-from tensorflow.python.ops.linalg.sparse import sparse
-from tensorflow.python.ops.losses import losses
-from tensorflow.python.ops.ragged import ragged_ops as _ragged_ops
-from tensorflow.python.ops.signal import signal
-from tensorflow.python.profiler import profiler
-from tensorflow.python.profiler import profiler_client
-from tensorflow.python.profiler import profiler_v2
-from tensorflow.python.profiler import trace
-from tensorflow.python.saved_model import saved_model
-from tensorflow.python.summary import summary
-from tensorflow.python.tpu import api
-from tensorflow.python.user_ops import user_ops
-from tensorflow.python.util import compat
-
-# Update the RaggedTensor package docs w/ a list of ops that support dispatch.
-ragged.__doc__ += _ragged_ops.ragged_dispatch.ragged_op_list()
-
-# Import to make sure the ops are registered.
-from tensorflow.python.ops import gen_audio_ops
-from tensorflow.python.ops import gen_boosted_trees_ops
-from tensorflow.python.ops import gen_cudnn_rnn_ops
-from tensorflow.python.ops import gen_rnn_ops
-from tensorflow.python.ops import gen_sendrecv_ops
-from tensorflow.python.ops import gen_tpu_ops
-
-# Import the names from python/training.py as train.Name.
-from tensorflow.python.training import training as train
-from tensorflow.python.training import quantize_training as _quantize_training
-
-# Sub-package for performing i/o directly instead of via ops in a graph.
-from tensorflow.python.lib.io import python_io
-
-# Make some application and test modules available.
-from tensorflow.python.platform import app
-from tensorflow.python.platform import flags
-from tensorflow.python.platform import gfile
-from tensorflow.python.platform import tf_logging as logging
-from tensorflow.python.platform import resource_loader
-from tensorflow.python.platform import sysconfig
-from tensorflow.python.platform import test
-
-from tensorflow.python.compat import v2_compat
-
-from tensorflow.python.util.all_util import make_all
-from tensorflow.python.util.tf_export import tf_export
-
-# Eager execution
-from tensorflow.python.eager.context import executing_eagerly
-from tensorflow.python.eager.remote import connect_to_remote_host
-from tensorflow.python.eager.def_function import function
-from tensorflow.python.framework.ops import enable_eager_execution
+# Modules bound in this package, as (name, module name), in import order. With
+# lazy API loading (see `lazy_loader.lazy_api_loading_enabled`) they are bound
+# to `LazyLoader`s instead, which import them on first attribute access.
+_MODULES = [
+    # Bring in subpackages.
+    ('data', 'tensorflow.python.data'),
+    ('distribute', 'tensorflow.python.distribute'),
+    ('keras', 'tensorflow.python.keras'),
+    ('feature_column', 'tensorflow.python.feature_column.feature_column_lib'),
+    ('layers', 'tensorflow.python.layers.layers'),
+    ('module', 'tensorflow.python.module.module'),
+    ('bincount_ops', 'tensorflow.python.ops.bincount_ops'),
+    ('bitwise', 'tensorflow.python.ops.bitwise_ops'),
+    ('gradient_checker_v2', 'tensorflow.python.ops.gradient_checker_v2'),
+    ('image', 'tensorflow.python.ops.image_ops'),
+    ('manip', 'tensorflow.python.ops.manip_ops'),
+    ('metrics', 'tensorflow.python.ops.metrics'),
+    ('nn', 'tensorflow.python.ops.nn'),
+    ('ragged', 'tensorflow.python.ops.ragged'),
+    ('sets', 'tensorflow.python.ops.sets'),
+    ('stateful_random_ops', 'tensorflow.python.ops.stateful_random_ops'),
+    ('distributions', 'tensorflow.python.ops.distributions.distributions'),
+    ('linalg', 'tensorflow.python.ops.linalg.linalg'),
+    ('sparse', 'tensorflow.python.ops.linalg.sparse.sparse'),
+    ('losses', 'tensorflow.python.ops.losses.losses'),
+    ('_ragged_ops', 'tensorflow.python.ops.ragged.ragged_ops'),
+    ('signal', 'tensorflow.python.ops.signal.signal'),
+    ('profiler', 'tensorflow.python.profiler.profiler'),
+    ('profiler_client', 'tensorflow.python.profiler.profiler_client'),
+    ('profiler_v2', 'tensorflow.python.profiler.profiler_v2'),
+    ('trace', 'tensorflow.python.profiler.trace'),
+    ('saved_model', 'tensorflow.python.saved_model.saved_model'),
+    ('summary', 'tensorflow.python.summary.summary'),
+    ('api', 'tensorflow.python.tpu.api'),
+    ('user_ops', 'tensorflow.python.user_ops.user_ops'),
+    ('compat', 'tensorflow.python.util.compat'),
+
+    # Import to make sure the ops are registered.
+    ('gen_audio_ops', 'tensorflow.python.ops.gen_audio_ops'),
+    ('gen_boosted_trees_ops', 'tensorflow.python.ops.gen_boosted_trees_ops'),
+    ('gen_cudnn_rnn_ops', 'tensorflow.python.ops.gen_cudnn_rnn_ops'),
+    ('gen_rnn_ops', 'tensorflow.python.ops.gen_rnn_ops'),
+    ('gen_sendrecv_ops', 'tensorflow.python.ops.gen_sendrecv_ops'),
+    ('gen_tpu_ops', 'tensorflow.python.ops.gen_tpu_ops'),
+
+    # Import the names from python/training.py as train.Name.
+    ('train', 'tensorflow.python.training.training'),
+    ('_quantize_training', 'tensorflow.python.training.quantize_training'),
+
+    # Sub-package for performing i/o directly instead of via ops in a graph.
+    ('python_io', 'tensorflow.python.lib.io.python_io'),
+
+    # Make some application and test modules available.
+    ('app', 'tensorflow.python.platform.app'),
+    ('flags', 'tensorflow.python.platform.flags'),
+    ('gfile', 'tensorflow.python.platform.gfile'),
+    ('logging', 'tensorflow.python.platform.tf_logging'),
+    ('resource_loader', 'tensorflow.python.platform.resource_loader'),
+    ('sysconfig', 'tensorflow.python.platform.sysconfig'),
+    ('test', 'tensorflow.python.platform.test'),
+
+    ('v2_compat', 'tensorflow.python.compat.v2_compat'),
+
+    # Necessary for the symbols in this module to be taken into account by
+    # the namespace management system (API decorators).
+    ('rnn', 'tensorflow.python.ops.rnn'),
+    ('rnn_cell', 'tensorflow.python.ops.rnn_cell'),
+
+    # TensorFlow Debugger (tfdbg).
+    ('check_numerics_callback',
+     'tensorflow.python.debug.lib.check_numerics_callback'),
+    ('dumping_callback', 'tensorflow.python.debug.lib.dumping_callback'),
+    ('gen_debug_ops', 'tensorflow.python.ops.gen_debug_ops'),
+
+    # XLA JIT compiler APIs.
+    ('jit', 'tensorflow.python.compiler.xla.jit'),
+    ('xla', 'tensorflow.python.compiler.xla.xla'),
+
+    # MLIR APIs.
+    ('mlir', 'tensorflow.python.compiler.mlir.mlir'),
+]
+
+# Other names bound in this package, as (name, module name). With lazy API
+# loading they are imported on first access, by the module `__getattr__`.
+_SYMBOLS = [
+    ('make_all', 'tensorflow.python.util.all_util'),
+    ('tf_export', 'tensorflow.python.util.tf_export'),
+
+    # Eager execution
+    ('executing_eagerly', 'tensorflow.python.eager.context'),
+    ('connect_to_remote_host', 'tensorflow.python.eager.remote'),
+    ('function', 'tensorflow.python.eager.def_function'),
+    ('enable_eager_execution', 'tensorflow.python.framework.ops'),
+
+    # DLPack
+    ('from_dlpack', 'tensorflow.python.dlpack.dlpack'),
+    ('to_dlpack', 'tensorflow.python.dlpack.dlpack'),
+]
+
+
+def _update_ragged_doc(ragged_module):
+  # Update the RaggedTensor package docs w/ a list of ops that support dispatch.
+  ragged_dispatch = importlib.import_module(
+      'tensorflow.python.ops.ragged.ragged_dispatch')
+  ragged_module.__doc__ += ragged_dispatch.ragged_op_list()
+
+
+def _add_rnn_to_nn(nn_module):
+  # Required due to `rnn` and `rnn_cell` not being imported in `nn` directly
+  # (due to a circular dependency issue: rnn depends on layers).
+  rnn_module = importlib.import_module('tensorflow.python.ops.rnn')
+  nn_module.dynamic_rnn = rnn_module.dynamic_rnn
+  nn_module.static_rnn = rnn_module.static_rnn
+  nn_module.raw_rnn = rnn_module.raw_rnn
+  nn_module.bidirectional_dynamic_rnn = rnn_module.bidirectional_dynamic_rnn
+  nn_module.static_state_saving_rnn = rnn_module.static_state_saving_rnn
+  nn_module.rnn_cell = importlib.import_module('tensorflow.python.ops.rnn_cell')
+
+
+_LAZY_API_LOADING = _lazy_loader.lazy_api_loading_enabled()
+
+if _LAZY_API_LOADING:
+  _ON_LOAD = {'ragged': _update_ragged_doc, 'nn': _add_rnn_to_nn}
+  for _name, _module_name in _MODULES:
+    globals()[_name] = _lazy_loader.LazyLoader(
+        _name, globals(), _module_name, on_load=_ON_LOAD.get(_name))
+  _SYMBOL_MODULES = dict(_SYMBOLS)
+
+  def __getattr__(name):
+    if name not in _SYMBOL_MODULES:
+      raise AttributeError(
+          "module '%s' has no attribute '%s'" % (__name__, name))
+    value = getattr(importlib.import_module(_SYMBOL_MODULES[name]), name)
+    globals()[name] = value
+    return value
+else:
+  for _name, _module_name in _MODULES:
+    globals()[_name] = importlib.import_module(_module_name)
+  for _name, _module_name in _SYMBOLS:
+    globals()[_name] = getattr(importlib.import_module(_module_name), _name)
+  _update_ragged_doc(ragged)  # pylint: disable=undefined-variable
+  _add_rnn_to_nn(nn)  # pylint: disable=undefined-variable
+del _name, _module_name
 
 # Check whether TF2_BEHAVIOR is turned on.
 from tensorflow.python.eager import monitoring as _monitoring
@@ -119,36 +193,6 @@ _tf2_gauge = _monitoring.BoolGauge(
     '/tensorflow/api/tf2_enable', 'Environment variable TF2_BEHAVIOR is set".')
 _tf2_gauge.get_cell().set(_tf2.enabled())
 
-# Necessary for the symbols in this module to be taken into account by
-# the namespace management system (API decorators).
-from tensorflow.python.ops import rnn
-from tensorflow.python.ops import rnn_cell
-
-# TensorFlow Debugger (tfdbg).
-from tensorflow.python.debug.lib import check_numerics_callback
-from tensorflow.python.debug.lib import dumping_callback
-from tensorflow.python.ops import gen_debug_ops
-
-# DLPack
-from tensorflow.python.dlpack.dlpack import from_dlpack
-from tensorflow.python.dlpack.dlpack import to_dlpack
-
-# XLA JIT compiler APIs.
-from tensorflow.python.compiler.xla import jit
-from tensorflow.python.compiler.xla import xla
-
-# MLIR APIs.
-from tensorflow.python.compiler.mlir import mlir
-
-# Required due to `rnn` and `rnn_cell` not being imported in `nn` directly
-# (due to a circular dependency issue: rnn depends on layers).
-nn.dynamic_rnn = rnn.dynamic_rnn
-nn.static_rnn = rnn.static_rnn
-nn.raw_rnn = rnn.raw_rnn
-nn.bidirectional_dynamic_rnn = rnn.bidirectional_dynamic_rnn
-nn.static_state_saving_rnn = rnn.static_state_saving_rnn
-nn.rnn_cell = rnn_cell
-
 # Special dunders that we choose to export:
 _exported_dunders = set([
     '__version__',
@@ -161,3 +205,5 @@ _exported_dunders = set([
 # Expose symbols minus dunders, unless they are whitelisted above.
 # This is necessary to export our dunders.
 __all__ = [s for s in dir() if s in _exported_dunders or not s.startswith('_')]
+if _LAZY_API_LOADING:
+  __all__.extend(_name for _name, _ in _SYMBOLS if _name not in __all__)
@@ -28,6 +28,7 @@ See [Importing Data](https://tensorflow.org/guide/datasets) for an overview.
 @@CsvDataset
 @@DatasetStructure
 @@DistributeOptions
+@@FeatureParser
 @@MapVectorizationOptions
 @@OptimizationOptions
 @@Optional
@@ -122,6 +123,7 @@ from tensorflow.python.data.experimental.ops.iterator_ops import CheckpointInput
 from tensorflow.python.data.experimental.ops.iterator_ops import make_saveable_from_iterator
 from tensorflow.python.data.experimental.ops.optimization_options import MapVectorizationOptions
 from tensorflow.python.data.experimental.ops.optimization_options import OptimizationOptions
+from tensorflow.python.data.experimental.ops.parsing_ops import FeatureParser
 from tensorflow.python.data.experimental.ops.parsing_ops import parse_example_dataset
 from tensorflow.python.data.experimental.ops.prefetching_ops import copy_to_device
 from tensorflow.python.data.experimental.ops.prefetching_ops import prefetch_to_device
@@ -1110,6 +1110,55 @@ class ParseExampleDatasetTest(test_base.DatasetTestBase,
         expected_values=expected_output,
         create_iterator_twice=True)
 
+  @combinations.generate(test_base.default_test_combinations())
+  def testFeatureParserProjection(self):
+    original = [
+        example(features=features({
+            "a": int64_feature([1]),
+            "b": bytes_feature([b"x", b"y"]),
+            "c": float_feature([3.0]),
+        })),
+        example(features=features({
+            "a": int64_feature([2]),
+            "b": bytes_feature([b"z"]),
+            "c": float_feature([4.0]),
+        })),
+    ]
+    serialized = ops.convert_to_tensor(
+        [m.SerializeToString() for m in original])
+
+    parser = contrib_parsing_ops.FeatureParser({
+        "a": parsing_ops.FixedLenFeature((), dtype=dtypes.int64),
+        "b": parsing_ops.VarLenFeature(dtype=dtypes.string),
+        "c": parsing_ops.FixedLenFeature((), dtype=dtypes.float32),
+    })
+    projection = parser.project(["c", "a"])
+    self.assertIs(projection, parser.project(["a", "c"]))
+    self.assertIs(parser, parser.project(["a", "b", "c"]))
+    self.assertEqual(set(projection), {"a", "c"})
+    with self.assertRaisesRegex(ValueError, "Unknown feature keys"):
+      parser.project(["a", "d"])
+
+    dataset = dataset_ops.Dataset.from_tensors(serialized).apply(
+        projection.parse_example_dataset())
+    self.assertEqual(set(dataset.element_spec), {"a", "c"})
+    self.assertDatasetProduces(
+        dataset,
+        expected_output=[{
+            "a": np.array([1, 2], dtype=np.int64),
+            "c": np.array([3.0, 4.0], dtype=np.float32),
+        }])
+
+    self._compare_output_to_expected(
+        self.evaluate(parser.parse(serialized)), {
+            "a": np.array([1, 2], dtype=np.int64),
+            "b": sparse_tensor.SparseTensorValue(
+                np.array([[0, 0], [0, 1], [1, 0]], dtype=np.int64),
+                np.array([b"x", b"y", b"z"], dtype=bytes),
+                np.array([2, 2], dtype=np.int64)),
+            "c": np.array([3.0, 4.0], dtype=np.float32),
+        })
+
   @combinations.generate(
       combinations.times(
           test_base.default_test_combinations(),
@@ -17,8 +17,11 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import threading
+
 from tensorflow.python.data.ops import dataset_ops
 from tensorflow.python.data.util import structure
+from tensorflow.python.eager import def_function
 from tensorflow.python.framework import dtypes
 from tensorflow.python.framework import sparse_tensor
 from tensorflow.python.framework import tensor_spec
@@ -28,11 +31,178 @@ from tensorflow.python.ops.ragged import ragged_tensor
 from tensorflow.python.util.tf_export import tf_export
 
 
+_SUPPORTED_FEATURE_TYPES = (
+    parsing_ops.VarLenFeature, parsing_ops.SparseFeature,
+    parsing_ops.FixedLenFeature, parsing_ops.FixedLenSequenceFeature,
+    parsing_ops.RaggedFeature)
+
+
+@tf_export("data.experimental.FeatureParser")
+class FeatureParser(object):
+  """A validated, reusable parser for a fixed `Example` feature spec.
+
+  `tf.data.experimental.parse_example_dataset` and
+  `tf.data.experimental.make_batched_features_dataset` validate the `features`
+  dict and rebuild the raw parse op parameters every time they are called. A
+  `FeatureParser` does that work once, so that programs which repeatedly build
+  input pipelines for the same spec only pay for it at construction time:
+
+  >>> parser = tf.data.experimental.FeatureParser({
+  ...     "age": tf.io.FixedLenFeature([], tf.int64, default_value=-1),
+  ...     "kws": tf.io.VarLenFeature(tf.string),
+  ... })
+  >>> "age" in parser
+  True
+
+  The parser can be passed anywhere a `features` dict is accepted by
+  `make_batched_features_dataset`, applied to a dataset of serialized
+  `Example` vectors with `parse_example_dataset()`, or used directly on a
+  batch with `parse()`, which reuses a single traced function.
+
+  `project(keys)` returns a (cached) parser for a subset of the features. Only
+  the projected features are decoded by the parse op, so consumers that need a
+  few columns of a wide spec do not pay for the rest.
+  """
+
+  def __init__(self, features):
+    """Creates a `FeatureParser`.
+
+    Args:
+      features: A `dict` mapping feature keys to `FixedLenFeature`,
+        `VarLenFeature`, `RaggedFeature`, and `SparseFeature` values.
+
+    Raises:
+      ValueError: if `features` is empty or contains an invalid feature.
+    """
+    if not features:
+      raise ValueError("Missing: features was %s." % features)
+    self._features = dict(features)
+    # pylint: disable=protected-access
+    self._parse_features = parsing_ops._prepend_none_dimension(self._features)
+    self._params = parsing_ops._ParseOpParams.from_features(
+        self._parse_features, _SUPPORTED_FEATURE_TYPES)
+    # pylint: enable=protected-access
+    self._has_composite_features = any(
+        isinstance(feature, parsing_ops.SparseFeature) or
+        (isinstance(feature, parsing_ops.RaggedFeature) and feature.partitions)
+        for feature in self._features.values())
+    self._lock = threading.Lock()
+    self._projections = {}
+    self._parse_fn = None
+
+  @property
+  def features(self):
+    """A copy of the feature spec this parser was built for."""
+    return dict(self._features)
+
+  def __contains__(self, key):
+    return key in self._features
+
+  def __len__(self):
+    return len(self._features)
+
+  def __iter__(self):
+    return iter(self._features)
+
+  def project(self, keys):
+    """Returns a `FeatureParser` that only decodes the given feature keys.
+
+    Projections are cached, so asking for the same set of keys again returns
+    the same parser.
+
+    Args:
+      keys: An iterable of feature keys, all of which must be in this parser's
+        spec.
+
+    Returns:
+      A `FeatureParser`.
+
+    Raises:
+      ValueError: if `keys` is empty or contains an unknown key.
+    """
+    keys = frozenset(keys)
+    if keys == frozenset(self._features):
+      return self
+    with self._lock:
+      parser = self._projections.get(keys)
+      if parser is None:
+        unknown = keys.difference(self._features)
+        if unknown:
+          raise ValueError("Unknown feature keys %s; expected a subset of %s." %
+                           (sorted(unknown), sorted(self._features)))
+        parser = FeatureParser({key: self._features[key] for key in keys})
+        self._projections[keys] = parser
+    return parser
+
+  def _parse(self, serialized):
+    # pylint: disable=protected-access
+    outputs = parsing_ops._parse_example_raw(
+        serialized, None, self._params, name=None)
+    if self._has_composite_features:
+      outputs = parsing_ops._construct_tensors_for_composite_features(
+          self._parse_features, outputs)
+    # pylint: enable=protected-access
+    return outputs
+
+  def parse(self, serialized):
+    """Parses a batch of serialized `Example` protos.
+
+    Equivalent to `tf.io.parse_example(serialized, self.features)`, but the
+    parse function is traced once and reused across calls.
+
+    Args:
+      serialized: A vector (1-D Tensor) of strings, a batch of binary
+        serialized `Example` protos.
+
+    Returns:
+      A `dict` mapping feature keys to `Tensor`, `SparseTensor`, and
+      `RaggedTensor` values.
+    """
+    with self._lock:
+      if self._parse_fn is None:
+        self._parse_fn = def_function.function(
+            self._parse,
+            input_signature=[tensor_spec.TensorSpec([None], dtypes.string)],
+            autograph=False)
+    return self._parse_fn(serialized)
+
+  def parse_example_dataset(self, num_parallel_calls=1, deterministic=None):
+    """Returns a transformation that parses `Example` vectors with this spec.
+
+    See `tf.data.experimental.parse_example_dataset` for details.
+
+    Args:
+      num_parallel_calls: (Optional.) A `tf.int32` scalar `tf.Tensor`,
+        representing the number of parsing processes to call in parallel.
+      deterministic: (Optional.) A boolean controlling whether determinism
+        should be traded for performance by allowing elements to be produced
+        out of order.
+
+    Returns:
+      A dataset transformation function, which can be passed to
+      `tf.data.Dataset.apply`.
+    """
+
+    def _apply_fn(dataset):
+      """Function from `Dataset` to `Dataset` that applies the transformation."""
+      out_dataset = _ParseExampleDataset(dataset, self, num_parallel_calls,
+                                         deterministic)
+      if self._has_composite_features:
+        # pylint: disable=protected-access
+        # pylint: disable=g-long-lambda
+        out_dataset = out_dataset.map(
+            lambda x: parsing_ops._construct_tensors_for_composite_features(
+                self._features, x),
+            num_parallel_calls=num_parallel_calls)
+      return out_dataset
+
+    return _apply_fn
+
+
 class _ParseExampleDataset(dataset_ops.UnaryDataset):
   """A `Dataset` that parses `example` dataset into a `dict` dataset."""
 
-  def __init__(self, input_dataset, features, num_parallel_calls,
-               deterministic):
+  def __init__(self, input_dataset, parser, num_parallel_calls, deterministic):
     self._input_dataset = input_dataset
     if not structure.are_compatible(
         input_dataset.element_spec,
@@ -46,13 +216,9 @@ class _ParseExampleDataset(dataset_ops.UnaryDataset):
     else:
       self._deterministic = "false"
     # pylint: disable=protected-access
-    self._features = parsing_ops._prepend_none_dimension(features)
+    self._features = parser._parse_features
     # TODO(b/112859642): Pass sparse_index and sparse_values for SparseFeature
-    params = parsing_ops._ParseOpParams.from_features(self._features, [
-        parsing_ops.VarLenFeature, parsing_ops.SparseFeature,
-        parsing_ops.FixedLenFeature, parsing_ops.FixedLenSequenceFeature,
-        parsing_ops.RaggedFeature
-    ])
+    params = parser._params
     # pylint: enable=protected-access
     self._sparse_keys = params.sparse_keys
     self._sparse_types = params.sparse_types
@@ -124,7 +290,8 @@ def parse_example_dataset(features, num_parallel_calls=1, deterministic=None):
 
   Args:
    features: A `dict` mapping feature keys to `FixedLenFeature`,
-     `VarLenFeature`, `RaggedFeature`, and `SparseFeature` values.
+     `VarLenFeature`, `RaggedFeature`, and `SparseFeature` values, or a
+     `tf.data.experimental.FeatureParser`.
    num_parallel_calls: (Optional.) A `tf.int32` scalar `tf.Tensor`,
       representing the number of parsing processes to call in parallel.
    deterministic: (Optional.) A boolean controlling whether determinism
@@ -144,21 +311,6 @@ def parse_example_dataset(features, num_parallel_calls=1, deterministic=None):
   """
   if features is None:
     raise ValueError("Missing: features was %s." % features)
-
-  def _apply_fn(dataset):
-    """Function from `Dataset` to `Dataset` that applies the transformation."""
-    out_dataset = _ParseExampleDataset(dataset, features, num_parallel_calls,
-                                       deterministic)
-    if any(
-        isinstance(feature, parsing_ops.SparseFeature) or
-        (isinstance(feature, parsing_ops.RaggedFeature) and feature.partitions)
-        for feature in features.values()):
-      # pylint: disable=protected-access
-      # pylint: disable=g-long-lambda
-      out_dataset = out_dataset.map(
-          lambda x: parsing_ops._construct_tensors_for_composite_features(
-              features, x),
-          num_parallel_calls=num_parallel_calls)
-    return out_dataset
-
-  return _apply_fn
+  if not isinstance(features, FeatureParser):
+    features = FeatureParser(features)
+  return features.parse_example_dataset(num_parallel_calls, deterministic)
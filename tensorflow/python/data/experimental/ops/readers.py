@@ -818,7 +818,10 @@ def make_batched_features_dataset_v2(file_pattern,
     batch_size: An int representing the number of records to combine
       in a single batch.
     features: A `dict` mapping feature keys to `FixedLenFeature` or
-      `VarLenFeature` values. See `tf.io.parse_example`.
+      `VarLenFeature` values. See `tf.io.parse_example`. May also be a
+      `tf.data.experimental.FeatureParser`, which avoids re-validating the
+      spec on every call; use `FeatureParser.project` to decode only a subset
+      of its features.
     reader: A function or class that can be
       called with a `filenames` tensor and (optional) `reader_args` and returns
       a `Dataset` of `Example` tensors. Defaults to `tf.data.TFRecordDataset`.
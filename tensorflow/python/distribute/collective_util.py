@@ -18,6 +18,15 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+from tensorflow.python.eager import context
+from tensorflow.python.framework import dtypes
+from tensorflow.python.framework import ops
+from tensorflow.python.ops import array_ops
+from tensorflow.python.ops import gen_linalg_ops
+from tensorflow.python.ops import math_ops
+from tensorflow.python.ops import nn_ops
+from tensorflow.python.ops import resource_variable_ops
+from tensorflow.python.ops import stateless_random_ops
 from tensorflow.python.util.tf_export import tf_export
 
 
@@ -45,9 +54,17 @@ class Hints(object):
       experimental_aggregate_gradients=False)
   ```
 
+  When all-reduce is bound by network bandwidth, gradients can also be
+  compressed before they are sent:
+
+  ```python
+  hints = tf.distribute.experimental.CollectiveHints(
+      compression=tf.distribute.experimental.CastCompression(tf.bfloat16))
+  ```
+
   """
 
-  def __init__(self, bytes_per_pack=0):
+  def __init__(self, bytes_per_pack=0, compression=None):
     """Creates a CollectiveHints.
 
     Args:
@@ -55,10 +72,326 @@ class Hints(object):
         packs of certain size. If it's zero, the value is determined
         automatically. This only applies to all-reduce with
         `MultiWorkerMirroredStrategy` currently.
+      compression: A `tf.distribute.experimental.CollectiveCompression` used to
+        compress dense values before they are all-reduced, or None to send
+        them as they are. This only applies to all-reduce with
+        `MultiWorkerMirroredStrategy` currently.
 
     Raises:
       ValueError: When arguments have invalid value.
     """
     if bytes_per_pack < 0:
       raise ValueError("bytes_per_pack must be non-negative")
+    if compression is not None and not isinstance(compression, Compression):
+      raise ValueError("compression must be a CollectiveCompression, got %r" %
+                       (compression,))
     self.bytes_per_pack = bytes_per_pack
+    self.compression = compression
+
+
+@tf_export("distribute.experimental.CollectiveCompression")
+class Compression(object):
+  """Base class for lossy compression of all-reduced values.
+
+  Pass an instance to `tf.distribute.experimental.CollectiveHints` to reduce
+  the number of bytes each replica sends when all-reducing gradients, which
+  helps when training is bound by network bandwidth. The base class sends
+  values unchanged; subclasses override `all_reduce` and `payload_bytes`.
+
+  Compressions that keep state between steps, such as the error feedback
+  residuals of `TopKCompression`, key it by the position of the value in the
+  all-reduce batch, so an instance should only be used for one sequence of
+  all-reduces with the same structure, such as the gradients of one model.
+  """
+
+  def all_reduce(self, key, values, devices, all_reduce_fn, all_gather_fn):
+    """Sums `values` across all replicas, possibly approximately.
+
+    Args:
+      key: A hashable identifying this value across steps, for compressions
+        that keep state.
+      values: A list of dense `Tensor`s with the same shape and dtype, one for
+        each local device.
+      devices: A list of the local device strings, matching `values`.
+      all_reduce_fn: A function that takes a list of `Tensor`s, one for each
+        local device, and returns their element-wise sums across all replicas,
+        one for each local device.
+      all_gather_fn: A function that takes a list of `Tensor`s, one for each
+        local device, and returns their concatenations along the first axis
+        across all replicas, one for each local device. It can only be called
+        in a `tf.function`.
+
+    Returns:
+      A list of `Tensor`s, one for each local device, with the sum.
+    """
+    del key, devices, all_gather_fn  # Unused.
+    return all_reduce_fn(values)
+
+  def payload_bytes(self, shape, dtype):
+    """Returns the number of bytes each replica sends for a value.
+
+    Args:
+      shape: A fully defined `TensorShape` of the value.
+      dtype: The `DType` of the value.
+
+    Returns:
+      The number of bytes of the tensors passed to `all_reduce_fn` and
+      `all_gather_fn` for a value of this shape and dtype.
+    """
+    return shape.num_elements() * dtype.size
+
+
+def _is_compressible(shape, dtype):
+  return (dtype.is_floating and shape.is_fully_defined() and
+          shape.num_elements() > 0)
+
+
+def _error_feedback_residual(states, key, value, device):
+  """Returns the error feedback residual variable for `key` on `device`."""
+  state_key = (key, device)
+  if state_key not in states:
+    # Created outside of any function and distribution strategy variable
+    # creator, so that each device keeps its own residual.
+    with ops.init_scope(), ops.device(device):
+      states[state_key] = resource_variable_ops.ResourceVariable(
+          array_ops.zeros(value.shape, value.dtype),
+          trainable=False,
+          name="collective_compression_residual")
+  return states[state_key]
+
+
+@tf_export("distribute.experimental.CastCompression")
+class CastCompression(Compression):
+  """Casts floating point values to a narrower type for the all-reduce.
+
+  Values are summed in the narrower type, so sums that exceed its range
+  overflow; `tf.bfloat16` has the same range as `tf.float32`.
+  """
+
+  def __init__(self, dtype=dtypes.float16):
+    """Creates a CastCompression.
+
+    Args:
+      dtype: The floating point `tf.DType` to send values as. Defaults to
+        `tf.float16`.
+
+    Raises:
+      ValueError: If `dtype` is not a floating point type.
+    """
+    dtype = dtypes.as_dtype(dtype)
+    if not dtype.is_floating:
+      raise ValueError("dtype must be a floating point type, got %s" % dtype)
+    self._dtype = dtype
+
+  def _should_cast(self, dtype):
+    return dtype.is_floating and dtype.size > self._dtype.size
+
+  def all_reduce(self, key, values, devices, all_reduce_fn, all_gather_fn):
+    dtype = values[0].dtype
+    if not self._should_cast(dtype):
+      return all_reduce_fn(values)
+    compressed = []
+    for value, device in zip(values, devices):
+      with ops.device(device):
+        compressed.append(math_ops.cast(value, self._dtype))
+    reduced = []
+    for value, device in zip(all_reduce_fn(compressed), devices):
+      with ops.device(device):
+        reduced.append(math_ops.cast(value, dtype))
+    return reduced
+
+  def payload_bytes(self, shape, dtype):
+    if not self._should_cast(dtype):
+      return shape.num_elements() * dtype.size
+    return shape.num_elements() * self._dtype.size
+
+
+@tf_export("distribute.experimental.TopKCompression")
+class TopKCompression(Compression):
+  """Sends only the largest elements of each value, with their indices.
+
+  Each replica keeps the `ratio` fraction of elements with the largest absolute
+  values and all-gathers them with their indices; the sum is rebuilt from the
+  gathered elements. With error feedback, the elements that were not sent are
+  added to the value of the next step, so that every update is eventually
+  applied. This requires a `tf.function`.
+  """
+
+  def __init__(self, ratio=0.01, error_feedback=True):
+    """Creates a TopKCompression.
+
+    Args:
+      ratio: The fraction of elements of each value to send, in (0, 1].
+      error_feedback: Whether to carry the elements that were not sent over to
+        the next step.
+
+    Raises:
+      ValueError: If `ratio` is not in (0, 1].
+    """
+    if not 0 < ratio <= 1:
+      raise ValueError("ratio must be in (0, 1], got %s" % ratio)
+    self._ratio = ratio
+    self._error_feedback = error_feedback
+    self._residuals = {}
+
+  def _k(self, shape):
+    return max(1, int(shape.num_elements() * self._ratio))
+
+  def _should_compress(self, shape, dtype):
+    # Sending an int32 index with each element only pays off for small ratios.
+    return (_is_compressible(shape, dtype) and self._k(shape) *
+            (dtype.size + 4) < shape.num_elements() * dtype.size)
+
+  def all_reduce(self, key, values, devices, all_reduce_fn, all_gather_fn):
+    if not self._should_compress(values[0].shape, values[0].dtype):
+      return all_reduce_fn(values)
+    if context.executing_eagerly():
+      raise ValueError("TopKCompression can only be used in a tf.function.")
+    shape = values[0].shape
+    num_elements = shape.num_elements()
+    k = self._k(shape)
+    selected_values = []
+    selected_indices = []
+    for value, device in zip(values, devices):
+      with ops.device(device):
+        flat = array_ops.reshape(value, [-1])
+        if self._error_feedback:
+          residual = _error_feedback_residual(self._residuals, key, value,
+                                              device)
+          flat += array_ops.reshape(residual.read_value(), [-1])
+        _, indices = nn_ops.top_k(math_ops.abs(flat), k, sorted=False)
+        selected = array_ops.gather(flat, indices)
+        if self._error_feedback:
+          unsent = flat - array_ops.scatter_nd(
+              array_ops.expand_dims(indices, 1), selected, [num_elements])
+          update = residual.assign(array_ops.reshape(unsent, shape))
+          with ops.control_dependencies([update]):
+            selected = array_ops.identity(selected)
+        selected_values.append(selected)
+        selected_indices.append(indices)
+    reduced = []
+    for gathered_values, gathered_indices, device in zip(
+        all_gather_fn(selected_values), all_gather_fn(selected_indices),
+        devices):
+      with ops.device(device):
+        reduced.append(
+            array_ops.reshape(
+                math_ops.unsorted_segment_sum(gathered_values,
+                                              gathered_indices, num_elements),
+                shape))
+    return reduced
+
+  def payload_bytes(self, shape, dtype):
+    if not self._should_compress(shape, dtype):
+      return shape.num_elements() * dtype.size
+    return self._k(shape) * (dtype.size + 4)
+
+
+@tf_export("distribute.experimental.PowerSGDCompression")
+class PowerSGDCompression(Compression):
+  """Sends a low-rank approximation of each value, as in PowerSGD.
+
+  A value of shape `[n, ...]` is viewed as an `[n, m]` matrix `M` and
+  approximated by `P Q^T`, with `P` of shape `[n, rank]` and `Q` of shape
+  `[m, rank]`, using one step of power iteration per all-reduce that is warm
+  started from the previous step's `Q`. Each replica sends `(n + m) * rank`
+  elements instead of `n * m`, in two all-reduces. The approximation error is
+  carried over to the next step. Values with fewer than two dimensions, and
+  values for which the approximation would not be smaller, are sent as they
+  are.
+
+  See https://arxiv.org/abs/1905.13727.
+  """
+
+  def __init__(self, rank=1):
+    """Creates a PowerSGDCompression.
+
+    Args:
+      rank: A positive integer, the rank of the approximation.
+
+    Raises:
+      ValueError: If `rank` is not positive.
+    """
+    if rank < 1:
+      raise ValueError("rank must be positive, got %s" % rank)
+    self._rank = rank
+    self._residuals = {}
+    self._qs = {}
+
+  def _should_compress(self, shape, dtype):
+    if (not _is_compressible(shape, dtype) or shape.rank < 2 or
+        dtype not in (dtypes.float32, dtypes.float64)):
+      return False
+    n, m = _matrix_shape(shape)
+    return (n + m) * self._rank < n * m
+
+  def _q(self, key, m, dtype, device):
+    """Returns the variable holding `Q` for `key` on `device`."""
+    state_key = (key, device)
+    if state_key not in self._qs:
+      # All replicas must start from the same Q, so it is drawn from a
+      # stateless generator with a fixed seed.
+      with ops.init_scope(), ops.device(device):
+        self._qs[state_key] = resource_variable_ops.ResourceVariable(
+            stateless_random_ops.stateless_random_normal(
+                [m, self._rank], seed=[0, self._rank], dtype=dtype),
+            trainable=False,
+            name="power_sgd_q")
+    return self._qs[state_key]
+
+  def all_reduce(self, key, values, devices, all_reduce_fn, all_gather_fn):
+    shape = values[0].shape
+    dtype = values[0].dtype
+    if not self._should_compress(shape, dtype):
+      return all_reduce_fn(values)
+    n, m = _matrix_shape(shape)
+    residuals = []
+    matrices = []
+    qs = []
+    ps = []
+    for value, device in zip(values, devices):
+      with ops.device(device):
+        residual = _error_feedback_residual(self._residuals, key, value,
+                                            device)
+        q = self._q(key, m, dtype, device)
+        matrix = array_ops.reshape(value + residual.read_value(), [n, m])
+        residuals.append(residual)
+        qs.append(q)
+        matrices.append(matrix)
+        ps.append(math_ops.matmul(matrix, q.read_value()))
+    # P is orthonormalized after the sum, so that every replica projects its
+    # matrix onto the same basis.
+    ps = all_reduce_fn(ps)
+    local_qs = []
+    for i, device in enumerate(devices):
+      with ops.device(device):
+        ps[i], _ = gen_linalg_ops.qr(ps[i], full_matrices=False)
+        local_qs.append(math_ops.matmul(matrices[i], ps[i], transpose_a=True))
+    summed_qs = all_reduce_fn(local_qs)
+    reduced = []
+    for i, device in enumerate(devices):
+      with ops.device(device):
+        unsent = matrices[i] - math_ops.matmul(
+            ps[i], local_qs[i], transpose_b=True)
+        updates = [
+            residuals[i].assign(array_ops.reshape(unsent, shape)),
+            qs[i].assign(summed_qs[i])
+        ]
+        with ops.control_dependencies(updates):
+          reduced.append(
+              array_ops.reshape(
+                  math_ops.matmul(ps[i], summed_qs[i], transpose_b=True),
+                  shape))
+    return reduced
+
+  def payload_bytes(self, shape, dtype):
+    if not self._should_compress(shape, dtype):
+      return shape.num_elements() * dtype.size
+    n, m = _matrix_shape(shape)
+    return (n + m) * self._rank * dtype.size
+
+
+def _matrix_shape(shape):
+  """Returns the `[n, m]` shape a value of shape `[n, ...]` is viewed as."""
+  n = shape.as_list()[0]
+  return n, shape.num_elements() // n
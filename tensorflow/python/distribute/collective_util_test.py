@@ -0,0 +1,204 @@
+# Copyright 2020 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for all-reduce compression in collective_util."""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import time
+
+from absl.testing import parameterized
+
+from tensorflow.python.distribute import collective_all_reduce_strategy
+from tensorflow.python.distribute import collective_util
+from tensorflow.python.distribute import combinations
+from tensorflow.python.distribute import distribution_strategy_context
+from tensorflow.python.distribute import multi_process_runner
+from tensorflow.python.distribute import multi_worker_test_base
+from tensorflow.python.distribute import reduce_util
+from tensorflow.python.eager import context
+from tensorflow.python.eager import def_function
+from tensorflow.python.eager import test
+from tensorflow.python.framework import config
+from tensorflow.python.framework import constant_op
+from tensorflow.python.framework import dtypes
+from tensorflow.python.framework import tensor_shape
+from tensorflow.python.ops import array_ops
+from tensorflow.python.ops import math_ops
+from tensorflow.python.ops import random_ops
+
+_DEVICES = ["/device:CPU:0", "/device:CPU:1"]
+
+
+def _fake_all_reduce(tensors):
+  """Sums `tensors` as if each came from a different replica."""
+  total = math_ops.add_n(tensors)
+  return [array_ops.identity(total) for _ in tensors]
+
+
+def _fake_all_gather(tensors):
+  """Concatenates `tensors` as if each came from a different replica."""
+  gathered = array_ops.concat(tensors, 0)
+  return [array_ops.identity(gathered) for _ in tensors]
+
+
+class CompressionTest(test.TestCase, parameterized.TestCase):
+
+  def setUp(self):
+    super(CompressionTest, self).setUp()
+    cpus = config.list_physical_devices("CPU")
+    config.set_logical_device_configuration(cpus[0], [
+        context.LogicalDeviceConfiguration(),
+        context.LogicalDeviceConfiguration(),
+    ])
+
+  def _all_reduce(self, compression, values, key=0):
+    return compression.all_reduce(key, values, _DEVICES, _fake_all_reduce,
+                                  _fake_all_gather)
+
+  @combinations.generate(combinations.combine(mode=["eager"]))
+  def testHintsValidation(self):
+    with self.assertRaisesRegexp(ValueError, "must be a CollectiveCompression"):
+      collective_util.Hints(compression="fp16")
+    with self.assertRaisesRegexp(ValueError, "floating point type"):
+      collective_util.CastCompression(dtypes.int32)
+    with self.assertRaisesRegexp(ValueError, "ratio must be in"):
+      collective_util.TopKCompression(ratio=0)
+    with self.assertRaisesRegexp(ValueError, "rank must be positive"):
+      collective_util.PowerSGDCompression(rank=0)
+
+  @combinations.generate(
+      combinations.combine(
+          mode=["eager"], dtype=[dtypes.float16, dtypes.bfloat16]))
+  def testCastCompression(self, dtype):
+    compression = collective_util.CastCompression(dtype)
+    reduced = self._all_reduce(
+        compression,
+        [constant_op.constant([1.5, 2.]),
+         constant_op.constant([0.5, -4.])])
+    for value in reduced:
+      self.assertEqual(value.dtype, dtypes.float32)
+      self.assertAllEqual(value, [2., -2.])
+    self.assertEqual(
+        compression.payload_bytes(
+            tensor_shape.TensorShape([10, 10]), dtypes.float32), 200)
+    self.assertEqual(
+        compression.payload_bytes(
+            tensor_shape.TensorShape([10]), dtypes.float16), 20)
+
+  @combinations.generate(combinations.combine(mode=["eager"]))
+  def testTopKCompressionWithErrorFeedback(self):
+    compression = collective_util.TopKCompression(ratio=0.25)
+
+    @def_function.function
+    def all_reduce(v0, v1):
+      return self._all_reduce(compression, [v0, v1])
+
+    reduced = all_reduce(
+        constant_op.constant([4., 1., 0., -3.]),
+        constant_op.constant([0., 2., 0., -1.]))
+    self.assertAllEqual(reduced, [[4., 2., 0., 0.]] * 2)
+    # The elements that were not sent are sent at the next step.
+    reduced = all_reduce(array_ops.zeros([4]), array_ops.zeros([4]))
+    self.assertAllEqual(reduced, [[0., 0., 0., -4.]] * 2)
+    self.assertEqual(
+        compression.payload_bytes(
+            tensor_shape.TensorShape([100]), dtypes.float32), 200)
+    # Too small to benefit from compression.
+    self.assertEqual(
+        compression.payload_bytes(
+            tensor_shape.TensorShape([2]), dtypes.float32), 8)
+
+  @combinations.generate(combinations.combine(mode=["eager"]))
+  def testTopKCompressionRequiresFunction(self):
+    compression = collective_util.TopKCompression(ratio=0.25)
+    with self.assertRaisesRegexp(ValueError, "tf.function"):
+      self._all_reduce(compression, [array_ops.ones([4])] * 2)
+
+  @combinations.generate(combinations.combine(mode=["eager"]))
+  def testPowerSGDCompressionIsExactForRankOne(self):
+    compression = collective_util.PowerSGDCompression(rank=1)
+    matrix = math_ops.matmul(
+        constant_op.constant([[1.], [2.], [3.]]),
+        constant_op.constant([[1., -1.]]))
+    for _ in range(2):
+      reduced = self._all_reduce(compression, [matrix, matrix])
+      for value in reduced:
+        self.assertAllClose(value, 2 * matrix, atol=1e-5)
+    self.assertEqual(
+        compression.payload_bytes(
+            tensor_shape.TensorShape([100, 50]), dtypes.float32),
+        (100 + 50) * 4)
+    # Vectors are sent as they are.
+    self.assertEqual(
+        compression.payload_bytes(
+            tensor_shape.TensorShape([100]), dtypes.float32), 400)
+
+
+# Shapes of the gradients all-reduced at each step of the benchmark.
+_BENCHMARK_SHAPES = [[1024, 1024], [1024], [4096, 256], [256]]
+_BENCHMARK_STEPS = 20
+
+
+def _benchmark_worker(compression):
+  """Runs all-reduce steps on one worker and returns the mean step time."""
+  strategy = collective_all_reduce_strategy.CollectiveAllReduceStrategy()
+  hints = collective_util.Hints(compression=compression)
+
+  @def_function.function
+  def step():
+
+    def replica_fn():
+      grads = [random_ops.random_normal(shape) for shape in _BENCHMARK_SHAPES]
+      return distribution_strategy_context.get_replica_context().all_reduce(
+          reduce_util.ReduceOp.SUM, grads, experimental_hints=hints)
+
+    return strategy.run(replica_fn)
+
+  step()  # Trace and warm up.
+  start = time.time()
+  for _ in range(_BENCHMARK_STEPS):
+    step()
+  return (time.time() - start) / _BENCHMARK_STEPS
+
+
+class CompressionBenchmark(test.Benchmark):
+  """Reports bytes sent and step time for each compression on 2 CPU workers."""
+
+  def benchmarkAllReduceCompression(self):
+    cluster_spec = multi_worker_test_base.create_cluster_spec(num_workers=2)
+    for name, compression in [
+        ("none", None),
+        ("float16", collective_util.CastCompression(dtypes.float16)),
+        ("bfloat16", collective_util.CastCompression(dtypes.bfloat16)),
+        ("top_k", collective_util.TopKCompression(ratio=0.01)),
+        ("power_sgd", collective_util.PowerSGDCompression(rank=4)),
+    ]:
+      step_times = multi_process_runner.run(
+          _benchmark_worker, cluster_spec, args=(compression,)).return_value
+      bytes_sent = sum(
+          (compression or collective_util.Compression()).payload_bytes(
+              tensor_shape.TensorShape(shape), dtypes.float32)
+          for shape in _BENCHMARK_SHAPES)
+      self.report_benchmark(
+          name="all_reduce_%s" % name,
+          iters=_BENCHMARK_STEPS,
+          wall_time=max(step_times),
+          extras={"bytes_sent_per_replica_per_step": bytes_sent})
+
+
+if __name__ == "__main__":
+  multi_process_runner.test_main()
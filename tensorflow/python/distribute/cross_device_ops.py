@@ -20,7 +20,10 @@ from __future__ import print_function
 
 import collections
 import enum
+import hashlib
+import json
 import threading
+import time
 
 import six
 
@@ -34,10 +37,13 @@ from tensorflow.python.distribute import reduce_util
 from tensorflow.python.distribute import tpu_values
 from tensorflow.python.distribute import values as value_lib
 from tensorflow.python.eager import context
+from tensorflow.python.eager import def_function
 from tensorflow.python.eager import executor
+from tensorflow.python.framework import errors
 from tensorflow.python.framework import kernels
 from tensorflow.python.framework import ops
 from tensorflow.python.framework import tensor_util
+from tensorflow.python.lib.io import file_io
 from tensorflow.python.ops import array_ops
 from tensorflow.python.ops import math_ops
 from tensorflow.python.ops import resource_variable_ops
@@ -649,8 +655,11 @@ class AllReduceCrossDeviceOps(CrossDeviceOps):
     cross-device transportation.
 
     Args:
-      all_reduce_alg: the all-reduce algorithm to use, currently only "nccl" or
-        "hierarchical_copy" are supported.
+      all_reduce_alg: the all-reduce algorithm to use, one of "nccl",
+        "hierarchical_copy", "ring" or "recursive_hd". "ring" and
+        "recursive_hd" are the algorithms of the same names in `all_reduce.py`;
+        they require fully defined shapes, and "recursive_hd" requires the
+        number of devices to be a power of 2.
       num_packs: If non-zero, pack values into `num_packs` splits.
     """
     self._all_reduce_alg = all_reduce_alg
@@ -713,6 +722,9 @@ class AllReduceCrossDeviceOps(CrossDeviceOps):
       # TODO(yuefengz): merge this into the all-reduce library.
       reduced = cross_device_utils.aggregate_gradients_using_nccl(
           device_grad_packs)
+    elif self._all_reduce_alg in ("ring", "recursive_hd"):
+      reduced = cross_device_utils.aggregate_gradients_using_all_reduce_alg(
+          device_grad_packs, self._all_reduce_alg)
     else:
       # TODO(yuefengz): check that gpu ids in `destinations` are in ascending
       # order.
@@ -801,6 +813,234 @@ class HierarchicalCopyAllReduce(AllReduceCrossDeviceOps):
         num_packs=num_packs)
 
 
+def _default_autotune_candidates(devices):
+  """Returns the `CrossDeviceOps` `AutoTunedCrossDeviceOps` tries by default.
+
+  Args:
+    devices: the devices the values to reduce are on.
+
+  Returns:
+    An OrderedDict mapping candidate names to `CrossDeviceOps`.
+  """
+  candidates = collections.OrderedDict()
+  candidates["reduction_to_one_device"] = ReductionToOneDevice()
+  # TODO(b/149881884): remove once AllReduceCrossDeviceOps works eagerly.
+  if len(devices) < 2 or context.executing_eagerly():
+    return candidates
+  num_devices_is_power_of_2 = not len(devices) & (len(devices) - 1)
+  use_nccl = (all("gpu" in d.lower() for d in devices) and
+              kernels.get_registered_kernels_for_op("NcclAllReduce"))
+  for num_packs in (0, 1, 4):
+    candidates["ring/num_packs=%d" % num_packs] = AllReduceCrossDeviceOps(
+        "ring", num_packs)
+    if num_devices_is_power_of_2:
+      candidates["recursive_hd/num_packs=%d" % num_packs] = (
+          AllReduceCrossDeviceOps("recursive_hd", num_packs))
+    if use_nccl:
+      candidates["nccl/num_packs=%d" % num_packs] = NcclAllReduce(num_packs)
+      # Hierarchical copy assumes the 8 GPU topology of a DGX-1.
+      if len(devices) == 8:
+        candidates["hierarchical_copy/num_packs=%d" % num_packs] = (
+            HierarchicalCopyAllReduce(num_packs))
+  return candidates
+
+
+def _batch_signature(value_destination_pairs):
+  """Returns a digest of the shapes, dtypes and devices of a batch, or None.
+
+  None is returned if some value is IndexedSlices or has an unknown shape, so
+  that stand-in tensors can't be built for it.
+
+  Args:
+    value_destination_pairs: a list of (PerReplica, destinations) pairs.
+  """
+  entries = ["eager" if context.executing_eagerly() else "graph"]
+  for value, destinations in value_destination_pairs:
+    first = value.values[0]
+    if (isinstance(first, ops.IndexedSlices) or
+        not first.shape.is_fully_defined()):
+      return None
+    entries.append("%s%s@%s->%s" % (
+        first.dtype.name, first.shape.as_list(),
+        ",".join(get_devices_from(value)),
+        ",".join(get_devices_from(destinations))))
+  return hashlib.sha256(";".join(entries).encode("utf-8")).hexdigest()
+
+
+@tf_export("distribute.experimental.AutoTunedCrossDeviceOps")
+class AutoTunedCrossDeviceOps(CrossDeviceOps):
+  """Reduction using the fastest of several `tf.distribute.CrossDeviceOps`.
+
+  The first time a batch of values with given shapes, dtypes and devices is
+  reduced, every candidate reduces zero tensors of the same shapes
+  `num_trials` times inside a `tf.function`, and the candidate with the lowest
+  median time is used for such batches from then on. The decision is logged.
+  If `cache_path` is set, decisions are also stored in that JSON file, keyed by
+  a digest of the batch's shapes, dtypes and devices, so that later runs of
+  the same model on the same devices skip the timing.
+
+  By default the candidates are `tf.distribute.ReductionToOneDevice`, ring and
+  recursive halving-doubling all-reduce and, on GPUs,
+  `tf.distribute.NcclAllReduce` and `tf.distribute.HierarchicalCopyAllReduce`,
+  each with 0, 1 and 4 packs.
+
+  This is meant for the local devices of a single worker, e.g. as the
+  `cross_device_ops` of `tf.distribute.MirroredStrategy`. Values with unknown
+  shapes and IndexedSlices are reduced with the first candidate.
+
+  ```python
+  strategy = tf.distribute.MirroredStrategy(
+      cross_device_ops=tf.distribute.experimental.AutoTunedCrossDeviceOps(
+          cache_path="/tmp/cross_device_ops_choices.json"))
+  ```
+  """
+
+  def __init__(self, candidates=None, num_trials=5, cache_path=None):
+    """Initializes the object.
+
+    Args:
+      candidates: a dict mapping names to `tf.distribute.CrossDeviceOps` to
+        choose from, or None to choose from defaults suited to the devices.
+      num_trials: the number of timed reductions per candidate.
+      cache_path: optional path of a JSON file to read and store decisions in.
+
+    Raises:
+      ValueError: if `candidates` is empty or `num_trials` is not positive.
+    """
+    if candidates is not None and not candidates:
+      raise ValueError("candidates must not be empty")
+    if num_trials < 1:
+      raise ValueError("num_trials must be positive, got %s" % num_trials)
+    if candidates is not None:
+      candidates = collections.OrderedDict(candidates)
+    self._candidates = candidates
+    self._num_trials = num_trials
+    self._cache_path = cache_path
+    # Default candidates by devices, so each is only created once.
+    self._default_candidates = {}
+    # Maps a batch signature to the name of the chosen candidate.
+    self._choices = {}
+    self._lock = threading.Lock()
+    super(AutoTunedCrossDeviceOps, self).__init__()
+
+  def reduce_implementation(self, reduce_op, per_replica_value, destinations,
+                            experimental_hints):
+    candidate = self._choose([(per_replica_value, destinations)])
+    return candidate.reduce_implementation(reduce_op, per_replica_value,
+                                           destinations, experimental_hints)
+
+  def batch_reduce_implementation(self, reduce_op, value_destination_pairs,
+                                  experimental_hints):
+    candidate = self._choose(value_destination_pairs)
+    return candidate.batch_reduce_implementation(
+        reduce_op, value_destination_pairs, experimental_hints)
+
+  def _candidates_for(self, devices):
+    if self._candidates is not None:
+      return self._candidates
+    key = (devices, context.executing_eagerly())
+    if key not in self._default_candidates:
+      self._default_candidates[key] = _default_autotune_candidates(devices)
+    return self._default_candidates[key]
+
+  def _choose(self, value_destination_pairs):
+    """Returns the candidate to reduce `value_destination_pairs` with."""
+    candidates = self._candidates_for(
+        get_devices_from(value_destination_pairs[0][0]))
+    signature = _batch_signature(value_destination_pairs)
+    if signature is None:
+      logging.log_first_n(
+          logging.WARN, "Not autotuning the reduction of values with unknown "
+          "shapes or IndexedSlices, using %s." % next(iter(candidates)), 10)
+      return next(iter(candidates.values()))
+    with self._lock:
+      name = self._choices.get(signature)
+      if name is None:
+        name = self._read_cache().get(signature)
+        if name in candidates:
+          logging.info("Using cached cross-device reduction %s for %d values.",
+                       name, len(value_destination_pairs))
+        else:
+          name = self._tune(candidates, value_destination_pairs)
+          self._write_cache(signature, name)
+        self._choices[signature] = name
+    return candidates[name]
+
+  def _tune(self, candidates, value_destination_pairs):
+    """Times every candidate and returns the name of the fastest."""
+    timings = {}
+    # Time eagerly with stand-in tensors, even if called while tracing a
+    # function whose tensors can't be evaluated yet.
+    with ops.init_scope():
+      if not context.executing_eagerly():
+        logging.warning("Cross-device reductions can only be autotuned "
+                        "eagerly or in a tf.function, using %s." %
+                        next(iter(candidates)))
+        return next(iter(candidates))
+      stand_ins = []
+      for value, destinations in value_destination_pairs:
+        components = []
+        for v in value.values:
+          with ops.device(v.device):
+            components.append(array_ops.zeros(v.shape, v.dtype))
+        stand_in = value_lib.PerReplica(components)
+        if _devices_match(value, destinations):
+          destinations = stand_in
+        stand_ins.append((stand_in, destinations))
+      for name, candidate in candidates.items():
+        try:
+          timings[name] = self._time(candidate, stand_ins)
+        except (errors.OpError, NotImplementedError, ValueError) as e:
+          logging.info("Skipping cross-device reduction %s: %s", name, e)
+    if not timings:
+      raise ValueError("None of the cross-device reductions %s could reduce "
+                       "the values." % list(candidates))
+    best = min(timings, key=timings.get)
+    logging.info(
+        "Autotuned cross-device reduction of %d values: chose %s. Median "
+        "times in ms: %s", len(value_destination_pairs), best, ", ".join(
+            "%s=%.3f" % (name, t * 1000) for name, t in sorted(
+                timings.items(), key=lambda item: item[1])))
+    return best
+
+  def _time(self, candidate, value_destination_pairs):
+    """Returns the median time of reducing the values with `candidate`."""
+
+    @def_function.function
+    def reduce_fn():
+      reduced = candidate.batch_reduce(reduce_util.ReduceOp.SUM,
+                                       value_destination_pairs)
+      # Return every component, so that no reduction is pruned.
+      return [
+          v.values if isinstance(v, value_lib.DistributedValues) else v
+          for v in reduced
+      ]
+
+    reduce_fn()  # Trace and warm up.
+    context.async_wait()
+    times = []
+    for _ in range(self._num_trials):
+      start = time.time()
+      reduce_fn()
+      context.async_wait()
+      times.append(time.time() - start)
+    return sorted(times)[len(times) // 2]
+
+  def _read_cache(self):
+    if not self._cache_path or not file_io.file_exists(self._cache_path):
+      return {}
+    return json.loads(file_io.read_file_to_string(self._cache_path))
+
+  def _write_cache(self, signature, name):
+    if not self._cache_path:
+      return
+    # Re-read the cache in case another process has added to it.
+    cache = self._read_cache()
+    cache[signature] = name
+    file_io.atomic_write_string_to_file(self._cache_path,
+                                        json.dumps(cache, sort_keys=True))
+
+
 class MultiWorkerAllReduce(AllReduceCrossDeviceOps):
   """All-reduce algorithms for distributed TensorFlow."""
 
@@ -1099,16 +1339,10 @@ class CollectiveAllReduce(CrossDeviceOps):
           else:
             control_inputs = None
           reduced_values.append(
-              cross_device_utils.build_collective_reduce(
-                  per_replica.values,
-                  self._devices,
-                  self._group_size,
-                  self._collective_keys,
-                  "Add",
-                  "Id",
-                  communication,
-                  control_inputs,
-                  executors=self._executors))
+              self._all_reduce_dense_value(
+                  len(reduced_values), per_replica.values,
+                  experimental_hints.compression, communication,
+                  control_inputs))
 
     mirrored = []
     # Reverse the order of reduced value to recover the order in the input.
@@ -1121,6 +1355,33 @@ class CollectiveAllReduce(CrossDeviceOps):
           distribute_utils.regroup(value, wrap_class=value_lib.Mirrored))
     return mirrored
 
+  def _all_reduce_dense_value(self, key, values, compression, communication,
+                              control_inputs):
+    """Sums one value across all workers, compressing it if requested."""
+
+    def all_reduce_fn(tensors):
+      return cross_device_utils.build_collective_reduce(
+          tensors,
+          self._devices,
+          self._group_size,
+          self._collective_keys,
+          "Add",
+          "Id",
+          communication,
+          control_inputs,
+          executors=self._executors)
+
+    if compression is None:
+      return all_reduce_fn(values)
+
+    def all_gather_fn(tensors):
+      return cross_device_utils.build_collective_gather(
+          tensors, self._devices, self._group_size, self._collective_keys,
+          communication, control_inputs)
+
+    return compression.all_reduce(key, values, self._devices, all_reduce_fn,
+                                  all_gather_fn)
+
   def _do_batch_all_reduce_sparse(self, reduce_op, per_replica_values):
     """All-reduce IndexedSlices across all workers in a batch."""
 
@@ -291,6 +291,9 @@ class SingleWorkerCrossDeviceOpsTest(CrossDeviceOpsTestBase):
               "AccumulateNCrossDeviceOp",
               cross_device_ops_lib.ReductionToOneDevice(
                   accumulation_fn=math_ops.add_n)),
+          combinations.NamedObject(
+              "AutoTunedCrossDeviceOps",
+              cross_device_ops_lib.AutoTunedCrossDeviceOps(num_trials=2)),
       ],
       devices=[
           ["/cpu:0"],
@@ -311,6 +314,12 @@ class SingleWorkerCrossDeviceOpsTest(CrossDeviceOpsTestBase):
           combinations.NamedObject(
               "HierarchicalCopy",
               cross_device_ops_lib.HierarchicalCopyAllReduce(8)),
+          combinations.NamedObject(
+              "RingAllReduce",
+              cross_device_ops_lib.AllReduceCrossDeviceOps("ring", 2)),
+          combinations.NamedObject(
+              "RecursiveHDAllReduce",
+              cross_device_ops_lib.AllReduceCrossDeviceOps("recursive_hd", 0)),
       ],
       devices=[
           ["/gpu:0", "/gpu:1"],
@@ -363,6 +372,41 @@ class SingleWorkerCrossDeviceOpsTest(CrossDeviceOpsTestBase):
           cross_device_ops_lib.choose_the_best(devices),
           cross_device_ops_lib.ReductionToOneDevice)
 
+  @combinations.generate(combinations.combine(mode=["eager"], required_gpus=1))
+  def testAutoTunedCrossDeviceOpsCachesChoice(self):
+    devices = ["/cpu:0", "/gpu:0"]
+    per_replica = _make_per_replica(
+        [constant_op.constant([1., 2., 3.]),
+         constant_op.constant([4., 5., 6.])], devices)
+    cache_path = os.path.join(self.get_temp_dir(), "choices.json")
+
+    def batch_reduce(cross_device_ops):
+      return cross_device_ops.batch_reduce(reduce_util.ReduceOp.SUM,
+                                           [(per_replica, per_replica)])
+
+    cross_device_ops = cross_device_ops_lib.AutoTunedCrossDeviceOps(
+        num_trials=2, cache_path=cache_path)
+    self._assert_mirrored_equal(
+        batch_reduce(cross_device_ops),
+        [_fake_mirrored(constant_op.constant([5., 7., 9.]), devices)])
+    self.assertLen(cross_device_ops._read_cache(), 1)
+
+    # A new instance uses the cached choice instead of timing the candidates.
+    cross_device_ops = cross_device_ops_lib.AutoTunedCrossDeviceOps(
+        cache_path=cache_path)
+    with test.mock.patch.object(cross_device_ops_lib.AutoTunedCrossDeviceOps,
+                                "_tune") as mock_tune:
+      self._assert_mirrored_equal(
+          batch_reduce(cross_device_ops),
+          [_fake_mirrored(constant_op.constant([5., 7., 9.]), devices)])
+    mock_tune.assert_not_called()
+
+  def testAutoTunedCrossDeviceOpsValidation(self):
+    with self.assertRaisesRegexp(ValueError, "candidates must not be empty"):
+      cross_device_ops_lib.AutoTunedCrossDeviceOps(candidates={})
+    with self.assertRaisesRegexp(ValueError, "num_trials must be positive"):
+      cross_device_ops_lib.AutoTunedCrossDeviceOps(num_trials=0)
+
   @combinations.generate(combinations.combine(
       mode=["graph", "eager"],
       required_gpus=1))
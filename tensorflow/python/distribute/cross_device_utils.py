@@ -53,6 +53,70 @@ def aggregate_gradients_using_nccl(replica_grads):
   return agg_all_g_and_v
 
 
+def _build_padded_recursive_hd_all_reduce(input_tensors):
+  """Recursive halving-doubling all-reduce of tensors of any size.
+
+  `all_reduce.build_recursive_hd_all_reduce` halves the tensors once per hop,
+  so they are flattened and padded to a multiple of the number of devices.
+
+  Args:
+    input_tensors: a list of tensors with the same fully defined shape, one per
+      device. The number of devices must be a power of 2.
+
+  Returns:
+    A list of summed tensors, one per device.
+  """
+  shape = input_tensors[0].shape
+  num_elements = shape.num_elements()
+  pad_len = -num_elements % len(input_tensors)
+  padded = []
+  for t in input_tensors:
+    with ops.colocate_with(t):
+      padded.append(
+          array_ops.pad(array_ops.reshape(t, [-1]), [[0, pad_len]]))
+  reduced = all_reduce.build_recursive_hd_all_reduce(padded, math_ops.add)
+  output_tensors = []
+  for t in reduced:
+    with ops.colocate_with(t):
+      output_tensors.append(array_ops.reshape(t[:num_elements], shape))
+  return output_tensors
+
+
+def aggregate_gradients_using_all_reduce_alg(replica_grads, alg):
+  """Aggregate gradients using an all-reduce algorithm from `all_reduce.py`.
+
+  Args:
+    replica_grads: a list of lists of (gradient, variable) pairs, one list per
+      replica. Gradients must have fully defined shapes.
+    alg: "ring" or "recursive_hd". "recursive_hd" requires the number of
+      replicas to be a power of 2.
+
+  Returns:
+    A list of lists of (summed gradient, variable) pairs, one list per replica.
+
+  Raises:
+    ValueError: if `alg` is not supported.
+  """
+  agg_all_g_and_v = []
+  for single_g_and_v in zip(*replica_grads):
+    single_grads = [g for g, _ in single_g_and_v]
+    if len(single_grads) == 1:
+      agg_grads = single_grads
+    elif alg == 'ring':
+      agg_grads = all_reduce.build_ring_all_reduce(
+          single_grads, 1, 1, list(range(len(single_grads))), math_ops.add)
+    elif alg == 'recursive_hd':
+      agg_grads = _build_padded_recursive_hd_all_reduce(single_grads)
+    else:
+      raise ValueError('unsupported all_reduce alg: %s' % alg)
+    agg_all_g_and_v.append(
+        [(g, v) for g, (_, v) in zip(agg_grads, single_g_and_v)])
+
+  agg_all_g_and_v = list(zip(*agg_all_g_and_v))
+
+  return agg_all_g_and_v
+
+
 def aggregate_gradients_using_hierarchical_copy(avail_devices, replica_grads):
   """Aggregate gradients using hierarchical copies.
 
@@ -23,6 +23,7 @@ import collections
 import contextlib
 import json
 import os
+import pickle
 import signal
 import sys
 import threading
@@ -53,6 +54,14 @@ try:
 except ImportError:
   dill = None
 
+try:
+  # `shared_memory` is only available in python >= 3.8.
+  from multiprocessing import resource_tracker
+  from multiprocessing import shared_memory
+except ImportError:
+  resource_tracker = None
+  shared_memory = None
+
 # TODO(b/150264776): Remove after resolving CI issue.
 try:
   import tblib.pickling_support
@@ -98,6 +107,13 @@ Resources = collections.namedtuple('Resources', [
 # "medium" timeout of the test runs.
 _DEFAULT_TIMEOUT_SEC = 200
 
+# Buffers of return values at least this large, e.g. those of NumPy arrays, are
+# passed to the parent process through shared memory.
+_MIN_SHARED_MEMORY_BYTES = 64 << 10
+
+# Maximum number of bytes of subprocess output read and forwarded at once.
+_STREAMING_CHUNK_BYTES = 64 << 10
+
 
 class MultiProcessRunner(object):
   """A utility class to start multiple processes to simulate a cluster.
@@ -207,24 +223,51 @@ class MultiProcessRunner(object):
     self._barrier = self._manager.Barrier(parties)
 
     # We use a queue to collect outputs from worker processes since it's thread
-    # safe.
-    self._streaming_queue = self._manager.Queue()
+    # safe. Outputs are read by threads of this process, so the queue doesn't
+    # need to be shared with subprocesses.
+    self._streaming_queue = Queue.Queue()
 
     # This flag will be set to True once terminate_all() is called.
     self._all_forced_terminated = False
 
   def _continuously_readline_from_sub(self, pipe_r, task_type, task_id):
-    """Function to continuously read lines from subprocesses."""
-    with os.fdopen(pipe_r.fileno(), 'r', closefd=False) as reader:
-      for line in reader:
-        task_string = '[{}-{}]:'.format(task_type, task_id)
-        formatted_line = '{} {}'.format(task_string.ljust(14), line)
-        if self._stream_stdout:
-          # TODO(rchao): Use a lock here to ensure the printed lines are not
-          # broken.
-          print(formatted_line, end='', flush=True)
-        if self._list_stdout:
-          self._streaming_queue.put(formatted_line)
+    """Function to continuously read lines from subprocesses.
+
+    Output is read in chunks, and all the complete lines of a chunk are
+    forwarded together.
+
+    Args:
+      pipe_r: the reading end of the subprocess' stdout and stderr pipe.
+      task_type: the task type of the subprocess.
+      task_id: the task id of the subprocess.
+    """
+    task_string = '[{}-{}]:'.format(task_type, task_id).ljust(14)
+    partial_line = b''
+    while True:
+      chunk = os.read(pipe_r.fileno(), _STREAMING_CHUNK_BYTES)
+      if not chunk:
+        break
+      lines = (partial_line + chunk).splitlines(True)
+      partial_line = b''
+      if not lines[-1].endswith((b'\n', b'\r')):
+        partial_line = lines.pop()
+      self._forward_lines(task_string, lines)
+    if partial_line:
+      self._forward_lines(task_string, [partial_line])
+
+  def _forward_lines(self, task_string, lines):
+    """Prints and/or lists lines of subprocess output."""
+    formatted_lines = [
+        '{} {}'.format(task_string, line.decode('utf-8', 'replace'))
+        for line in lines
+    ]
+    if self._stream_stdout:
+      # TODO(rchao): Use a lock here to ensure the printed lines are not
+      # broken.
+      print(''.join(formatted_lines), end='', flush=True)
+    if self._list_stdout:
+      for formatted_line in formatted_lines:
+        self._streaming_queue.put(formatted_line)
 
   def _start_subprocess_and_reading_thread(self,
                                            task_type,
@@ -416,9 +459,12 @@ class MultiProcessRunner(object):
       # Force termination to dump worker processes stack trace.
       self.terminate_all(sig=signal.SIGTERM)
       process_statuses = self._queue_to_list(self._process_status_queue)
-      raise SubprocessTimeoutError(
-          '%s-%d and possibly more subprocesses timed out.' %
-          (task_type, task_id), self._get_mpr_result(process_statuses))
+      try:
+        raise SubprocessTimeoutError(
+            '%s-%d and possibly more subprocesses timed out.' %
+            (task_type, task_id), self._get_mpr_result(process_statuses))
+      finally:
+        _release_shared_memory(process_statuses)
 
   def join(self, timeout=_DEFAULT_TIMEOUT_SEC):
     """Joins all the processes with timeout.
@@ -473,46 +519,54 @@ class MultiProcessRunner(object):
       logging.info('%s-%d exit code: %s', task_type, task_id, p.exitcode)
 
     process_statuses = self._queue_to_list(self._process_status_queue)
-    if not self._all_forced_terminated and len(
-        process_statuses) != self._outstanding_subprocess_count:
-      raise UnexpectedSubprocessExitError(
-          'Missing status(es) from %d subprocess(es). See logs for details.' %
-          (self._outstanding_subprocess_count - len(process_statuses)),
-          self._get_mpr_result(process_statuses))
-    for process_status in process_statuses:
-      assert isinstance(process_status, _ProcessStatusInfo)
-      if not process_status.is_successful:
-        six.reraise(*process_status.exc_info)
-
-    # Checking all the processes that are expected to exit properly.
-    for (task_type, task_id), p in self._processes.items():
-      if self._dependence_on_chief and task_type != 'chief':
-        # If _dependence_on_chief, other processes may have been
-        # forced-terminated, which is expected.
-        continue
-      # Successfully exiting process has exit code 0.
-      if p.exitcode > 0:
+    try:
+      if not self._all_forced_terminated and len(
+          process_statuses) != self._outstanding_subprocess_count:
         raise UnexpectedSubprocessExitError(
-            'Subprocess %s-%d exited with exit code %d. See logs for details.' %
-            (task_type, task_id, p.exitcode),
+            'Missing status(es) from %d subprocess(es). See logs for details.' %
+            (self._outstanding_subprocess_count - len(process_statuses)),
             self._get_mpr_result(process_statuses))
+      for process_status in process_statuses:
+        assert isinstance(process_status, _ProcessStatusInfo)
+        if not process_status.is_successful:
+          six.reraise(*process_status.exc_info)
 
-    logging.info('Joining log reading threads.')
-    for thread in self._reading_threads:
-      thread.join()
-    logging.info('Joined log reading threads.')
-
-    # Clear the alarm.
-    signal.alarm(0)
-
-    return self._get_mpr_result(process_statuses)
+      # Checking all the processes that are expected to exit properly.
+      for (task_type, task_id), p in self._processes.items():
+        if self._dependence_on_chief and task_type != 'chief':
+          # If _dependence_on_chief, other processes may have been
+          # forced-terminated, which is expected.
+          continue
+        # Successfully exiting process has exit code 0.
+        if p.exitcode > 0:
+          raise UnexpectedSubprocessExitError(
+              'Subprocess %s-%d exited with exit code %d. See logs for '
+              'details.' % (task_type, task_id, p.exitcode),
+              self._get_mpr_result(process_statuses))
+
+      logging.info('Joining log reading threads.')
+      for thread in self._reading_threads:
+        thread.join()
+      logging.info('Joined log reading threads.')
+
+      # Clear the alarm.
+      signal.alarm(0)
+
+      return self._get_mpr_result(process_statuses)
+    finally:
+      # Values that weren't returned, e.g. because another subprocess failed,
+      # still have to be unlinked.
+      _release_shared_memory(process_statuses)
 
   def _get_mpr_result(self, process_statuses):
     stdout = self._queue_to_list(self._streaming_queue)
     return_values = []
     for process_status in process_statuses:
       if process_status.return_value is not None:
-        return_values.append(process_status.return_value)
+        return_value = process_status.return_value
+        if isinstance(return_value, _SharedMemoryValue):
+          return_value = return_value.get()
+        return_values.append(return_value)
     return MultiProcessRunnerResult(stdout=stdout, return_value=return_values)
 
   def terminate(self, task_type, task_id):
@@ -682,7 +736,7 @@ class _ProcFunc(object):
           task_type=test_env.task_type,
           is_successful=is_successful,
           exc_info=exc_info,
-          return_value=return_value)
+          return_value=_maybe_share_memory(return_value))
       self._resources.process_status_queue.put(info)
       self._close_streaming()
 
@@ -690,6 +744,107 @@ class _ProcFunc(object):
     sys.exit(0)
 
 
+if shared_memory is not None:
+
+  class _AttachedSharedMemory(shared_memory.SharedMemory):
+    """A `SharedMemory` that stays mapped while its buffer is referenced."""
+
+    def __init__(self, name):
+      super(_AttachedSharedMemory, self).__init__(name=name)
+      # The mapping doesn't need the file descriptor, and results may outlive
+      # this object, so don't hold onto it.
+      if getattr(self, '_fd', -1) >= 0:
+        os.close(self._fd)
+        self._fd = -1
+
+    def __del__(self):
+      try:
+        self.close()
+      except BufferError:
+        # Values unpickled from the buffer are still alive, the memory is
+        # unmapped when the last of them is deleted.
+        pass
+
+
+class _SharedMemoryValue(object):
+  """A return value whose large buffers are stored in shared memory.
+
+  The value is pickled with protocol 5 in the subprocess. Buffers that support
+  out-of-band pickling, such as those of NumPy arrays, are copied into shared
+  memory segments rather than into the pickle, so only the small pickle goes
+  through the process status queue. The parent process maps the segments and
+  unpickles the value on top of them without copying.
+  """
+
+  def __init__(self, data, segments):
+    self._data = data
+    # A list of (segment name, size in bytes).
+    self._segments = segments
+
+  def get(self):
+    """Returns the value. Can only be called once, in the parent process."""
+    buffers = []
+    segments, self._segments = self._segments, []
+    for name, size in segments:
+      segment = _AttachedSharedMemory(name)
+      # The mapping stays valid after unlinking, and unlinking now means the
+      # memory is released with the last reference to the value.
+      segment.unlink()
+      buffers.append(segment.buf[:size])
+    return pickle.loads(self._data, buffers=buffers)
+
+  def release(self):
+    """Unlinks the segments of the value if `get` hasn't been called."""
+    segments, self._segments = self._segments, []
+    for name, _ in segments:
+      try:
+        _AttachedSharedMemory(name).unlink()
+      except OSError:
+        pass
+
+
+def _release_shared_memory(process_statuses):
+  """Unlinks the shared memory of return values which haven't been read."""
+  for process_status in process_statuses:
+    if isinstance(process_status.return_value, _SharedMemoryValue):
+      process_status.return_value.release()
+
+
+def _maybe_share_memory(value):
+  """Moves the large buffers of `value` to shared memory, if there are any."""
+  if value is None or shared_memory is None:
+    return value
+  buffers = []
+
+  def buffer_callback(buf):
+    if buf.raw().nbytes < _MIN_SHARED_MEMORY_BYTES:
+      return True  # Pickle in-band.
+    buffers.append(buf)
+    return False
+
+  try:
+    data = pickle.dumps(value, protocol=5, buffer_callback=buffer_callback)
+  except (pickle.PicklingError, TypeError, AttributeError):
+    # Let the process status queue report values that can't be pickled.
+    return value
+  if not buffers:
+    return value
+  segments = []
+  for buf in buffers:
+    raw = buf.raw()
+    segment = shared_memory.SharedMemory(create=True, size=raw.nbytes)
+    segment.buf[:raw.nbytes] = raw
+    segments.append((segment.name, raw.nbytes))
+    segment.close()
+    # The parent process owns the segment from now on: attaching to it
+    # registers it with the resource tracker and unlinking it unregisters it.
+    # Dropping this process's registration keeps it from being registered
+    # twice, which would make the tracker warn about a leak and unlink it
+    # again.
+    resource_tracker.unregister(segment._name, 'shared_memory')  # pylint: disable=protected-access
+  return _SharedMemoryValue(data, segments)
+
+
 class SubprocessTimeoutError(RuntimeError):
   """An error that indicates there is at least one subprocess timing out.
 
@@ -24,6 +24,7 @@ import os
 import threading
 import time
 from absl import logging
+import numpy as np
 
 from tensorflow.python.distribute import multi_process_runner
 from tensorflow.python.distribute import multi_worker_test_base
@@ -54,6 +55,18 @@ def proc_func_with_barrier():
   return multi_process_runner.barrier()
 
 
+def proc_func_that_returns_large_array(num_elements, num_lines=0):
+  for i in range(num_lines):
+    print('line %d' % i)
+  return np.arange(num_elements, dtype=np.float32)
+
+
+def proc_func_that_returns_large_array_or_errors(num_elements):
+  if json.loads(os.environ['TF_CONFIG'])['task']['index'] == 1:
+    raise ValueError('This is an error.')
+  return np.arange(num_elements, dtype=np.float32)
+
+
 class MultiProcessRunnerTest(test.TestCase):
 
   def _worker_idx(self):
@@ -334,5 +347,60 @@ class MultiProcessRunnerTest(test.TestCase):
     list_to_assert = cm.exception.mpr_result.stdout
     self.assertTrue(any('SIGSEGV' in line for line in list_to_assert))
 
+  def test_large_return_value_through_shared_memory(self):
+    # 4MB per task, well above the shared memory threshold.
+    num_elements = 1 << 20
+    mpr_result = multi_process_runner.run(
+        proc_func_that_returns_large_array,
+        multi_worker_test_base.create_cluster_spec(num_workers=2),
+        args=(num_elements,))
+    self.assertLen(mpr_result.return_value, 2)
+    for return_value in mpr_result.return_value:
+      self.assertAllEqual(return_value,
+                          np.arange(num_elements, dtype=np.float32))
+
+  def test_shared_memory_is_released_when_a_subprocess_fails(self):
+    if not os.path.isdir('/dev/shm'):
+      self.skipTest('Shared memory segments are not listed in /dev/shm.')
+    segments_before = set(os.listdir('/dev/shm'))
+    with self.assertRaisesRegexp(ValueError, 'This is an error.'):
+      multi_process_runner.run(
+          proc_func_that_returns_large_array_or_errors,
+          multi_worker_test_base.create_cluster_spec(num_workers=2),
+          args=(1 << 20,))
+    self.assertEmpty(set(os.listdir('/dev/shm')) - segments_before)
+
+  def test_batched_stdout_keeps_line_order(self):
+    mpr_result = multi_process_runner.run(
+        proc_func_that_returns_large_array,
+        multi_worker_test_base.create_cluster_spec(num_workers=1),
+        args=(1, 1000),
+        list_stdout=True)
+    self.assertEqual(
+        [line for line in mpr_result.stdout if 'line ' in line],
+        ['[worker-0]:    line %d\n' % i for i in range(1000)])
+
+
+class MultiProcessRunnerBenchmark(test.Benchmark):
+
+  def benchmark_per_task_overhead(self):
+    num_elements = 1 << 20
+    for num_workers in (1, 4, 16, 64):
+      start = time.time()
+      multi_process_runner.run(
+          proc_func_that_returns_large_array,
+          multi_worker_test_base.create_cluster_spec(num_workers=num_workers),
+          args=(num_elements, 100),
+          list_stdout=True)
+      wall_time = time.time() - start
+      self.report_benchmark(
+          name='per_task_overhead_%d_workers' % num_workers,
+          iters=1,
+          wall_time=wall_time / num_workers,
+          extras={
+              'num_workers': num_workers,
+              'total_wall_time': wall_time,
+          })
+
 if __name__ == '__main__':
   multi_process_runner.test_main()
@@ -19,7 +19,14 @@ from __future__ import print_function
 
 import copy
 
+from tensorflow.python.framework import dtypes as dtypes_lib
+from tensorflow.python.framework import ops
 from tensorflow.python.framework import tensor_shape
+from tensorflow.python.ops import array_ops
+from tensorflow.python.ops import control_flow_ops
+from tensorflow.python.ops import data_flow_ops
+from tensorflow.python.ops import embedding_ops
+from tensorflow.python.ops import math_ops
 from tensorflow.python.ops import variables as variables_lib
 from tensorflow.python.training.saving import saveable_object_util
 from tensorflow.python.training.tracking import base as trackable
@@ -38,7 +45,14 @@ class ShardedVariable(trackable.Trackable):
   Objects of this class can be saved with a given number of shards and then
   restored from a checkpoint into a different number of shards.
 
-  Sharding is only supported along the first dimension.
+  Sharding is only supported along the first dimension. Rows are assigned to
+  shards contiguously, in the order of the variables: with shards of 10 and 15
+  rows, rows 0-9 are in the first shard and rows 10-24 in the second.
+
+  `sparse_read`, `embedding_lookup`, `scatter_add`, `scatter_update` and
+  `assign` route each row to its shard with a single vectorized partition step
+  and run the per-shard work colocated with the shard, so the shards are never
+  concatenated.
   """
 
   def __init__(self, variables, name='ShardedVariable'):
@@ -86,7 +100,12 @@ class ShardedVariable(trackable.Trackable):
       raise ValueError(
           'All `Variables`s must have the same shapes except for the first '
           'axis, found {}'.format([v.shape for v in variables]))
-    first_dim = sum(int(v.shape[0]) for v in variables)
+    self._shard_sizes = [int(v.shape[0]) for v in variables]
+    # The first row of each shard.
+    self._shard_starts = [0]
+    for size in self._shard_sizes[:-1]:
+      self._shard_starts.append(self._shard_starts[-1] + size)
+    first_dim = sum(self._shard_sizes)
     self._shape = tensor_shape.TensorShape([first_dim] + first_var.shape[1:])
 
     save_slice_info = [v._get_save_slice_info() for v in variables]  # pylint: disable=protected-access
@@ -120,6 +139,153 @@ class ShardedVariable(trackable.Trackable):
     """The overall shape, combining all shards along axis `0`."""
     return self._shape
 
+  def _partition(self, ids):
+    """Maps a vector of row ids to shard numbers and ids within the shard.
+
+    Args:
+      ids: A 1-D int32 or int64 `Tensor` of row ids.
+
+    Returns:
+      A tuple of two `Tensor`s shaped like `ids`: the int32 shard number of
+      each id, and the id of its row within that shard.
+    """
+    starts = ops.convert_to_tensor(self._shard_starts, dtype=ids.dtype)
+    shard_ids = array_ops.searchsorted(
+        starts[1:], ids, side='right', out_type=dtypes_lib.int32)
+    return shard_ids, ids - array_ops.gather(starts, shard_ids)
+
+  def sparse_read(self, indices, name=None):
+    """Gathers rows from the shards.
+
+    Args:
+      indices: An int32 or int64 `Tensor` of row ids.
+      name: A name for the operation (optional).
+
+    Returns:
+      A `Tensor` of shape `indices.shape + self.shape[1:]`.
+    """
+    with ops.name_scope(name, 'ShardedVariableSparseRead', [indices]):
+      indices = ops.convert_to_tensor(indices, name='indices')
+      if len(self._variables) == 1:
+        return self._variables[0].sparse_read(indices)
+      num_shards = len(self._variables)
+      flat_ids = array_ops.reshape(indices, [-1])
+      shard_ids, local_ids = self._partition(flat_ids)
+      local_ids_per_shard = data_flow_ops.dynamic_partition(
+          local_ids, shard_ids, num_shards)
+      positions_per_shard = data_flow_ops.dynamic_partition(
+          math_ops.range(array_ops.size(flat_ids)), shard_ids, num_shards)
+      rows_per_shard = []
+      for v, ids in zip(self._variables, local_ids_per_shard):
+        with ops.colocate_with(v):
+          rows_per_shard.append(v.sparse_read(ids))
+      rows = data_flow_ops.parallel_dynamic_stitch(positions_per_shard,
+                                                   rows_per_shard)
+      return array_ops.reshape(
+          rows,
+          array_ops.concat(
+              [array_ops.shape(indices), array_ops.shape(rows)[1:]], 0))
+
+  def embedding_lookup(self, ids, max_norm=None, name=None):
+    """Looks up `ids` in this sharded embedding table.
+
+    This is equivalent to `tf.nn.embedding_lookup` on the concatenation of the
+    shards.
+
+    Args:
+      ids: An int32 or int64 `Tensor` of row ids.
+      max_norm: If not `None`, each embedding is clipped if its l2-norm is
+        larger than this value.
+      name: A name for the operation (optional).
+
+    Returns:
+      A `Tensor` of shape `ids.shape + self.shape[1:]`.
+    """
+    with ops.name_scope(name, 'ShardedVariableEmbeddingLookup', [ids]):
+      ids = ops.convert_to_tensor(ids, name='ids')
+      return embedding_ops._clip(self.sparse_read(ids), ids, max_norm)  # pylint: disable=protected-access
+
+  def _scatter(self, method_name, sparse_delta, use_locking, name):
+    """Applies `Variable.<method_name>` to the shards of `sparse_delta`."""
+    if not isinstance(sparse_delta, ops.IndexedSlices):
+      raise TypeError('sparse_delta is not IndexedSlices: %s' % sparse_delta)
+    with ops.name_scope(name, 'ShardedVariable_' + method_name,
+                        [sparse_delta.indices, sparse_delta.values]):
+      if len(self._variables) == 1:
+        return control_flow_ops.group(
+            getattr(self._variables[0], method_name)(
+                sparse_delta, use_locking=use_locking).op)
+      num_shards = len(self._variables)
+      shard_ids, local_ids = self._partition(sparse_delta.indices)
+      local_ids_per_shard = data_flow_ops.dynamic_partition(
+          local_ids, shard_ids, num_shards)
+      values_per_shard = data_flow_ops.dynamic_partition(
+          sparse_delta.values, shard_ids, num_shards)
+      updates = []
+      for v, ids, values in zip(self._variables, local_ids_per_shard,
+                                values_per_shard):
+        with ops.colocate_with(v):
+          updates.append(
+              getattr(v, method_name)(
+                  ops.IndexedSlices(values, ids), use_locking=use_locking).op)
+      return control_flow_ops.group(*updates)
+
+  def scatter_add(self, sparse_delta, use_locking=False, name=None):
+    """Adds `tf.IndexedSlices` to this variable.
+
+    Args:
+      sparse_delta: `tf.IndexedSlices` to be added, indexed by row of the
+        combined variable.
+      use_locking: If `True`, use locking during the operation.
+      name: A name for the operation (optional).
+
+    Returns:
+      An `Operation` that updates the shards, or `None` when executing eagerly.
+
+    Raises:
+      TypeError: if `sparse_delta` is not an `IndexedSlices`.
+    """
+    return self._scatter('scatter_add', sparse_delta, use_locking, name)
+
+  def scatter_update(self, sparse_delta, use_locking=False, name=None):
+    """Assigns `tf.IndexedSlices` to this variable.
+
+    Args:
+      sparse_delta: `tf.IndexedSlices` to be assigned, indexed by row of the
+        combined variable.
+      use_locking: If `True`, use locking during the operation.
+      name: A name for the operation (optional).
+
+    Returns:
+      An `Operation` that updates the shards, or `None` when executing eagerly.
+
+    Raises:
+      TypeError: if `sparse_delta` is not an `IndexedSlices`.
+    """
+    return self._scatter('scatter_update', sparse_delta, use_locking, name)
+
+  def assign(self, value, use_locking=False, name=None):
+    """Assigns a new value to this variable, splitting it across the shards.
+
+    Args:
+      value: A `Tensor` of shape `self.shape`.
+      use_locking: If `True`, use locking during the assignment.
+      name: A name for the operation (optional).
+
+    Returns:
+      An `Operation` that updates the shards, or `None` when executing eagerly.
+    """
+    with ops.name_scope(name, 'ShardedVariableAssign', [value]):
+      value = ops.convert_to_tensor(value, dtype=self._dtype, name='value')
+      self._shape.assert_is_compatible_with(value.shape)
+      updates = []
+      for v, shard_value in zip(
+          self._variables, array_ops.split(value, self._shard_sizes, axis=0)):
+        with ops.colocate_with(v):
+          updates.append(
+              v.assign(shard_value, use_locking=use_locking, read_value=False))
+      return control_flow_ops.group(*updates)
+
   def _gather_saveables_for_checkpoint(self):
     """Return a `Saveable` for each shard. See `Trackable`."""
 
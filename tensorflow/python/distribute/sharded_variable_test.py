@@ -19,10 +19,18 @@ from __future__ import division
 from __future__ import print_function
 
 import os
+import time
 
 from tensorflow.python.compat import v2_compat
 from tensorflow.python.distribute import sharded_variable
+from tensorflow.python.eager import context
+from tensorflow.python.eager import def_function
+from tensorflow.python.framework import config
+from tensorflow.python.framework import constant_op
+from tensorflow.python.framework import ops
 from tensorflow.python.ops import array_ops
+from tensorflow.python.ops import embedding_ops
+from tensorflow.python.ops import random_ops
 from tensorflow.python.ops import variables as variables_lib
 from tensorflow.python.platform import test
 from tensorflow.python.training.tracking import util
@@ -116,6 +124,83 @@ class ShardedVariableTest(test.TestCase):
     self.assertAllEqual(self.evaluate(cp2.s.variables[0]), [0, 1])
     self.assertAllEqual(self.evaluate(cp2.s.variables[1]), [2, 3])
 
+  def _make_sharded_variable(self):
+    # Shards of 1, 3 and 2 rows: row i is [i, 10 * i].
+    return sharded_variable.ShardedVariable([
+        variables_lib.Variable([[0, 0]]),
+        variables_lib.Variable([[1, 10], [2, 20], [3, 30]]),
+        variables_lib.Variable([[4, 40], [5, 50]])
+    ])
+
+  def test_sparse_read(self):
+    s = self._make_sharded_variable()
+    self.assertAllEqual(
+        self.evaluate(s.sparse_read([[5, 0], [3, 3]])),
+        [[[5, 50], [0, 0]], [[3, 30], [3, 30]]])
+    self.assertAllEqual(
+        self.evaluate(s.sparse_read(constant_op.constant([1, 4], 'int64'))),
+        [[1, 10], [4, 40]])
+
+  def test_embedding_lookup(self):
+    s = sharded_variable.ShardedVariable([
+        variables_lib.Variable([[3., 4.], [1., 0.]]),
+        variables_lib.Variable([[0., 6.]])
+    ])
+    self.assertAllClose(
+        self.evaluate(s.embedding_lookup([2, 0, 1], max_norm=2.)),
+        [[0., 2.], [1.2, 1.6], [1., 0.]])
+
+  def test_scatter_add_and_update(self):
+    s = self._make_sharded_variable()
+    s.scatter_add(ops.IndexedSlices([[1, 1], [2, 2], [3, 3]], [4, 0, 4]))
+    s.scatter_update(ops.IndexedSlices([[7, 7]], [2]))
+    self.assertAllEqual(
+        self.evaluate(s.sparse_read(list(range(6)))),
+        [[2, 2], [1, 10], [7, 7], [3, 30], [8, 44], [5, 50]])
+
+    with self.assertRaisesRegexp(TypeError, 'not IndexedSlices'):
+      s.scatter_add([[1, 1]])
+
+  def test_assign(self):
+    s = self._make_sharded_variable()
+    s.assign([[i, -i] for i in range(6)])
+    self.assertAllEqual(self.evaluate(s.variables[0]), [[0, 0]])
+    self.assertAllEqual(
+        self.evaluate(s.variables[1]), [[1, -1], [2, -2], [3, -3]])
+    self.assertAllEqual(self.evaluate(s.variables[2]), [[4, -4], [5, -5]])
+
+  def test_updates_return_ops_in_graph(self):
+    with ops.Graph().as_default():
+      s = self._make_sharded_variable()
+      self.evaluate(variables_lib.global_variables_initializer())
+      scatter_add = s.scatter_add(
+          ops.IndexedSlices([[1, 1], [2, 2]], [4, 0]))
+      scatter_update = s.scatter_update(ops.IndexedSlices([[7, 7]], [2]))
+      assign = s.assign([[i, -i] for i in range(6)])
+      # Nothing runs until the returned ops do.
+      self.assertAllEqual(self.evaluate(s.variables[0]), [[0, 0]])
+
+      self.evaluate(scatter_add)
+      self.evaluate(scatter_update)
+      self.assertAllEqual(
+          self.evaluate(s.sparse_read(list(range(6)))),
+          [[2, 2], [1, 10], [7, 7], [3, 30], [5, 41], [5, 50]])
+      self.evaluate(assign)
+      self.assertAllEqual(
+          self.evaluate(s.sparse_read(list(range(6)))),
+          [[i, -i] for i in range(6)])
+
+  def test_lookup_in_function(self):
+    s = self._make_sharded_variable()
+
+    @def_function.function
+    def lookup(ids):
+      return s.embedding_lookup(ids)
+
+    self.assertAllEqual(
+        self.evaluate(lookup(constant_op.constant([3, 1]))),
+        [[3, 30], [1, 10]])
+
   def test_validation_errors(self):
     with self.assertRaisesRegexp(ValueError, 'Expected a list of '):
       sharded_variable.ShardedVariable(
@@ -141,6 +226,52 @@ class ShardedVariableTest(test.TestCase):
       sharded_variable.ShardedVariable([v])
 
 
+class ShardedVariableBenchmark(test.Benchmark):
+  """Compares sharded lookups against gathering from concatenated shards."""
+
+  def _run_benchmark(self, name, lookup, ids, iters=50):
+    lookup(ids)  # Warm up and trace.
+    start = time.time()
+    for _ in range(iters):
+      lookup(ids).numpy()
+    wall_time = (time.time() - start) / iters
+    self.report_benchmark(
+        name=name,
+        iters=iters,
+        wall_time=wall_time,
+        extras={'lookups_per_second': int(ids.shape[0]) / wall_time})
+
+  def benchmarkEmbeddingLookup(self):
+    num_shards = 4
+    cpus = config.list_physical_devices('CPU')
+    config.set_logical_device_configuration(
+        cpus[0], [context.LogicalDeviceConfiguration()] * num_shards)
+    rows_per_shard = 250000
+    shards = []
+    for i in range(num_shards):
+      with ops.device('/cpu:%d' % i):
+        shards.append(
+            variables_lib.Variable(
+                random_ops.random_uniform([rows_per_shard, 64])))
+    s = sharded_variable.ShardedVariable(shards)
+
+    @def_function.function
+    def sharded_lookup(ids):
+      return s.embedding_lookup(ids)
+
+    @def_function.function
+    def concat_lookup(ids):
+      return embedding_ops.embedding_lookup(array_ops.concat(shards, 0), ids)
+
+    for batch_size in (1024, 65536):
+      ids = random_ops.random_uniform([batch_size],
+                                      maxval=num_shards * rows_per_shard,
+                                      dtype='int64')
+      self._run_benchmark('sharded_lookup_%d' % batch_size, sharded_lookup,
+                          ids)
+      self._run_benchmark('concat_lookup_%d' % batch_size, concat_lookup, ids)
+
+
 if __name__ == '__main__':
   v2_compat.enable_v2_behavior()
   test.main()
@@ -378,7 +378,10 @@ class _StateManagerImplV2(_StateManagerImpl):
     return var
 
 
-def _transform_features_v2(features, feature_columns, state_manager):
+def _transform_features_v2(features,
+                           feature_columns,
+                           state_manager,
+                           fuse_transformations=False):
   """Returns transformed features based on features columns passed in.
 
   Please note that most probably you would not need to use this function. Please
@@ -408,6 +411,9 @@ def _transform_features_v2(features, feature_columns, state_manager):
       corresponding `FeatureColumn`.
     feature_columns: An iterable containing all the `FeatureColumn`s.
     state_manager: A StateManager object that holds the FeatureColumn state.
+    fuse_transformations: If True, similar columns are transformed together
+      with `FeatureTransformationCache.transform_fused` before the remaining
+      columns are transformed one by one. Defaults to False.
 
   Returns:
     A `dict` mapping `FeatureColumn` to `Tensor` and `SparseTensor` values.
@@ -417,6 +423,8 @@ def _transform_features_v2(features, feature_columns, state_manager):
   with ops.name_scope(
       None, default_name='transform_features', values=features.values()):
     transformation_cache = FeatureTransformationCache(features)
+    if fuse_transformations:
+      transformation_cache.transform_fused(feature_columns, state_manager)
     for column in feature_columns:
       with ops.name_scope(
           None,
@@ -2286,6 +2294,10 @@ class FeatureTransformationCache(object):
   If we transform each column independently, then we'll get duplication of
   bucketization (one for cross, one for bucketization itself).
   The `FeatureTransformationCache` eliminates this duplication.
+
+  Models with many columns of the same kind can also call `transform_fused`
+  first, which transforms such columns together with a few batched ops instead
+  of a few ops per column.
   """
 
   def __init__(self, features):
@@ -2358,6 +2370,41 @@ class FeatureTransformationCache(object):
     self._feature_tensors[column] = transformed
     return transformed
 
+  def transform_fused(self, feature_columns, state_manager):
+    """Transforms groups of similar columns with batched ops.
+
+    Walks `feature_columns` and their parents, and groups the columns whose
+    transformation is a single elementwise op:
+
+      * `NumericColumn`s without `normalizer_fn` whose input is cast to
+        `float32`, grouped by input dtype.
+      * `BucketizedColumn`s of one-dimensional `NumericColumn`s, grouped by
+        boundaries.
+      * `HashedCategoricalColumn`s, grouped by `hash_bucket_size` and by
+        whether their input is a string.
+
+    The inputs of each group of two or more columns are concatenated,
+    transformed by one op and split again, and the results are cached, so that
+    subsequent calls to `get` return them. The results are the same as those of
+    transforming each column separately. Columns that cannot be fused, or that
+    are already cached, are left for `get`.
+
+    Args:
+      feature_columns: An iterable of `FeatureColumn`s.
+      state_manager: A StateManager object that holds the FeatureColumn state.
+    """
+    columns = collections.OrderedDict()
+    _collect_fusable_columns(feature_columns, columns)
+    columns = [
+        column for column in columns
+        if column not in self._features and column not in self._feature_tensors
+    ]
+    # Numeric columns first, since they may be the sources of bucketized ones.
+    for fuse_fn in (_fuse_numeric_columns, _fuse_bucketized_columns,
+                    _fuse_hashed_columns):
+      for column, transformed in fuse_fn(self, columns, state_manager):
+        self._feature_tensors[column] = transformed
+
   def _get_raw_feature_as_tensor(self, key):
     """Gets the raw_feature (keyed by `key`) as `tensor`.
 
@@ -2408,6 +2455,127 @@ class FeatureTransformationCache(object):
           lambda: feature_tensor)
 
 
+def _collect_fusable_columns(feature_columns, columns):
+  """Adds the fusable columns in `feature_columns` and their parents."""
+  for column in feature_columns:
+    if type(column) in (NumericColumn, BucketizedColumn,  # pylint: disable=unidiomatic-typecheck
+                        HashedCategoricalColumn):
+      if column in columns:
+        continue
+      columns[column] = None
+    # Only look through the columns defined here; the parents of other columns
+    # are not necessarily transformed through the cache.
+    if isinstance(column, (BucketizedColumn, CrossedColumn, EmbeddingColumn,
+                           IndicatorColumn, SequenceCategoricalColumn,
+                           SharedEmbeddingColumn, WeightedCategoricalColumn)):
+      _collect_fusable_columns(column.parents, columns)
+
+
+def _static_width(tensor):
+  """Returns the static second dimension of a rank 2 `Tensor`, or None."""
+  if (isinstance(tensor, sparse_tensor_lib.SparseTensor) or
+      tensor.shape.rank != 2):
+    return None
+  return tensor_shape.dimension_value(tensor.shape[1])
+
+
+def _fuse_dense(group, fn, name):
+  """Applies `fn` to the concatenation of rank 2 tensors and splits it.
+
+  Args:
+    group: A list of (column, rank 2 `Tensor`) pairs.
+    fn: An elementwise function of a `Tensor`.
+    name: A name scope for the ops.
+
+  Returns:
+    A list of (column, transformed `Tensor`) pairs.
+  """
+  columns, tensors = zip(*group)
+  with ops.name_scope(name):
+    fused = fn(array_ops.concat(tensors, axis=1))
+    outputs = array_ops.split(
+        fused, [_static_width(tensor) for tensor in tensors], axis=1)
+  return list(zip(columns, outputs))
+
+
+def _fuse_numeric_columns(transformation_cache, columns, state_manager):
+  """Casts the inputs of `NumericColumn`s to float32, batched by dtype."""
+  groups = collections.OrderedDict()
+  for column in columns:
+    if (type(column) is not NumericColumn or  # pylint: disable=unidiomatic-typecheck
+        column.normalizer_fn is not None or len(column.shape) != 1):
+      continue
+    input_tensor = transformation_cache.get(column.key, state_manager)
+    # A float32 input needs no op, and other inputs are left for
+    # `transform_feature` to handle, or to raise on.
+    if (_static_width(input_tensor) != column.shape[0] or
+        input_tensor.dtype == dtypes.float32):
+      continue
+    groups.setdefault(input_tensor.dtype, []).append((column, input_tensor))
+  for group in groups.values():
+    if len(group) > 1:
+      for fused in _fuse_dense(
+          group, lambda x: math_ops.cast(x, dtypes.float32), 'fused_numeric'):
+        yield fused
+
+
+def _fuse_bucketized_columns(transformation_cache, columns, state_manager):
+  """Bucketizes the sources of `BucketizedColumn`s, batched by boundaries."""
+  groups = collections.OrderedDict()
+  for column in columns:
+    if (type(column) is not BucketizedColumn or  # pylint: disable=unidiomatic-typecheck
+        type(column.source_column) is not NumericColumn or  # pylint: disable=unidiomatic-typecheck
+        len(column.source_column.shape) != 1):
+      continue
+    source_tensor = transformation_cache.get(column.source_column,
+                                             state_manager)
+    if _static_width(source_tensor) != column.source_column.shape[0]:
+      continue
+    groups.setdefault(tuple(column.boundaries), []).append(
+        (column, source_tensor))
+  for boundaries, group in groups.items():
+    if len(group) > 1:
+      bucketize = lambda x, b=boundaries: math_ops._bucketize(x, boundaries=b)  # pylint: disable=protected-access
+      for fused in _fuse_dense(group, bucketize, 'fused_bucketized'):
+        yield fused
+
+
+def _fuse_hashed_columns(transformation_cache, columns, state_manager):
+  """Hashes the values of `HashedCategoricalColumn`s, batched by bucket size."""
+  groups = collections.OrderedDict()
+  for column in columns:
+    if type(column) is not HashedCategoricalColumn:  # pylint: disable=unidiomatic-typecheck
+      continue
+    input_tensor = transformation_cache.get(column.key, state_manager)
+    if not isinstance(input_tensor, sparse_tensor_lib.SparseTensor):
+      # Dense inputs are converted per column, so there is little to save.
+      continue
+    try:
+      column._check_input_tensor(input_tensor)  # pylint: disable=protected-access
+    except ValueError:
+      continue
+    key = (column.hash_bucket_size, column.dtype == dtypes.string)
+    groups.setdefault(key, []).append((column, input_tensor))
+  for (hash_bucket_size, is_string), group in groups.items():
+    if len(group) < 2:
+      continue
+    columns, input_tensors = zip(*group)
+    with ops.name_scope('fused_hashed'):
+      values = [input_tensor.values for input_tensor in input_tensors]
+      sizes = array_ops.concat([array_ops.shape(v) for v in values], axis=0)
+      if is_string:
+        values = array_ops.concat(values, axis=0)
+      else:
+        values = string_ops.as_string(array_ops.concat(
+            [math_ops.cast(v, dtypes.int64) for v in values], axis=0))
+      sparse_id_values = string_ops.string_to_hash_bucket_fast(
+          values, hash_bucket_size, name='lookup')
+      outputs = array_ops.split(sparse_id_values, sizes, num=len(group))
+    for column, input_tensor, output in zip(columns, input_tensors, outputs):
+      yield column, sparse_tensor_lib.SparseTensor(
+          input_tensor.indices, output, input_tensor.dense_shape)
+
+
 # TODO(ptucker): Move to third_party/tensorflow/python/ops/sparse_ops.py
 def _to_sparse_input_and_drop_ignore_values(input_tensor, ignore_value=None):
   """Converts a `Tensor` to a `SparseTensor`, dropping ignore_value cells.
@@ -3247,6 +3415,117 @@ class SharedEmbeddingColumn(
     return [self.categorical_column]
 
 
+_SPARSE_SEGMENT_REDUCERS = {
+    'sum': math_ops.sparse_segment_sum,
+    'mean': math_ops.sparse_segment_mean,
+    'sqrtn': math_ops.sparse_segment_sqrt_n,
+}
+
+
+def _fused_embedding_lookups(feature_columns, transformation_cache,
+                             state_manager):
+  """Looks up groups of embedding columns in combined tables.
+
+  `EmbeddingColumn`s and `SharedEmbeddingColumn`s with the same dimension and
+  combiner, no `max_norm` and unweighted rank 2 ids are grouped. For each group
+  of two or more columns, the unique ids of each table are gathered from it,
+  the gathered rows are concatenated, and all columns are reduced by one sparse
+  segment reduction. The tables themselves are never copied, so the cost per
+  batch is one gather per table plus the size of the looked up rows, not the
+  size of the tables. Each table is still its own variable, so checkpoints and
+  variable names don't change, and gradients remain sparse.
+
+  As with `safe_embedding_lookup_sparse`, negative ids are dropped and rows
+  without ids are looked up as zeros.
+
+  Args:
+    feature_columns: An iterable of `FeatureColumn`s. Other columns are
+      ignored.
+    transformation_cache: A `FeatureTransformationCache` object to access
+      features.
+    state_manager: A `StateManager` holding the embedding variables.
+
+  Returns:
+    A dict mapping each fused column to its embedding lookup result.
+  """
+  groups = collections.OrderedDict()
+  for column in feature_columns:
+    if type(column) is EmbeddingColumn:  # pylint: disable=unidiomatic-typecheck
+      if column.ckpt_to_load_from is not None:
+        continue
+      dimension = column.dimension
+      table = state_manager.get_variable(column, name='embedding_weights')
+    elif type(column) is SharedEmbeddingColumn:  # pylint: disable=unidiomatic-typecheck
+      dimension = column.shared_embedding_column_creator.dimension
+      table = column.shared_embedding_column_creator.embedding_weights
+    else:
+      continue
+    if (column.max_norm is not None or
+        column.combiner not in _SPARSE_SEGMENT_REDUCERS or
+        isinstance(column.categorical_column, SequenceCategoricalColumn) or
+        isinstance(table, (list, variables.PartitionedVariable))):
+      continue
+    sparse_tensors = column.categorical_column.get_sparse_tensors(
+        transformation_cache, state_manager)
+    sparse_ids = sparse_tensors.id_tensor
+    if (sparse_tensors.weight_tensor is not None or
+        tensor_shape.dimension_value(
+            sparse_ids.dense_shape.get_shape()[0]) != 2):
+      continue
+    groups.setdefault((dimension, column.combiner), []).append(
+        (column, table, sparse_ids))
+
+  outputs = {}
+  for (_, combiner), group in groups.items():
+    if len(group) < 2:
+      continue
+    # Maps each table, looked up once even if shared, to the positions of its
+    # columns in the group.
+    table_positions = collections.OrderedDict()
+    for position, (_, table, _) in enumerate(group):
+      table_positions.setdefault(id(table), (table, []))[1].append(position)
+    with ops.name_scope('fused_embedding_lookup'):
+      column_ids = []
+      segment_ids = []
+      batch_sizes = []
+      num_segments = 0
+      for _, _, sparse_ids in group:
+        ids = math_ops.cast(sparse_ids.values, dtypes.int64)
+        is_valid = math_ops.greater_equal(ids, 0)
+        column_ids.append(array_ops.boolean_mask(ids, is_valid))
+        segment_ids.append(
+            array_ops.boolean_mask(sparse_ids.indices[:, 0], is_valid) +
+            num_segments)
+        batch_size = sparse_ids.dense_shape[0]
+        batch_sizes.append(batch_size)
+        num_segments += batch_size
+      # Rows are gathered from each table with its own ids, and the indices of
+      # each column point into the concatenation of the gathered rows.
+      embeddings = []
+      column_indices = [None] * len(group)
+      num_rows = 0
+      for table, positions in table_positions.values():
+        unique_ids, idx = array_ops.unique(
+            array_ops.concat([column_ids[i] for i in positions], axis=0))
+        embeddings.append(array_ops.gather(table, unique_ids))
+        sizes = array_ops.stack(
+            [array_ops.size(column_ids[i]) for i in positions])
+        for position, indices in zip(
+            positions, array_ops.split(idx, sizes, num=len(positions))):
+          column_indices[position] = indices + num_rows
+        num_rows += array_ops.size(unique_ids)
+      result = _SPARSE_SEGMENT_REDUCERS[combiner](
+          array_ops.concat(embeddings, axis=0),
+          array_ops.concat(column_indices, axis=0),
+          math_ops.cast(array_ops.concat(segment_ids, axis=0), dtypes.int32),
+          num_segments=math_ops.cast(num_segments, dtypes.int32))
+      results = array_ops.split(
+          result, array_ops.stack(batch_sizes), num=len(group))
+    for (column, _, _), column_result in zip(group, results):
+      outputs[column] = column_result
+  return outputs
+
+
 def _check_shape(shape, key):
   """Returns shape if it's valid, raises error otherwise."""
   assert shape is not None
@@ -3290,8 +3569,8 @@ class HashedCategoricalColumn(
   def _parse_example_spec(self):
     return self.parse_example_spec
 
-  def _transform_input_tensor(self, input_tensor):
-    """Hashes the values in the feature_column."""
+  def _check_input_tensor(self, input_tensor):
+    """Raises ValueError if `input_tensor` can't be hashed by this column."""
     if not isinstance(input_tensor, sparse_tensor_lib.SparseTensor):
       raise ValueError('SparseColumn input must be a SparseTensor.')
 
@@ -3305,6 +3584,9 @@ class HashedCategoricalColumn(
           'key: {}, column dtype: {}, tensor dtype: {}'.format(
               self.key, self.dtype, input_tensor.dtype))
 
+  def _transform_input_tensor(self, input_tensor):
+    """Hashes the values in the feature_column."""
+    self._check_input_tensor(input_tensor)
     if self.dtype == dtypes.string:
       sparse_values = input_tensor.values
     else:
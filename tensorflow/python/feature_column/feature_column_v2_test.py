@@ -20,6 +20,7 @@ from __future__ import print_function
 
 import collections
 import copy
+import time
 
 from absl.testing import parameterized
 import numpy as np
@@ -4318,6 +4319,147 @@ class TransformFeaturesTest(test.TestCase):
       self.assertEqual(0, column1.call_order)
       self.assertEqual(1, column2.call_order)
 
+  def test_fuse_transformations_is_opt_in(self):
+    bucketized_a = fc.bucketized_column(
+        fc.numeric_column('price_a'), boundaries=[0, 2, 4, 6])
+    bucketized_b = fc.bucketized_column(
+        fc.numeric_column('price_b'), boundaries=[0, 2, 4, 6])
+    features = {'price_a': [[-1.], [5.]], 'price_b': [[3.], [7.]]}
+    for fuse, num_bucketize in ((False, 2), (True, 1)):
+      with ops.Graph().as_default() as g:
+        transformed = fc._transform_features_v2(
+            features, [bucketized_a, bucketized_b], None,
+            fuse_transformations=fuse)
+        op_types = [op.type for op in g.get_operations()]
+        self.assertEqual(num_bucketize, op_types.count('Bucketize'))
+        self.assertAllEqual([[0], [3]],
+                            self.evaluate(transformed[bucketized_a]))
+        self.assertAllEqual([[2], [4]],
+                            self.evaluate(transformed[bucketized_b]))
+
+  def test_fused_transformations(self):
+    price_a = fc.numeric_column('price_a', dtype=dtypes.int64)
+    price_b = fc.numeric_column('price_b', shape=(2,), dtype=dtypes.int64)
+    bucketized_a = fc.bucketized_column(price_a, boundaries=[0, 2, 4, 6])
+    bucketized_b = fc.bucketized_column(price_b, boundaries=[0, 2, 4, 6])
+    wire = fc.categorical_column_with_hash_bucket('wire', 10)
+    cabbage = fc.categorical_column_with_hash_bucket('cabbage', 10)
+    ids_a = fc.categorical_column_with_hash_bucket(
+        'ids_a', 10, dtype=dtypes.int64)
+    ids_b = fc.categorical_column_with_hash_bucket(
+        'ids_b', 10, dtype=dtypes.int32)
+    # The embedding column is not fused itself, but its parent is.
+    cabbage_embedding = fc.embedding_column(cabbage, dimension=2)
+    columns = [price_a, price_b, bucketized_a, bucketized_b, wire, cabbage,
+               ids_a, ids_b]
+
+    def make_features():
+      return {
+          'price_a': constant_op.constant([[-1], [5]], dtype=dtypes.int64),
+          'price_b': constant_op.constant([[1, 3], [7, 0]], dtype=dtypes.int64),
+          'wire': sparse_tensor.SparseTensor(
+              values=['omar', 'stringer', 'marlo'],
+              indices=[[0, 0], [1, 0], [1, 1]],
+              dense_shape=[2, 2]),
+          'cabbage': sparse_tensor.SparseTensor(
+              values=['kale'], indices=[[1, 0]], dense_shape=[2, 1]),
+          'ids_a': sparse_tensor.SparseTensor(
+              values=constant_op.constant([11, 12], dtype=dtypes.int64),
+              indices=[[0, 0], [0, 1]],
+              dense_shape=[2, 2]),
+          'ids_b': sparse_tensor.SparseTensor(
+              values=constant_op.constant([13], dtype=dtypes.int32),
+              indices=[[1, 0]],
+              dense_shape=[2, 1]),
+      }
+
+    with ops.Graph().as_default() as g:
+      transformation_cache = fc.FeatureTransformationCache(make_features())
+      transformation_cache.transform_fused(
+          columns[:-3] + [ids_a, ids_b, cabbage_embedding], None)
+      fused = [transformation_cache.get(c, None) for c in columns]
+      op_types = [op.type for op in g.get_operations()]
+      self.assertEqual(1, op_types.count('Bucketize'))
+      # One hash for the string columns and one for the integer columns.
+      self.assertEqual(2, op_types.count('StringToHashBucketFast'))
+
+      transformation_cache = fc.FeatureTransformationCache(make_features())
+      expected = [transformation_cache.get(c, None) for c in columns]
+      fused, expected = self.evaluate((fused, expected))
+      for column, fused_value, expected_value in zip(columns, fused, expected):
+        if isinstance(column, fc.HashedCategoricalColumn):
+          self.assertAllEqual(expected_value.indices, fused_value.indices)
+          self.assertAllEqual(expected_value.values, fused_value.values)
+          self.assertAllEqual(expected_value.dense_shape,
+                              fused_value.dense_shape)
+        else:
+          self.assertAllEqual(expected_value, fused_value)
+
+  def test_fused_transformations_skip_single_columns(self):
+    hashed = fc.categorical_column_with_hash_bucket('wire', 10)
+    bucketized = fc.bucketized_column(
+        fc.numeric_column('price'), boundaries=[0, 2, 4, 6])
+    with ops.Graph().as_default() as g:
+      features = {
+          'price': [[-1.], [5.]],
+          'wire': sparse_tensor.SparseTensor(
+              values=['omar'], indices=[[0, 0]], dense_shape=[2, 1]),
+      }
+      transformation_cache = fc.FeatureTransformationCache(features)
+      transformation_cache.transform_fused([hashed, bucketized], None)
+      op_types = [op.type for op in g.get_operations()]
+      self.assertNotIn('Bucketize', op_types)
+      self.assertNotIn('StringToHashBucketFast', op_types)
+
+
+class FusedTransformationBenchmark(test.Benchmark):
+  """Compares fused and per-column transforms of wide and deep features."""
+
+  def _build(self, num_columns, batch_size, fused):
+    columns = []
+    features = {}
+    for i in range(num_columns):
+      numeric = fc.numeric_column('numeric_%d' % i, dtype=dtypes.int64)
+      columns.append(numeric)
+      columns.append(fc.bucketized_column(numeric, boundaries=[0, 10, 100]))
+      columns.append(fc.categorical_column_with_hash_bucket(
+          'hashed_%d' % i, 1000, dtype=dtypes.int64))
+      features['numeric_%d' % i] = constant_op.constant(
+          np.arange(batch_size).reshape(batch_size, 1), dtype=dtypes.int64)
+      features['hashed_%d' % i] = sparse_tensor.SparseTensor(
+          indices=[[j, 0] for j in range(batch_size)],
+          values=constant_op.constant(np.arange(batch_size), dtypes.int64),
+          dense_shape=[batch_size, 1])
+    transformation_cache = fc.FeatureTransformationCache(features)
+    if fused:
+      transformation_cache.transform_fused(columns, None)
+    outputs = [transformation_cache.get(c, None) for c in columns]
+    return [o.values if isinstance(o, sparse_tensor.SparseTensor) else o
+            for o in outputs]
+
+  def benchmark_wide_and_deep_transform(self):
+    num_columns = 200
+    batch_size = 256
+    iters = 20
+    for fused in (False, True):
+      with ops.Graph().as_default() as g:
+        outputs = self._build(num_columns, batch_size, fused)
+        num_ops = len(g.get_operations())
+        with session.Session() as sess:
+          sess.run(outputs)
+          start = time.time()
+          for _ in range(iters):
+            sess.run(outputs)
+          wall_time = (time.time() - start) / iters
+      self.report_benchmark(
+          name='wide_and_deep_transform_%s' % ('fused' if fused else 'unfused'),
+          iters=iters,
+          wall_time=wall_time,
+          extras={
+              'num_columns': 3 * num_columns,
+              'num_ops': num_ops,
+          })
+
 
 class IndicatorColumnTest(test.TestCase):
 
@@ -19,6 +19,12 @@ from __future__ import division
 from __future__ import print_function
 
 import collections
+import contextlib
+import os
+import re
+import tempfile
+
+from concurrent import futures
 import numpy as np
 
 from tensorflow.core.framework import attr_value_pb2
@@ -33,8 +39,10 @@ from tensorflow.python.framework import graph_util
 from tensorflow.python.framework import ops
 from tensorflow.python.framework import tensor_util
 from tensorflow.python.grappler import tf_optimizer
+from tensorflow.python.lib.io import file_io
 from tensorflow.python.ops import array_ops
 from tensorflow.python.training.saver import export_meta_graph
+from tensorflow.python.util import compat
 from tensorflow.python.util import lazy_loader
 from tensorflow.python.util import object_identity
 
@@ -49,12 +57,27 @@ _CONDITIONAL_OPS = set(["If", "StatelessIf"])
 _LOOP_OPS = set(["While", "StatelessWhile"])
 _CONTROL_FLOW_OPS = _CONDITIONAL_OPS.union(_LOOP_OPS)
 
+# Characters that are not allowed in weights file names.
+_INVALID_FILENAME_CHARS = re.compile(r"[^A-Za-z0-9_.]")
+
 
 class _TensorData(
-    collections.namedtuple("_TensorData", ["numpy", "dtype", "index"])):
-  """Data about a tensor that was converted to a constant."""
+    collections.namedtuple(
+        "_TensorData",
+        ["numpy", "dtype", "index", "shape", "memory_region_name"])):
+  """Data about a tensor that was converted to a constant.
+
+  If `memory_region_name` is set, the value was written to that file and is
+  loaded by an `ImmutableConst` node; `numpy` is then None.
+  """
   __slots__ = ()
 
+  def __new__(cls, numpy, dtype, index, shape=None, memory_region_name=None):
+    if shape is None:
+      shape = numpy.shape
+    return super(_TensorData, cls).__new__(cls, numpy, dtype, index, shape,
+                                           memory_region_name)
+
   @property
   def dtype_attr(self):
     return attr_value_pb2.AttrValue(type=self.dtype)
@@ -376,16 +399,25 @@ class _VarHandle(_Node):
   """Specialization of _Node to VarHandleOp."""
 
   def convert_variable_to_constant(self, incoming_edge, tensor_data):
-    tensor_proto = tensor_util.make_tensor_proto(tensor_data.numpy,
-                                                 tensor_data.dtype,
-                                                 tensor_data.numpy.shape)
-
     node = self.converted_self().node
     node.Clear()
     node.name = self._node.name
-    node.op = "Const"
     node.attr["dtype"].CopyFrom(tensor_data.dtype_attr)
-    node.attr["value"].tensor.CopyFrom(tensor_proto)
+    if tensor_data.memory_region_name is None:
+      tensor_proto = tensor_util.make_tensor_proto(tensor_data.numpy,
+                                                   tensor_data.dtype,
+                                                   tensor_data.shape)
+      node.op = "Const"
+      node.attr["value"].tensor.CopyFrom(tensor_proto)
+    else:
+      node.op = "ImmutableConst"
+      node.attr["shape"].shape.CopyFrom(
+          tensor_shape_pb2.TensorShapeProto(dim=[
+              tensor_shape_pb2.TensorShapeProto.Dim(size=dim)
+              for dim in tensor_data.shape
+          ]))
+      node.attr["memory_region_name"].s = compat.as_bytes(
+          tensor_data.memory_region_name)
 
     for edge in self.outgoing_edges:
       edge.destination.convertible.convert_variable_to_constant(
@@ -616,7 +648,7 @@ class _While(_FunctionCaller):
         incoming_edge.destination.index].CopyFrom(
             tensor_shape_pb2.TensorShapeProto(dim=[
                 tensor_shape_pb2.TensorShapeProto.Dim(size=dim)
-                for dim in tensor_data.numpy.shape
+                for dim in tensor_data.shape
             ]))
     # The while's body inputs and outputs have the same type, so here we can go
     # ahead and change that function's output type.
@@ -700,6 +732,106 @@ class _GraphDef(_Convertible):
       f.create_edges()
 
 
+class _WeightsWriter(object):
+  """Streams converted values to files that `ImmutableConst` nodes load.
+
+  Each value is written to its own file in a new subdirectory of
+  `weights_dir`, so conversions into the same directory never overwrite the
+  files of earlier frozen graphs. The `ImmutableConst` kernel memory-maps the
+  file when the graph runs, so the frozen graph holds no
+  weights and the values are never copied into a `GraphDef`. Files are written
+  on a background thread while the caller fetches the next value; at most one
+  value is waiting to be written, so no more than two values are held in
+  memory at a time.
+  """
+
+  def __init__(self, weights_dir):
+    # ImmutableConst memory-maps its file, so only local paths are supported.
+    weights_dir = os.path.abspath(compat.as_str(weights_dir))
+    file_io.recursive_create_dir(weights_dir)
+    self._weights_dir = tempfile.mkdtemp(prefix="weights_", dir=weights_dir)
+    self._executor = futures.ThreadPoolExecutor(max_workers=1)
+    self._pending = None
+    self._num_written = 0
+
+  def write(self, name, value):
+    """Schedules `value` to be written, returns the path it will be read from.
+
+    Args:
+      name: The name of the converted tensor, used in the file name.
+      value: A numpy array.
+
+    Returns:
+      The file path.
+    """
+    filename = "%d_%s" % (self._num_written,
+                          _INVALID_FILENAME_CHARS.sub("_", name))
+    path = os.path.join(self._weights_dir, filename)
+    self._num_written += 1
+    self._wait()
+    self._pending = self._executor.submit(_write_weights_file, path, value)
+    return path
+
+  def _wait(self):
+    if self._pending is not None:
+      pending, self._pending = self._pending, None
+      pending.result()
+
+  def close(self):
+    """Waits for all values to be written."""
+    try:
+      self._wait()
+    finally:
+      self._executor.shutdown()
+
+
+def _write_weights_file(path, value):
+  with open(path, "wb") as f:
+    # `tofile` writes in C order without making a contiguous copy first.
+    value.tofile(f)
+
+
+@contextlib.contextmanager
+def _maybe_weights_writer(weights_dir):
+  """Yields a _WeightsWriter for `weights_dir`, or None if it is None."""
+  if weights_dir is None:
+    yield None
+    return
+  writer = _WeightsWriter(weights_dir)
+  try:
+    yield writer
+  finally:
+    writer.close()
+
+
+def _new_tensor_data(name, value, dtype, index, weights_writer):
+  """Creates the _TensorData for `value`, streaming it out if possible.
+
+  Strings and empty tensors have no flat buffer to memory-map, so they are
+  always embedded in the graph.
+
+  Args:
+    name: The name of the converted tensor.
+    value: A numpy array.
+    dtype: The DataType enum of the tensor.
+    index: The index of the captured input, or None.
+    weights_writer: A _WeightsWriter, or None to embed the value.
+
+  Returns:
+    A _TensorData.
+  """
+  if (weights_writer is None or dtype == dtypes.string.as_datatype_enum or
+      not value.size):
+    return _TensorData(numpy=value, dtype=dtype, index=index)
+  value = np.asarray(value)
+  return _TensorData(
+      numpy=None,
+      dtype=dtype,
+      index=index,
+      shape=value.shape,
+      memory_region_name=weights_writer.write(name, value))
+
+
 class _ConverterData(object):
   """Container for constant conversion supporting data.
 
@@ -777,7 +909,8 @@ class _FunctionConverterData(_ConverterData):
                lower_control_flow,
                aggressive_inlining,
                variable_names_whitelist=None,
-               variable_names_blacklist=None):
+               variable_names_blacklist=None,
+               weights_dir=None):
     """Creates the conversion data for the given function.
 
     Args:
@@ -791,6 +924,9 @@ class _FunctionConverterData(_ConverterData):
         default, all variables are converted).
       variable_names_blacklist: The set of variable names to omit converting to
         constants.
+      weights_dir: If set, variable values are written to files in this
+        directory and loaded by `ImmutableConst` nodes instead of being
+        embedded in the graph.
     """
 
     self._func = func
@@ -801,9 +937,10 @@ class _FunctionConverterData(_ConverterData):
         graph_def,
         variable_names_whitelist=variable_names_whitelist,
         variable_names_blacklist=variable_names_blacklist)
-    self._build_tensor_data()
+    with _maybe_weights_writer(weights_dir) as weights_writer:
+      self._build_tensor_data(weights_writer)
 
-  def _build_tensor_data(self):
+  def _build_tensor_data(self, weights_writer):
     """Caches the tensor data for all Placeholders in the given function."""
     map_index_to_variable = {}
     for var in self._func.graph.variables:
@@ -821,10 +958,12 @@ class _FunctionConverterData(_ConverterData):
         data = map_index_to_variable[idx].numpy()
       else:
         data = val_tensor.numpy()
-      self._tensor_data[tensor_name] = _TensorData(
-          numpy=data,
+      self._tensor_data[tensor_name] = _new_tensor_data(
+          tensor_name,
+          data,
           dtype=dtypes.as_dtype(data.dtype).as_datatype_enum,
-          index=idx)
+          index=idx,
+          weights_writer=weights_writer)
 
     # Get data for VariableV2 ops (reference variables) that cannot be lifted.
     for node in self.node_defs.values():
@@ -836,10 +975,12 @@ class _FunctionConverterData(_ConverterData):
             identity_node = array_ops.identity(
                 self._func.graph.as_graph_element(node.name + ":0"))
           pruned_graph = self._func.prune([], [identity_node.name])()[0]
-          self._tensor_data[node.name] = _TensorData(
-              numpy=pruned_graph.numpy(),
+          self._tensor_data[node.name] = _new_tensor_data(
+              node.name,
+              pruned_graph.numpy(),
               dtype=node.attr["dtype"].type,
-              index=None)
+              index=None,
+              weights_writer=weights_writer)
 
 
 class _SessionConverterData(_ConverterData):
@@ -850,7 +991,8 @@ class _SessionConverterData(_ConverterData):
                graph_def,
                output_node_names,
                variable_names_whitelist=None,
-               variable_names_blacklist=None):
+               variable_names_blacklist=None,
+               weights_dir=None):
     graph_def = graph_util.extract_sub_graph(graph_def, output_node_names)
     super(_SessionConverterData, self).__init__(
         graph_def,
@@ -869,11 +1011,23 @@ class _SessionConverterData(_ConverterData):
         nodes_to_convert.append(node)
         tensor_names_to_convert.append(tensor_name + ":0")
 
-    if tensor_names_to_convert:
-      converted_tensors = session.run(tensor_names_to_convert)
+    if not tensor_names_to_convert:
+      return
+    with _maybe_weights_writer(weights_dir) as weights_writer:
+      if weights_writer is None:
+        converted_tensors = session.run(tensor_names_to_convert)
+      else:
+        # Fetch one value at a time so that only the values being written are
+        # held in memory.
+        converted_tensors = (
+            session.run(name) for name in tensor_names_to_convert)
       for node, tensor_value in zip(nodes_to_convert, converted_tensors):
-        self._tensor_data[node.name] = _TensorData(
-            numpy=tensor_value, dtype=node.attr["dtype"].type, index=None)
+        self._tensor_data[node.name] = _new_tensor_data(
+            node.name,
+            tensor_value,
+            dtype=node.attr["dtype"].type,
+            index=None,
+            weights_writer=weights_writer)
 
 
 def disable_lower_using_switch_merge(graph_def):
@@ -1039,7 +1193,8 @@ def _replace_variables_by_constants(converter_data):
 
 def convert_variables_to_constants_v2(func,
                                       lower_control_flow=True,
-                                      aggressive_inlining=False):
+                                      aggressive_inlining=False,
+                                      weights_dir=None):
   """Replaces all the variables in a graph with constants of the same values.
 
   TensorFlow 2.0 function for converting all Variable ops into Const ops holding
@@ -1058,6 +1213,13 @@ def convert_variables_to_constants_v2(func,
     aggressive_inlining: Boolean indicating whether or not to to aggressive
       function inlining (might be unsafe if function has stateful ops, not
       properly connected to control outputs). (default False)
+    weights_dir: If set, variable values are streamed to files in a new
+      subdirectory of this directory, one file per variable and one
+      subdirectory per conversion, and the frozen graph loads them with
+      memory-mapped `ImmutableConst` ops instead of embedding them in `Const`
+      nodes. This keeps the graph small and avoids holding more than two
+      variable values in memory at a time. The graph refers to the files by
+      absolute path, so the directory must not be moved. (default None)
 
   Returns:
     ConcreteFunction containing a simplified version of the original.
@@ -1066,7 +1228,8 @@ def convert_variables_to_constants_v2(func,
   converter_data = _FunctionConverterData(
       func=func,
       lower_control_flow=lower_control_flow,
-      aggressive_inlining=aggressive_inlining)
+      aggressive_inlining=aggressive_inlining,
+      weights_dir=weights_dir)
 
   output_graph_def, converted_input_indices = _replace_variables_by_constants(
       converter_data=converter_data)
@@ -1077,7 +1240,8 @@ def convert_variables_to_constants_v2(func,
 
 def convert_variables_to_constants_v2_as_graph(func,
                                                lower_control_flow=True,
-                                               aggressive_inlining=False):
+                                               aggressive_inlining=False,
+                                               weights_dir=None):
   """Replaces all the variables in a graph with constants of the same values.
 
   This function works as same as convert_variables_to_constants_v2, but it
@@ -1091,6 +1255,13 @@ def convert_variables_to_constants_v2_as_graph(func,
     aggressive_inlining: Boolean indicating whether or not to to aggressive
       function inlining (might be unsafe if function has stateful ops, not
       properly connected to control outputs).
+    weights_dir: If set, variable values are streamed to files in a new
+      subdirectory of this directory, one file per variable and one
+      subdirectory per conversion, and the frozen graph loads them with
+      memory-mapped `ImmutableConst` ops instead of embedding them in `Const`
+      nodes. This keeps the graph small and avoids holding more than two
+      variable values in memory at a time. The graph refers to the files by
+      absolute path, so the directory must not be moved.
 
   Returns:
     ConcreteFunction containing a simplified version of the original, and also
@@ -1100,7 +1271,8 @@ def convert_variables_to_constants_v2_as_graph(func,
   converter_data = _FunctionConverterData(
       func=func,
       lower_control_flow=lower_control_flow,
-      aggressive_inlining=aggressive_inlining)
+      aggressive_inlining=aggressive_inlining,
+      weights_dir=weights_dir)
 
   output_graph_def, converted_input_indices = _replace_variables_by_constants(
       converter_data=converter_data)
@@ -1115,7 +1287,8 @@ def convert_variables_to_constants_from_session_graph(
     graph_def,
     output_node_names,
     variable_names_whitelist=None,
-    variable_names_blacklist=None):
+    variable_names_blacklist=None,
+    weights_dir=None):
   """Replaces all the variables in a graph with constants of the same values.
 
   This function works similarly to convert_variables_to_constants_v2, but it
@@ -1133,6 +1306,13 @@ def convert_variables_to_constants_from_session_graph(
       all variables are converted).
     variable_names_blacklist: The set of variable names to omit converting to
       constants.
+    weights_dir: If set, variable values are streamed to files in a new
+      subdirectory of this directory, one file per variable and one
+      subdirectory per conversion, and the frozen graph loads them with
+      memory-mapped `ImmutableConst` ops instead of embedding them in `Const`
+      nodes. This keeps the graph small and avoids holding more than two
+      variable values in memory at a time. The graph refers to the files by
+      absolute path, so the directory must not be moved.
 
   Returns:
     An optimized GraphDef.
@@ -1143,5 +1323,6 @@ def convert_variables_to_constants_from_session_graph(
           graph_def=graph_def,
           output_node_names=output_node_names,
           variable_names_whitelist=variable_names_whitelist,
-          variable_names_blacklist=variable_names_blacklist))
+          variable_names_blacklist=variable_names_blacklist,
+          weights_dir=weights_dir))
   return graph_def
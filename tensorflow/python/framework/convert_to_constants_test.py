@@ -243,6 +243,44 @@ class VariablesToConstantsTest(test.TestCase):
         input_func)
     self._testConvertedFunction(root, root.f, output_func, input_data)
 
+  @test_util.run_v2_only
+  def testVariableModelWithWeightsDir(self):
+    """Test streaming variable values to a weights directory."""
+    input_data = {"x": constant_op.constant(1., shape=[2])}
+    root = tracking.AutoTrackable()
+    root.v1 = variables.Variable([3., 4.])
+    root.v2 = variables.Variable(2.)
+    root.f = def_function.function(lambda x: root.v1 * root.v2 * x)
+    input_func = root.f.get_concrete_function(input_data["x"])
+
+    weights_dir = os.path.join(self.get_temp_dir(), "weights")
+    output_func = convert_to_constants.convert_variables_to_constants_v2(
+        input_func, weights_dir=weights_dir)
+
+    constant_graph_def = output_func.graph.as_graph_def()
+    immutable_consts = [
+        node for node in constant_graph_def.node
+        if node.op == "ImmutableConst"
+    ]
+    self.assertLen(immutable_consts, 2)
+    conversion_dir, = os.listdir(weights_dir)
+    self.assertLen(os.listdir(os.path.join(weights_dir, conversion_dir)), 2)
+    for node in immutable_consts:
+      self.assertTrue(
+          os.path.exists(node.attr["memory_region_name"].s.decode("utf-8")))
+    self._testConvertedFunction(root, root.f, output_func, input_data)
+
+    # A second conversion into the same directory leaves the files of the
+    # first one alone.
+    root.v2.assign(5.)
+    second_output_func = (
+        convert_to_constants.convert_variables_to_constants_v2(
+            input_func, weights_dir=weights_dir))
+    self.assertLen(os.listdir(weights_dir), 2)
+    self.assertAllClose([6., 8.], nest.flatten(output_func(**input_data))[0])
+    self.assertAllClose([15., 20.],
+                        nest.flatten(second_output_func(**input_data))[0])
+
   @test_util.run_v2_only
   def testScalarModel(self):
     """Test a basic model with Variables."""
@@ -783,6 +821,40 @@ class ConvertVariablesToConstantsSessionTest(test.TestCase):
               attr { key: "T" value { type: DT_FLOAT } }
             }""")
 
+  def testConvertWithWeightsDir(self):
+    """Tests streaming variable values to files from a Session."""
+    weights_dir = os.path.join(self.get_temp_dir(), "session_weights")
+    with ops.Graph().as_default():
+      with variable_scope.variable_scope("", use_resource=True):
+        x = variable_scope.get_variable("x", initializer=[1.0, 2.0])
+      _ = math_ops.multiply(x, 2.0, name="output_node")
+      with session_lib.Session() as sess:
+        sess.run(variables.global_variables_initializer())
+        variable_graph_def = sess.graph.as_graph_def()
+        constant_graph_defs = [
+            convert_to_constants
+            .convert_variables_to_constants_from_session_graph(
+                sess, variable_graph_def, ["output_node"],
+                weights_dir=weights_dir) for _ in range(2)
+        ]
+
+    # Each conversion writes its own files.
+    self.assertLen(os.listdir(weights_dir), 2)
+    paths = set()
+    for constant_graph_def in constant_graph_defs:
+      self._ensure_no_variables_in_graph(constant_graph_def)
+      immutable_const, = [
+          node for node in constant_graph_def.node
+          if node.op == "ImmutableConst"
+      ]
+      paths.add(immutable_const.attr["memory_region_name"].s)
+      with ops.Graph().as_default():
+        output = importer.import_graph_def(
+            constant_graph_def, return_elements=["output_node:0"], name="")
+        with session_lib.Session() as sess:
+          self.assertAllClose([2.0, 4.0], sess.run(output[0]))
+    self.assertLen(paths, 2)
+
   def testConvertOneVariableOfTwo(self):
     """Tests that one variable can be kept unconverted."""
     with ops.Graph().as_default():
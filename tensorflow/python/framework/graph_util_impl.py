@@ -18,7 +18,6 @@
 from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
-import copy
 import re
 
 import six
@@ -26,6 +25,7 @@ import six
 from tensorflow.core.framework import graph_pb2
 from tensorflow.core.framework import node_def_pb2
 from tensorflow.python.framework import dtypes
+from tensorflow.python.framework import indexed_graph
 from tensorflow.python.framework import ops
 from tensorflow.python.util import deprecation
 from tensorflow.python.util import lazy_loader
@@ -120,10 +120,7 @@ def must_run_on_cpu(node, pin_variables_on_cpu=False):
 
 
 def _node_name(n):
-  if n.startswith("^"):
-    return n[1:]
-  else:
-    return n.split(":")[0]
+  return indexed_graph.node_name(n)
 
 
 def _get_colocated_node_name(colocated_node_name):
@@ -135,51 +132,67 @@ def _get_colocated_node_name(colocated_node_name):
 
 
 def _extract_graph_summary(graph_def):
-  """Extracts useful information from the graph and returns them."""
+  """Extracts useful information from the graph and returns them.
+
+  Kept for callers outside this module, such as tf.lite's op_hint. New code
+  should use `indexed_graph.IndexedGraph` directly.
+
+  Args:
+    graph_def: A `GraphDef`.
+
+  Returns:
+    A tuple of dicts keyed by node name: the names of the inputs (including
+    colocated nodes) of each node, the `NodeDef`s, and the position of each
+    node in the graph.
+  """
+  graph = indexed_graph.IndexedGraph(graph_def)
   name_to_input_name = {}  # Keyed by the dest node name.
   name_to_node = {}  # Keyed by node name.
-
   # Keeps track of node sequences. It is important to still output the
   # operations in the original order.
   name_to_seq_num = {}  # Keyed by node name.
-  seq = 0
-  for node in graph_def.node:
-    n = _node_name(node.name)
-    name_to_node[n] = node
-    name_to_input_name[n] = [_node_name(x) for x in node.input]
-    # Prevent colocated nodes from being lost.
-    if "_class" in node.attr:
-      for colocated_node_name in node.attr["_class"].list.s:
-        name_to_input_name[n].append(
-            _get_colocated_node_name(colocated_node_name))
-    name_to_seq_num[n] = seq
-    seq += 1
+  for seq, node in enumerate(graph.nodes()):
+    name_to_node[node.name] = node
+    name_to_input_name[node.name] = (
+        [_node_name(x) for x in node.input] +
+        list(indexed_graph.colocated_node_names(node)))
+    name_to_seq_num[node.name] = seq
   return name_to_input_name, name_to_node, name_to_seq_num
 
 
-def _assert_nodes_are_present(name_to_node, nodes):
-  """Assert that nodes are present in the graph."""
-  for d in nodes:
-    assert d in name_to_node, "%s is not in graph" % d
+def _bfs_for_reachable_nodes(target_nodes, name_to_input_name):
+  """Returns the nodes reachable from `target_nodes` in `name_to_input_name`.
 
+  Kept for callers outside this module; see `_extract_graph_summary`. The
+  search is linear in the size of the reachable subgraph.
 
-def _bfs_for_reachable_nodes(target_nodes, name_to_input_name):
-  """Breadth first search for reachable nodes from target nodes."""
+  Args:
+    target_nodes: Names of the nodes to start from.
+    name_to_input_name: A dict mapping node names to the names of their inputs,
+      as returned by `_extract_graph_summary`.
+
+  Returns:
+    A set of node names, including `target_nodes`.
+  """
   nodes_to_keep = set()
-  # Breadth first search to find all the nodes that we should keep.
-  next_to_visit = target_nodes[:]
+  next_to_visit = list(target_nodes)
   while next_to_visit:
-    node = next_to_visit[0]
-    del next_to_visit[0]
+    node = next_to_visit.pop()
     if node in nodes_to_keep:
       # Already visited this node.
       continue
     nodes_to_keep.add(node)
     if node in name_to_input_name:
-      next_to_visit += name_to_input_name[node]
+      next_to_visit.extend(name_to_input_name[node])
   return nodes_to_keep
 
 
+def _assert_nodes_are_present(graph, nodes):
+  """Assert that nodes are present in the graph."""
+  for d in nodes:
+    assert d in graph, "%s is not in graph" % d
+
+
 @deprecation.deprecated(
     date=None,
     instructions="Use `tf.compat.v1.graph_util.extract_sub_graph`")
@@ -203,18 +216,13 @@ def extract_sub_graph(graph_def, dest_nodes):
   if isinstance(dest_nodes, six.string_types):
     raise TypeError("dest_nodes must be a list.")
 
-  name_to_input_name, name_to_node, name_to_seq_num = _extract_graph_summary(
-      graph_def)
-  _assert_nodes_are_present(name_to_node, dest_nodes)
-
-  nodes_to_keep = _bfs_for_reachable_nodes(dest_nodes, name_to_input_name)
+  graph = indexed_graph.IndexedGraph(graph_def)
+  _assert_nodes_are_present(graph, dest_nodes)
 
-  nodes_to_keep_list = sorted(
-      list(nodes_to_keep), key=lambda n: name_to_seq_num[n])
-  # Now construct the output GraphDef
+  nodes_to_keep = graph.reachable(dest_nodes)
+  # Now construct the output GraphDef, keeping the original node order.
   out = graph_pb2.GraphDef()
-  for n in nodes_to_keep_list:
-    out.node.extend([copy.deepcopy(name_to_node[n])])
+  out.node.extend(node for node in graph.nodes() if node.name in nodes_to_keep)
   out.library.CopyFrom(graph_def.library)
   out.versions.CopyFrom(graph_def.versions)
 
@@ -307,43 +315,51 @@ def remove_training_nodes(input_graph, protected_nodes=None):
   Returns:
     A list of nodes with the unnecessary ones removed.
   """
-  if not protected_nodes:
-    protected_nodes = []
+  graph = indexed_graph.IndexedGraph(input_graph)
+  remove_training_nodes_in_place(graph, protected_nodes)
+  output_graph = graph_pb2.GraphDef()
+  output_graph.node.extend(graph.nodes())
+  return output_graph
+
+
+def remove_training_nodes_in_place(graph, protected_nodes=None):
+  """Like `remove_training_nodes`, but rewrites an `IndexedGraph` in place.
+
+  Args:
+    graph: An `indexed_graph.IndexedGraph` to prune.
+    protected_nodes: An optional list of names of nodes to be kept
+      unconditionally.
+  """
+  protected_nodes = set(protected_nodes or ())
 
   types_to_remove = {"CheckNumerics": True}
 
-  input_nodes = input_graph.node
-  names_to_remove = {}
-  for node in input_nodes:
-    if node.op in types_to_remove and node.name not in protected_nodes:
-      names_to_remove[node.name] = True
+  names_to_remove = set(
+      node.name for node in graph.nodes()
+      if node.op in types_to_remove and node.name not in protected_nodes)
 
-  nodes_after_removal = []
-  for node in input_nodes:
-    if node.name in names_to_remove:
-      continue
-    new_node = node_def_pb2.NodeDef()
-    new_node.CopyFrom(node)
-    input_before_removal = node.input
-    del new_node.input[:]
-    for full_input_name in input_before_removal:
-      input_name = re.sub(r"^\^", "", full_input_name)
-      if input_name in names_to_remove:
+  for name in names_to_remove:
+    for consumer in graph.consumers(name):
+      if consumer in names_to_remove:
         continue
-      new_node.input.append(full_input_name)
-    nodes_after_removal.append(new_node)
+      node = graph.node(consumer)
+      graph.set_inputs(consumer, [
+          full_input_name for full_input_name in node.input
+          if re.sub(r"^\^", "", full_input_name) not in names_to_remove])
+  for name in names_to_remove:
+    graph.remove_node(name)
 
   types_to_splice = {"Identity": True}
   control_input_names = set()
   node_names_with_control_input = set()
-  for node in nodes_after_removal:
+  for node in graph.nodes():
     for node_input in node.input:
       if "^" in node_input:
         control_input_names.add(node_input.replace("^", ""))
         node_names_with_control_input.add(node.name)
 
   names_to_splice = {}
-  for node in nodes_after_removal:
+  for node in graph.nodes():
     if node.op in types_to_splice and node.name not in protected_nodes:
       # We don't want to remove nodes that have control edge inputs, because
       # they might be involved in subtle dependency issues that removing them
@@ -355,22 +371,19 @@ def remove_training_nodes(input_graph, protected_nodes=None):
   names_to_splice = {name: value for name, value in names_to_splice.items()
                      if name not in control_input_names}
 
-  nodes_after_splicing = []
-  for node in nodes_after_removal:
-    if node.name in names_to_splice:
-      continue
-    new_node = node_def_pb2.NodeDef()
-    new_node.CopyFrom(node)
-    input_before_removal = node.input
-    del new_node.input[:]
-    for full_input_name in input_before_removal:
+  # Only the consumers of spliced nodes need their inputs rewritten.
+  consumers_to_rewrite = set()
+  for name in names_to_splice:
+    consumers_to_rewrite.update(graph.consumers(name))
+  consumers_to_rewrite.difference_update(names_to_splice)
+  for consumer in consumers_to_rewrite:
+    new_inputs = []
+    for full_input_name in graph.node(consumer).input:
       input_name = re.sub(r"^\^", "", full_input_name)
       while input_name in names_to_splice:
         full_input_name = names_to_splice[input_name]
         input_name = re.sub(r"^\^", "", full_input_name)
-      new_node.input.append(full_input_name)
-    nodes_after_splicing.append(new_node)
-
-  output_graph = graph_pb2.GraphDef()
-  output_graph.node.extend(nodes_after_splicing)
-  return output_graph
+      new_inputs.append(full_input_name)
+    graph.set_inputs(consumer, new_inputs)
+  for name in names_to_splice:
+    graph.remove_node(name)
@@ -18,12 +18,16 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import time
+
 from tensorflow.core.framework import attr_value_pb2
 from tensorflow.core.framework import graph_pb2
 from tensorflow.core.framework import node_def_pb2
 from tensorflow.python.framework import constant_op
 from tensorflow.python.framework import dtypes
 from tensorflow.python.framework import graph_util
+from tensorflow.python.framework import graph_util_impl
+from tensorflow.python.framework import indexed_graph
 from tensorflow.python.framework import ops
 from tensorflow.python.framework import tensor_util
 from tensorflow.python.framework import test_util
@@ -185,6 +189,32 @@ class DeviceFunctionsTest(test.TestCase):
     self.assertEqual("n3", sub_graph.node[2].name)
     self.assertEqual("n5", sub_graph.node[3].name)
 
+  def testExtractGraphSummary(self):
+    graph_def = graph_pb2.GraphDef()
+    n1 = graph_def.node.add()
+    n1.name = "n1"
+    n2 = graph_def.node.add()
+    n2.name = "n2"
+    n2.input.extend(["n1:1", "^n4"])
+    n2.attr["_class"].list.s.append(b"loc:@n3")
+    n3 = graph_def.node.add()
+    n3.name = "n3"
+    n4 = graph_def.node.add()
+    n4.name = "n4"
+
+    # pylint: disable=protected-access
+    name_to_input_name, name_to_node, name_to_seq_num = (
+        graph_util_impl._extract_graph_summary(graph_def))
+    self.assertEqual(["n1", "n4", "n3"], name_to_input_name["n2"])
+    self.assertEqual(n2, name_to_node["n2"])
+    self.assertEqual({"n1": 0, "n2": 1, "n3": 2, "n4": 3}, name_to_seq_num)
+    self.assertEqual({"n1", "n2", "n3", "n4"},
+                     graph_util_impl._bfs_for_reachable_nodes(
+                         ["n2"], name_to_input_name))
+    self.assertEqual({"n4"}, graph_util_impl._bfs_for_reachable_nodes(
+        ["n4"], name_to_input_name))
+    # pylint: enable=protected-access
+
   def testExtractSubGraphWithInvalidDestNodes(self):
     graph_def = graph_pb2.GraphDef()
     n1 = graph_def.node.add()
@@ -303,6 +333,78 @@ class DeviceFunctionsTest(test.TestCase):
     self.assertProtoEquals(graph_def,
                            graph_util.remove_training_nodes(graph_def))
 
+  def testIndexedGraphRewrites(self):
+    graph_def = graph_pb2.GraphDef()
+    graph_def.node.extend([
+        self.create_node_def("Aop", "A", ["B", "B:1"]),
+        self.create_node_def("Bop", "B", ["^C"]),
+        self.create_node_def("Cop", "C", []),
+        self.create_node_def("Dop", "D", ["C"]),
+    ])
+    original = graph_pb2.GraphDef()
+    original.CopyFrom(graph_def)
+
+    graph = indexed_graph.IndexedGraph(graph_def)
+    self.assertEqual(["A"], graph.consumers("B"))
+    self.assertEqual(2, graph.reference_count("B"))
+    self.assertCountEqual(["B", "D"], graph.consumers("C"))
+    self.assertEqual({"A", "B", "C"}, graph.reachable(["A"]))
+
+    graph.set_inputs("A", ["C"])
+    graph.remove_node("B")
+    graph.add_node(self.create_node_def("Eop", "E", ["A"]))
+    self.assertCountEqual(["A", "D"], graph.consumers("C"))
+    self.assertEqual([], graph.consumers("B"))
+
+    expected = graph_pb2.GraphDef()
+    expected.node.extend([
+        self.create_node_def("Aop", "A", ["C"]),
+        self.create_node_def("Cop", "C", []),
+        self.create_node_def("Dop", "D", ["C"]),
+        self.create_node_def("Eop", "E", ["A"]),
+    ])
+    self.assertProtoEquals(expected, graph.to_graph_def())
+    # The wrapped GraphDef is copied on write, not modified.
+    self.assertProtoEquals(original, graph_def)
+
+
+class GraphUtilBenchmark(test.Benchmark):
+  """Reports how graph_util passes scale with the number of nodes."""
+
+  def _chain_graph_def(self, num_nodes):
+    graph_def = graph_pb2.GraphDef()
+    graph_def.node.add(name="n0", op="Const")
+    for i in range(1, num_nodes):
+      node = graph_def.node.add(
+          name="n%d" % i, op="Identity" if i % 2 else "Mul")
+      node.input.append("n%d" % (i - 1))
+      if not i % 2:
+        node.input.append("n0")
+    return graph_def
+
+  def _run_benchmark(self, name, fn):
+    for num_nodes in (1000, 10000, 100000):
+      graph_def = self._chain_graph_def(num_nodes)
+      start = time.time()
+      fn(graph_def, "n%d" % (num_nodes - 1))
+      self.report_benchmark(
+          name="%s_%d" % (name, num_nodes),
+          iters=1,
+          wall_time=time.time() - start,
+          extras={"num_nodes": num_nodes})
+
+  def benchmarkExtractSubGraph(self):
+    self._run_benchmark(
+        "extract_sub_graph",
+        lambda graph_def, output: graph_util.extract_sub_graph(
+            graph_def, [output]))
+
+  def benchmarkRemoveTrainingNodes(self):
+    self._run_benchmark(
+        "remove_training_nodes",
+        lambda graph_def, output: graph_util.remove_training_nodes(
+            graph_def, [output]))
+
 
 if __name__ == "__main__":
   test.main()
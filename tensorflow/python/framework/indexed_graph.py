@@ -0,0 +1,224 @@
+# Copyright 2020 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""An indexed view of a `GraphDef` for rewriting passes."""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import collections
+
+from tensorflow.core.framework import graph_pb2
+from tensorflow.core.framework import node_def_pb2
+
+
+def node_name(input_name):
+  """Strips the control marker and output port from a NodeDef input."""
+  if input_name.startswith("^"):
+    return input_name[1:]
+  return input_name.split(":")[0]
+
+
+def colocated_node_names(node):
+  """Yields the names of the nodes `node` is colocated with."""
+  if "_class" in node.attr:
+    for colocated_node_name in node.attr["_class"].list.s:
+      colocated_node_name = colocated_node_name.decode("utf-8")
+      if colocated_node_name.startswith("loc:@"):
+        colocated_node_name = colocated_node_name[5:]
+      yield colocated_node_name
+
+
+class IndexedGraph(object):
+  """A `GraphDef` with name and consumer indexes, for in-place rewrites.
+
+  Building the index is linear in the size of the graph. After that, node and
+  consumer lookups, node removal and input rewrites take constant time, and
+  reachability queries are linear, so a sequence of passes over a large graph
+  never rebuilds name maps or copies the `GraphDef` between passes. The
+  rewritten graph is materialized once with `to_graph_def()`.
+
+  Nodes are held by reference. With `copy_on_write=True` (the default) a node
+  of the wrapped `GraphDef` is copied the first time it is modified through
+  `mutable_node` or `set_inputs`, and the wrapped `GraphDef` is never changed.
+  Pass `copy_on_write=False` when the caller owns the `GraphDef` and it may be
+  modified in place.
+
+  If several nodes share a name, the last one wins, as in
+  `tf.compat.v1.graph_util.extract_sub_graph`; the names are available in
+  `duplicate_names`.
+  """
+
+  def __init__(self, graph_def, copy_on_write=True):
+    self._graph_def = graph_def
+    self._copy_on_write = copy_on_write
+    self._nodes = {}
+    # Node names in output order. A name may appear more than once if it was
+    # redefined; `_position` says which occurrence is current.
+    self._order = []
+    self._position = {}
+    self._owned = set()
+    # Maps a node name to a dict of {consumer name: number of references}.
+    self._consumers = collections.defaultdict(dict)
+    self.duplicate_names = []
+    for node in graph_def.node:
+      if node.name in self._nodes:
+        self.duplicate_names.append(node.name)
+      self._nodes[node.name] = node
+      self._position[node.name] = len(self._order)
+      self._order.append(node.name)
+    for node in self._nodes.values():
+      self._index_inputs(node)
+
+  def _index_inputs(self, node):
+    for input_name in node.input:
+      consumers = self._consumers[node_name(input_name)]
+      consumers[node.name] = consumers.get(node.name, 0) + 1
+
+  def _unindex_inputs(self, node):
+    for input_name in node.input:
+      consumers = self._consumers[node_name(input_name)]
+      count = consumers[node.name] - 1
+      if count:
+        consumers[node.name] = count
+      else:
+        del consumers[node.name]
+
+  def __contains__(self, name):
+    return name in self._nodes
+
+  def __len__(self):
+    return len(self._nodes)
+
+  def __getitem__(self, name):
+    return self._nodes[name]
+
+  def node(self, name):
+    """Returns the `NodeDef` called `name`. Raises `KeyError` if missing."""
+    return self._nodes[name]
+
+  def get(self, name, default=None):
+    return self._nodes.get(name, default)
+
+  def nodes(self):
+    """Yields the nodes in graph order; added nodes come last."""
+    for i, name in enumerate(self._order):
+      if self._position.get(name) == i:
+        yield self._nodes[name]
+
+  def consumers(self, name):
+    """Returns the names of the nodes that take an input from `name`."""
+    return list(self._consumers.get(name, ()))
+
+  def reference_count(self, name):
+    """Returns the number of node inputs (data or control) naming `name`."""
+    return sum(self._consumers.get(name, {}).values())
+
+  def reachable(self, target_names):
+    """Returns the names of the nodes that `target_names` depend on.
+
+    Follows data inputs, control inputs and colocation constraints. The
+    targets themselves are included. Runs in time linear in the size of the
+    reachable subgraph.
+
+    Args:
+      target_names: Names of the nodes to start from.
+
+    Returns:
+      A set of node names.
+    """
+    reached = set()
+    to_visit = list(target_names)
+    while to_visit:
+      name = to_visit.pop()
+      if name in reached:
+        continue
+      reached.add(name)
+      node = self._nodes.get(name)
+      if node is None:
+        continue
+      to_visit.extend(node_name(input_name) for input_name in node.input)
+      to_visit.extend(colocated_node_names(node))
+    return reached
+
+  def mutable_node(self, name):
+    """Returns the `NodeDef` called `name`, copied first if needed.
+
+    Callers that change the node's inputs must use `set_inputs` instead, so
+    the consumer index stays up to date.
+
+    Args:
+      name: The node name.
+
+    Returns:
+      A `NodeDef` that may be modified.
+    """
+    node = self._nodes[name]
+    if self._copy_on_write and name not in self._owned:
+      copied = node_def_pb2.NodeDef()
+      copied.CopyFrom(node)
+      self._nodes[name] = copied
+      self._owned.add(name)
+      node = copied
+    return node
+
+  def set_inputs(self, name, inputs):
+    """Replaces the inputs of the node called `name`."""
+    node = self.mutable_node(name)
+    self._unindex_inputs(node)
+    del node.input[:]
+    node.input.extend(inputs)
+    self._index_inputs(node)
+
+  def add_node(self, node):
+    """Adds `node` after all existing nodes. The graph takes ownership."""
+    if node.name in self._nodes:
+      raise ValueError("Node %s is already in the graph." % node.name)
+    self._nodes[node.name] = node
+    self._owned.add(node.name)
+    self._position[node.name] = len(self._order)
+    self._order.append(node.name)
+    self._index_inputs(node)
+
+  def replace_node(self, node):
+    """Replaces the node with the same name as `node`, keeping its position.
+
+    The graph takes ownership of `node`.
+
+    Args:
+      node: A `NodeDef` whose name is already in the graph.
+    """
+    self._unindex_inputs(self._nodes[node.name])
+    self._nodes[node.name] = node
+    self._owned.add(node.name)
+    self._index_inputs(node)
+
+  def remove_node(self, name):
+    """Removes the node called `name`. Inputs naming it are left as-is."""
+    node = self._nodes.pop(name)
+    del self._position[name]
+    self._owned.discard(name)
+    self._unindex_inputs(node)
+
+  def to_graph_def(self):
+    """Returns a new `GraphDef` holding the current nodes.
+
+    The function library and versions of the wrapped `GraphDef` are copied.
+    """
+    graph_def = graph_pb2.GraphDef()
+    graph_def.node.extend(self.nodes())
+    graph_def.library.CopyFrom(self._graph_def.library)
+    graph_def.versions.CopyFrom(self._graph_def.versions)
+    return graph_def
@@ -25,8 +25,11 @@ import copy
 import csv
 import io
 import json
+import math
 import os
 import re
+import sys
+import threading
 import time
 
 import numpy as np
@@ -589,6 +592,81 @@ class CallbackList(object):
     return iter(self.callbacks)
 
 
+class _AsyncTrainBatchHooks(object):
+  """Runs the train batch hooks of a `CallbackList` on a background thread.
+
+  `Model.fit` uses this when `experimental_callback_lag` is passed to
+  `compile`. The training loop hands the (still unmaterialized) logs of each
+  execution to the worker thread and immediately dispatches the next
+  execution, so converting the logs to NumPy and running the callbacks overlaps
+  with device compute. At most `max_lag` executions can be pending; beyond
+  that the training loop blocks until the callbacks catch up.
+
+  Errors raised by a callback are re-raised in the training loop the next time
+  it submits a batch, or when the context is exited. Exiting the context waits
+  for all pending hooks to run.
+
+  Arguments:
+    callbacks: The `CallbackList` whose hooks should be run.
+    max_lag: Maximum number of executions the callbacks may trail behind.
+    strategy: The `tf.distribute.Strategy` whose scope the callbacks run in.
+  """
+
+  def __init__(self, callbacks, max_lag, strategy):
+    self._callbacks = callbacks
+    self._strategy = strategy
+    self._queue = six.moves.queue.Queue(maxsize=max_lag)
+    self._exc_info = None
+    self._thread = threading.Thread(
+        target=self._run, name='keras_train_batch_hooks')
+    self._thread.daemon = True
+    self._thread.start()
+
+  def _run(self):
+    with self._strategy.scope():
+      while True:
+        item = self._queue.get()
+        try:
+          if item is None:
+            return
+          # Once a callback failed, skip the remaining batches until the
+          # training loop picks up the error.
+          if self._exc_info is None:
+            batch, end_batch, logs = item
+            self._callbacks.on_train_batch_begin(batch)
+            self._callbacks.on_train_batch_end(end_batch, logs)
+        except Exception:  # pylint: disable=broad-except
+          self._exc_info = sys.exc_info()
+        finally:
+          self._queue.task_done()
+
+  def _maybe_raise(self):
+    if self._exc_info is not None:
+      exc_info, self._exc_info = self._exc_info, None
+      six.reraise(*exc_info)
+
+  def on_train_batch(self, batch, end_batch, logs):
+    """Schedules `on_train_batch_begin/end` for an execution.
+
+    Arguments:
+      batch: Integer, index of the first batch of the execution.
+      end_batch: Integer, index of the last batch of the execution.
+      logs: Dict, the (possibly not yet computed) logs of the execution.
+    """
+    self._maybe_raise()
+    self._queue.put((batch, end_batch, logs))
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, exc_type, exc_value, traceback):
+    self._queue.join()  # Waits for the pending hooks.
+    self._queue.put(None)
+    self._thread.join()
+    if exc_type is None:
+      self._maybe_raise()
+
+
 @keras_export('keras.callbacks.Callback')
 class Callback(object):
   """Abstract base class used to build new callbacks.
@@ -1555,6 +1633,223 @@ class BackupAndRestore(Callback):
     self._training_state.back_up(epoch)
 
 
+class StepTimeStats(object):
+  """Aggregates where the time of training steps goes.
+
+  Each step is split into three phases:
+    - `'input'`: waiting for the next batch from the dataset iterator.
+    - `'compute'`: the rest of the train function, plus any host overhead that
+      is neither input nor callbacks.
+    - `'callbacks'`: running the `on_train_batch_*` methods of callbacks.
+
+  The time of each phase is aggregated into a total and a histogram with
+  power-of-two buckets, so recording a step is cheap and memory use does not
+  grow with the number of steps. With `steps_per_execution > 1`, the time of
+  an execution is split evenly between its steps.
+  """
+
+  PHASES = ('input', 'compute', 'callbacks')
+
+  # Bucket `i` counts steps that took less than `2**i` microseconds, and at
+  # least `2**(i - 1)` microseconds for `i > 0`. The last bucket also counts
+  # all longer steps.
+  NUM_BUCKETS = 32
+
+  # The fraction of the step time above which a phase is the bottleneck.
+  BOTTLENECK_FRACTION = 0.5
+
+  def __init__(self):
+    self.reset()
+
+  def reset(self):
+    """Clears all recorded steps."""
+    self.num_steps = 0
+    self._totals = dict((phase, 0.) for phase in self.PHASES)
+    self._histograms = dict(
+        (phase, [0] * self.NUM_BUCKETS) for phase in self.PHASES)
+    self._input_time = 0.
+    self._callback_time = 0.
+
+  def add_input_time(self, seconds):
+    """Adds time spent waiting for input to the current step."""
+    self._input_time += seconds
+
+  def add_callback_time(self, seconds):
+    """Adds time spent in callbacks to the current step."""
+    self._callback_time += seconds
+
+  def end_step(self, step_time, num_steps=1):
+    """Records the current step, or execution of `num_steps` steps.
+
+    Arguments:
+      step_time: The total time of the step in seconds. The time not added as
+        input or callback time is counted as compute time.
+      num_steps: The number of steps run in the execution.
+    """
+    input_time = self._input_time
+    callback_time = self._callback_time
+    compute_time = max(step_time - input_time - callback_time, 0.)
+    for phase, seconds in (('input', input_time), ('compute', compute_time),
+                           ('callbacks', callback_time)):
+      self._totals[phase] += seconds
+      self._histograms[phase][self._bucket(seconds / num_steps)] += num_steps
+    self.num_steps += num_steps
+    self._input_time = 0.
+    self._callback_time = 0.
+
+  def _bucket(self, seconds):
+    microseconds = seconds * 1e6
+    if microseconds < 1:
+      return 0
+    return min(math.frexp(microseconds)[1], self.NUM_BUCKETS - 1)
+
+  def total_time(self, phase):
+    """Returns the total seconds spent in `phase`."""
+    return self._totals[phase]
+
+  def mean_time(self, phase):
+    """Returns the mean seconds per step spent in `phase`."""
+    return self._totals[phase] / self.num_steps if self.num_steps else 0.
+
+  def fraction(self, phase):
+    """Returns the fraction of the step time spent in `phase`."""
+    total = sum(self._totals.values())
+    return self._totals[phase] / total if total else 0.
+
+  def histogram(self, phase):
+    """Returns the histogram of the time per step spent in `phase`.
+
+    Arguments:
+      phase: One of `PHASES`.
+
+    Returns:
+      A list of `(upper_bound, count)` tuples, where `count` steps took at
+      most `upper_bound` seconds and more than the previous upper bound. The
+      upper bound of the last bucket is infinite.
+    """
+    upper_bounds = [2.**i / 1e6 for i in range(self.NUM_BUCKETS - 1)]
+    upper_bounds.append(float('inf'))
+    return list(zip(upper_bounds, self._histograms[phase]))
+
+  def percentile(self, phase, percent):
+    """Returns an upper bound of the `percent`-th percentile of `phase` time."""
+    rank = self.num_steps * percent / 100.
+    count = 0
+    for upper_bound, bucket_count in self.histogram(phase):
+      count += bucket_count
+      if count >= rank and count:
+        return upper_bound
+    return 0.
+
+  def bottleneck(self):
+    """Returns the phase taking most of the step time, or None if balanced."""
+    for phase in self.PHASES:
+      if self.fraction(phase) > self.BOTTLENECK_FRACTION:
+        return phase
+    return None
+
+  def hint(self):
+    """Returns a description of the bottleneck and how to address it."""
+    if not self.num_steps:
+      return 'No training steps were recorded.'
+    breakdown = ', '.join(
+        '%s %.1f%% (%.2fms/step)' %
+        (phase, 100 * self.fraction(phase), 1e3 * self.mean_time(phase))
+        for phase in self.PHASES)
+    bottleneck = self.bottleneck()
+    if bottleneck == 'input':
+      advice = ('Training is input-bound: steps mostly wait for the next '
+                'batch. Consider `dataset.prefetch`, `num_parallel_calls` in '
+                '`dataset.map`, `dataset.cache`, or simpler preprocessing.')
+    elif bottleneck == 'callbacks':
+      advice = ('Training is callback-bound: steps mostly run callbacks on '
+                'the host. Consider doing less work per batch in callbacks, '
+                'e.g. a larger `update_freq` in TensorBoard, or '
+                '`experimental_steps_per_execution` in `compile`.')
+    elif bottleneck == 'compute':
+      advice = ('Training is compute-bound: steps mostly run the train '
+                'function. Consider mixed precision, XLA, or more devices.')
+    else:
+      advice = 'No single phase dominates the step time.'
+    return '%s Step time breakdown: %s.' % (advice, breakdown)
+
+
+@keras_export('keras.callbacks.experimental.StepTimeAnalyzer', v1=[])
+class StepTimeAnalyzer(Callback):
+  """Callback that shows whether `fit` is input, callback or compute bound.
+
+  While training, each step is timed without capturing a profile: the time
+  spent waiting for the next batch, in the train function and in callbacks is
+  aggregated into histograms, which are reset at the start of each epoch. At
+  the end of each epoch, the mean time per step of each phase is written as
+  TensorBoard scalars if `log_dir` is set, and a hint about the bottleneck is
+  logged if `verbose` is set.
+
+  Waiting for input is timed inside the train function, which adds a few ops
+  per step, and reading it back synchronizes with the device every step.
+
+  Example:
+
+  ```python
+  analyzer = tf.keras.callbacks.experimental.StepTimeAnalyzer('./logs')
+  model.fit(dataset, epochs=2, callbacks=[analyzer])
+  print(analyzer.stats.hint())
+  ```
+
+  Arguments:
+      log_dir: The directory to write TensorBoard scalars to, or None.
+      verbose: Whether to log the bottleneck hint at the end of each epoch.
+  """
+
+  def __init__(self, log_dir=None, verbose=1):
+    super(StepTimeAnalyzer, self).__init__()
+    self.log_dir = path_to_string(log_dir) if log_dir is not None else None
+    self.verbose = verbose
+    self._supports_tf_logs = True
+    self._stats = StepTimeStats()
+    self._writer = None
+
+  @property
+  def stats(self):
+    """The `StepTimeStats` of the current or last epoch."""
+    return self._stats
+
+  def set_model(self, model):
+    self.model = model
+    if hasattr(model, '_set_step_time_stats'):
+      model._set_step_time_stats(self._stats)  # pylint: disable=protected-access
+
+  def on_epoch_begin(self, epoch, logs=None):
+    self._stats.reset()
+
+  def on_epoch_end(self, epoch, logs=None):
+    stats = self._stats
+    if not stats.num_steps:
+      return
+    if self.log_dir is not None:
+      if self._writer is None:
+        self._writer = summary_ops_v2.create_file_writer_v2(self.log_dir)
+      with self._writer.as_default():
+        for phase in stats.PHASES:
+          summary_ops_v2.scalar(
+              'step_time/%s' % phase, stats.mean_time(phase), step=epoch)
+          summary_ops_v2.scalar(
+              'step_time/%s_p90' % phase, stats.percentile(phase, 90),
+              step=epoch)
+          summary_ops_v2.scalar(
+              'step_time/%s_fraction' % phase, stats.fraction(phase),
+              step=epoch)
+    if self.verbose > 0:
+      print('\nEpoch %05d: %s' % (epoch + 1, stats.hint()))
+
+  def on_train_end(self, logs=None):
+    if hasattr(self.model, '_set_step_time_stats'):
+      self.model._set_step_time_stats(None)  # pylint: disable=protected-access
+    if self._writer is not None:
+      self._writer.close()
+      self._writer = None
+
+
 @keras_export('keras.callbacks.EarlyStopping')
 class EarlyStopping(Callback):
   """Stop training when a monitored metric has stopped improving.
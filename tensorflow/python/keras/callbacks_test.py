@@ -34,6 +34,7 @@ import numpy as np
 
 from tensorflow.core.framework import summary_pb2
 from tensorflow.python import keras
+from tensorflow.python.data.experimental.ops import testing
 from tensorflow.python.data.ops import dataset_ops
 from tensorflow.python.eager import context
 from tensorflow.python.framework import ops
@@ -307,6 +308,85 @@ class KerasCallbacksTest(keras_parameterized.TestCase):
                    'to the batch time')
     self.assertIn(warning_msg, '\n'.join(warning_messages))
 
+  @keras_parameterized.run_all_keras_modes(always_skip_v1=True)
+  def test_step_time_analyzer(self):
+
+    class SleepCallback(keras.callbacks.Callback):
+
+      def on_train_batch_end(self, batch, logs=None):
+        time.sleep(0.1)
+
+    model = sequential.Sequential()
+    model.add(keras.layers.Dense(1, activation='sigmoid'))
+    model.compile(
+        'sgd',
+        loss='binary_crossentropy',
+        run_eagerly=testing_utils.should_run_eagerly())
+    log_dir = self.get_temp_dir()
+    analyzer = keras.callbacks.StepTimeAnalyzer(log_dir, verbose=0)
+    model.fit(
+        np.ones((10, 10), 'float32'),
+        np.ones((10, 1), 'float32'),
+        batch_size=2,
+        epochs=2,
+        callbacks=[analyzer, SleepCallback()])
+
+    stats = analyzer.stats
+    self.assertEqual(5, stats.num_steps)
+    for phase in stats.PHASES:
+      self.assertEqual(5, sum(count for _, count in stats.histogram(phase)))
+    self.assertGreaterEqual(stats.total_time('callbacks'), 0.5)
+    self.assertLess(stats.total_time('input'), stats.total_time('callbacks'))
+    self.assertEqual('callbacks', stats.bottleneck())
+    self.assertIn('callback-bound', stats.hint())
+    self.assertNotEmpty(os.listdir(log_dir))
+    # Step timing is turned off after training.
+    self.assertIsNone(model._step_time_stats)
+
+  @keras_parameterized.run_all_keras_modes(always_skip_v1=True)
+  def test_step_time_analyzer_input_bound(self):
+    model = sequential.Sequential()
+    model.add(keras.layers.Dense(1, activation='sigmoid'))
+    model.compile(
+        'sgd',
+        loss='binary_crossentropy',
+        run_eagerly=testing_utils.should_run_eagerly())
+    # Every batch takes 100ms to produce.
+    dataset = dataset_ops.Dataset.from_tensor_slices(
+        (np.ones((10, 10), 'float32'), np.ones((10, 1), 'float32'))).batch(2)
+    dataset = dataset.apply(testing.sleep(100000))
+    analyzer = keras.callbacks.StepTimeAnalyzer(self.get_temp_dir(), verbose=0)
+    model.fit(dataset, epochs=1, callbacks=[analyzer])
+
+    stats = analyzer.stats
+    self.assertEqual(5, stats.num_steps)
+    self.assertGreaterEqual(stats.total_time('input'), 0.4)
+    self.assertEqual('input', stats.bottleneck())
+    self.assertIn('input-bound', stats.hint())
+
+  def test_step_time_stats(self):
+    stats = keras.callbacks.StepTimeStats()
+    self.assertIsNone(stats.bottleneck())
+    for _ in range(4):
+      stats.add_input_time(0.03)
+      stats.add_callback_time(0.001)
+      stats.end_step(0.04)
+    self.assertEqual(4, stats.num_steps)
+    self.assertAllClose(0.03, stats.mean_time('input'))
+    self.assertAllClose(0.009, stats.mean_time('compute'))
+    self.assertAllClose(0.75, stats.fraction('input'))
+    self.assertEqual('input', stats.bottleneck())
+    self.assertIn('input-bound', stats.hint())
+    # 30ms lies in the bucket of up to 2**15 microseconds.
+    self.assertEqual(2.**15 / 1e6, stats.percentile('input', 50))
+
+    # An execution of several steps is split evenly between them.
+    stats.reset()
+    stats.end_step(0.08, num_steps=4)
+    self.assertEqual(4, stats.num_steps)
+    self.assertAllClose(0.02, stats.mean_time('compute'))
+    self.assertEqual(2.**15 / 1e6, stats.percentile('compute', 100))
+
   @keras_parameterized.run_with_all_model_types(exclude_models='functional')
   @keras_parameterized.run_all_keras_modes
   def test_progbar_logging_deferred_model_build(self):
@@ -1704,6 +1784,71 @@ class KerasCallbacksTest(keras_parameterized.TestCase):
     self.assertEqual(my_cb.test_batches, 0)
     self.assertEqual(my_cb.predict_batches, 0)
 
+  @keras_parameterized.run_all_keras_modes(always_skip_v1=True)
+  def test_async_train_batch_hooks(self):
+
+    class MyCallback(keras.callbacks.Callback):
+
+      def __init__(self):
+        self.batches = []
+        self.threads = set()
+        self.loss_types = set()
+
+      def on_train_batch_begin(self, batch, logs=None):
+        self.batches.append(('begin', batch))
+
+      def on_train_batch_end(self, batch, logs=None):
+        self.threads.add(threading.current_thread())
+        self.batches.append(('end', batch))
+        self.loss_types.add(type(logs['loss']))
+
+      def on_epoch_end(self, epoch, logs=None):
+        # All the batch hooks of the epoch have run.
+        self.batches.append(('epoch_end', epoch))
+
+    x, y = np.ones((10, 1)), np.ones((10, 1))
+    model = keras.Sequential([keras.layers.Dense(1)])
+    model.compile(
+        'sgd',
+        'mse',
+        experimental_steps_per_execution=2,
+        experimental_callback_lag=2,
+        run_eagerly=testing_utils.should_run_eagerly())
+
+    my_cb = MyCallback()
+    model.fit(x, y, epochs=2, batch_size=2, callbacks=[my_cb], verbose=0)
+
+    expected_epoch = [('begin', 0), ('end', 1), ('begin', 2), ('end', 3),
+                      ('begin', 4), ('end', 4)]
+    self.assertEqual(my_cb.batches, expected_epoch + [('epoch_end', 0)] +
+                     expected_epoch + [('epoch_end', 1)])
+    self.assertNotIn(threading.current_thread(), my_cb.threads)
+    self.assertEqual(my_cb.loss_types, {float})
+
+  @keras_parameterized.run_all_keras_modes(always_skip_v1=True)
+  def test_async_train_batch_hooks_error(self):
+
+    class MyCallback(keras.callbacks.Callback):
+
+      def on_train_batch_end(self, batch, logs=None):
+        raise RuntimeError('Callback failed.')
+
+    x, y = np.ones((10, 1)), np.ones((10, 1))
+    model = keras.Sequential([keras.layers.Dense(1)])
+    model.compile(
+        'sgd',
+        'mse',
+        experimental_callback_lag=1,
+        run_eagerly=testing_utils.should_run_eagerly())
+    with self.assertRaisesRegexp(RuntimeError, 'Callback failed.'):
+      model.fit(x, y, batch_size=2, callbacks=[MyCallback()], verbose=0)
+
+  def test_invalid_callback_lag(self):
+    model = keras.Sequential([keras.layers.Dense(1)])
+    for callback_lag in (-1, 1.5, True, '2'):
+      with self.assertRaisesRegexp(ValueError, 'experimental_callback_lag'):
+        model.compile('sgd', 'mse', experimental_callback_lag=callback_lag)
+
 
 # A summary that was emitted during a test. Fields:
 #   logdir: str. The logdir of the FileWriter to which the summary was
@@ -0,0 +1,101 @@
+# Copyright 2020 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for bucketed gradient all-reduce in multi-worker Keras training."""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import time
+
+from absl.testing import parameterized
+
+from tensorflow.python import keras
+from tensorflow.python.data.ops import dataset_ops
+from tensorflow.python.distribute import collective_all_reduce_strategy as collective_strategy
+from tensorflow.python.distribute import combinations
+from tensorflow.python.distribute import multi_process_runner
+from tensorflow.python.distribute import multi_worker_test_base as test_base
+from tensorflow.python.keras.optimizer_v2 import gradient_descent
+from tensorflow.python.ops import random_ops
+from tensorflow.python.platform import test
+
+_BATCH_SIZE = 32
+_NUM_FEATURES = 256
+_NUM_LAYERS = 8
+
+
+def _dataset():
+  x = random_ops.random_uniform([_BATCH_SIZE * 4, _NUM_FEATURES], seed=1)
+  y = random_ops.random_uniform([_BATCH_SIZE * 4, 1], seed=2)
+  return dataset_ops.Dataset.from_tensor_slices((x, y)).repeat().batch(
+      _BATCH_SIZE, drop_remainder=True)
+
+
+def _train(gradient_bucket_bytes, steps):
+  """Trains an MLP and returns (mean step time, first kernel)."""
+  strategy = collective_strategy.CollectiveAllReduceStrategy()
+  with strategy.scope():
+    model = keras.Sequential([
+        keras.layers.Dense(
+            _NUM_FEATURES,
+            activation="relu",
+            kernel_initializer=keras.initializers.TruncatedNormal(
+                stddev=0.01, seed=i)) for i in range(_NUM_LAYERS)
+    ] + [keras.layers.Dense(1)])
+    model.compile(
+        loss="mse",
+        optimizer=gradient_descent.SGD(
+            learning_rate=0.01, gradient_bucket_bytes=gradient_bucket_bytes))
+  model.fit(_dataset(), epochs=1, steps_per_epoch=1, verbose=0)
+  start = time.time()
+  model.fit(_dataset(), epochs=1, steps_per_epoch=steps, verbose=0)
+  return (time.time() - start) / steps, model.get_weights()[0]
+
+
+class GradientBucketingTest(test.TestCase, parameterized.TestCase):
+
+  @combinations.generate(combinations.combine(mode=["eager"]))
+  def testBucketingDoesNotChangeResult(self):
+    cluster_spec = test_base.create_cluster_spec(num_workers=2)
+    results = []
+    for gradient_bucket_bytes in [None, 64 * 1024]:
+      results.append(
+          multi_process_runner.run(
+              _train, cluster_spec,
+              args=(gradient_bucket_bytes, 2)).return_value)
+    for (_, unbucketed), (_, bucketed) in zip(*results):
+      self.assertAllClose(unbucketed, bucketed)
+
+
+class GradientBucketingBenchmark(test.Benchmark):
+  """Compares fit step time with and without bucketing on 2 CPU workers."""
+
+  def benchmarkGradientBucketing(self):
+    steps = 20
+    cluster_spec = test_base.create_cluster_spec(num_workers=2)
+    for gradient_bucket_bytes in [None, 256 * 1024, 1024 * 1024]:
+      results = multi_process_runner.run(
+          _train, cluster_spec,
+          args=(gradient_bucket_bytes, steps)).return_value
+      self.report_benchmark(
+          name="fit_gradient_bucket_bytes_%d" % (gradient_bucket_bytes or 0),
+          iters=steps,
+          wall_time=max(step_time for step_time, _ in results),
+          extras={"num_workers": 2, "num_layers": _NUM_LAYERS})
+
+
+if __name__ == "__main__":
+  multi_process_runner.test_main()
@@ -24,6 +24,7 @@ import functools
 import itertools
 import math
 import random
+import time
 
 import numpy as np
 import six
@@ -1129,9 +1130,19 @@ class DataHandler(object):
     self._current_step = 0
     self._step_increment = self._steps_per_execution_value - 1
     self._insufficient_data = False
+    self._step_time_stats = None
 
     self._validate_data_handler()
 
+  def set_step_time_stats(self, stats):
+    """Records the time of each step from `steps()` in `stats`, if not None.
+
+    Arguments:
+      stats: A `StepTimeStats`, or None. The model must time its iterator, so
+        that the input wait time can be separated from the rest of the step.
+    """
+    self._step_time_stats = stats
+
   def enumerate_epochs(self):
     """Yields `(epoch, tf.data.Iterator)`."""
     with self._truncate_execution_to_epoch():
@@ -1181,7 +1192,42 @@ class DataHandler(object):
             "when building your dataset.".format(total_epochs *
                                                  self._inferred_steps))
 
+  @contextlib.contextmanager
+  def time_callbacks(self):
+    """Records the time spent in the block as time spent in callbacks."""
+    if self._step_time_stats is None:
+      yield
+      return
+    start = time.time()
+    try:
+      yield
+    finally:
+      self._step_time_stats.add_callback_time(time.time() - start)
+
   def steps(self):
+    """Yields steps for the current epoch."""
+    if self._step_time_stats is None:
+      return self._steps()
+    return self._timed_steps()
+
+  def _timed_steps(self):
+    """Yields from `_steps()`, recording the time of each step."""
+    stats = self._step_time_stats
+    input_wait_time = self._model._input_wait_time  # pylint: disable=protected-access
+    last_input_wait = input_wait_time.numpy()
+    for step in self._steps():
+      num_steps = self._step_increment + 1
+      start = time.time()
+      yield step
+      # Reading the variable waits for the step to finish on the device, so
+      # the step ends after the read.
+      total_input_wait = input_wait_time.numpy()
+      step_time = time.time() - start
+      stats.add_input_time(total_input_wait - last_input_wait)
+      last_input_wait = total_input_wait
+      stats.end_step(step_time, num_steps)
+
+  def _steps(self):
     """Yields steps for the current epoch."""
     self._current_step = 0
     # `self._inferred_steps` can be changed by `catch_stop_iteration`.
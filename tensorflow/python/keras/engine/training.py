@@ -18,6 +18,7 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import contextlib
 import copy
 import itertools
 import json
@@ -61,6 +62,7 @@ from tensorflow.python.keras.utils.io_utils import ask_to_proceed_with_overwrite
 from tensorflow.python.keras.utils.io_utils import path_to_string
 from tensorflow.python.keras.utils.mode_keys import ModeKeys
 from tensorflow.python.ops import array_ops
+from tensorflow.python.ops import logging_ops
 from tensorflow.python.ops import math_ops
 from tensorflow.python.ops import sparse_ops
 from tensorflow.python.ops import summary_ops_v2
@@ -231,7 +233,7 @@ class Model(base_layer.Layer, version_utils.ModelVersionSelector):
   """
   _TF_MODULE_IGNORED_PROPERTIES = frozenset(
       itertools.chain(('_train_counter', '_test_counter', '_predict_counter',
-                       '_steps_per_execution'),
+                       '_steps_per_execution', '_input_wait_time'),
                       base_layer.Layer._TF_MODULE_IGNORED_PROPERTIES))  # pylint: disable=protected-access
 
   def __new__(cls, *args, **kwargs):
@@ -304,6 +306,11 @@ class Model(base_layer.Layer, version_utils.ModelVersionSelector):
         trackable_utils.saver_with_op_caching(self))
 
     self._steps_per_execution = None
+    self._callback_lag = 0
+
+    # Set by `StepTimeAnalyzer` to record where the time of `fit` steps goes.
+    self._step_time_stats = None
+    self._input_wait_time = None
 
     self._init_batch_counters()
     self._base_model_initialized = True
@@ -527,11 +534,20 @@ class Model(base_layer.Layer, version_utils.ModelVersionSelector):
               one full epoch will be run each execution. If a number larger than
               the size of the epoch is passed, the execution will be truncated
               to the size of the epoch.
+            - `experimental_callback_lag`: Int. If greater than `0`, batch-level
+              callbacks in `fit` run on a background thread and may trail the
+              training loop by up to this many executions. The next execution
+              is dispatched before the logs of the previous one are converted
+              to NumPy, which overlaps host-side callback overhead with device
+              compute. Callbacks then observe the model in a state that may be
+              a few executions ahead of the `logs` they receive. All pending
+              callbacks are run before `on_epoch_end`. Defaults to `0`, in
+              which case callbacks are called synchronously.
             - `sample_weight_mode` for backward compatibility.
 
     Raises:
         ValueError: In case of invalid arguments for
-            `optimizer`, `loss` or `metrics`.
+            `optimizer`, `loss`, `metrics` or `experimental_callback_lag`.
     """
     _keras_api_gauge.get_cell('compile').set(True)
     with self.distribute_strategy.scope():
@@ -547,6 +563,7 @@ class Model(base_layer.Layer, version_utils.ModelVersionSelector):
       experimental_steps_per_execution = kwargs.pop(
           'experimental_steps_per_execution', 1)
       self._configure_steps_per_execution(experimental_steps_per_execution)
+      self._callback_lag = kwargs.pop('experimental_callback_lag', 0)
 
       # Initializes attrs that are reset each time `compile` is called.
       self._reset_compile_cache()
@@ -582,6 +599,21 @@ class Model(base_layer.Layer, version_utils.ModelVersionSelector):
         dtype='int64',
         aggregation=variables.VariableAggregationV2.ONLY_FIRST_REPLICA)
 
+  @trackable.no_automatic_dependency_tracking
+  def _set_step_time_stats(self, stats):
+    """Sets the `StepTimeStats` that `fit` records step timings in, or None."""
+    if (stats is None) != (self._step_time_stats is None):
+      # Timing the iterator changes the train function.
+      self.train_function = None
+    if stats is not None and self._input_wait_time is None:
+      # Untracked Variable accumulating the seconds spent waiting for input.
+      with self.distribute_strategy.scope():
+        self._input_wait_time = variables.Variable(
+            0.,
+            dtype='float64',
+            aggregation=variables.VariableAggregationV2.ONLY_FIRST_REPLICA)
+    self._step_time_stats = stats
+
   @property
   def _should_compute_mask(self):
     return False
@@ -792,7 +824,10 @@ class Model(base_layer.Layer, version_utils.ModelVersionSelector):
           model._train_counter.assign_add(1)  # pylint: disable=protected-access
         return outputs
 
-      data = next(iterator)
+      if model._step_time_stats is not None:  # pylint: disable=protected-access
+        data = _timed_next(model, iterator)
+      else:
+        data = next(iterator)
       outputs = model.distribute_strategy.run(run_step, args=(data,))
       outputs = reduce_per_replica(
           outputs, self.distribute_strategy, reduction='first')
@@ -1075,6 +1110,8 @@ class Model(base_layer.Layer, version_utils.ModelVersionSelector):
 
       self.stop_training = False
       train_function = self.make_train_function()
+      # Set after the callbacks, which may enable step timing in `set_model`.
+      data_handler.set_step_time_stats(self._step_time_stats)
       self._train_counter.assign(0)
       callbacks.on_train_begin()
       training_logs = None
@@ -1086,21 +1123,28 @@ class Model(base_layer.Layer, version_utils.ModelVersionSelector):
       for epoch, iterator in data_handler.enumerate_epochs():
         self.reset_metrics()
         callbacks.on_epoch_begin(epoch)
-        with data_handler.catch_stop_iteration():
-          for step in data_handler.steps():
-            with trace.Trace(
-                'TraceContext',
-                graph_type='train',
-                epoch_num=epoch,
-                step_num=step,
-                batch_size=batch_size):
-              callbacks.on_train_batch_begin(step)
-              tmp_logs = train_function(iterator)
-              if data_handler.should_sync:
-                context.async_wait()
-              logs = tmp_logs  # No error, now safe to assign to logs.
-              end_step = step + data_handler.step_increment
-              callbacks.on_train_batch_end(end_step, logs)
+        with self._maybe_async_train_batch_hooks(callbacks) as async_hooks:
+          with data_handler.catch_stop_iteration():
+            for step in data_handler.steps():
+              with trace.Trace(
+                  'TraceContext',
+                  graph_type='train',
+                  epoch_num=epoch,
+                  step_num=step,
+                  batch_size=batch_size):
+                if async_hooks is None:
+                  with data_handler.time_callbacks():
+                    callbacks.on_train_batch_begin(step)
+                tmp_logs = train_function(iterator)
+                if data_handler.should_sync:
+                  context.async_wait()
+                logs = tmp_logs  # No error, now safe to assign to logs.
+                end_step = step + data_handler.step_increment
+                if async_hooks is None:
+                  with data_handler.time_callbacks():
+                    callbacks.on_train_batch_end(end_step, logs)
+                else:
+                  async_hooks.on_train_batch(step, end_step, logs)
         epoch_logs = copy.copy(logs)
 
         # Run validation.
@@ -1145,6 +1189,19 @@ class Model(base_layer.Layer, version_utils.ModelVersionSelector):
       callbacks.on_train_end(logs=training_logs)
       return self.history
 
+  @contextlib.contextmanager
+  def _maybe_async_train_batch_hooks(self, callbacks):
+    """Yields the hooks to run train batch callbacks asynchronously, if set."""
+    # pylint: disable=protected-access
+    if (not self._callback_lag or
+        not callbacks._should_call_train_batch_hooks):
+      yield None
+      return
+    with callbacks_module._AsyncTrainBatchHooks(
+        callbacks, self._callback_lag, self.distribute_strategy) as hooks:
+      yield hooks
+    # pylint: enable=protected-access
+
   def test_step(self, data):
     """The logic for one evaluation step.
 
@@ -2490,11 +2547,17 @@ class Model(base_layer.Layer, version_utils.ModelVersionSelector):
       raise ValueError(
           'target_tensors argument is not supported when executing eagerly.')
     invalid_kwargs = set(kwargs) - {
-        'experimental_steps_per_execution', 'sample_weight_mode'
+        'experimental_steps_per_execution', 'experimental_callback_lag',
+        'sample_weight_mode'
     }
     if invalid_kwargs:
       raise TypeError('Invalid keyword argument(s) in `compile`: %s' %
                       (invalid_kwargs,))
+    callback_lag = kwargs.get('experimental_callback_lag', 0)
+    if (isinstance(callback_lag, bool) or
+        not isinstance(callback_lag, six.integer_types) or callback_lag < 0):
+      raise ValueError('`experimental_callback_lag` must be a non-negative '
+                       'integer, got: %r' % (callback_lag,))
 
     # Model must be created and compiled with the same DistStrat.
     if self.built and ds_context.has_strategy():
@@ -2757,6 +2820,21 @@ def write_scalar_summaries(logs, step):
       summary_ops_v2.scalar('batch_' + name, value, step=step)
 
 
+def _timed_next(model, iterator):
+  """Returns `next(iterator)`, adding the seconds it takes to the model."""
+  start = logging_ops.timestamp()
+  with ops.control_dependencies([start]):
+    data = next(iterator)
+  data_tensors = []
+  for value in nest.flatten(data, expand_composites=True):
+    data_tensors.extend(
+        model.distribute_strategy.experimental_local_results(value))
+  with ops.control_dependencies(data_tensors):
+    end = logging_ops.timestamp()
+  model._input_wait_time.assign_add(end - start)  # pylint: disable=protected-access
+  return data
+
+
 def _minimum_control_deps(outputs):
   """Returns the minimum control dependencies to ensure step succeeded."""
   if context.executing_eagerly():
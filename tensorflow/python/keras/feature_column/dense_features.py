@@ -72,6 +72,8 @@ class DenseFeatures(kfc._BaseFeaturesLayer):  # pylint: disable=protected-access
                trainable=True,
                name=None,
                partitioner=None,
+               experimental_fuse_embedding_tables=False,
+               experimental_fuse_transformations=False,
                **kwargs):
     """Constructs a DenseFeatures layer.
 
@@ -86,6 +88,20 @@ class DenseFeatures(kfc._BaseFeaturesLayer):  # pylint: disable=protected-access
         gradient descent during training.
       name: Name to give to the DenseFeatures.
       partitioner: Partitioner for input layer. Defaults to None.
+      experimental_fuse_embedding_tables: If True, `embedding_column`s and
+        `shared_embedding_columns` with the same dimension and combiner are
+        looked up together, with one gather per table and one segment
+        reduction, instead of one lookup per column. Tables are not copied:
+        the extra cost is concatenating the looked up rows, which is
+        proportional to the number of unique ids times the dimension. Each
+        table is still its own variable, so checkpoints are unchanged. Columns
+        with weights, `max_norm`, `ckpt_to_load_from` or partitioned tables are
+        looked up separately. Rows without ids are looked up as zeros, as with
+        `use_safe_embedding_lookup=True`. Defaults to False.
+      experimental_fuse_transformations: If True, numeric casts, bucketization
+        and string or integer hashing of columns with matching parameters are
+        each done by one op over the concatenated inputs, instead of one op
+        per column. Outputs are unchanged. Defaults to False.
       **kwargs: Keyword arguments to construct a layer.
 
     Raises:
@@ -98,6 +114,8 @@ class DenseFeatures(kfc._BaseFeaturesLayer):  # pylint: disable=protected-access
         partitioner=partitioner,
         expected_column_type=fc.DenseColumn,
         **kwargs)
+    self._fuse_embedding_tables = experimental_fuse_embedding_tables
+    self._fuse_transformations = experimental_fuse_transformations
 
   @property
   def _is_feature_layer(self):
@@ -117,6 +135,14 @@ class DenseFeatures(kfc._BaseFeaturesLayer):  # pylint: disable=protected-access
   def _target_shape(self, input_shape, total_elements):
     return (input_shape[0], total_elements)
 
+  def get_config(self):
+    config = super(DenseFeatures, self).get_config()
+    if self._fuse_embedding_tables:
+      config['experimental_fuse_embedding_tables'] = True
+    if self._fuse_transformations:
+      config['experimental_fuse_transformations'] = True
+    return config
+
   def call(self, features, cols_to_output_tensors=None, training=None):
     """Returns a dense tensor corresponding to the `feature_columns`.
 
@@ -159,15 +185,25 @@ class DenseFeatures(kfc._BaseFeaturesLayer):  # pylint: disable=protected-access
       raise ValueError('We expected a dictionary here. Instead we got: ',
                        features)
     transformation_cache = fc.FeatureTransformationCache(features)
+    if self._fuse_transformations:
+      transformation_cache.transform_fused(self._feature_columns,
+                                           self._state_manager)
+    fused_tensors = {}
+    if self._fuse_embedding_tables:
+      fused_tensors = fc._fused_embedding_lookups(  # pylint: disable=protected-access
+          self._feature_columns, transformation_cache, self._state_manager)
     output_tensors = []
     for column in self._feature_columns:
       with ops.name_scope(column.name):
-        try:
-          tensor = column.get_dense_tensor(
-              transformation_cache, self._state_manager, training=training)
-        except TypeError:
-          tensor = column.get_dense_tensor(transformation_cache,
-                                           self._state_manager)
+        if column in fused_tensors:
+          tensor = fused_tensors[column]
+        else:
+          try:
+            tensor = column.get_dense_tensor(
+                transformation_cache, self._state_manager, training=training)
+          except TypeError:
+            tensor = column.get_dense_tensor(transformation_cache,
+                                             self._state_manager)
         processed_tensors = self._process_dense_tensor(column, tensor)
         if cols_to_output_tensors is not None:
           cols_to_output_tensors[column] = processed_tensors
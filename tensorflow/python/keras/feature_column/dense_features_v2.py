@@ -62,6 +62,8 @@ class DenseFeatures(dense_features.DenseFeatures):
                feature_columns,
                trainable=True,
                name=None,
+               experimental_fuse_embedding_tables=False,
+               experimental_fuse_transformations=False,
                **kwargs):
     """Creates a DenseFeatures object.
 
@@ -75,6 +77,16 @@ class DenseFeatures(dense_features.DenseFeatures):
       trainable:  Boolean, whether the layer's variables will be updated via
         gradient descent during training.
       name: Name to give to the DenseFeatures.
+      experimental_fuse_embedding_tables: If True, `embedding_column`s and
+        `shared_embedding_columns` with the same dimension and combiner are
+        looked up together, with one gather per table and one segment
+        reduction. Tables are not copied, so this saves per-column overhead at
+        the cost of concatenating the looked up rows. Checkpoints are
+        unchanged. See the V1 layer for details. Defaults to False.
+      experimental_fuse_transformations: If True, similar columns are
+        transformed together with one op per group instead of one op per
+        column. Outputs are unchanged. See the V1 layer for details. Defaults
+        to False.
       **kwargs: Keyword arguments to construct a layer.
 
     Raises:
@@ -84,6 +96,8 @@ class DenseFeatures(dense_features.DenseFeatures):
         feature_columns=feature_columns,
         trainable=trainable,
         name=name,
+        experimental_fuse_embedding_tables=experimental_fuse_embedding_tables,
+        experimental_fuse_transformations=experimental_fuse_transformations,
         **kwargs)
     self._state_manager = fc._StateManagerImplV2(self, self.trainable)  # pylint: disable=protected-access
 
@@ -144,6 +144,86 @@ class DenseFeaturesTest(test.TestCase):
       self.assertAllEqual([0, 1, 2], indexed_slice.indices)
       self.assertAllEqual([[2, 2], [2, 2], [2, 2]], gradient)
 
+  def test_fuse_embedding_tables(self):
+    with context.eager_mode():
+      features = {
+          'a': sparse_tensor.SparseTensor(
+              indices=((0, 0), (1, 0), (2, 0), (2, 1)),
+              values=(0, 1, 2, 0),
+              dense_shape=(3, 2)),
+          # Row 1 has no ids, and -1 is dropped.
+          'b': sparse_tensor.SparseTensor(
+              indices=((0, 0), (2, 0), (2, 1)),
+              values=(3, -1, 1),
+              dense_shape=(3, 2)),
+      }
+
+      def _initializer(shape, dtype, partition_info=None):
+        del dtype  # unused
+        del partition_info  # unused
+        return np.arange(np.prod(shape), dtype=np.float32).reshape(shape)
+
+      def _make_layer(fuse):
+        columns = [
+            fc.embedding_column(
+                fc.categorical_column_with_identity('a', num_buckets=3),
+                dimension=2, combiner='sum', initializer=_initializer),
+            fc.embedding_column(
+                fc.categorical_column_with_identity('b', num_buckets=4),
+                dimension=2, combiner='sum', initializer=_initializer),
+        ]
+        return df.DenseFeatures(
+            columns, experimental_fuse_embedding_tables=fuse)
+
+      expected_layer = _make_layer(False)
+      fused_layer = _make_layer(True)
+      with backprop.GradientTape(persistent=True) as tape:
+        expected = expected_layer(features)
+        fused = fused_layer(features)
+      self.assertAllEqual([[0, 1, 6, 7], [2, 3, 0, 0], [4, 6, 2, 3]],
+                          expected)
+      self.assertAllEqual(expected, fused)
+
+      # The variables and their sparse gradients are the same.
+      self.assertEqual([v.name for v in expected_layer.variables],
+                       [v.name for v in fused_layer.variables])
+      expected_grads = tape.gradient(expected, expected_layer.variables)
+      fused_grads = tape.gradient(fused, fused_layer.variables)
+      for expected_grad, fused_grad in zip(expected_grads, fused_grads):
+        self.assertIsInstance(fused_grad, ops.IndexedSlices)
+        self.assertAllEqual(ops.convert_to_tensor(expected_grad),
+                            ops.convert_to_tensor(fused_grad))
+
+      self.assertTrue(
+          fused_layer.get_config()['experimental_fuse_embedding_tables'])
+      self.assertNotIn('experimental_fuse_embedding_tables',
+                       expected_layer.get_config())
+
+  def test_fuse_transformations(self):
+    columns = [
+        fc.bucketized_column(
+            fc.numeric_column('price_a'), boundaries=[0, 2, 4, 6]),
+        fc.bucketized_column(
+            fc.numeric_column('price_b'), boundaries=[0, 2, 4, 6]),
+    ]
+    features = {'price_a': [[-1.], [5.]], 'price_b': [[3.], [7.]]}
+    outputs = []
+    for fuse, num_bucketize in ((False, 2), (True, 1)):
+      with ops.Graph().as_default() as g:
+        layer = df.DenseFeatures(
+            columns, experimental_fuse_transformations=fuse)
+        output = layer(features)
+        op_types = [op.type for op in g.get_operations()]
+        self.assertEqual(num_bucketize, op_types.count('Bucketize'))
+        outputs.append(self.evaluate(output))
+        if fuse:
+          self.assertTrue(
+              layer.get_config()['experimental_fuse_transformations'])
+        else:
+          self.assertNotIn('experimental_fuse_transformations',
+                           layer.get_config())
+    self.assertAllEqual(outputs[0], outputs[1])
+
   def test_dense_feature_with_training_arg(self):
     price1 = fc.numeric_column('price1', shape=2)
     price2 = fc.numeric_column('price2')
@@ -1406,6 +1406,8 @@ class TFOpLambda(Layer):
 class KerasOpDispatcher(dispatch.GlobalOpDispatcher):
   """A global dispatcher that allows building a functional model with TF Ops."""
 
+  dispatch_types = (keras_tensor.KerasTensor,)
+
   def handle(self, op, args, kwargs):
     """Handle the specified operation with the specified arguments."""
     if any(
@@ -60,6 +60,7 @@ from tensorflow.python.keras.utils.generic_utils import to_list
 from tensorflow.python.keras.utils.tf_utils import is_tensor_or_variable
 from tensorflow.python.ops import array_ops
 from tensorflow.python.ops import check_ops
+from tensorflow.python.ops import clip_ops
 from tensorflow.python.ops import confusion_matrix
 from tensorflow.python.ops import control_flow_ops
 from tensorflow.python.ops import init_ops
@@ -2246,6 +2247,250 @@ class AUC(Metric):
     return dict(list(base_config.items()) + list(config.items()))
 
 
+@keras_export('keras.metrics.StreamingAUC')
+class StreamingAUC(Metric):
+  """Computes a near-exact AUC from a fixed-size histogram of predictions.
+
+  Unlike `AUC`, which evaluates the confusion matrix on a linearly spaced grid
+  of thresholds, this metric accumulates the weight of positive and negative
+  examples in `num_buckets` buckets that are evenly spaced in logit space,
+  i.e. geometrically spaced in the odds `p / (1 - p)`. Buckets are therefore
+  narrow close to 0 and 1, where the predictions of heavily skewed problems
+  such as click-through-rate models concentrate, and the memory footprint does
+  not depend on the number of examples seen.
+
+  The area under the curve is computed exactly over the bucketed predictions:
+  two examples are only ranked incorrectly relative to each other if they fall
+  in the same bucket, in which case they count as a tie (half a correctly
+  ordered pair). With the default settings a bucket spans a relative change of
+  about 0.3% in the odds of the prediction.
+
+  The histograms are plain sums, so the state of several instances (for
+  example metrics computed on different evaluation shards) can be combined
+  with `merge_state`, and per-replica state is summed automatically when the
+  metric is used under a `tf.distribute.Strategy`. The histograms are kept in
+  `float64` so that counts stay exact over billions of examples.
+
+  If `sample_weight` is `None`, weights default to 1.
+  Use `sample_weight` of 0 to mask values.
+
+  Args:
+    num_buckets: (Optional) Defaults to 10000. The number of histogram buckets.
+      Values must be > 1.
+    curve: (Optional) Specifies the name of the curve to be computed, 'ROC'
+      [default] or 'PR' for the Precision-Recall-curve.
+    logit_range: (Optional) Defaults to 16. Buckets cover the logits in
+      `[-logit_range, logit_range]`; predictions outside of this range are
+      assigned to the first or last bucket. The default covers predictions
+      in roughly `[1e-7, 1 - 1e-7]`.
+    name: (Optional) string name of the metric instance.
+    dtype: (Optional) data type of the metric result.
+
+  Standalone usage:
+
+  >>> m = tf.keras.metrics.StreamingAUC()
+  >>> m.update_state([0, 0, 1, 1], [0, 0.5, 0.3, 0.9])
+  >>> m.result().numpy()
+  0.75
+
+  >>> m.reset_states()
+  >>> m.update_state([0, 0, 1, 1], [0, 0.5, 0.3, 0.9],
+  ...                sample_weight=[1, 0, 0, 1])
+  >>> m.result().numpy()
+  1.0
+
+  Usage with `compile()` API:
+
+  ```python
+  model.compile(optimizer='sgd',
+                loss='binary_crossentropy',
+                metrics=[tf.keras.metrics.StreamingAUC()])
+  ```
+  """
+
+  def __init__(self,
+               num_buckets=10000,
+               curve='ROC',
+               logit_range=16.,
+               name=None,
+               dtype=None):
+    if isinstance(curve, metrics_utils.AUCCurve) and curve not in list(
+        metrics_utils.AUCCurve):
+      raise ValueError('Invalid curve: "{}". Valid options are: "{}"'.format(
+          curve, list(metrics_utils.AUCCurve)))
+    if num_buckets <= 1:
+      raise ValueError('`num_buckets` must be > 1.')
+    if logit_range <= 0:
+      raise ValueError('`logit_range` must be > 0.')
+    self.num_buckets = num_buckets
+    self.logit_range = float(logit_range)
+    if isinstance(curve, metrics_utils.AUCCurve):
+      self.curve = curve
+    else:
+      self.curve = metrics_utils.AUCCurve.from_str(curve)
+    super(StreamingAUC, self).__init__(name=name, dtype=dtype)
+
+    self.positives = self.add_weight(
+        'positives',
+        shape=(num_buckets,),
+        initializer=init_ops.zeros_initializer,
+        dtype=dtypes.float64)
+    self.negatives = self.add_weight(
+        'negatives',
+        shape=(num_buckets,),
+        initializer=init_ops.zeros_initializer,
+        dtype=dtypes.float64)
+
+  def _bucketize(self, y_pred):
+    """Maps predictions in [0, 1] to bucket indices evenly spaced in logits."""
+    epsilon = K.epsilon()
+    y_pred = clip_ops.clip_by_value(y_pred, epsilon, 1. - epsilon)
+    logits = math_ops.log(y_pred) - math_ops.log1p(-y_pred)
+    scale = self.num_buckets / (2. * self.logit_range)
+    buckets = math_ops.floor((logits + self.logit_range) * scale)
+    buckets = clip_ops.clip_by_value(buckets, 0., self.num_buckets - 1.)
+    return math_ops.cast(buckets, dtypes.int32)
+
+  def update_state(self, y_true, y_pred, sample_weight=None):
+    """Accumulates the bucketed weight of positive and negative examples.
+
+    Args:
+      y_true: The ground truth values.
+      y_pred: The predicted values, in the range `[0, 1]`.
+      sample_weight: Optional weighting of each example. Defaults to 1. Can be a
+        `Tensor` whose rank is either 0, or the same rank as `y_true`, and must
+        be broadcastable to `y_true`.
+
+    Returns:
+      Update op.
+    """
+    y_true = math_ops.cast(y_true, dtypes.float64)
+    y_pred = math_ops.cast(y_pred, dtypes.float64)
+    [y_pred, y_true], sample_weight = (
+        metrics_utils.ragged_assert_compatible_and_get_flat_values(
+            [y_pred, y_true], sample_weight))
+
+    with ops.control_dependencies([
+        check_ops.assert_greater_equal(
+            y_pred,
+            math_ops.cast(0.0, dtype=y_pred.dtype),
+            message='predictions must be >= 0'),
+        check_ops.assert_less_equal(
+            y_pred,
+            math_ops.cast(1.0, dtype=y_pred.dtype),
+            message='predictions must be <= 1')
+    ]):
+      if sample_weight is None:
+        y_pred, y_true = tf_losses_utils.squeeze_or_expand_dimensions(
+            y_pred, y_true)
+        weights = array_ops.ones_like(y_pred)
+      else:
+        sample_weight = math_ops.cast(sample_weight, dtypes.float64)
+        y_pred, y_true, sample_weight = (
+            tf_losses_utils.squeeze_or_expand_dimensions(
+                y_pred, y_true, sample_weight=sample_weight))
+        weights = weights_broadcast_ops.broadcast_weights(
+            sample_weight, y_pred)
+    y_pred.shape.assert_is_compatible_with(y_true.shape)
+
+    y_true = array_ops.reshape(math_ops.cast(y_true > 0, dtypes.float64), [-1])
+    weights = array_ops.reshape(weights, [-1])
+    buckets = self._bucketize(array_ops.reshape(y_pred, [-1]))
+
+    positives = math_ops.unsorted_segment_sum(y_true * weights, buckets,
+                                              self.num_buckets)
+    negatives = math_ops.unsorted_segment_sum((1. - y_true) * weights,
+                                              buckets, self.num_buckets)
+    return control_flow_ops.group(
+        self.positives.assign_add(positives),
+        self.negatives.assign_add(negatives))
+
+  def merge_state(self, metrics):
+    """Merges the state of other `StreamingAUC` instances into this one.
+
+    Args:
+      metrics: An iterable of `StreamingAUC` instances with the same
+        `num_buckets` and `logit_range` as this metric.
+
+    Returns:
+      Update op.
+
+    Raises:
+      ValueError: If any of `metrics` is not a compatible `StreamingAUC`.
+    """
+    positives = [self.positives]
+    negatives = [self.negatives]
+    for metric in metrics:
+      if (not isinstance(metric, StreamingAUC) or
+          metric.num_buckets != self.num_buckets or
+          metric.logit_range != self.logit_range):
+        raise ValueError(
+            'Metric {} is not compatible with {}: `merge_state` requires '
+            '`StreamingAUC` metrics with the same `num_buckets` and '
+            '`logit_range`.'.format(metric, self))
+      positives.append(metric.positives)
+      negatives.append(metric.negatives)
+    # Use `assign` rather than `assign_add`, which is not supported for summed
+    # sync-on-read variables in a cross-replica context.
+    return control_flow_ops.group(
+        self.positives.assign(math_ops.add_n(positives)),
+        self.negatives.assign(math_ops.add_n(negatives)))
+
+  def _interpolate_pr_auc(self, tp, fp, total_pos):
+    """Davis & Goadrich interpolation of the P-R curve; see `AUC`."""
+    dtp = tp[:-1] - tp[1:]
+    p = tp + fp
+    dp = p[:-1] - p[1:]
+    prec_slope = math_ops.div_no_nan(dtp, math_ops.maximum(dp, 0))
+    intercept = tp[1:] - prec_slope * p[1:]
+    safe_p_ratio = array_ops.where(
+        math_ops.logical_and(p[:-1] > 0, p[1:] > 0),
+        math_ops.div_no_nan(p[:-1], math_ops.maximum(p[1:], 0)),
+        array_ops.ones_like(p[1:]))
+    return math_ops.div_no_nan(
+        math_ops.reduce_sum(
+            prec_slope * (dtp + intercept * math_ops.log(safe_p_ratio))),
+        total_pos)
+
+  def result(self):
+    positives = ops.convert_to_tensor_v2(self.positives)
+    negatives = ops.convert_to_tensor_v2(self.negatives)
+    total_pos = math_ops.reduce_sum(positives)
+    total_neg = math_ops.reduce_sum(negatives)
+
+    if self.curve == metrics_utils.AUCCurve.ROC:
+      # Every positive example is ranked above all negatives in lower buckets
+      # and ties with the negatives that share its bucket.
+      negatives_below = math_ops.cumsum(negatives, exclusive=True)
+      correct_pairs = math_ops.reduce_sum(
+          positives * (negatives_below + 0.5 * negatives))
+      auc = math_ops.div_no_nan(correct_pairs, total_pos * total_neg)
+    else:  # curve == 'PR'.
+      # Confusion matrix at thresholds placed on the lower edge of each bucket,
+      # followed by a final threshold above every prediction.
+      zero = array_ops.zeros([1], dtype=dtypes.float64)
+      tp = array_ops.concat(
+          [math_ops.cumsum(positives, reverse=True), zero], axis=0)
+      fp = array_ops.concat(
+          [math_ops.cumsum(negatives, reverse=True), zero], axis=0)
+      auc = self._interpolate_pr_auc(tp, fp, total_pos)
+    return math_ops.cast(auc, self.dtype, name=self.name)
+
+  def reset_states(self):
+    K.batch_set_value([
+        (v, np.zeros((self.num_buckets,))) for v in self.variables
+    ])
+
+  def get_config(self):
+    config = {
+        'num_buckets': self.num_buckets,
+        'curve': self.curve.value,
+        'logit_range': self.logit_range,
+    }
+    base_config = super(StreamingAUC, self).get_config()
+    return dict(list(base_config.items()) + list(config.items()))
+
+
 @keras_export('keras.metrics.CosineSimilarity')
 class CosineSimilarity(MeanMetricWrapper):
   """Computes the cosine similarity between the labels and predictions.
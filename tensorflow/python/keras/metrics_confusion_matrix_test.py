@@ -1660,5 +1660,137 @@ class MultiAUCTest(test.TestCase, parameterized.TestCase):
       self.assertAllEqual(auc_obj.true_positives, np.zeros((5, 2)))
 
 
+@combinations.generate(combinations.combine(mode=['graph', 'eager']))
+class StreamingAUCTest(test.TestCase, parameterized.TestCase):
+
+  def setup(self):
+    self.y_pred = constant_op.constant([0, 0.5, 0.3, 0.9], dtype=dtypes.float32)
+    self.y_true = constant_op.constant([0, 0, 1, 1])
+    self.sample_weight = [1, 2, 3, 4]
+
+  def test_config(self):
+    auc_obj = metrics.StreamingAUC(
+        num_buckets=100, curve='PR', logit_range=8., name='auc_1')
+    self.assertEqual(auc_obj.name, 'auc_1')
+    self.assertLen(auc_obj.variables, 2)
+    self.assertEqual(auc_obj.num_buckets, 100)
+    self.assertEqual(auc_obj.curve, metrics_utils.AUCCurve.PR)
+    old_config = auc_obj.get_config()
+    self.assertDictEqual(old_config, json.loads(json.dumps(old_config)))
+
+    # Check save and restore config.
+    auc_obj2 = metrics.StreamingAUC.from_config(auc_obj.get_config())
+    self.assertEqual(auc_obj2.name, 'auc_1')
+    self.assertEqual(auc_obj2.num_buckets, 100)
+    self.assertEqual(auc_obj2.logit_range, 8.)
+    self.assertEqual(auc_obj2.curve, metrics_utils.AUCCurve.PR)
+    self.assertDictEqual(old_config, auc_obj2.get_config())
+
+  def test_unweighted(self):
+    self.setup()
+    auc_obj = metrics.StreamingAUC()
+    self.evaluate(variables.variables_initializer(auc_obj.variables))
+    result = auc_obj(self.y_true, self.y_pred)
+
+    # Correctly ordered (positive, negative) pairs:
+    # (0.3, 0), (0.9, 0), (0.9, 0.5) out of 4.
+    self.assertAllClose(self.evaluate(result), 0.75, 1e-6)
+
+  def test_weighted_roc(self):
+    self.setup()
+    auc_obj = metrics.StreamingAUC()
+    self.evaluate(variables.variables_initializer(auc_obj.variables))
+    result = auc_obj(self.y_true, self.y_pred, sample_weight=self.sample_weight)
+
+    # (3 * 1 + 4 * 1 + 4 * 2) / ((3 + 4) * (1 + 2))
+    self.assertAllClose(self.evaluate(result), 15. / 21., 1e-6)
+
+  def test_weighted_pr_interpolation(self):
+    self.setup()
+    auc_obj = metrics.StreamingAUC(curve='PR')
+    self.evaluate(variables.variables_initializer(auc_obj.variables))
+    result = auc_obj(self.y_true, self.y_pred, sample_weight=self.sample_weight)
+
+    # Examples by decreasing prediction: 0.9 (pos, 4), 0.5 (neg, 2),
+    # 0.3 (pos, 3), 0 (neg, 1).
+    # tp = [0, 4, 4, 7, 7], P = tp + fp = [0, 4, 6, 9, 10]
+    # The first positive run has constant precision 1: 4.
+    # The second has slope 1 and intercept 7 - 9 = -2: 3 - 2 * log(9 / 6).
+    expected_result = (4. + 3. - 2. * np.log(1.5)) / 7.
+    self.assertAllClose(self.evaluate(result), expected_result, 1e-6)
+
+  def test_ties_within_bucket(self):
+    auc_obj = metrics.StreamingAUC(num_buckets=2)
+    self.evaluate(variables.variables_initializer(auc_obj.variables))
+    # 0.6 and 0.9 share the upper bucket and count as a tie.
+    result = auc_obj([0, 1, 1], [0.1, 0.6, 0.9])
+    self.assertAllClose(self.evaluate(result), 1., 1e-6)
+    # Adds a negative example to the upper bucket:
+    # (3 * 1 + 3 * 0.5 * 1) / (3 * 2)
+    result = auc_obj([0, 1], [0.9, 0.6])
+    self.assertAllClose(self.evaluate(result), 0.75, 1e-6)
+
+  def test_matches_exact_auc_on_skewed_predictions(self):
+    rng = np.random.RandomState(1337)
+    y_true = (rng.uniform(size=20000) < 0.01).astype(np.float32)
+    y_pred = expit(rng.normal(size=20000) - 6. + 2. * y_true)
+
+    # Exact AUC from the Mann-Whitney U statistic.
+    ranks = np.empty_like(y_pred)
+    ranks[np.argsort(y_pred)] = np.arange(1, len(y_pred) + 1)
+    num_pos = np.sum(y_true)
+    num_neg = len(y_true) - num_pos
+    expected_result = ((np.sum(ranks[y_true == 1]) - num_pos *
+                        (num_pos + 1) / 2.) / (num_pos * num_neg))
+
+    auc_obj = metrics.StreamingAUC()
+    self.evaluate(variables.variables_initializer(auc_obj.variables))
+    result = auc_obj(y_true, y_pred)
+    self.assertAllClose(self.evaluate(result), expected_result, atol=1e-4)
+
+  def test_extra_dims(self):
+    logits = expit(-np.array([[[-10., 10., -10.], [10., -10., 10.]],
+                              [[-12., 12., -12.], [12., -12., 12.]]],
+                             dtype=np.float32))
+    labels = np.array([[[1, 0, 0], [1, 0, 0]],
+                       [[0, 1, 1], [0, 1, 1]]], dtype=np.int64)
+    auc_obj = metrics.StreamingAUC()
+    self.evaluate(variables.variables_initializer(auc_obj.variables))
+    result = auc_obj(labels, logits)
+    self.assertAllClose(self.evaluate(result), 0.5, 1e-6)
+
+  def test_merge_state(self):
+    self.setup()
+    auc_obj = metrics.StreamingAUC()
+    auc_obj2 = metrics.StreamingAUC()
+    self.evaluate(variables.variables_initializer(auc_obj.variables))
+    self.evaluate(variables.variables_initializer(auc_obj2.variables))
+    self.evaluate(auc_obj.update_state(self.y_true[:2], self.y_pred[:2]))
+    self.evaluate(auc_obj2.update_state(self.y_true[2:], self.y_pred[2:]))
+    self.evaluate(auc_obj.merge_state([auc_obj2]))
+    self.assertAllClose(self.evaluate(auc_obj.result()), 0.75, 1e-6)
+
+    with self.assertRaisesRegexp(ValueError, 'is not compatible'):
+      auc_obj.merge_state([metrics.StreamingAUC(num_buckets=10)])
+
+  def test_reset_states(self):
+    self.setup()
+    auc_obj = metrics.StreamingAUC(num_buckets=10)
+    self.evaluate(variables.variables_initializer(auc_obj.variables))
+    self.evaluate(auc_obj.update_state(self.y_true, self.y_pred))
+    auc_obj.reset_states()
+    self.assertAllEqual(self.evaluate(auc_obj.positives), np.zeros((10,)))
+    self.assertAllEqual(self.evaluate(auc_obj.negatives), np.zeros((10,)))
+
+  def test_invalid_num_buckets(self):
+    with self.assertRaisesRegexp(ValueError, '`num_buckets` must be > 1.'):
+      metrics.StreamingAUC(num_buckets=1)
+
+  def test_invalid_curve(self):
+    with self.assertRaisesRegexp(ValueError,
+                                 'Invalid AUC curve value "Invalid".'):
+      metrics.StreamingAUC(curve='Invalid')
+
+
 if __name__ == '__main__':
   test.main()
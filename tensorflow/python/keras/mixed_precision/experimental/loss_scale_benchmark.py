@@ -46,7 +46,8 @@ def _get_strategy(num_gpus):
 class LossScaleBenchmark(test.Benchmark):
   """Benchmark for loss scaling."""
 
-  def _benchmark(self, gradient_type, num_gpus, mode, loss_scaling):
+  def _benchmark(self, gradient_type, num_gpus, mode, loss_scaling,
+                 num_vars=200, fused=True):
     """Benchmarks loss scaling.
 
     We run a simple model with several scalar variables. The loss is the sum of
@@ -66,6 +67,9 @@ class LossScaleBenchmark(test.Benchmark):
       loss_scaling: "fixed", "dynamic", or None. The type of loss scaling to
         use. None means use no loss scaling, which is useful as a baseline to
         see how much slower loss scaling is in comparison.
+      num_vars: The number of variables in the model.
+      fused: Whether gradients of the same dtype are unscaled and checked for
+        NaNs together.
     """
     if mode == 'graph':
       graph = ops.Graph()
@@ -77,7 +81,13 @@ class LossScaleBenchmark(test.Benchmark):
       ctx_mgr = context.eager_mode()
     ls_str = loss_scaling or 'no_loss_scaling'
     name = '%s_%d_GPU_%s_%s' % (gradient_type, num_gpus, mode, ls_str)
-    with ctx_mgr, _get_strategy(num_gpus).scope() as strategy:
+    if num_vars != 200:
+      name += '_%d_vars' % num_vars
+    if not fused:
+      name += '_unfused'
+    fuse_gradients = test.mock.patch.object(loss_scale_module,
+                                            '_FUSE_GRADIENTS', fused)
+    with ctx_mgr, fuse_gradients, _get_strategy(num_gpus).scope() as strategy:
       opt = adam.Adam()
       if loss_scaling == 'fixed':
         loss_scale = loss_scale_module.FixedLossScale(2.)
@@ -94,17 +104,15 @@ class LossScaleBenchmark(test.Benchmark):
         assert loss_scaling is None
         loss_scale = None
 
-      num_vars = 200
       num_warmup_iters = 1
       num_iters = 20
       # By using scalar variables, we reduce overhead of the actual GPU work of
       # multiplying variables, dividing gradients, and checking gradients for
-      # NaNs. Measuring these overheads isn't very useful as there is little we
-      # can do to reduce them (one such way would be to fuse dividing gradients
-      # and checking them for NaNs). We still have all other overheads, such as
-      # all-reducing the `is_finite` values and having a tf.cond or
-      # tf.while_loop based on whether gradients are NaNs. Currently, these
-      # other overheads are much more significant than the GPU work.
+      # NaNs, so the per-op overhead of these steps dominates. Fusing gradients
+      # of the same dtype reduces that overhead, which `benchmark_fusion`
+      # measures. We still have all other overheads, such as all-reducing the
+      # `is_finite` values and having a tf.cond or tf.while_loop based on
+      # whether gradients are NaNs.
       var_list = [
           variables.Variable(i, dtype='float32') for i in range(num_vars)]
 
@@ -174,6 +182,15 @@ class LossScaleBenchmark(test.Benchmark):
         for loss_scaling in None, 'fixed', 'dynamic':
           self._benchmark('gradient_tape', num_gpus, mode, loss_scaling)
 
+  def benchmark_fusion(self):
+    # Step time of fused and unfused loss scaling as the number of variables
+    # grows. Gradients are only fused in functions and graphs.
+    for num_gpus in self._gpus_to_test_with():
+      for num_vars in 10, 100, 1000:
+        for fused in True, False:
+          self._benchmark('optimizer', num_gpus, 'tf_function', 'dynamic',
+                          num_vars=num_vars, fused=fused)
+
 
 if __name__ == '__main__':
   test.main()
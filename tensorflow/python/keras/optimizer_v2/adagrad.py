@@ -25,7 +25,10 @@ from tensorflow.python.framework import ops
 from tensorflow.python.keras import backend_config
 from tensorflow.python.keras.optimizer_v2 import optimizer_v2
 from tensorflow.python.ops import array_ops
+from tensorflow.python.ops import control_flow_ops
 from tensorflow.python.ops import init_ops
+from tensorflow.python.ops import math_ops
+from tensorflow.python.ops import state_ops
 from tensorflow.python.training import training_ops
 from tensorflow.python.util.tf_export import keras_export
 
@@ -78,6 +81,11 @@ class Adagrad(optimizer_v2.OptimizerV2):
 
   def _create_slots(self, var_list):
     for var in var_list:
+      if self._quantizes_slots_of(var):
+        self._add_quantized_slot(var, 'accumulator',
+                                 self._initial_accumulator_value,
+                                 non_negative=True)
+        continue
       dtype = var.dtype.base_dtype
       init = init_ops.constant_initializer(
           self._initial_accumulator_value, dtype=dtype)
@@ -128,6 +136,9 @@ class Adagrad(optimizer_v2.OptimizerV2):
     coefficients = ((apply_state or {}).get((var_device, var_dtype))
                     or self._fallback_apply_state(var_device, var_dtype))
 
+    if self._has_quantized_slot(var, 'accumulator'):
+      return self._resource_apply_quantized(grad, var, coefficients)
+
     acc = self.get_slot(var, 'accumulator')
     return training_ops.resource_apply_adagrad_v2(
         var.handle,
@@ -137,11 +148,54 @@ class Adagrad(optimizer_v2.OptimizerV2):
         grad,
         use_locking=self._use_locking)
 
+  def _resource_apply_dense_grouped(self, grads, var_list, apply_state):
+    var_device, var_dtype = var_list[0].device, var_list[0].dtype.base_dtype
+    coefficients = ((apply_state or {}).get((var_device, var_dtype))
+                    or self._fallback_apply_state(var_device, var_dtype))
+
+    def update(grad, acc):
+      # Same as the ApplyAdagradV2 kernel.
+      acc_t = acc + math_ops.square(grad)
+      return -coefficients['lr_t'] * grad / (
+          math_ops.sqrt(acc_t) + coefficients['epsilon']), acc_t
+
+    return self._apply_flat_update(grads, var_list, ['accumulator'], update)
+
+  def _resource_apply_quantized(self, grad, var, coefficients, indices=None):
+    """Applies a gradient to a variable with quantized accumulators.
+
+    Args:
+      grad: the gradient, or the gradient of the rows at `indices`.
+      var: the variable.
+      coefficients: the apply state of the variable's device and dtype.
+      indices: optional unique indices of the rows `grad` updates.
+
+    Returns:
+      An `Operation` which updates the variable and its accumulator.
+    """
+    acc = self._read_quantized_slot(
+        var, 'accumulator', non_negative=True, indices=indices)
+    # Same as the ApplyAdagradV2 and SparseApplyAdagradV2 kernels.
+    acc_t = acc + math_ops.square(grad)
+    update = coefficients['lr_t'] * grad / (
+        math_ops.sqrt(acc_t) + coefficients['epsilon'])
+    acc_update = self._write_quantized_slot(
+        var, 'accumulator', acc_t, non_negative=True, indices=indices)
+    if indices is None:
+      var_update = state_ops.assign_sub(
+          var, update, use_locking=self._use_locking)
+    else:
+      var_update = self._resource_scatter_add(var, indices, -update)
+    return control_flow_ops.group(var_update, acc_update)
+
   def _resource_apply_sparse(self, grad, var, indices, apply_state=None):
     var_device, var_dtype = var.device, var.dtype.base_dtype
     coefficients = ((apply_state or {}).get((var_device, var_dtype))
                     or self._fallback_apply_state(var_device, var_dtype))
 
+    if self._has_quantized_slot(var, 'accumulator'):
+      return self._resource_apply_quantized(grad, var, coefficients, indices)
+
     acc = self.get_slot(var, 'accumulator')
     return training_ops.resource_sparse_apply_adagrad_v2(
         var.handle,
@@ -536,6 +536,49 @@ class AdagradOptimizerTest(test.TestCase, parameterized.TestCase):
     self.assertAllClose(self.evaluate(opt_2.lr), (1.0))
     self.assertAllClose(self.evaluate(opt_3.lr), (0.1))
 
+  @combinations.generate(combinations.combine(mode=["graph", "eager"]))
+  def testQuantizedSlots(self):
+    with self.cached_session(use_gpu=True):
+      np.random.seed(0)
+      var0_np = np.random.randn(64, 300).astype(np.float32)
+      var1_np = np.random.randn(64, 300).astype(np.float32)
+      grads0_np = np.random.uniform(0.5, 1.5, size=[64, 300]).astype(np.float32)
+      grads1_np = np.random.uniform(0.5, 1.5, size=[3, 300]).astype(np.float32)
+      indices = np.array([0, 5, 9], dtype=np.int32)
+      var0 = variables.Variable(var0_np)
+      var1 = variables.Variable(var1_np)
+      grads0 = constant_op.constant(grads0_np)
+      grads1 = ops.IndexedSlices(
+          constant_op.constant(grads1_np), constant_op.constant(indices),
+          constant_op.constant([64, 300]))
+
+      opt = adagrad.Adagrad(quantize_slots=True)
+      if not context.executing_eagerly():
+        update = opt.apply_gradients(zip([grads0, grads1], [var0, var1]))
+      self.evaluate(variables.global_variables_initializer())
+
+      accum0_np = np.full([64, 300], 0.1, dtype=np.float32)
+      accum1_np = np.full([64, 300], 0.1, dtype=np.float32)
+      for _ in range(3):
+        if not context.executing_eagerly():
+          self.evaluate(update)
+        else:
+          opt.apply_gradients(zip([grads0, grads1], [var0, var1]))
+        var0_np, accum0_np = adagrad_update_numpy(
+            var0_np, accum0_np, grads0_np)
+        var1_np, accum1_np = sparse_adagrad_update_numpy(
+            var1_np, accum1_np, indices, grads1_np)
+        self.assertAllClose(var0_np, self.evaluate(var0), rtol=0, atol=1e-4)
+        self.assertAllClose(var1_np, self.evaluate(var1), rtol=0, atol=1e-4)
+
+      self.assertEqual(
+          dtypes.int8, opt.get_slot(var0, "accumulator_codes").dtype)
+      self.assertAllClose(
+          np.sqrt(accum1_np),
+          np.sqrt(self.evaluate(opt._read_quantized_slot(
+              var1, "accumulator", non_negative=True))),
+          rtol=0, atol=0.01)
+
 
 if __name__ == "__main__":
   test.main()
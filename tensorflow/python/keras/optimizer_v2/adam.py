@@ -123,13 +123,14 @@ class Adam(optimizer_v2.OptimizerV2):
   def _create_slots(self, var_list):
     # Create slots for the first and second moments.
     # Separate for-loops to respect the ordering of slot variables from v1.
-    for var in var_list:
-      self.add_slot(var, 'm')
-    for var in var_list:
-      self.add_slot(var, 'v')
-    if self.amsgrad:
+    slot_names = ['m', 'v', 'vhat'] if self.amsgrad else ['m', 'v']
+    for slot_name in slot_names:
       for var in var_list:
-        self.add_slot(var, 'vhat')
+        if self._quantizes_slots_of(var):
+          self._add_quantized_slot(var, slot_name,
+                                   non_negative=slot_name != 'm')
+        else:
+          self.add_slot(var, slot_name)
 
   def _prepare_local(self, var_device, var_dtype, apply_state):
     super(Adam, self)._prepare_local(var_device, var_dtype, apply_state)
@@ -167,6 +168,9 @@ class Adam(optimizer_v2.OptimizerV2):
     coefficients = ((apply_state or {}).get((var_device, var_dtype))
                     or self._fallback_apply_state(var_device, var_dtype))
 
+    if self._has_quantized_slot(var, 'm'):
+      return self._resource_apply_quantized(grad, var, coefficients)
+
     m = self.get_slot(var, 'm')
     v = self.get_slot(var, 'v')
 
@@ -199,11 +203,63 @@ class Adam(optimizer_v2.OptimizerV2):
           grad,
           use_locking=self._use_locking)
 
+  def _resource_apply_dense_grouped(self, grads, var_list, apply_state):
+    var_device, var_dtype = var_list[0].device, var_list[0].dtype.base_dtype
+    coefficients = ((apply_state or {}).get((var_device, var_dtype))
+                    or self._fallback_apply_state(var_device, var_dtype))
+
+    def update(grad, m, v, vhat=None):
+      # Same as the ApplyAdam and ApplyAdamWithAmsgrad kernels.
+      m_t = m + (grad - m) * coefficients['one_minus_beta_1_t']
+      v_t = v + (math_ops.square(grad) - v) * coefficients['one_minus_beta_2_t']
+      if not self.amsgrad:
+        return (-coefficients['lr'] * m_t /
+                (math_ops.sqrt(v_t) + coefficients['epsilon']), m_t, v_t)
+      vhat_t = math_ops.maximum(vhat, v_t)
+      return (-coefficients['lr'] * m_t /
+              (math_ops.sqrt(vhat_t) + coefficients['epsilon']), m_t, v_t,
+              vhat_t)
+
+    slot_names = ['m', 'v', 'vhat'] if self.amsgrad else ['m', 'v']
+    return self._apply_flat_update(grads, var_list, slot_names, update)
+
+  def _resource_apply_quantized(self, grad, var, coefficients):
+    """Applies a dense gradient to a variable with quantized slots."""
+    m = self._read_quantized_slot(var, 'm')
+    v = self._read_quantized_slot(var, 'v', non_negative=True)
+    # An element whose second moment rounds to zero would otherwise take a step
+    # of about m / epsilon.
+    m = array_ops.where_v2(v > 0, m, array_ops.zeros_like(m))
+    # Same as the ApplyAdam and ApplyAdamWithAmsgrad kernels.
+    m_t = m + (grad - m) * coefficients['one_minus_beta_1_t']
+    v_t = v + (math_ops.square(grad) - v) * coefficients['one_minus_beta_2_t']
+    slot_updates = [
+        self._write_quantized_slot(var, 'm', m_t),
+        self._write_quantized_slot(var, 'v', v_t, non_negative=True)
+    ]
+    if self.amsgrad:
+      v_t = math_ops.maximum(
+          self._read_quantized_slot(var, 'vhat', non_negative=True), v_t)
+      slot_updates.append(
+          self._write_quantized_slot(var, 'vhat', v_t, non_negative=True))
+    var_update = state_ops.assign_sub(
+        var, coefficients['lr'] * m_t / (
+            math_ops.sqrt(v_t) + coefficients['epsilon']),
+        use_locking=self._use_locking)
+    return control_flow_ops.group(var_update, *slot_updates)
+
   def _resource_apply_sparse(self, grad, var, indices, apply_state=None):
     var_device, var_dtype = var.device, var.dtype.base_dtype
     coefficients = ((apply_state or {}).get((var_device, var_dtype))
                     or self._fallback_apply_state(var_device, var_dtype))
 
+    if self._has_quantized_slot(var, 'm'):
+      # The moments of every row decay, so the update is dense anyway.
+      grad = array_ops.scatter_nd(
+          array_ops.expand_dims(indices, -1), grad,
+          array_ops.shape(var, out_type=indices.dtype))
+      return self._resource_apply_quantized(grad, var, coefficients)
+
     # m_t = beta1 * m + (1 - beta1) * g_t
     m = self.get_slot(var, 'm')
     m_scaled_g_values = grad * coefficients['one_minus_beta_1_t']
@@ -568,6 +568,82 @@ class AdamOptimizerTest(test.TestCase, parameterized.TestCase):
     self.assertAllClose(self.evaluate(opt_2.lr), (1.0))
     self.assertAllClose(self.evaluate(opt_3.lr), (0.1))
 
+  def _quantized_slots_test_values(self):
+    np.random.seed(0)
+    var_np = np.random.randn(64, 300).astype(np.float32)
+    # Gradients of similar magnitudes, so that every element of a block is
+    # quantized with a small relative error.
+    grads_np = (np.random.uniform(0.5, 1.5, size=[64, 300]) *
+                np.random.choice([-1, 1], size=[64, 300])).astype(np.float32)
+    return var_np, grads_np
+
+  @combinations.generate(combinations.combine(mode=["graph", "eager"]))
+  def testQuantizedSlots(self):
+    for amsgrad in [False, True]:
+      with self.cached_session(use_gpu=True):
+        var0_np, grads0_np = self._quantized_slots_test_values()
+        var1_np = np.array([1.0, 2.0], dtype=np.float32)
+        grads1_np = np.array([0.1, 0.1], dtype=np.float32)
+        var0 = variables.Variable(var0_np)
+        var1 = variables.Variable(var1_np)
+        grads0 = constant_op.constant(grads0_np)
+        grads1 = constant_op.constant(grads1_np)
+
+        opt = adam.Adam(amsgrad=amsgrad, quantize_slots=True)
+        if not context.executing_eagerly():
+          update = opt.apply_gradients(zip([grads0, grads1], [var0, var1]))
+        self.evaluate(variables.global_variables_initializer())
+
+        m0, v0, v0hat, m1, v1, v1hat = 0.0, 0.0, 0.0, 0.0, 0.0, 0.0
+        for t in range(3):
+          if not context.executing_eagerly():
+            self.evaluate(update)
+          else:
+            opt.apply_gradients(zip([grads0, grads1], [var0, var1]))
+          if amsgrad:
+            var0_np, m0, v0, v0hat = adam_update_numpy_amsgrad(
+                var0_np, grads0_np, t, m0, v0, v0hat)
+            var1_np, m1, v1, v1hat = adam_update_numpy_amsgrad(
+                var1_np, grads1_np, t, m1, v1, v1hat)
+          else:
+            var0_np, m0, v0 = adam_update_numpy(var0_np, grads0_np, t, m0, v0)
+            var1_np, m1, v1 = adam_update_numpy(var1_np, grads1_np, t, m1, v1)
+          self.assertAllClose(var0_np, self.evaluate(var0), rtol=0, atol=1e-4)
+          self.assertAllClose(var1_np, self.evaluate(var1))
+
+        self.assertEqual(dtypes.int8, opt.get_slot(var0, "m_codes").dtype)
+        self.assertEqual([64, 2, 150], opt.get_slot(var0, "v_codes").shape)
+        self.assertEqual([64, 2], opt.get_slot(var0, "v_scales").shape)
+        # Small variables keep full precision slots.
+        self.assertEqual(dtypes.float32, opt.get_slot(var1, "m").dtype)
+
+  @combinations.generate(combinations.combine(mode=["graph", "eager"]))
+  def testQuantizedSlotsSparse(self):
+    with self.cached_session(use_gpu=True):
+      var0_np, grads0_np = self._quantized_slots_test_values()
+      indices = np.array([0, 5, 9], dtype=np.int32)
+      dense_grads0_np = np.zeros_like(grads0_np)
+      dense_grads0_np[indices] = grads0_np[indices]
+      var0 = variables.Variable(var0_np)
+      grads0 = ops.IndexedSlices(
+          constant_op.constant(grads0_np[indices]),
+          constant_op.constant(indices), constant_op.constant([64, 300]))
+
+      opt = adam.Adam(quantize_slots=True)
+      if not context.executing_eagerly():
+        update = opt.apply_gradients([(grads0, var0)])
+      self.evaluate(variables.global_variables_initializer())
+
+      m0, v0 = 0.0, 0.0
+      for t in range(3):
+        if not context.executing_eagerly():
+          self.evaluate(update)
+        else:
+          opt.apply_gradients([(grads0, var0)])
+        var0_np, m0, v0 = adam_update_numpy(
+            var0_np, dense_grads0_np, t, m0, v0)
+        self.assertAllClose(var0_np, self.evaluate(var0), rtol=0, atol=1e-4)
+
 
 class NonFusedAdamOptimizerTest(test.TestCase, parameterized.TestCase):
 
@@ -148,6 +148,26 @@ class SGD(optimizer_v2.OptimizerV2):
       return training_ops.resource_apply_gradient_descent(
           var.handle, coefficients["lr_t"], grad, use_locking=self._use_locking)
 
+  def _resource_apply_dense_grouped(self, grads, var_list, apply_state):
+    var_device, var_dtype = var_list[0].device, var_list[0].dtype.base_dtype
+    coefficients = ((apply_state or {}).get((var_device, var_dtype))
+                    or self._fallback_apply_state(var_device, var_dtype))
+
+    if not self._momentum:
+      return self._apply_flat_update(
+          grads, var_list, [], lambda grad: (-coefficients["lr_t"] * grad,))
+
+    def update(grad, momentum):
+      # Same as the ApplyKerasMomentum kernel.
+      momentum_t = (momentum * coefficients["momentum"] -
+                    coefficients["lr_t"] * grad)
+      if self.nesterov:
+        return (momentum_t * coefficients["momentum"] -
+                coefficients["lr_t"] * grad, momentum_t)
+      return momentum_t, momentum_t
+
+    return self._apply_flat_update(grads, var_list, ["momentum"], update)
+
   def _resource_apply_sparse_duplicate_indices(self, grad, var, indices,
                                                **kwargs):
     if self._momentum:
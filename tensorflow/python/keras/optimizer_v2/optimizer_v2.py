@@ -20,11 +20,13 @@ from __future__ import division
 from __future__ import print_function
 
 import abc
+import collections
 import contextlib
 import functools
 
 import six
 
+from tensorflow.python.distribute import collective_util
 from tensorflow.python.distribute import distribution_strategy_context as distribute_ctx
 from tensorflow.python.distribute import parameter_server_strategy
 from tensorflow.python.distribute import reduce_util as ds_reduce_util
@@ -38,6 +40,7 @@ from tensorflow.python.keras import backend
 from tensorflow.python.keras import initializers
 from tensorflow.python.keras.engine import base_layer_utils
 from tensorflow.python.keras.optimizer_v2 import learning_rate_schedule
+from tensorflow.python.keras.optimizer_v2 import slot_quantization
 from tensorflow.python.keras.utils import generic_utils
 from tensorflow.python.keras.utils import tf_utils
 from tensorflow.python.ops import array_ops
@@ -55,6 +58,9 @@ from tensorflow.python.util import nest
 from tensorflow.python.util import tf_inspect
 from tensorflow.python.util.tf_export import keras_export
 
+# Suffix of the names of the flat slots of slot groups, see `grouped_apply`.
+_GROUPED_SLOT_SUFFIX = "_grouped"
+
 
 def _deduplicate_indexed_slices(values, indices):
   """Sums `values` associated with any non-unique `indices`.
@@ -164,6 +170,15 @@ class OptimizerV2(trackable.Trackable):
   `experimental_aggregate_gradients` set to False. This is useful if you need to
   process aggregated gradients.
 
+  By default, gradients are all-reduced together once they have all been
+  computed. To overlap communication with the backward pass, pass
+  `gradient_bucket_bytes` to the constructor. The gradients are then reduced in
+  buckets of about that many bytes, starting from the last variables, whose
+  gradients are computed first. Inside a `tf.function` each bucket's
+  all-reduce runs as soon as its gradients are available, while the rest of
+  the gradients are still being computed. Bucketing applies to strategies that
+  use collective ops, such as `tf.distribute.MultiWorkerMirroredStrategy`.
+
   If you are not using these and you want to average gradients, you should use
   `tf.math.reduce_sum` to add up your per-example losses and then divide by the
   global batch size. Note that when using `tf.distribute.Strategy`, the first
@@ -172,6 +187,33 @@ class OptimizerV2(trackable.Trackable):
   step. As a result, using `tf.math.reduce_mean` will give the wrong answer,
   resulting in gradients that can be many times too big.
 
+  ### Grouped updates
+
+  By default each variable is updated by its own ops. Models with many small
+  variables, such as biases and normalization parameters, can instead pass
+  `grouped_apply=True` to `SGD`, `Adam`, `RMSprop` or `Adagrad`. The first time
+  variables are passed to `apply_gradients`, those with dense gradients are
+  grouped by dtype and device, and each slot of a group is kept in one flat
+  slot variable. A step then computes the update of a whole group with a few
+  ops over the concatenated gradients and the flat slots, and adds its part of
+  the update to each variable. Flat slots are slots of the group's first
+  variable, named e.g. `m_grouped`; the other variables of the group have no
+  slots. Variables with sparse gradients or constraints, and variables which
+  already have slots, e.g. restored from a checkpoint written without
+  `grouped_apply`, are updated separately.
+
+  ### Quantized slots
+
+  Slots of `Adam` and `Adagrad` take two or three times the memory of the
+  variables they train. Passing `quantize_slots=True` stores them in 8 bits:
+  each row of a slot is split into blocks of 256 elements, and a block is kept
+  as int8 codes and one float32 scale. Updates dequantize the slots, compute
+  the new values in full precision and quantize them again, and sparse updates
+  only touch the rows they update. Checkpoints hold the codes and scales, as
+  slots named e.g. `m_codes` and `m_scales`. Variables of rank 0 or 1,
+  variables with fewer than 4096 elements and variables with fewer than 8
+  elements per row keep full precision slots.
+
   ### Variable Constraints
 
   All Keras optimizers respect variable constraints. If constraint function is
@@ -288,15 +330,25 @@ class OptimizerV2(trackable.Trackable):
       name: A non-empty string.  The name to use for accumulators created
         for the optimizer.
       **kwargs: keyword arguments. Allowed to be {`clipnorm`, `clipvalue`, `lr`,
-        `decay`}. `clipnorm` is clip gradients by norm; `clipvalue` is clip
-        gradients by value, `decay` is included for backward compatibility to
-        allow time inverse decay of learning rate. `lr` is included for backward
+        `decay`, `gradient_bucket_bytes`, `grouped_apply`, `quantize_slots`}.
+        `clipnorm` is clip gradients by norm; `clipvalue` is clip gradients by
+        value, `decay` is included for backward compatibility to allow time
+        inverse decay of learning rate. `lr` is included for backward
         compatibility, recommended to use `learning_rate` instead.
+        `gradient_bucket_bytes` is the size of the buckets gradients are
+        all-reduced in under a `tf.distribute.Strategy`; 0 (the default)
+        reduces all gradients in one batch. `grouped_apply` keeps the slots of
+        variables of the same dtype and device in flat slots and updates the
+        variables together, if the optimizer supports it. `quantize_slots`
+        stores large slots in 8 bits, if the optimizer supports it.
 
     Raises:
       ValueError: If name is malformed.
     """
-    allowed_kwargs = {"clipnorm", "clipvalue", "lr", "decay"}
+    allowed_kwargs = {
+        "clipnorm", "clipvalue", "lr", "decay", "gradient_bucket_bytes",
+        "grouped_apply", "quantize_slots"
+    }
     for k in kwargs:
       if k not in allowed_kwargs:
         raise TypeError("Unexpected keyword argument "
@@ -311,6 +363,10 @@ class OptimizerV2(trackable.Trackable):
     # dict: {variable name : {slot name : variable}}
     self._slots = {}
     self._slot_names = []
+    # With `grouped_apply`, lists of variables whose slots are kept in the flat
+    # slots of the first variable, and {variable key: index of its group}.
+    self._slot_groups = []
+    self._slot_group_index = {}
     self._weights = []
     self._iterations = None
 
@@ -335,6 +391,9 @@ class OptimizerV2(trackable.Trackable):
       raise ValueError("Gradient clipping in the optimizer "
                        "(by setting clipnorm or clipvalue) is currently "
                        "unsupported when using a distribution strategy.")
+    self.gradient_bucket_bytes = kwargs.pop("gradient_bucket_bytes", None)
+    self.grouped_apply = kwargs.pop("grouped_apply", False)
+    self.quantize_slots = kwargs.pop("quantize_slots", False)
 
     self._hypers_created = False
 
@@ -516,6 +575,8 @@ class OptimizerV2(trackable.Trackable):
     with backend.name_scope(self._name):
       # Create iteration if necessary.
       with ops.init_scope():
+        if self.grouped_apply and self._supports_grouped_apply():
+          self._create_slot_groups(grads_and_vars)
         self._create_all_weights(var_list)
 
       if not grads_and_vars:
@@ -560,9 +621,14 @@ class OptimizerV2(trackable.Trackable):
     """
     grads_and_vars = list(grads_and_vars)
     filtered_grads_and_vars = _filter_grads(grads_and_vars)
+    # Collective all-reduce splits the gradients into packs of
+    # `bytes_per_pack`, in reverse order, and each pack only depends on its own
+    # gradients, so the packs are the buckets that overlap with backprop.
+    hints = collective_util.Hints(
+        bytes_per_pack=self.gradient_bucket_bytes or 0)
     def all_reduce_fn(distribution, grads_and_vars):
       return distribution.extended.batch_reduce_to(
-          ds_reduce_util.ReduceOp.SUM, grads_and_vars)
+          ds_reduce_util.ReduceOp.SUM, grads_and_vars, experimental_hints=hints)
     # We switch to a cross-replica context since there is a bug which causes
     # IndexedSlices to be converted to dense tensors when all-reduced in a
     # replica context.
@@ -612,17 +678,46 @@ class OptimizerV2(trackable.Trackable):
       else:
         return update_op
 
+    # TODO(crccw): It's not allowed to assign PerReplica value to
+    # MirroredVariable.  Remove this after we relax this restriction.
+    def _assume_mirrored(grad):
+      if isinstance(grad, ds_values.PerReplica):
+        return ds_values.Mirrored(grad.values)
+      return grad
+
+    def apply_grads_to_update_vars(first_var, other_vars, grads):
+      """Apply gradients to a slot group."""
+      return self._resource_apply_dense_grouped(
+          grads, [first_var] + list(other_vars), apply_state)
+
     eagerly_outside_functions = ops.executing_eagerly_outside_functions()
     update_ops = []
     with ops.name_scope(name or self._name, skip_on_eager=True):
-      for grad, var in grads_and_vars:
-        # TODO(crccw): It's not allowed to assign PerReplica value to
-        # MirroredVariable.  Remove this after we relax this restriction.
-        def _assume_mirrored(grad):
-          if isinstance(grad, ds_values.PerReplica):
-            return ds_values.Mirrored(grad.values)
-          return grad
+      if self._slot_groups:
+        group_grads = {}
+        remaining = []
+        for grad, var in grads_and_vars:
+          index = self._slot_group_index.get(_var_key(var))
+          if index is None:
+            remaining.append((grad, var))
+          else:
+            group_grads.setdefault(index, {})[_var_key(var)] = grad
+        grads_and_vars = remaining
+        for index, grads_by_key in sorted(group_grads.items()):
+          var_list = self._slot_groups[index]
+          grads = [
+              nest.map_structure(_assume_mirrored, grads_by_key[_var_key(var)])
+              if _var_key(var) in grads_by_key else None for var in var_list
+          ]
+          # The other variables and their slots are mirrored like the first
+          # one, so `update` passes each replica its own components.
+          with distribution.extended.colocate_vars_with(var_list[0]):
+            with ops.name_scope("update_grouped", skip_on_eager=True):
+              update_ops.extend(distribution.extended.update(
+                  var_list[0], apply_grads_to_update_vars,
+                  args=(list(var_list[1:]), grads), group=False))
 
+      for grad, var in grads_and_vars:
         grad = nest.map_structure(_assume_mirrored, grad)
         # Colocate the update with variables to avoid unnecessary communication
         # delays. See b/136304694.
@@ -734,8 +829,8 @@ class OptimizerV2(trackable.Trackable):
 
   def add_slot(self, var, slot_name, initializer="zeros"):
     """Add a new slot variable for `var`."""
-    if slot_name not in self._slot_names:
-      self._slot_names.append(slot_name)
+    if _var_key(var) in self._slot_group_index:
+      return self._add_grouped_slot(var, slot_name, initializer)
     var_key = _var_key(var)
     slot_dict = self._slots.setdefault(var_key, {})
     weight = slot_dict.get(slot_name, None)
@@ -746,30 +841,157 @@ class OptimizerV2(trackable.Trackable):
             initializer, shape=var.shape, dtype=var.dtype)
       else:
         initial_value = initializer
-      strategy = distribute_ctx.get_strategy()
-      if not strategy.extended.variable_created_in_scope(var):
-        raise ValueError(
-            "Trying to create optimizer slot variable under the scope for "
-            "tf.distribute.Strategy ({}), which is different from the scope "
-            "used for the original variable ({}). Make sure the slot "
-            "variables are created under the same strategy scope. This may "
-            "happen if you're restoring from a checkpoint outside the scope"
-            .format(strategy, var))
-
-      with strategy.extended.colocate_vars_with(var):
-        weight = tf_variables.Variable(
-            name="%s/%s" % (var._shared_name, slot_name),  # pylint: disable=protected-access
-            dtype=var.dtype,
-            trainable=False,
-            initial_value=initial_value)
-      backend.track_variable(weight)
-      slot_dict[slot_name] = weight
-      self._restore_slot_variable(
-          slot_name=slot_name, variable=var,
-          slot_variable=weight)
-      self._weights.append(weight)
+      weight = self._add_slot_variable(var, slot_name, initial_value, var.dtype)
+    return weight
+
+  def _add_slot_variable(self, var, slot_name, initial_value, dtype):
+    """Creates the slot variable `slot_name` of `var`, which must not exist."""
+    if slot_name not in self._slot_names:
+      self._slot_names.append(slot_name)
+    strategy = distribute_ctx.get_strategy()
+    if not strategy.extended.variable_created_in_scope(var):
+      raise ValueError(
+          "Trying to create optimizer slot variable under the scope for "
+          "tf.distribute.Strategy ({}), which is different from the scope "
+          "used for the original variable ({}). Make sure the slot "
+          "variables are created under the same strategy scope. This may "
+          "happen if you're restoring from a checkpoint outside the scope"
+          .format(strategy, var))
+
+    with strategy.extended.colocate_vars_with(var):
+      weight = tf_variables.Variable(
+          name="%s/%s" % (var._shared_name, slot_name),  # pylint: disable=protected-access
+          dtype=dtype,
+          trainable=False,
+          initial_value=initial_value)
+    backend.track_variable(weight)
+    self._slots.setdefault(_var_key(var), {})[slot_name] = weight
+    self._restore_slot_variable(
+        slot_name=slot_name, variable=var,
+        slot_variable=weight)
+    self._weights.append(weight)
     return weight
 
+  def _create_slot_groups(self, grads_and_vars):
+    """Groups variables which have no slots yet, see `grouped_apply`."""
+
+    def has_slots(var):
+      return (_var_key(var) in self._slot_group_index or
+              self._quantizes_slots_of(var) or
+              any(not slot_name.endswith(_GROUPED_SLOT_SUFFIX)
+                  for slot_name in self._slots.get(_var_key(var), {})))
+
+    groups, _ = _group_dense_grads_and_vars(grads_and_vars, exclude=has_slots)
+    for group in groups:
+      for _, var in group:
+        self._slot_group_index[_var_key(var)] = len(self._slot_groups)
+      self._slot_groups.append([var for _, var in group])
+
+  def _add_grouped_slot(self, var, slot_name, initializer):
+    """Returns the flat slot `slot_name` of the group of `var`, creating it."""
+    var_list = self._slot_groups[self._slot_group_index[_var_key(var)]]
+    first_var = var_list[0]
+    flat_name = slot_name + _GROUPED_SLOT_SUFFIX
+    size = sum(v.shape.num_elements() for v in var_list)
+    weight = self._slots.get(_var_key(first_var), {}).get(flat_name)
+    if weight is None:
+      if isinstance(initializer, six.string_types) or callable(initializer):
+        initializer = initializers.get(initializer)
+        initial_value = functools.partial(
+            initializer, shape=[size], dtype=first_var.dtype)
+      else:
+        initial_value = initializer
+      weight = self._add_slot_variable(first_var, flat_name, initial_value,
+                                       first_var.dtype)
+    if weight.shape != [size]:
+      raise ValueError(
+          "Slot %s of %s has shape %s, which doesn't match its group of "
+          "variables with %d elements. Checkpoints of optimizers with "
+          "`grouped_apply=True` can only be restored into the same variables."
+          % (flat_name, first_var.name, weight.shape, size))
+    return weight
+
+  def _quantizes_slots_of(self, var):
+    """Whether slots created with `_add_quantized_slot` for `var` are 8-bit."""
+    return self.quantize_slots and slot_quantization.is_quantizable(var)
+
+  def _add_quantized_slot(self, var, slot_name, initial_value=0.,
+                          non_negative=False):
+    """Adds the codes and scales of a quantized slot for `var`.
+
+    The slot is stored as two slot variables, `slot_name + "_codes"` and
+    `slot_name + "_scales"`. Use `_read_quantized_slot` and
+    `_write_quantized_slot` to access it.
+
+    Args:
+      var: a variable for which `_quantizes_slots_of` is True.
+      slot_name: the name of the slot.
+      initial_value: a Python float, the initial value of every element.
+      non_negative: whether the slot never holds negative values.
+    """
+    slot_dict = self._slots.setdefault(_var_key(var), {})
+    if slot_name + "_codes" in slot_dict:
+      return
+    initial_values = functools.partial(
+        slot_quantization.initial_values, var.shape, initial_value,
+        non_negative=non_negative)
+    self._add_slot_variable(var, slot_name + "_codes",
+                            lambda: initial_values()[0], dtypes.int8)
+    self._add_slot_variable(var, slot_name + "_scales",
+                            lambda: initial_values()[1], dtypes.float32)
+
+  def _has_quantized_slot(self, var, slot_name):
+    return slot_name + "_codes" in self._slots.get(_var_key(var), {})
+
+  def _read_quantized_slot(self, var, slot_name, non_negative=False,
+                           indices=None):
+    """Returns the dequantized value of a quantized slot of `var`.
+
+    Args:
+      var: the variable the slot belongs to.
+      slot_name: the name passed to `_add_quantized_slot`.
+      non_negative: the value passed to `_add_quantized_slot`.
+      indices: optional indices of the rows to read. All rows are read if None.
+
+    Returns:
+      A `Tensor` with the dtype of `var`.
+    """
+    codes = self.get_slot(var, slot_name + "_codes")
+    scales = self.get_slot(var, slot_name + "_scales")
+    if indices is not None:
+      codes = array_ops.gather(codes, indices)
+      scales = array_ops.gather(scales, indices)
+    return slot_quantization.dequantize(
+        codes, scales, var.shape[1:], var.dtype.base_dtype,
+        non_negative=non_negative)
+
+  def _write_quantized_slot(self, var, slot_name, value, non_negative=False,
+                            indices=None):
+    """Quantizes `value` into a quantized slot of `var`.
+
+    Args:
+      var: the variable the slot belongs to.
+      slot_name: the name passed to `_add_quantized_slot`.
+      value: the new value of the slot, or of the rows at `indices`.
+      non_negative: the value passed to `_add_quantized_slot`.
+      indices: optional indices of the rows `value` holds.
+
+    Returns:
+      An `Operation` which updates the slot.
+    """
+    codes, scales = slot_quantization.quantize(value, non_negative=non_negative)
+    codes_var = self.get_slot(var, slot_name + "_codes")
+    scales_var = self.get_slot(var, slot_name + "_scales")
+    if indices is None:
+      return control_flow_ops.group(
+          codes_var.assign(codes, use_locking=self._use_locking),
+          scales_var.assign(scales, use_locking=self._use_locking))
+    return control_flow_ops.group(
+        codes_var.scatter_update(ops.IndexedSlices(codes, indices),
+                                 use_locking=self._use_locking),
+        scales_var.scatter_update(ops.IndexedSlices(scales, indices),
+                                  use_locking=self._use_locking))
+
   def get_slot(self, var, slot_name):
     var_key = _var_key(var)
     slot_dict = self._slots[var_key]
@@ -874,6 +1096,12 @@ class OptimizerV2(trackable.Trackable):
       config["clipnorm"] = self.clipnorm
     if self.clipvalue is not None:
       config["clipvalue"] = self.clipvalue
+    if self.gradient_bucket_bytes is not None:
+      config["gradient_bucket_bytes"] = self.gradient_bucket_bytes
+    if self.grouped_apply:
+      config["grouped_apply"] = True
+    if self.quantize_slots:
+      config["quantize_slots"] = True
     return config
 
   @classmethod
@@ -1097,6 +1325,87 @@ class OptimizerV2(trackable.Trackable):
     """
     raise NotImplementedError("Must be implemented in subclasses.")
 
+  def _resource_apply_dense_grouped(self, grads, var_list, apply_state):
+    """Add ops to apply dense gradients to variables of one dtype and device.
+
+    Optimizers implementing this method support `grouped_apply=True`. The
+    result must be the same as calling `_resource_apply_dense` on each variable
+    which has a gradient. `_apply_flat_update` does most of the work.
+
+    Args:
+      grads: a list of the gradients of the variables in `var_list`, None for
+        variables without a gradient in this step.
+      var_list: the variables of a slot group, in the order of the group.
+      apply_state: A dict which is used across multiple apply calls.
+
+    Returns:
+      An `Operation` which updates the values of the variables.
+    """
+    raise NotImplementedError("Must be implemented in subclasses.")
+
+  def _supports_grouped_apply(self):
+    """Whether `_resource_apply_dense_grouped` matches this optimizer.
+
+    The grouped update is only used if it is defined by the same class as
+    `_resource_apply_dense`, so that subclasses overriding the latter keep
+    their own update.
+
+    Returns:
+      A boolean.
+    """
+    return (_defining_class(type(self), "_resource_apply_dense_grouped") is
+            _defining_class(type(self), "_resource_apply_dense"))
+
+  def _apply_flat_update(self, grads, var_list, slot_names, update_fn):
+    """Applies `update_fn` to the flat slots of a slot group.
+
+    The slots are updated in place, and each variable takes one `assign_add`
+    of its part of the update, so the cost per variable does not depend on the
+    number of slots.
+
+    Args:
+      grads: a list of the gradients of the variables in `var_list`, None for
+        variables without a gradient in this step.
+      var_list: the variables of a slot group, in the order of the group.
+      slot_names: the names of the slots read and updated by `update_fn`.
+      update_fn: a function taking the flat gradient and the flat slots, in the
+        order of `slot_names`, and returning the flat update to add to the
+        variables followed by the new values of the slots.
+
+    Returns:
+      An `Operation` which applies the update.
+    """
+    dtype = var_list[0].dtype.base_dtype
+    sizes = [var.shape.num_elements() for var in var_list]
+    flat_grad = _concat_flat([
+        array_ops.zeros([size], dtype) if grad is None else grad
+        for grad, size in zip(grads, sizes)
+    ])
+    slots = [
+        self.get_slot(var_list[0], slot_name + _GROUPED_SLOT_SUFFIX)
+        for slot_name in slot_names
+    ]
+    new_values = update_fn(flat_grad, *slots)
+    update, new_slots = new_values[0], list(new_values[1:])
+    has_grad = [grad is not None for grad in grads]
+    if not all(has_grad):
+      # Variables without a gradient keep their part of the slots, as if they
+      # weren't passed to `apply_gradients`.
+      mask = array_ops.repeat(has_grad, sizes)
+      new_slots = [array_ops.where_v2(mask, new_slot, slot)
+                   for new_slot, slot in zip(new_slots, slots)]
+    update_ops = [
+        slot.assign(new_slot, use_locking=self._use_locking, read_value=False)
+        for slot, new_slot in zip(slots, new_slots)
+    ]
+    for var, part, var_has_grad in zip(
+        var_list, array_ops.split(update, sizes), has_grad):
+      if var_has_grad:
+        update_ops.append(var.assign_add(
+            array_ops.reshape(part, var.shape), use_locking=self._use_locking,
+            read_value=False))
+    return control_flow_ops.group(*update_ops)
+
   def _resource_apply_sparse_duplicate_indices(self, grad, handle, indices,
                                                **kwargs):
     """Add ops to apply sparse gradients to `handle`, with repeated indices.
@@ -1276,6 +1585,53 @@ def _filter_grads(grads_and_vars):
   return filtered
 
 
+def _group_dense_grads_and_vars(grads_and_vars, exclude=None):
+  """Groups variables with dense gradients by dtype and device.
+
+  Args:
+    grads_and_vars: List of (gradient, variable) pairs.
+    exclude: Optional predicate on variables which must not be grouped.
+
+  Returns:
+    A tuple of (groups, remaining). `groups` is a list of lists of two or more
+    (gradient, variable) pairs, `remaining` the pairs to apply one by one.
+  """
+  groups = collections.OrderedDict()
+  remaining = []
+  for grad, var in grads_and_vars:
+    if isinstance(grad, ds_values.DistributedValues):
+      is_sparse = isinstance(grad.values[0], ops.IndexedSlices)
+    else:
+      is_sparse = isinstance(grad, ops.IndexedSlices)
+    if (is_sparse or isinstance(var, ops.Tensor) or
+        var.constraint is not None or not var.shape.is_fully_defined() or
+        (exclude is not None and exclude(var))):
+      remaining.append((grad, var))
+    else:
+      groups.setdefault((var.dtype.base_dtype, var.device), []).append(
+          (grad, var))
+  grouped = []
+  for group in groups.values():
+    if len(group) > 1:
+      grouped.append(group)
+    else:
+      remaining.extend(group)
+  return grouped, remaining
+
+
+def _concat_flat(tensors):
+  """Flattens and concatenates a list of tensors."""
+  return array_ops.concat([array_ops.reshape(t, [-1]) for t in tensors], 0)
+
+
+def _defining_class(cls, attr_name):
+  """Returns the first class in the MRO of `cls` defining `attr_name`."""
+  for klass in cls.__mro__:
+    if attr_name in klass.__dict__:
+      return klass
+  return None
+
+
 def _var_key(var):
   """Key for representing a primary variable, for looking up slots.
 
@@ -19,11 +19,14 @@ from __future__ import division
 from __future__ import print_function
 
 import collections
+import os
+import time
 
 from absl.testing import parameterized
 import numpy as np
 
 from tensorflow.python import keras
+from tensorflow.python.eager import backprop
 from tensorflow.python.eager import context
 from tensorflow.python.eager import def_function
 from tensorflow.python.framework import constant_op
@@ -54,12 +57,14 @@ from tensorflow.python.keras.optimizer_v2 import rmsprop
 from tensorflow.python.keras.utils import np_utils
 from tensorflow.python.ops import array_ops
 from tensorflow.python.ops import clip_ops
+from tensorflow.python.ops import math_ops
 from tensorflow.python.ops import resource_variable_ops
 from tensorflow.python.ops import state_ops
 from tensorflow.python.ops import variables
 from tensorflow.python.platform import test
 from tensorflow.python.training import momentum
 from tensorflow.python.training import training_util
+from tensorflow.python.training.tracking import util as trackable_utils
 
 
 _DATA_TYPES = [dtypes.half, dtypes.float32, dtypes.float64]
@@ -361,6 +366,52 @@ class OptimizerTest(test.TestCase, parameterized.TestCase):
     with self.assertRaisesRegexp(ValueError, '>= 0'):
       gradient_descent.SGD(learning_rate=1.0, clipnorm=-1.0)
 
+  @combinations.generate(combinations.combine(mode=['graph', 'eager']))
+  def testGradientBucketBytes(self):
+    opt = gradient_descent.SGD(learning_rate=1.0, gradient_bucket_bytes=1024)
+    self.assertEqual(1024, opt.get_config()['gradient_bucket_bytes'])
+    opt = gradient_descent.SGD.from_config(opt.get_config())
+    self.assertEqual(1024, opt.gradient_bucket_bytes)
+    self.assertNotIn('gradient_bucket_bytes',
+                     gradient_descent.SGD(1.0).get_config())
+    with self.assertRaisesRegexp(ValueError, '>= 0'):
+      gradient_descent.SGD(learning_rate=1.0, gradient_bucket_bytes=-1)
+
+  @combinations.generate(combinations.combine(mode=['graph', 'eager']))
+  def testGroupedApplyConfig(self):
+    opt = adam.Adam(learning_rate=1.0, grouped_apply=True)
+    self.assertTrue(opt.get_config()['grouped_apply'])
+    self.assertTrue(adam.Adam.from_config(opt.get_config()).grouped_apply)
+    self.assertNotIn('grouped_apply', adam.Adam(1.0).get_config())
+
+  def testQuantizeSlotsConfig(self):
+    opt = adagrad.Adagrad(learning_rate=1.0, quantize_slots=True)
+    self.assertTrue(opt.get_config()['quantize_slots'])
+    self.assertTrue(
+        adagrad.Adagrad.from_config(opt.get_config()).quantize_slots)
+    self.assertNotIn('quantize_slots', adagrad.Adagrad(1.0).get_config())
+
+  @combinations.generate(combinations.combine(mode=['graph', 'eager']))
+  def testQuantizedSlotsCheckpoint(self):
+    with self.cached_session():
+      var = variables.Variable(array_ops.ones([64, 128]))
+      opt = adam.Adam(1.0, quantize_slots=True)
+      update = opt.apply_gradients([(array_ops.ones([64, 128]), var)])
+      self.evaluate(variables.global_variables_initializer())
+      self.evaluate(update)
+      checkpoint = trackable_utils.Checkpoint(var=var, optimizer=opt)
+      save_path = checkpoint.save(self.get_temp_dir() + '/ckpt')
+      m = self.evaluate(opt._read_quantized_slot(var, 'm'))
+
+      new_opt = adam.Adam(1.0, quantize_slots=True)
+      status = trackable_utils.Checkpoint(var=var, optimizer=new_opt).restore(
+          save_path)
+      new_opt._create_slots([var])
+      status.run_restore_ops()
+      self.assertAllClose(m, self.evaluate(new_opt._read_quantized_slot(
+          var, 'm')))
+      self.assertNotIn('m', new_opt.get_slot_names())
+
   @combinations.generate(combinations.combine(mode=['graph', 'eager']))
   def testInvalidKwargs(self):
     with self.assertRaisesRegexp(TypeError, 'Unexpected keyword argument'):
@@ -1174,5 +1225,225 @@ class OptimizerCoefficientTest(keras_parameterized.TestCase):
         optimizer.apply_gradients(zip(grads, trainable_variables))
 
 
+GROUPED_APPLY_PARAMS = (
+    ('SGD', gradient_descent.SGD, None),
+    ('SGD_momentum', gradient_descent.SGD, dict(momentum=0.5)),
+    ('SGD_nesterov', gradient_descent.SGD, dict(momentum=0.5, nesterov=True)),
+    ('Adam', adam.Adam, None),
+    ('Adam_amsgrad', adam.Adam, dict(amsgrad=True)),
+    ('Adagrad', adagrad.Adagrad, None),
+    ('RMSprop', rmsprop.RMSprop, None),
+    ('RMSprop_centered', rmsprop.RMSprop, dict(centered=True)),
+    ('RMSprop_momentum', rmsprop.RMSprop, dict(momentum=0.5)),
+    ('RMSprop_momentum_centered', rmsprop.RMSprop,
+     dict(momentum=0.5, centered=True)),
+)
+
+
+class OptimizerGroupedApplyTest(test.TestCase, parameterized.TestCase):
+
+  def _make_variables(self):
+    return [
+        variables.Variable(np.arange(6.).reshape(2, 3), dtype=dtypes.float32),
+        variables.Variable([1., 2., 3., 4.]),
+        variables.Variable(2.),
+        # Sparse gradients and constraints are applied one by one.
+        variables.Variable([[1., 2.], [3., 4.]]),
+        variables.Variable([5., 6.], constraint=lambda x: x * 0.5),
+    ]
+
+  def _run_steps(self, optimizer, var_list):
+    for step in range(3):
+      scale = float(step + 1)
+      grads = [
+          constant_op.constant([[.1, -.2, .3], [.4, -.5, .6]]) * scale,
+          constant_op.constant([-.1, .2, -.3, .4]) * scale,
+          constant_op.constant(.5) * scale,
+          ops.IndexedSlices(
+              constant_op.constant([[.1, .2]]) * scale,
+              constant_op.constant([1]), constant_op.constant([2, 2])),
+          constant_op.constant([.3, .4]) * scale,
+      ]
+      grads_and_vars = list(zip(grads, var_list))
+      if step == 1:
+        # A grouped variable without a gradient keeps its value and slots.
+        del grads_and_vars[1]
+      optimizer.apply_gradients(grads_and_vars)
+
+  @parameterized.named_parameters(*GROUPED_APPLY_PARAMS)
+  def test_matches_per_variable_apply(self, optimizer_class, init_kwargs=None):
+    init_kwargs = init_kwargs or {}
+    with context.eager_mode():
+      expected_var_list = self._make_variables()
+      expected_optimizer = optimizer_class(0.1, **init_kwargs)
+      self._run_steps(expected_optimizer, expected_var_list)
+      var_list = self._make_variables()
+      optimizer = optimizer_class(0.1, grouped_apply=True, **init_kwargs)
+      self.assertTrue(optimizer._supports_grouped_apply())
+      self._run_steps(optimizer, var_list)
+
+      self.assertLen(optimizer._slot_groups, 1)
+      for grouped_var, var in zip(optimizer._slot_groups[0], var_list[:3]):
+        self.assertIs(grouped_var, var)
+      for expected_var, var in zip(expected_var_list, var_list):
+        self.assertAllClose(
+            self.evaluate(expected_var), self.evaluate(var), rtol=1e-5,
+            atol=1e-6)
+      for slot_name in expected_optimizer.get_slot_names():
+        expected_flat_slot = np.concatenate([
+            np.reshape(self.evaluate(expected_optimizer.get_slot(
+                var, slot_name)), [-1]) for var in expected_var_list[:3]
+        ])
+        self.assertAllClose(
+            expected_flat_slot,
+            self.evaluate(optimizer.get_slot(var_list[0],
+                                             slot_name + '_grouped')),
+            rtol=1e-5, atol=1e-6)
+        with self.assertRaises(KeyError):
+          optimizer.get_slot(var_list[1], slot_name)
+        for expected_var, var in zip(expected_var_list[3:], var_list[3:]):
+          self.assertAllClose(
+              self.evaluate(expected_optimizer.get_slot(expected_var,
+                                                        slot_name)),
+              self.evaluate(optimizer.get_slot(var, slot_name)), rtol=1e-5,
+              atol=1e-6)
+
+  def test_checkpoint(self):
+    with context.eager_mode():
+      var_list = self._make_variables()
+      optimizer = adam.Adam(0.1, grouped_apply=True)
+      self._run_steps(optimizer, var_list)
+      save_path = trackable_utils.Checkpoint(
+          optimizer=optimizer, var_list=var_list).save(
+              os.path.join(self.get_temp_dir(), 'ckpt'))
+
+      restored_var_list = self._make_variables()
+      restored_optimizer = adam.Adam(0.1, grouped_apply=True)
+      trackable_utils.Checkpoint(
+          optimizer=restored_optimizer,
+          var_list=restored_var_list).restore(save_path)
+      self._run_steps(optimizer, var_list)
+      self._run_steps(restored_optimizer, restored_var_list)
+      self.assertLen(restored_optimizer._slot_groups, 1)
+      for var, restored_var in zip(var_list, restored_var_list):
+        self.assertAllClose(
+            self.evaluate(var), self.evaluate(restored_var), rtol=1e-5)
+
+  def test_checkpoint_without_grouped_apply(self):
+    with context.eager_mode():
+      var_list = self._make_variables()
+      optimizer = adam.Adam(0.1)
+      self._run_steps(optimizer, var_list)
+      save_path = trackable_utils.Checkpoint(
+          optimizer=optimizer, var_list=var_list).save(
+              os.path.join(self.get_temp_dir(), 'ckpt'))
+
+      # Restored variables keep their own slots and aren't grouped.
+      restored_var_list = self._make_variables()
+      restored_optimizer = adam.Adam(0.1, grouped_apply=True)
+      trackable_utils.Checkpoint(
+          optimizer=restored_optimizer,
+          var_list=restored_var_list).restore(save_path)
+      self._run_steps(optimizer, var_list)
+      self._run_steps(restored_optimizer, restored_var_list)
+      self.assertEmpty(restored_optimizer._slot_groups)
+      for var, restored_var in zip(var_list, restored_var_list):
+        self.assertAllClose(
+            self.evaluate(var), self.evaluate(restored_var), rtol=1e-5)
+
+  def test_subclass_without_grouped_apply(self):
+
+    class SubclassedOptimizer(adam.Adam):
+
+      def _resource_apply_dense(self, grad, var, apply_state=None):  # pylint: disable=useless-super-delegation
+        return super(SubclassedOptimizer, self)._resource_apply_dense(
+            grad, var, apply_state)
+
+    self.assertFalse(
+        SubclassedOptimizer(grouped_apply=True)._supports_grouped_apply())
+    self.assertFalse(
+        adamax.Adamax(grouped_apply=True)._supports_grouped_apply())
+
+
+class QuantizedSlotsBenchmark(test.Benchmark):
+  """Compares slot memory and convergence of full precision and 8-bit slots."""
+
+  def _run(self, optimizer_class, quantize_slots, iters=200):
+    with context.eager_mode():
+      np.random.seed(0)
+      x = constant_op.constant(np.random.randn(256, 512).astype(np.float32))
+      y = constant_op.constant(np.random.randn(256, 64).astype(np.float32))
+      kernel = variables.Variable(array_ops.zeros([512, 64]))
+      bias = variables.Variable(array_ops.zeros([64]))
+      optimizer = optimizer_class(0.01, quantize_slots=quantize_slots)
+
+      @def_function.function
+      def step():
+        with backprop.GradientTape() as tape:
+          loss = math_ops.reduce_mean(
+              math_ops.square(math_ops.matmul(x, kernel) + bias - y))
+        grads = tape.gradient(loss, [kernel, bias])
+        optimizer.apply_gradients(zip(grads, [kernel, bias]))
+        return loss
+
+      step()
+      start = time.time()
+      for _ in range(iters):
+        loss = step()
+      wall_time = (time.time() - start) / iters
+      slot_bytes = sum(
+          v.shape.num_elements() * v.dtype.size
+          for v in optimizer.variables()
+          if v is not optimizer.iterations)
+      return wall_time, slot_bytes, float(loss)
+
+  def benchmark_slot_memory_and_convergence(self):
+    for optimizer_class in (adam.Adam, adagrad.Adagrad):
+      for quantize_slots in (False, True):
+        wall_time, slot_bytes, loss = self._run(optimizer_class,
+                                                quantize_slots)
+        self.report_benchmark(
+            name='%s%s' % (optimizer_class.__name__,
+                           '_quantized' if quantize_slots else ''),
+            iters=200,
+            wall_time=wall_time,
+            extras={'slot_bytes': slot_bytes, 'final_loss': loss})
+
+
+class GroupedApplyBenchmark(test.Benchmark):
+  """Compares the step time of per-variable and grouped updates."""
+
+  def _run(self, optimizer_class, num_variables, grouped_apply, iters=20):
+    with context.eager_mode():
+      var_list = [variables.Variable(array_ops.zeros([256]))
+                  for _ in range(num_variables)]
+      grads = [array_ops.ones([256]) for _ in range(num_variables)]
+      optimizer = optimizer_class(0.01, grouped_apply=grouped_apply)
+
+      @def_function.function
+      def step():
+        optimizer.apply_gradients(zip(grads, var_list))
+
+      step()
+      start = time.time()
+      for _ in range(iters):
+        step()
+      return (time.time() - start) / iters
+
+  def benchmark_step_time_vs_num_variables(self):
+    for optimizer_class in (gradient_descent.SGD, adam.Adam, rmsprop.RMSprop,
+                            adagrad.Adagrad):
+      for num_variables in (10, 100, 1000):
+        for grouped_apply in (False, True):
+          wall_time = self._run(optimizer_class, num_variables, grouped_apply)
+          self.report_benchmark(
+              name='%s_%d_variables%s' % (optimizer_class.__name__,
+                                          num_variables,
+                                          '_grouped' if grouped_apply else ''),
+              iters=20,
+              wall_time=wall_time,
+              extras={'num_variables': num_variables})
+
+
 if __name__ == '__main__':
   test.main()
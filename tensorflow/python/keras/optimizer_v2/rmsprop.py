@@ -218,6 +218,49 @@ class RMSprop(optimizer_v2.OptimizerV2):
           math_ops.sqrt(denom_t) + coefficients["epsilon"])
       return state_ops.assign(var, var_t, use_locking=self._use_locking).op
 
+  def _resource_apply_dense_grouped(self, grads, var_list, apply_state):
+    var_device, var_dtype = var_list[0].device, var_list[0].dtype.base_dtype
+    coefficients = ((apply_state or {}).get((var_device, var_dtype))
+                    or self._fallback_apply_state(var_device, var_dtype))
+
+    slot_names = ["rms"]
+    if self._momentum:
+      slot_names.append("momentum")
+    if self.centered:
+      slot_names.append("mg")
+
+    def update(grad, rms, *slots):
+      slots = dict(zip(slot_names[1:], slots))
+      if self._momentum:
+        # Same as the ApplyRMSProp and ApplyCenteredRMSProp kernels.
+        one_minus_rho = coefficients["one_minus_rho"]
+        rms_t = rms + (math_ops.square(grad) - rms) * one_minus_rho
+        denom_t = rms_t
+        if self.centered:
+          mg_t = slots["mg"] + (grad - slots["mg"]) * one_minus_rho
+          denom_t = rms_t - math_ops.square(mg_t)
+        mom_t = (slots["momentum"] * coefficients["momentum"] +
+                 coefficients["lr_t"] * grad /
+                 math_ops.sqrt(denom_t + coefficients["epsilon"]))
+        new_values = [-mom_t, rms_t, mom_t]
+      else:
+        rms_t = (coefficients["rho"] * rms +
+                 coefficients["one_minus_rho"] * math_ops.square(grad))
+        denom_t = rms_t
+        if self.centered:
+          mg_t = (coefficients["rho"] * slots["mg"] +
+                  coefficients["one_minus_rho"] * grad)
+          denom_t = rms_t - math_ops.square(mg_t)
+        new_values = [
+            -coefficients["lr_t"] * grad / (
+                math_ops.sqrt(denom_t) + coefficients["epsilon"]), rms_t
+        ]
+      if self.centered:
+        new_values.append(mg_t)
+      return new_values
+
+    return self._apply_flat_update(grads, var_list, slot_names, update)
+
   def _resource_apply_sparse(self, grad, var, indices, apply_state=None):
     var_device, var_dtype = var.device, var.dtype.base_dtype
     coefficients = ((apply_state or {}).get((var_device, var_dtype))
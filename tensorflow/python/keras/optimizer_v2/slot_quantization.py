@@ -0,0 +1,141 @@
+# Copyright 2020 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Block-wise 8-bit storage for optimizer slot variables.
+
+A slot of a variable with shape `[rows, ...]` is stored as int8 codes of shape
+`[rows, blocks_per_row, block_length]` and float32 scales of shape
+`[rows, blocks_per_row]`. Each row is split into blocks of at most
+`BLOCK_SIZE` elements, padded at the end, and each block is scaled by its
+largest absolute value. Keeping blocks within rows lets sparse updates read and
+write the rows they touch only.
+
+Non-negative slots, such as second moments and accumulators, span many orders
+of magnitude. Their square roots are stored instead, which halves the range in
+log scale.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import math
+
+from tensorflow.python.framework import constant_op
+from tensorflow.python.framework import dtypes
+from tensorflow.python.ops import array_ops
+from tensorflow.python.ops import clip_ops
+from tensorflow.python.ops import math_ops
+
+# Number of slot elements sharing one scale.
+BLOCK_SIZE = 256
+
+# Variables with fewer elements keep full precision slots: the memory saved is
+# negligible and their updates are latency rather than bandwidth bound.
+MIN_NUM_ELEMENTS = 4096
+
+# Rows shorter than this keep full precision slots. Each row takes at least
+# one float32 scale besides its int8 codes, so with one element per row 8-bit
+# slots would be larger than float32 ones.
+MIN_ROW_SIZE = 8
+
+_MAX_CODE = 127.
+
+
+def is_quantizable(var):
+  """Whether the slots of `var` may be stored in 8 bits."""
+  shape = var.shape
+  return (var.dtype.base_dtype.is_floating and shape.is_fully_defined() and
+          shape.rank >= 2 and shape.num_elements() >= MIN_NUM_ELEMENTS and
+          shape[1:].num_elements() >= MIN_ROW_SIZE)
+
+
+def _layout(row_shape):
+  """Returns (row_size, blocks_per_row, block_length) for `row_shape`."""
+  row_size = row_shape.num_elements()
+  blocks_per_row = -(-row_size // BLOCK_SIZE)
+  block_length = -(-row_size // blocks_per_row)
+  return row_size, blocks_per_row, block_length
+
+
+def shapes(var_shape):
+  """Returns the shapes of the codes and scales of a slot for `var_shape`."""
+  _, blocks_per_row, block_length = _layout(var_shape[1:])
+  rows = var_shape.as_list()[0]
+  return [rows, blocks_per_row, block_length], [rows, blocks_per_row]
+
+
+def initial_values(var_shape, value, non_negative=False):
+  """Returns the codes and scales of a slot filled with `value`."""
+  codes_shape, scales_shape = shapes(var_shape)
+  if non_negative:
+    value = math.sqrt(value)
+  code = int(math.copysign(_MAX_CODE, value)) if value else 0
+  codes = array_ops.fill(codes_shape, constant_op.constant(code, dtypes.int8))
+  scales = array_ops.fill(scales_shape, abs(value) / _MAX_CODE)
+  return codes, scales
+
+
+def quantize(value, non_negative=False):
+  """Quantizes `value`, a tensor of rows of the slot.
+
+  Args:
+    value: A float `Tensor` of shape `[rows, ...]`, with a fully defined shape
+      after the first dimension.
+    non_negative: Whether `value` is a non-negative slot, stored as its square
+      root.
+
+  Returns:
+    A tuple of int8 codes of shape `[rows, blocks_per_row, block_length]` and
+    float32 scales of shape `[rows, blocks_per_row]`.
+  """
+  row_size, blocks_per_row, block_length = _layout(value.shape[1:])
+  value = math_ops.cast(value, dtypes.float32)
+  value = array_ops.reshape(value, [-1, row_size])
+  if non_negative:
+    value = math_ops.sqrt(math_ops.maximum(value, 0.))
+  padding = blocks_per_row * block_length - row_size
+  if padding:
+    value = array_ops.pad(value, [[0, 0], [0, padding]])
+  value = array_ops.reshape(value, [-1, blocks_per_row, block_length])
+  scales = math_ops.reduce_max(math_ops.abs(value), axis=-1) / _MAX_CODE
+  inverse_scales = math_ops.div_no_nan(1., scales)
+  codes = math_ops.round(value * array_ops.expand_dims(inverse_scales, -1))
+  codes = clip_ops.clip_by_value(codes, -_MAX_CODE, _MAX_CODE)
+  return math_ops.cast(codes, dtypes.int8), scales
+
+
+def dequantize(codes, scales, row_shape, dtype, non_negative=False):
+  """Reconstructs rows of a slot from their codes and scales.
+
+  Args:
+    codes: An int8 `Tensor` as returned by `quantize`.
+    scales: A float32 `Tensor` as returned by `quantize`.
+    row_shape: The `TensorShape` of a row of the slot, which is the shape of
+      the variable without its first dimension.
+    dtype: The dtype of the returned value.
+    non_negative: Whether the slot was quantized with `non_negative=True`.
+
+  Returns:
+    A `Tensor` of shape `[rows] + row_shape`.
+  """
+  row_size, blocks_per_row, block_length = _layout(row_shape)
+  value = math_ops.cast(codes, dtypes.float32) * array_ops.expand_dims(
+      scales, -1)
+  value = array_ops.reshape(value, [-1, blocks_per_row * block_length])
+  if blocks_per_row * block_length != row_size:
+    value = value[:, :row_size]
+  if non_negative:
+    value = math_ops.square(value)
+  value = array_ops.reshape(value, [-1] + row_shape.as_list())
+  return math_ops.cast(value, dtype)
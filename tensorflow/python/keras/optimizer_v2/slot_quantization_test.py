@@ -0,0 +1,92 @@
+# Copyright 2020 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for slot_quantization."""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import numpy as np
+
+from tensorflow.python.framework import constant_op
+from tensorflow.python.framework import dtypes
+from tensorflow.python.framework import tensor_shape
+from tensorflow.python.framework import test_util
+from tensorflow.python.keras.optimizer_v2 import slot_quantization
+from tensorflow.python.ops import variables
+from tensorflow.python.platform import test
+
+
+@test_util.run_all_in_graph_and_eager_modes
+class SlotQuantizationTest(test.TestCase):
+
+  def testShapes(self):
+    # 300 elements per row are split into two blocks of 150.
+    codes_shape, scales_shape = slot_quantization.shapes(
+        tensor_shape.TensorShape([4, 3, 100]))
+    self.assertEqual([4, 2, 150], codes_shape)
+    self.assertEqual([4, 2], scales_shape)
+
+  def testIsQuantizable(self):
+    self.assertTrue(slot_quantization.is_quantizable(
+        variables.Variable(np.zeros([64, 64], np.float32))))
+    self.assertFalse(slot_quantization.is_quantizable(
+        variables.Variable(np.zeros([8, 8], np.float32))))
+    self.assertFalse(slot_quantization.is_quantizable(
+        variables.Variable(np.zeros([8192], np.float32))))
+    # A row per element, e.g. a Dense kernel with one unit.
+    self.assertFalse(slot_quantization.is_quantizable(
+        variables.Variable(np.zeros([8192, 1], np.float32))))
+    self.assertTrue(slot_quantization.is_quantizable(
+        variables.Variable(np.zeros([1024, 8], np.float32))))
+    self.assertFalse(slot_quantization.is_quantizable(
+        variables.Variable(np.zeros([64, 64], np.int32))))
+
+  def testRoundTrip(self):
+    np.random.seed(0)
+    value = np.random.randn(8, 3, 100).astype(np.float32)
+    codes, scales = slot_quantization.quantize(constant_op.constant(value))
+    self.assertEqual(dtypes.int8, codes.dtype)
+    restored = self.evaluate(slot_quantization.dequantize(
+        codes, scales, tensor_shape.TensorShape([3, 100]), dtypes.float32))
+    # The error is at most half a step, which is 1/254 of the block maximum.
+    max_error = np.abs(value).max() / 254.
+    self.assertAllClose(value, restored, atol=max_error, rtol=0)
+
+  def testRoundTripNonNegative(self):
+    value = np.square(np.linspace(0., 2., 2 * 512)).reshape([2, 512])
+    value = value.astype(np.float32)
+    codes, scales = slot_quantization.quantize(
+        constant_op.constant(value), non_negative=True)
+    restored = self.evaluate(slot_quantization.dequantize(
+        codes, scales, tensor_shape.TensorShape([512]), dtypes.float32,
+        non_negative=True))
+    self.assertAllGreaterEqual(restored, 0.)
+    self.assertAllClose(np.sqrt(value), np.sqrt(restored), atol=2. / 254.,
+                        rtol=0)
+
+  def testInitialValues(self):
+    shape = tensor_shape.TensorShape([2, 300])
+    codes, scales = slot_quantization.initial_values(shape, 0.1,
+                                                     non_negative=True)
+    restored = self.evaluate(slot_quantization.dequantize(
+        codes, scales, shape[1:], dtypes.float32, non_negative=True))
+    self.assertAllClose(np.full([2, 300], 0.1), restored)
+    codes, scales = slot_quantization.initial_values(shape, 0.)
+    self.assertAllEqual(np.zeros([2, 2, 150]), self.evaluate(codes))
+
+
+if __name__ == '__main__':
+  test.main()
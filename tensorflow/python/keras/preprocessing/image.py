@@ -301,6 +301,127 @@ def load_img(path, grayscale=False, color_mode='rgb', target_size=None,
                         target_size=target_size, interpolation=interpolation)
 
 
+def _affine_transform_matrices(transform_parameters, h, w):
+  """Builds the matrices `apply_affine_transform` uses for a batch of images.
+
+  Arguments:
+      transform_parameters: List of dictionaries, as returned by
+        `ImageDataGenerator.get_random_transform`.
+      h: Height of the images.
+      w: Width of the images.
+
+  Returns:
+      A tuple `(matrices, needs_warp)` where `matrices` is a `(N, 3, 3)` array
+      mapping output to input coordinates, offset to the center of the image,
+      and `needs_warp` is a boolean `(N,)` array which is `False` for the
+      images whose affine transform is the identity.
+  """
+
+  def get(key, default):
+    return np.array([params.get(key, default)
+                     for params in transform_parameters], dtype=np.float64)
+
+  theta = get('theta', 0)
+  tx = get('tx', 0)
+  ty = get('ty', 0)
+  shear = get('shear', 0)
+  zx = get('zx', 1)
+  zy = get('zy', 1)
+  needs_warp = ((theta != 0) | (tx != 0) | (ty != 0) | (shear != 0) |
+                (zx != 1) | (zy != 1))
+
+  zeros = np.zeros_like(theta)
+  ones = np.ones_like(theta)
+
+  def stack(rows):
+    return np.stack([np.stack(row, axis=-1) for row in rows], axis=-2)
+
+  cos_theta = np.cos(np.deg2rad(theta))
+  sin_theta = np.sin(np.deg2rad(theta))
+  rotation = stack([[cos_theta, -sin_theta, zeros],
+                    [sin_theta, cos_theta, zeros],
+                    [zeros, zeros, ones]])
+  shift = stack([[ones, zeros, tx],
+                 [zeros, ones, ty],
+                 [zeros, zeros, ones]])
+  shear_angle = np.deg2rad(shear)
+  shear = stack([[ones, -np.sin(shear_angle), zeros],
+                 [zeros, np.cos(shear_angle), zeros],
+                 [zeros, zeros, ones]])
+  zoom = stack([[zx, zeros, zeros],
+                [zeros, zy, zeros],
+                [zeros, zeros, ones]])
+  matrices = np.matmul(np.matmul(np.matmul(rotation, shift), shear), zoom)
+
+  # Same as `transform_matrix_offset_center`.
+  o_x = float(h) / 2 + 0.5
+  o_y = float(w) / 2 + 0.5
+  offset = np.array([[1, 0, o_x], [0, 1, o_y], [0, 0, 1]])
+  reset = np.array([[1, 0, -o_x], [0, 1, -o_y], [0, 0, 1]])
+  return np.matmul(np.matmul(offset, matrices), reset), needs_warp
+
+
+def _map_indices(indices, size, fill_mode):
+  """Maps integer pixel indices outside of `[0, size)` according to fill_mode."""
+  if fill_mode == 'reflect':
+    indices = np.mod(indices, 2 * size)
+    indices = np.where(indices >= size, 2 * size - 1 - indices, indices)
+  else:  # 'nearest' and 'constant'.
+    indices = np.clip(indices, 0, size - 1)
+  return indices.astype(np.int64)
+
+
+def _affine_warp_batch(x, matrices, fill_mode, cval, order):
+  """Warps a batch of images with one affine transform per image.
+
+  This is a vectorized version of applying `scipy.ndimage.affine_transform` to
+  every channel of every image, for interpolation orders 0 and 1.
+
+  Arguments:
+      x: `(N, H, W, C)` array of images.
+      matrices: `(N, 3, 3)` array of matrices mapping output pixel coordinates
+        `(row, col, 1)` to input coordinates.
+      fill_mode: One of `"constant"`, `"nearest"` or `"reflect"`. The `"wrap"`
+        mode of `scipy.ndimage` is not a plain modulo of the pixel indices, so
+        it is not supported.
+      cval: Value used for points outside the boundaries of the input if
+        `fill_mode` is `"constant"`.
+      order: Interpolation order, 0 (nearest neighbor) or 1 (bilinear).
+
+  Returns:
+      The warped images, with the same shape and dtype as `x`.
+  """
+  n, h, w, c = x.shape
+  rows, cols = np.meshgrid(np.arange(h), np.arange(w), indexing='ij')
+  coords = np.stack([rows.ravel(), cols.ravel(), np.ones(h * w)])
+  src = np.matmul(matrices[:, :2, :], coords)
+  src_rows, src_cols = src[:, 0], src[:, 1]
+  flat_x = x.reshape(n, h * w, c)
+  batch_indices = np.arange(n)[:, None]
+
+  def gather(r, c):
+    r = _map_indices(r, h, fill_mode)
+    c = _map_indices(c, w, fill_mode)
+    return flat_x[batch_indices, r * w + c]
+
+  if order == 0:
+    outputs = gather(np.floor(src_rows + 0.5), np.floor(src_cols + 0.5))
+  else:
+    r0 = np.floor(src_rows)
+    c0 = np.floor(src_cols)
+    dr = (src_rows - r0)[..., None]
+    dc = (src_cols - c0)[..., None]
+    outputs = ((1 - dr) * ((1 - dc) * gather(r0, c0) + dc * gather(r0, c0 + 1))
+               + dr * ((1 - dc) * gather(r0 + 1, c0) +
+                       dc * gather(r0 + 1, c0 + 1)))
+  if fill_mode == 'constant':
+    eps = 1e-6
+    outside = ((src_rows < -eps) | (src_rows > h - 1 + eps) |
+               (src_cols < -eps) | (src_cols > w - 1 + eps))
+    outputs[outside] = cval
+  return outputs.reshape(x.shape).astype(x.dtype)
+
+
 @keras_export('keras.preprocessing.image.Iterator')
 class Iterator(image.Iterator, data_utils.Sequence):
   pass
@@ -460,6 +581,29 @@ class NumpyArrayIterator(image.NumpyArrayIterator, Iterator):
         subset=subset,
         **kwargs)
 
+  def _get_batches_of_transformed_samples(self, index_array):
+    generator = self.image_data_generator
+    if not getattr(generator, 'batch_transforms', False) or self.save_to_dir:
+      return super(NumpyArrayIterator,
+                   self)._get_batches_of_transformed_samples(index_array)
+
+    batch_x = self.x[index_array].astype(self.dtype)
+    # Draw the random parameters image by image, in the same order as the
+    # per-image path, so that both modes produce the same transforms.
+    params = [generator.get_random_transform(x.shape) for x in batch_x]
+    batch_x = generator.apply_transform_batch(batch_x, params)
+    for i in range(len(batch_x)):
+      batch_x[i] = generator.standardize(batch_x[i])
+
+    batch_x_miscs = [xx[index_array] for xx in self.x_misc]
+    output = (batch_x if not batch_x_miscs else [batch_x] + batch_x_miscs,)
+    if self.y is None:
+      return output[0]
+    output += (self.y[index_array],)
+    if self.sample_weight is not None:
+      output += (self.sample_weight[index_array],)
+    return output
+
 
 class DataFrameIterator(image.DataFrameIterator, Iterator):
   """Iterator capable of reading images from a directory on disk as a dataframe.
@@ -655,6 +799,15 @@ class ImageDataGenerator(image.ImageDataGenerator):
       validation_split: Float. Fraction of images reserved for validation
           (strictly between 0 and 1).
       dtype: Dtype to use for the generated arrays.
+      batch_transforms: Boolean. If `True`, iterators returned by `flow`
+          transform each batch with `apply_transform_batch`: the affine
+          transforms, channel shifts and flips of all images in the batch are
+          applied with vectorized NumPy operations instead of one image (and
+          one `scipy.ndimage.affine_transform` call per channel) at a time.
+          The random transform parameters are the same as in the default
+          mode. Only interpolation orders 0 and 1, and fill modes other than
+          `"wrap"`, are vectorized.
+          Defaults to `False`.
 
   Examples:
 
@@ -772,7 +925,8 @@ class ImageDataGenerator(image.ImageDataGenerator):
                preprocessing_function=None,
                data_format=None,
                validation_split=0.0,
-               dtype=None):
+               dtype=None,
+               batch_transforms=False):
     if data_format is None:
       data_format = backend.image_data_format()
     kwargs = {}
@@ -781,6 +935,7 @@ class ImageDataGenerator(image.ImageDataGenerator):
       if dtype is None:
         dtype = backend.floatx()
       kwargs['dtype'] = dtype
+    self.batch_transforms = batch_transforms
     super(ImageDataGenerator, self).__init__(
         featurewise_center=featurewise_center,
         samplewise_center=samplewise_center,
@@ -805,6 +960,73 @@ class ImageDataGenerator(image.ImageDataGenerator):
         validation_split=validation_split,
         **kwargs)
 
+  def apply_transform_batch(self, x, transform_parameters):
+    """Applies transformations to a batch of images.
+
+    This is equivalent to calling `apply_transform` on every image of the
+    batch, but the affine transforms, channel shifts and flips are applied to
+    all the images at once with vectorized NumPy operations. Brightness shifts
+    go through PIL and are still applied one image at a time, and so are all
+    transforms when `interpolation_order` is above 1 or `fill_mode` is
+    `"wrap"`.
+
+    Arguments:
+        x: 4D numpy array, a batch of images.
+        transform_parameters: List with one dictionary per image, as returned
+          by `get_random_transform`.
+
+    Returns:
+        A transformed version of the input (same shape).
+    """
+    order = getattr(self, 'interpolation_order', 1)
+    if order not in (0, 1) or self.fill_mode == 'wrap':
+      return np.stack([
+          self.apply_transform(xi, params)
+          for xi, params in zip(x, transform_parameters)
+      ])
+
+    # Work on a copy in (N, H, W, C) layout.
+    axes = (self.row_axis, self.col_axis, self.channel_axis)
+    x = np.array(np.moveaxis(x, axes, (1, 2, 3)))
+    _, h, w, _ = x.shape
+
+    matrices, needs_warp = _affine_transform_matrices(transform_parameters, h,
+                                                      w)
+    if np.any(needs_warp):
+      x[needs_warp] = _affine_warp_batch(x[needs_warp], matrices[needs_warp],
+                                         self.fill_mode, self.cval, order)
+
+    intensities = [
+        params.get('channel_shift_intensity')
+        for params in transform_parameters
+    ]
+    shifted = np.array([intensity is not None for intensity in intensities])
+    if np.any(shifted):
+      x_shifted = x[shifted]
+      intensities = np.array(
+          [intensity for intensity in intensities if intensity is not None])
+      x[shifted] = np.clip(
+          x_shifted + intensities.reshape((-1, 1, 1, 1)),
+          np.min(x_shifted, axis=(1, 2, 3), keepdims=True),
+          np.max(x_shifted, axis=(1, 2, 3), keepdims=True))
+
+    flip_horizontal = np.array([
+        bool(params.get('flip_horizontal', False))
+        for params in transform_parameters
+    ])
+    x[flip_horizontal] = x[flip_horizontal][:, :, ::-1]
+    flip_vertical = np.array([
+        bool(params.get('flip_vertical', False))
+        for params in transform_parameters
+    ])
+    x[flip_vertical] = x[flip_vertical][:, ::-1]
+
+    x = np.moveaxis(x, (1, 2, 3), axes)
+    for i, params in enumerate(transform_parameters):
+      if params.get('brightness') is not None:
+        x[i] = self.apply_transform(x[i], {'brightness': params['brightness']})
+    return x
+
   def flow(self,
            x,
            y=None,
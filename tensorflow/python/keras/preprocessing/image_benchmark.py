@@ -0,0 +1,73 @@
+# Copyright 2020 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Benchmarks for batched augmentation in `ImageDataGenerator`."""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import time
+
+import numpy as np
+
+from tensorflow.python.keras.preprocessing import image as preprocessing_image
+from tensorflow.python.platform import test
+
+BATCH_SIZE = 32
+NUM_BATCHES = 20
+
+
+class ImageDataGeneratorBenchmark(test.Benchmark):
+  """Compares the per-image and the batched transform modes."""
+
+  def _run(self, image_size, batch_transforms):
+    x = np.random.random((BATCH_SIZE * 4, image_size, image_size, 3))
+    generator = preprocessing_image.ImageDataGenerator(
+        rotation_range=20.,
+        width_shift_range=0.1,
+        height_shift_range=0.1,
+        shear_range=10.,
+        zoom_range=0.2,
+        horizontal_flip=True,
+        batch_transforms=batch_transforms)
+    iterator = generator.flow(x, batch_size=BATCH_SIZE, seed=1)
+    next(iterator)  # Warm up.
+
+    start = time.time()
+    for _ in range(NUM_BATCHES):
+      next(iterator)
+    wall_time = (time.time() - start) / NUM_BATCHES
+
+    name = 'image_data_generator_%s|size_%d' % (
+        'batched' if batch_transforms else 'per_image', image_size)
+    self.report_benchmark(
+        iters=NUM_BATCHES,
+        wall_time=wall_time,
+        extras={'images_per_second': BATCH_SIZE / wall_time},
+        name=name)
+    return wall_time
+
+  def benchmark_transforms_by_image_size(self):
+    for image_size in [32, 64, 128, 224]:
+      per_image = self._run(image_size, batch_transforms=False)
+      batched = self._run(image_size, batch_transforms=True)
+      self.report_benchmark(
+          iters=NUM_BATCHES,
+          wall_time=batched,
+          extras={'speedup': per_image / batched},
+          name='image_data_generator_speedup|size_%d' % image_size)
+
+
+if __name__ == '__main__':
+  test.main()
@@ -118,6 +118,53 @@ class TestImage(keras_parameterized.TestCase):
         self.assertEqual(x.shape[1:], images.shape[1:])
         break
 
+  def test_apply_transform_batch(self):
+    x = np.random.random((8, 12, 10, 3)).astype('float32')
+    for data_format in ('channels_last', 'channels_first'):
+      for fill_mode in ('nearest', 'reflect', 'constant', 'wrap'):
+        generator = preprocessing_image.ImageDataGenerator(
+            rotation_range=90.,
+            width_shift_range=0.2,
+            height_shift_range=0.2,
+            shear_range=20.,
+            zoom_range=0.3,
+            channel_shift_range=0.5,
+            fill_mode=fill_mode,
+            cval=0.5,
+            horizontal_flip=True,
+            vertical_flip=True,
+            data_format=data_format)
+        images = x if data_format == 'channels_last' else np.transpose(
+            x, (0, 3, 1, 2))
+        params = [generator.get_random_transform(im.shape) for im in images]
+        # Make sure that the identity transform is covered as well.
+        params[0] = {}
+        expected = np.stack([
+            generator.apply_transform(im, p) for im, p in zip(images, params)
+        ])
+        output = generator.apply_transform_batch(images, params)
+        self.assertEqual(output.shape, images.shape)
+        self.assertAllClose(expected, output, atol=1e-4)
+
+  def test_image_data_generator_batch_transforms(self):
+    x = np.random.random((16, 10, 10, 3))
+    y = np.arange(16)
+    generator_kwargs = dict(
+        rotation_range=30.,
+        width_shift_range=0.1,
+        zoom_range=0.2,
+        horizontal_flip=True,
+        rescale=2.)
+    expected_x, expected_y = next(
+        preprocessing_image.ImageDataGenerator(**generator_kwargs).flow(
+            x, y, batch_size=4, seed=1))
+    x_batch, y_batch = next(
+        preprocessing_image.ImageDataGenerator(
+            batch_transforms=True, **generator_kwargs).flow(
+                x, y, batch_size=4, seed=1))
+    self.assertAllEqual(expected_y, y_batch)
+    self.assertAllClose(expected_x, x_batch, atol=1e-4)
+
   def test_image_data_generator_with_split_value_error(self):
     with self.assertRaises(ValueError):
       preprocessing_image.ImageDataGenerator(validation_split=5)
@@ -28,6 +28,7 @@ from __future__ import print_function
 
 from tensorflow.python.ops.array_ops import newaxis
 from tensorflow.python.ops.numpy_ops import np_random as random
+from tensorflow.python.ops.numpy_ops.np_jit import jit
 # pylint: disable=wildcard-import
 from tensorflow.python.ops.numpy_ops.np_array_ops import *
 from tensorflow.python.ops.numpy_ops.np_arrays import ndarray
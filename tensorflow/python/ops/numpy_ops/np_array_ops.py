@@ -31,6 +31,7 @@ from tensorflow.python.framework import tensor_shape
 from tensorflow.python.ops import array_ops
 from tensorflow.python.ops import clip_ops
 from tensorflow.python.ops import control_flow_ops
+from tensorflow.python.ops import gen_math_ops
 from tensorflow.python.ops import linalg_ops
 from tensorflow.python.ops import manip_ops
 from tensorflow.python.ops import math_ops
@@ -208,6 +209,9 @@ def array(val, dtype=None, copy=True, ndmin=0):  # pylint: disable=redefined-out
     result_t = math_ops.cast(result_t, dtype=dtype)
   elif dtype:
     result_t = math_ops.cast(result_t, dtype)
+  if isinstance(ndmin, six.integer_types) and ndmin <= 0:
+    # Avoids building (or, in eager mode, running) the rank and cond ops.
+    return np_arrays.tensor_to_ndarray(result_t)
   ndims = array_ops.rank(result_t)
 
   def true_fn():
@@ -468,6 +472,40 @@ _TO_INT_ = 0
 _TO_FLOAT = 1
 
 
+# Maps a rank to the axes of a full reduction, see `_fast_reduce`.
+_ALL_AXES = {}
+
+
+def _fast_reduce(gen_fn, a, axis, keepdims):
+  """Reduces `a` with the kernel `gen_fn`, or returns None.
+
+  This is the eager fast path of `_reduce` for floating point `ndarray`s with
+  no `dtype` requested, which need no promotion (see
+  `np_utils.eager_fast_path_tensors`).
+
+  Args:
+    gen_fn: The generated op of the reduction, e.g. `gen_math_ops._sum`.
+    a: The array to be reduced.
+    axis: The axis argument of the reduction.
+    keepdims: The keepdims argument of the reduction.
+
+  Returns:
+    An ndarray, or None if the fast path doesn't apply.
+  """
+  tensors = np_utils.eager_fast_path_tensors(a)
+  if tensors is None:
+    return None
+  t = tensors[0]
+  if axis is None:
+    rank = t.shape.rank
+    axis = _ALL_AXES.get(rank)
+    if axis is None:
+      axis = _ALL_AXES[rank] = np.arange(rank, dtype=np.int32)
+  elif not isinstance(axis, (tuple, list) + six.integer_types):
+    return None
+  return np_utils.tensor_to_ndarray(gen_fn(t, axis, bool(keepdims)))
+
+
 def _reduce(tf_fn,
             a,
             axis=None,
@@ -510,7 +548,8 @@ def _reduce(tf_fn,
         tf_bool_fn(input_tensor=a.data, axis=axis, keepdims=keepdims))
   if dtype is None:
     dtype = a.dtype
-    if np.issubdtype(dtype, np.integer) or dtype == np.bool_:
+    # Checking the kind is much cheaper than np.issubdtype.
+    if dtype.kind in 'biu':
       if promote_int == _TO_INT_:
         # If a is an integer/bool type and whose bit width is less than np.int_,
         # numpy up-casts it to np.int_ based on the documentation at
@@ -538,6 +577,10 @@ def _reduce(tf_fn,
 
 @np_utils.np_doc('sum')
 def sum(a, axis=None, dtype=None, keepdims=None):  # pylint: disable=redefined-builtin
+  if dtype is None:
+    result = _fast_reduce(gen_math_ops._sum, a, axis, keepdims)  # pylint: disable=protected-access
+    if result is not None:
+      return result
   return _reduce(
       math_ops.reduce_sum,
       a,
@@ -560,6 +603,10 @@ def prod(a, axis=None, dtype=None, keepdims=None):
 
 @np_utils.np_doc('mean')
 def mean(a, axis=None, dtype=None, keepdims=None):
+  if dtype is None:
+    result = _fast_reduce(gen_math_ops.mean, a, axis, keepdims)
+    if result is not None:
+      return result
   return _reduce(
       math_ops.reduce_mean,
       a,
@@ -571,6 +618,9 @@ def mean(a, axis=None, dtype=None, keepdims=None):
 
 @np_utils.np_doc('amax')
 def amax(a, axis=None, keepdims=None):
+  result = _fast_reduce(gen_math_ops._max, a, axis, keepdims)  # pylint: disable=protected-access
+  if result is not None:
+    return result
   return _reduce(
       math_ops.reduce_max,
       a,
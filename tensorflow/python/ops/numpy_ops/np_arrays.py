@@ -307,6 +307,8 @@ class ndarray(composite_tensor.CompositeTensor):  # pylint: disable=invalid-name
 
 
 def tensor_to_ndarray(tensor):
+  if isinstance(tensor, ndarray):
+    return tensor
   return ndarray.from_tensor(tensor)
 
 
@@ -52,6 +52,10 @@ class ArrayTest(test.TestCase):
     self.assertIs(a.dtype.type, np.bool_)
     self.assertAllEqual([False, True], a)
 
+  def testTensorToNdarrayDoesNotRewrap(self):
+    a = t2a(constant_op.constant([1., 2.]))
+    self.assertIs(a, t2a(a))
+
   def testConstructor(self):
     t = constant_op.constant([[1], [1]])
     a = np_arrays.ndarray(shape=(2, 1), buffer=t)
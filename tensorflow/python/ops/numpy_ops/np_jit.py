@@ -0,0 +1,129 @@
+# Copyright 2020 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Just-in-time compilation of functions written with tf.experimental.numpy."""
+
+# pylint: disable=g-direct-tensorflow-import
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import functools
+import weakref
+
+from tensorflow.python.framework import errors
+from tensorflow.python.platform import tf_logging as logging
+from tensorflow.python.util import lazy_loader
+
+# Loaded lazily because tf.function depends on this package.
+def_function = lazy_loader.LazyLoader(
+    'def_function', globals(), 'tensorflow.python.eager.def_function')
+
+# Errors raised when XLA can't compile a function, e.g. because it contains ops
+# without XLA kernels or because XLA isn't linked into the binary.
+_COMPILATION_ERRORS = (errors.InvalidArgumentError, errors.UnimplementedError,
+                       errors.NotFoundError)
+
+
+class _JitFunction(object):
+  """Callable returned by `jit`."""
+
+  def __init__(self, func, uncompiled, compiled):
+    """Creates the callable.
+
+    Args:
+      func: The Python function.
+      uncompiled: A `tf.function` of `func`.
+      compiled: A `tf.function` of `func` compiled with XLA, or None.
+    """
+    functools.update_wrapper(self, func)
+    self._func = func
+    self._name = getattr(func, '__name__', repr(func))
+    self._uncompiled = uncompiled
+    self._compiled = compiled
+    self._descriptor_cache = weakref.WeakKeyDictionary()
+
+  def __get__(self, instance, owner):
+    """Makes it possible to jit instance methods, like `tf.function`."""
+    if instance is None:
+      return self
+    # The `tf.function`s are bound the same way, which gives each instance its
+    # own traces. The bound callable is cached so that a compilation failure
+    # is only reported once per instance.
+    if instance not in self._descriptor_cache:
+      compiled = self._compiled
+      if compiled is not None:
+        compiled = compiled.__get__(instance, owner)
+      self._descriptor_cache[instance] = _JitFunction(
+          self._func, self._uncompiled.__get__(instance, owner), compiled)
+    return self._descriptor_cache[instance]
+
+  def __call__(self, *args, **kwargs):
+    if self._compiled is None:
+      return self._uncompiled(*args, **kwargs)
+    try:
+      return self._compiled(*args, **kwargs)
+    except _COMPILATION_ERRORS as e:
+      # XLA reports compilation errors before running anything, so running
+      # the uncompiled function can't repeat side effects. If it fails too,
+      # the error came from `func` itself and compilation is kept.
+      result = self._uncompiled(*args, **kwargs)
+      logging.warning(
+          'Could not compile %s with XLA, running it without compilation '
+          'from now on: %s', self._name, e)
+      self._compiled = None
+      return result
+
+
+def jit(func=None, experimental_compile=True):
+  """Traces a function using tf.experimental.numpy into a fused computation.
+
+  Called op by op, an expression such as `np.exp(x - np.max(x)) / np.sum(...)`
+  dispatches every op from Python and materializes every intermediate array.
+  `jit` instead traces `func` into a `tf.function` and, by default, compiles it
+  with XLA, which fuses the elementwise ops and reductions into a few kernels.
+
+  Like `tf.function`, a trace is made and cached for each distinct combination
+  of input shapes and dtypes (and values of non-array arguments). Shapes are
+  not relaxed, so each trace is specialized to, and compiled for, static
+  shapes. Functions XLA can't compile fall back to running as an uncompiled
+  `tf.function`, with a warning.
+
+  Example:
+
+  ```python
+  @np.jit
+  def softmax(x):
+    e = np.exp(x - np.max(x, axis=-1, keepdims=True))
+    return e / np.sum(e, axis=-1, keepdims=True)
+  ```
+
+  Args:
+    func: The function to trace. Its arguments may be `ndarray`s, `Tensor`s or
+      NumPy arrays, and it may return (nests of) `ndarray`s.
+    experimental_compile: Whether to compile `func` with XLA. If False, `func`
+      still runs as a graph, without Python overhead per op.
+
+  Returns:
+    A callable with the same signature as `func`, or, if `func` is None, a
+    decorator.
+  """
+  if func is None:
+    return functools.partial(jit, experimental_compile=experimental_compile)
+  if experimental_compile:
+    compiled = def_function.function(func, experimental_compile=True)
+  else:
+    compiled = None
+  return _JitFunction(func, def_function.function(func), compiled)
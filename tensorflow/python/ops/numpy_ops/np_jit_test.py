@@ -0,0 +1,110 @@
+# Copyright 2020 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for tf numpy jit."""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import numpy as np
+
+from tensorflow.python.framework import errors
+from tensorflow.python.ops.numpy_ops import np_array_ops
+from tensorflow.python.ops.numpy_ops import np_arrays
+from tensorflow.python.ops.numpy_ops import np_jit
+from tensorflow.python.ops.numpy_ops import np_math_ops
+from tensorflow.python.platform import test
+
+
+def _softmax(x):
+  e = np_math_ops.exp(x - np_array_ops.amax(x, axis=-1, keepdims=True))
+  return e / np_array_ops.sum(e, axis=-1, keepdims=True)
+
+
+def _np_softmax(x):
+  e = np.exp(x - np.max(x, axis=-1, keepdims=True))
+  return e / np.sum(e, axis=-1, keepdims=True)
+
+
+class JitTest(test.TestCase):
+
+  def testResult(self):
+    x = np.random.uniform(size=[3, 5]).astype(np.float32)
+    for experimental_compile in (True, False):
+      f = np_jit.jit(_softmax, experimental_compile=experimental_compile)
+      out = f(np_array_ops.asarray(x))
+      self.assertIsInstance(out, np_arrays.ndarray)
+      self.assertAllClose(_np_softmax(x), out, rtol=1e-5)
+
+  def testDecorator(self):
+
+    @np_jit.jit(experimental_compile=False)
+    def f(x, y):
+      """f docstring."""
+      return np_math_ops.add(x, y)
+
+    self.assertEqual('f docstring.', f.__doc__)
+    self.assertAllEqual([3, 5], f(np_array_ops.asarray([1, 2]),
+                                  np_array_ops.asarray([2, 3])))
+
+  def testMethod(self):
+
+    class Scaler(object):
+
+      def __init__(self, scale):
+        self.scale = scale
+
+      @np_jit.jit
+      def apply(self, x):
+        return np_math_ops.multiply(x, self.scale)
+
+    x = np_array_ops.asarray([1., 2.])
+    self.assertAllClose([2., 4.], Scaler(2.).apply(x))
+    self.assertAllClose([3., 6.], Scaler(3.).apply(x))
+    scaler = Scaler(4.)
+    self.assertIs(scaler.apply, scaler.apply)
+    self.assertAllClose([4., 8.], Scaler.apply(scaler, x))
+
+  def testTracesAreCachedByShapeAndDtype(self):
+    traces = []
+
+    @np_jit.jit
+    def f(x):
+      traces.append(x.shape)
+      return np_math_ops.multiply(x, 2)
+
+    f(np_array_ops.ones([2], np.float32))
+    f(np_array_ops.ones([2], np.float32))
+    self.assertLen(traces, 1)
+    f(np_array_ops.ones([3], np.float32))
+    self.assertLen(traces, 2)
+    f(np_array_ops.ones([3], np.int32))
+    self.assertLen(traces, 3)
+
+  def testFallsBackWhenCompilationFails(self):
+    f = np_jit.jit(_softmax)
+
+    def fail_to_compile(*args, **kwargs):
+      del args, kwargs
+      raise errors.UnimplementedError(None, None, 'No XLA kernel.')
+
+    f._compiled = fail_to_compile  # pylint: disable=protected-access
+    x = np.random.uniform(size=[2, 4]).astype(np.float32)
+    self.assertAllClose(_np_softmax(x), f(np_array_ops.asarray(x)), rtol=1e-5)
+    self.assertIsNone(f._compiled)  # pylint: disable=protected-access
+
+
+if __name__ == '__main__':
+  test.main()
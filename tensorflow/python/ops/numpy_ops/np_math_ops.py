@@ -32,6 +32,7 @@ from tensorflow.python.ops import array_ops
 from tensorflow.python.ops import bitwise_ops
 from tensorflow.python.ops import clip_ops
 from tensorflow.python.ops import control_flow_ops
+from tensorflow.python.ops import gen_math_ops
 from tensorflow.python.ops import math_ops
 from tensorflow.python.ops import sort_ops
 from tensorflow.python.ops import special_math_ops
@@ -75,6 +76,9 @@ def _bin_op(tf_fun, a, b, promote=True):
 
 @np_utils.np_doc('add')
 def add(x1, x2):
+  tensors = np_utils.eager_fast_path_tensors(x1, x2)
+  if tensors is not None:
+    return np_utils.tensor_to_ndarray(gen_math_ops.add_v2(*tensors))
 
   def add_or_or(x1, x2):
     if x1.dtype == dtypes.bool:
@@ -92,6 +96,9 @@ def subtract(x1, x2):
 
 @np_utils.np_doc('multiply')
 def multiply(x1, x2):
+  tensors = np_utils.eager_fast_path_tensors(x1, x2)
+  if tensors is not None:
+    return np_utils.tensor_to_ndarray(gen_math_ops.mul(*tensors))
 
   def mul_or_and(x1, x2):
     if x1.dtype == dtypes.bool:
@@ -587,6 +594,9 @@ def log(x):
 
 @np_utils.np_doc('exp')
 def exp(x):
+  tensors = np_utils.eager_fast_path_tensors(x)
+  if tensors is not None:
+    return np_utils.tensor_to_ndarray(gen_math_ops.exp(tensors[0]))
   return _scalar(math_ops.exp, x, True)
 
 
@@ -23,10 +23,12 @@ from absl.testing import parameterized
 import numpy as np
 from six.moves import range
 
+from tensorflow.python.eager import context
 from tensorflow.python.framework import errors
 from tensorflow.python.framework import ops
 from tensorflow.python.ops.numpy_ops import np_array_ops
 from tensorflow.python.ops.numpy_ops import np_arrays
+from tensorflow.python.ops.numpy_ops import np_dtypes
 from tensorflow.python.ops.numpy_ops import np_math_ops
 from tensorflow.python.platform import test
 
@@ -154,6 +156,46 @@ class MathTest(test.TestCase, parameterized.TestCase):
   def testSqrt(self):
     self._testUnaryOp(np_math_ops.sqrt, np.sqrt, 'sqrt')
 
+  @parameterized.parameters((np.float32, True), (np.float64, True),
+                            (np.float64, False), (np.int32, True))
+  def testEagerFastPath(self, dtype, allow_float64):
+    old_allow_float64 = np_dtypes.is_allow_float64()
+    np_dtypes.set_allow_float64(allow_float64)
+    try:
+      with context.eager_mode():
+        tensors = [
+            ops.convert_to_tensor(np.arange(6).reshape([2, 3]).astype(dtype)),
+            ops.convert_to_tensor(np.ones([3], dtype)),
+        ]
+        arrays = [np_arrays.tensor_to_ndarray(t) for t in tensors]
+        cases = [
+            (np_math_ops.add, 2, {}),
+            (np_math_ops.multiply, 2, {}),
+            (np_math_ops.exp, 1, {}),
+            (np_array_ops.sum, 1, {}),
+            (np_array_ops.sum, 1, {'axis': 0}),
+            (np_array_ops.mean, 1, {'axis': (0, 1), 'keepdims': True}),
+            (np_array_ops.amax, 1, {'axis': -1}),
+        ]
+        for fn, num_args, kwargs in cases:
+          # Tensor arguments always take the generic path.
+          expected = fn(*tensors[:num_args], **kwargs)
+          self.match(fn(*arrays[:num_args], **kwargs), expected,
+                     msg='{} {}'.format(fn.__name__, kwargs))
+    finally:
+      np_dtypes.set_allow_float64(old_allow_float64)
+
+  def testEagerFastPathSkipsPromotion(self):
+    with context.eager_mode():
+      a = np_array_ops.asarray([1., 2.], dtype=np.float32)
+      with test.mock.patch.object(
+          np_math_ops, '_bin_op', side_effect=AssertionError):
+        self.match(np_math_ops.add(a, a),
+                   np.array([2., 4.], dtype=np.float32))
+      with test.mock.patch.object(
+          np_array_ops, '_reduce', side_effect=AssertionError):
+        self.match(np_array_ops.sum(a), np.array(3., dtype=np.float32))
+
   def match(self, actual, expected, msg='', check_dtype=True):
     self.assertIsInstance(actual, np_arrays.ndarray)
     if check_dtype:
@@ -0,0 +1,109 @@
+# Copyright 2020 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Benchmarks of eager tf.experimental.numpy ops against NumPy.
+
+Small arrays measure the per-op Python overhead (promotion, conversion and
+wrapping), large arrays the kernels themselves. The ratio of the two wall times
+is reported in `extras`.
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import time
+
+import numpy as np
+
+from tensorflow.python.eager import context
+from tensorflow.python.ops.numpy_ops import np_array_ops
+from tensorflow.python.ops.numpy_ops import np_jit
+from tensorflow.python.ops.numpy_ops import np_math_ops
+from tensorflow.python.platform import test
+
+_SIZES = {'small': [4], 'large': [1000, 1000]}
+
+
+class NumpyOpsBenchmark(test.Benchmark):
+  """Compares eager tf.experimental.numpy ops with their NumPy equivalents."""
+
+  def _run(self, fn, iters):
+    for _ in range(10):
+      fn()
+    start = time.time()
+    for _ in range(iters):
+      fn()
+    return (time.time() - start) / iters
+
+  def _benchmark(self, name, np_fn, tfnp_fn, num_args=2):
+    for size_name, shape in sorted(_SIZES.items()):
+      iters = 1000 if size_name == 'small' else 20
+      np_args = [
+          np.random.uniform(1., 2., size=shape).astype(np.float32)
+          for _ in range(num_args)
+      ]
+      with context.eager_mode():
+        tfnp_args = [np_array_ops.asarray(x) for x in np_args]
+        np_time = self._run(lambda: np_fn(*np_args), iters)
+        # `.data` forces the computation so that asynchronous execution is
+        # accounted for.
+        tfnp_time = self._run(lambda: tfnp_fn(*tfnp_args).data.numpy(), iters)
+      self.report_benchmark(
+          name='{}_{}'.format(name, size_name),
+          iters=iters,
+          wall_time=tfnp_time,
+          extras={
+              'numpy_wall_time': np_time,
+              'slowdown_vs_numpy': tfnp_time / np_time,
+          })
+
+  def benchmark_add(self):
+    self._benchmark('add', np.add, np_math_ops.add)
+
+  def benchmark_add_scalar(self):
+    self._benchmark('add_scalar', lambda x: x + 1., lambda x: x + 1., 1)
+
+  def benchmark_multiply(self):
+    self._benchmark('multiply', np.multiply, np_math_ops.multiply)
+
+  def benchmark_exp(self):
+    self._benchmark('exp', np.exp, np_math_ops.exp, 1)
+
+  def benchmark_sum(self):
+    self._benchmark('sum', np.sum, np_array_ops.sum, 1)
+
+  def benchmark_mean(self):
+    self._benchmark('mean', np.mean, np_array_ops.mean, 1)
+
+  def benchmark_max(self):
+    self._benchmark('max', np.max, np_array_ops.amax, 1)
+
+  def benchmark_softmax(self):
+
+    def softmax(exp, amax, sum_):
+      def f(x):
+        e = exp(x - amax(x, axis=-1, keepdims=True))
+        return e / sum_(e, axis=-1, keepdims=True)
+      return f
+
+    np_softmax = softmax(np.exp, np.max, np.sum)
+    tfnp_softmax = softmax(np_math_ops.exp, np_array_ops.amax,
+                           np_array_ops.sum)
+    self._benchmark('softmax', np_softmax, tfnp_softmax, 1)
+    self._benchmark('softmax_jit', np_softmax, np_jit.jit(tfnp_softmax), 1)
+
+
+if __name__ == '__main__':
+  test.main()
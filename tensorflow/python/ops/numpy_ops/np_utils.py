@@ -22,6 +22,7 @@ from __future__ import print_function
 import inspect
 import numpy as np
 
+from tensorflow.python.eager import context
 from tensorflow.python.framework import dtypes
 from tensorflow.python.framework import indexed_slices
 from tensorflow.python.framework import tensor_util
@@ -98,6 +99,36 @@ def finfo(dtype):
   return np.finfo(_to_numpy_type(dtype))
 
 
+def eager_fast_path_tensors(*arrays):
+  """Returns the tensors of `arrays` if ops on them can skip promotion.
+
+  Elementwise ops and reductions on such arrays can call their TF kernels
+  directly: in eager mode, `ndarray`s that share a floating point dtype, which
+  canonicalization leaves unchanged, need no promotion or conversion, and their
+  results have the same dtype as the generic code path.
+
+  Args:
+    *arrays: The arguments of an op.
+
+  Returns:
+    A list with the `Tensor` of each array, or None if the fast path doesn't
+    apply.
+  """
+  if not context.executing_eagerly():
+    return None
+  tensors = []
+  for a in arrays:
+    if not isinstance(a, np_arrays.ndarray):
+      return None
+    tensors.append(a.data)
+  dtype = tensors[0].dtype
+  if not dtype.is_floating or any(t.dtype != dtype for t in tensors[1:]):
+    return None
+  if dtype == dtypes.float64 and not np_dtypes.is_allow_float64():
+    return None
+  return tensors
+
+
 def isscalar(val):
   """Returns whether `val` is a scalar value or scalar Tensor."""
   if isinstance(val, np_arrays.ndarray):
@@ -112,16 +143,72 @@ def isscalar(val):
     return np.isscalar(val)
 
 
+# Maps the promotion keys (see `_result_type_key`) of `result_type` arguments
+# to the dtype computed by `np.result_type`, before canonicalization so that
+# entries stay valid when `np_dtypes.set_allow_float64` is called.
+_result_type_cache = {}
+
+_RESULT_TYPE_CACHE_SIZE = 1024
+
+_PYTHON_SCALAR_TYPES = (bool, int, float, complex)
+
+
+def _result_type_key(arrays_and_dtypes):
+  """Returns a hashable key determining the result of `np.result_type`.
+
+  Args:
+    arrays_and_dtypes: A list of array_like objects or dtypes.
+
+  Returns:
+    A tuple, or None if some argument (e.g. a list or an `np.ndarray`) must be
+    inspected by value, in which case the result is not cached.
+  """
+  key = []
+  for x in arrays_and_dtypes:
+    if isinstance(
+        x, (np_arrays.ndarray, core.Tensor, indexed_slices.IndexedSlices)):
+      key.append(x.dtype)
+    elif isinstance(x, (dtypes.DType, np.dtype, type, str)):
+      key.append(x)
+    elif isinstance(x, _PYTHON_SCALAR_TYPES):
+      # np.result_type uses the smallest dtype that can hold a Python scalar,
+      # unless the scalar is of a higher kind than the arrays. Then it uses the
+      # scalar's default dtype, which for ints depends on the magnitude.
+      key.append((type(x), np.min_scalar_type(x),
+                  isinstance(x, int) and x >= 2**63))
+    else:
+      return None
+  return tuple(key)
+
+
 # Can't use np_doc because np.result_type is a builtin function.
 def result_type(*arrays_and_dtypes):
   """Returns the type resulting from applying NumPy type promotion to arguments.
 
+  Results for arguments that are arrays, dtypes or Python scalars are cached,
+  which keeps promotion cheap for eager code operating on small arrays.
+
   Args:
     *arrays_and_dtypes: A list of array_like objects or dtypes.
 
   Returns:
     A numpy dtype.
   """
+  key = _result_type_key(arrays_and_dtypes)
+  if key is None:
+    dtype = _uncached_result_type(arrays_and_dtypes)
+  else:
+    dtype = _result_type_cache.get(key)
+    if dtype is None:
+      dtype = _uncached_result_type(arrays_and_dtypes)
+      if len(_result_type_cache) >= _RESULT_TYPE_CACHE_SIZE:
+        _result_type_cache.clear()
+      _result_type_cache[key] = dtype
+  return np_dtypes.canonicalize_dtype(dtype)
+
+
+def _uncached_result_type(arrays_and_dtypes):
+  """Returns `np.result_type` of `arrays_and_dtypes`, not canonicalized."""
 
   def maybe_get_dtype(x):
     # Don't put np.ndarray in this list, because np.result_type looks at the
@@ -139,7 +226,7 @@ def result_type(*arrays_and_dtypes):
   if not arrays_and_dtypes:
     # If arrays_and_dtypes is an empty list, let numpy decide what the dtype is.
     arrays_and_dtypes = [np.asarray([])]
-  return np_dtypes._result_type(*arrays_and_dtypes)  # pylint: disable=protected-access
+  return np.result_type(*arrays_and_dtypes)
 
 
 def promote_types(type1, type2):
@@ -18,6 +18,12 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import numpy as np
+
+from tensorflow.python.framework import constant_op
+from tensorflow.python.framework import dtypes
+from tensorflow.python.ops.numpy_ops import np_arrays
+from tensorflow.python.ops.numpy_ops import np_dtypes
 from tensorflow.python.ops.numpy_ops import np_utils
 from tensorflow.python.platform import test
 
@@ -58,6 +64,35 @@ f docstring.
 """
     self.assertEqual(expected, f.__doc__)
 
+  def testResultTypeCache(self):
+    f32 = np_arrays.tensor_to_ndarray(constant_op.constant(1., dtypes.float32))
+    i8 = constant_op.constant(1, dtypes.int8)
+    cases = [
+        ((f32, f32), np.float32),
+        ((f32, i8), np.float32),
+        ((i8, 1000), np.int16),
+        ((i8, 1), np.int8),
+        ((i8, 1.), np.float64),
+        ((f32, 1.), np.float32),
+        ((f32, float), np.float64),
+        ((dtypes.bool, 2**62), np.int64),
+        ((dtypes.bool, 2**63), np.uint64),
+        ((np.int32, 'float16'), np.float64),
+        ((f32, [1., 2.]), np.float32),
+    ]
+    old_allow_float64 = np_dtypes.is_allow_float64()
+    try:
+      for allow_float64 in (True, False, True):
+        np_dtypes.set_allow_float64(allow_float64)
+        # Run twice so that the second lookup is served by the cache.
+        for _ in range(2):
+          for args, expected in cases:
+            self.assertEqual(
+                np_dtypes.canonicalize_dtype(np.dtype(expected)),
+                np_utils.result_type(*args), msg=str(args))
+    finally:
+      np_dtypes.set_allow_float64(old_allow_float64)
+
   def testNpDocErrors(self):
 
     self.skipTest('Enable once np signature checking is done.')
@@ -18,6 +18,8 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import time
+
 from absl.testing import parameterized
 import numpy as np
 
@@ -310,6 +312,89 @@ class RaggedConstOpTest(test_util.TensorFlowTestCase,
         ragged_rank=ragged_rank,
         inner_shape=inner_shape)
 
+  @parameterized.parameters(
+      dict(
+          rows=[np.array([1, 2]), np.array([3]), np.array([4, 5, 6])],
+          expected=[[1, 2], [3], [4, 5, 6]]),
+      dict(
+          rows=[[1., 2.], [], [3.]],
+          dtype=dtypes.float32,
+          expected=[[1., 2.], [], [3.]]),
+      dict(
+          rows=[np.array([[1, 2], [3, 4]]), np.zeros([0, 2], np.int64),
+                np.array([[5, 6]])],
+          expected=[[[1, 2], [3, 4]], [], [[5, 6]]]),
+      dict(
+          rows=[np.array([b'a', b'b']), np.array([b'c'])],
+          expected=[[b'a', b'b'], [b'c']]),
+      dict(
+          flat_values=np.array([1, 2, 3, 4, 5, 6]),
+          row_lengths=[2, 0, 1, 3],
+          expected=[[1, 2], [], [3], [4, 5, 6]]),
+      dict(
+          flat_values=[1, 2, 3],
+          row_lengths=np.array([3], np.int32),
+          dtype=dtypes.int32,
+          row_splits_dtype=dtypes.int32,
+          expected=[[1, 2, 3]]),
+      dict(rows=[], expected=[]),
+  )
+  def testConstantFromRows(self,
+                           expected,
+                           rows=None,
+                           flat_values=None,
+                           row_lengths=None,
+                           dtype=None,
+                           row_splits_dtype=dtypes.int64):
+    rt = ragged_factory_ops.constant_from_rows(
+        rows=rows,
+        flat_values=flat_values,
+        row_lengths=row_lengths,
+        dtype=dtype,
+        row_splits_dtype=row_splits_dtype)
+    self.assertEqual(rt.ragged_rank, 1)
+    self.assertEqual(rt.row_splits.dtype, row_splits_dtype)
+    if dtype is not None:
+      self.assertEqual(rt.dtype, dtype)
+    if expected:
+      self.assertAllEqual(rt, expected)
+    else:
+      self.assertEqual(rt.shape.as_list(), [0, None])
+
+  @parameterized.parameters(
+      dict(message='Exactly one of rows and flat_values'),
+      dict(
+          rows=[[1]],
+          flat_values=[1],
+          row_lengths=[1],
+          message='Exactly one of rows and flat_values'),
+      dict(
+          flat_values=[1],
+          message='flat_values and row_lengths must be specified together'),
+      dict(rows=[[1], 2], message='rows must have at least one dimension'),
+      dict(rows=[[[1]], [[1, 2]]], message='inconsistent inner shapes'),
+      dict(
+          flat_values=[1, 2],
+          row_lengths=[[2]],
+          message='row_lengths must be a 1-D integer array'),
+      dict(
+          flat_values=[1, 2],
+          row_lengths=[3, -1],
+          message='row_lengths must be non-negative'),
+      dict(
+          flat_values=[1, 2],
+          row_lengths=[1, 2],
+          message='row_lengths sum to 3, but flat_values has 2 rows'),
+  )
+  def testConstantFromRowsError(self,
+                                message,
+                                rows=None,
+                                flat_values=None,
+                                row_lengths=None):
+    with self.assertRaisesRegexp(ValueError, message):
+      ragged_factory_ops.constant_from_rows(
+          rows=rows, flat_values=flat_values, row_lengths=row_lengths)
+
   @parameterized.parameters([
       dict(pylist=9, scalar_depth=0, max_depth=0),
       dict(pylist=[9], scalar_depth=1, max_depth=1),
@@ -410,5 +495,36 @@ def _normalize_pylist(item):
   return [_normalize_pylist(el) if np.ndim(el) != 0 else el for el in level]
 
 
+class RaggedConstantBenchmark(googletest.Benchmark):
+  """Compares `constant_from_rows` with `constant` on a batch of token ids."""
+
+  def _run_benchmark(self, name, fn, num_rows):
+    start = time.time()
+    fn()
+    self.report_benchmark(
+        name='%s_%d' % (name, num_rows),
+        iters=1,
+        wall_time=time.time() - start,
+        extras={'num_rows': num_rows})
+
+  def benchmarkConstantFromRows(self):
+    for num_rows in (10000, 1000000):
+      lengths = np.random.randint(0, 64, size=num_rows)
+      rows = [np.arange(length, dtype=np.int64) for length in lengths]
+      pylist = [row.tolist() for row in rows]
+      flat_values = np.concatenate(rows)
+      self._run_benchmark('constant',
+                          lambda: ragged_factory_ops.constant(pylist),
+                          num_rows)
+      self._run_benchmark('constant_from_rows',
+                          lambda: ragged_factory_ops.constant_from_rows(rows),
+                          num_rows)
+      self._run_benchmark(
+          'constant_from_rows_flat_values',
+          lambda: ragged_factory_ops.constant_from_rows(  # pylint: disable=g-long-lambda
+              flat_values=flat_values, row_lengths=lengths),
+          num_rows)
+
+
 if __name__ == '__main__':
   googletest.main()
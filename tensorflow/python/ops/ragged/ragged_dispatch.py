@@ -44,6 +44,7 @@ from tensorflow.python.ops.ragged import ragged_squeeze_op
 from tensorflow.python.ops.ragged import ragged_string_ops
 from tensorflow.python.ops.ragged import ragged_tensor
 from tensorflow.python.ops.ragged import ragged_tensor_shape
+from tensorflow.python.ops.ragged import ragged_tensor_value
 from tensorflow.python.ops.ragged import ragged_util
 from tensorflow.python.ops.ragged import ragged_where_op
 from tensorflow.python.util import deprecation
@@ -104,9 +105,15 @@ def _is_convertible_to_tensor(value):
       return False
 
 
+_RAGGED_TYPES = (ragged_tensor.RaggedTensor,
+                 ragged_tensor_value.RaggedTensorValue)
+
+
 class UnaryRaggedElementwiseDispatcher(dispatch.OpDispatcher):
   """OpDispatcher for unary ops that map a base op across ragged values."""
 
+  dispatch_types = _RAGGED_TYPES
+
   def __init__(self, original_op, arg_is_list=False):
     self._original_op = original_op
     self._arg_is_list = arg_is_list
@@ -166,6 +173,8 @@ class BinaryRaggedElementwiseDispatcher(dispatch.OpDispatcher):
   Supports broadcasting.
   """
 
+  dispatch_types = _RAGGED_TYPES
+
   def __init__(self, original_op):
     self._original_op = original_op
     arg_names = tf_inspect.getfullargspec(original_op)[0]
@@ -239,6 +248,8 @@ class RaggedDispatcher(dispatch.OpDispatcher):
   `tensor_args` arguments are convertible to Tensor or RaggedTensor.
   """
 
+  dispatch_types = _RAGGED_TYPES
+
   def __init__(self, original_op, ragged_op, ragged_args):
     op_arg_names = tf_inspect.getfullargspec(original_op)[0]
     ragged_arg_names = tf_inspect.getfullargspec(ragged_op)[0]
@@ -2894,6 +2894,8 @@ def _take_many_sparse_from_tensors_map(sparse_map_op,
 class _UnaryMapValueDispatcher(dispatch.OpDispatcher):
   """OpDispatcher for unary ops that maps base function across sparse values."""
 
+  dispatch_types = (sparse_tensor.SparseTensor,)
+
   def __init__(self, original_func):
     self._original_func = original_func
     func_name = get_canonical_name_for_symbol(original_func)
@@ -21,9 +21,14 @@ The profiler has two modes:
                      TensorBoard logdir or destroying the Profiler class.
 - Sampling Mode: start_server(). It will perform profiling after receiving a
                  profiling request.
+- Continuous Mode: ContinuousProfiler. It keeps profiling in short windows and
+                   holds the most recent ones in memory, saving them to
+                   logdir when triggered.
 
 NOTE: Only one active profiler session is allowed. Use of simultaneous
 Programmatic Mode and Sampling Mode is undefined and will likely fail.
+Continuous Mode pauses while Programmatic Mode is profiling, but a Sampling
+Mode request that arrives during one of its windows fails.
 
 NOTE: The Keras TensorBoard callback will automatically perform sampled
 profiling. Before enabling customized profiling, set the callback flag
@@ -35,15 +40,23 @@ from __future__ import division
 from __future__ import print_function
 
 import collections
+import gzip
+import os
+import signal
+import socket
 import threading
+import time
 
 from tensorflow.python.framework import errors
+from tensorflow.python.platform import gfile
 from tensorflow.python.platform import tf_logging as logging
 from tensorflow.python.profiler.internal import _pywrap_profiler
 from tensorflow.python.util.tf_export import tf_export
 
 _profiler = None
 _profiler_lock = threading.Lock()
+# The running `ContinuousProfiler`, which `start` pauses.
+_continuous_profiler = None
 
 
 @tf_export('profiler.experimental.ProfilerOptions', v1=[])
@@ -105,12 +118,16 @@ def start(logdir, options=None):
       raise errors.AlreadyExistsError(None, None,
                                       'Another profiler is running.')
     _profiler = _pywrap_profiler.ProfilerSession()
+    if _continuous_profiler is not None:
+      # Explicit profiling takes precedence over continuous profiling.
+      _continuous_profiler._pause()  # pylint: disable=protected-access
     try:
       # support for namedtuple in pybind11 is missing, we change it to
       # dict type first.
       opts = dict(options._asdict()) if options is not None else {}
       _profiler.start(logdir, opts)
     except errors.AlreadyExistsError:
+      _resume_continuous_profiler()
       logging.warning('Another profiler session is running which is probably '
                       'created by profiler server. Please avoid using profiler '
                       'server and profiler APIs at the same time.')
@@ -118,6 +135,7 @@ def start(logdir, options=None):
                                       'Another profiler is running.')
     except Exception:
       _profiler = None
+      _resume_continuous_profiler()
       raise
 
 
@@ -139,13 +157,18 @@ def stop(save=True):
       raise errors.UnavailableError(
           None, None,
           'Cannot export profiling results. No profiler is running.')
-    if save:
-      try:
+    try:
+      if save:
         _profiler.export_to_tb()
-      except Exception:
-        _profiler = None
-        raise
-    _profiler = None
+    finally:
+      _profiler = None
+      _resume_continuous_profiler()
+
+
+def _resume_continuous_profiler():
+  """Resumes the continuous profiler paused by `start`, if any."""
+  if _continuous_profiler is not None:
+    _continuous_profiler._resume()  # pylint: disable=protected-access
 
 
 def warmup():
@@ -205,3 +228,399 @@ class Profile(object):
 
   def __exit__(self, typ, value, tb):
     stop()
+
+
+# A profiled time window. `trace` holds its events as a Chrome trace JSON.
+_ProfileWindow = collections.namedtuple('_ProfileWindow',
+                                        ['start_time', 'end_time', 'trace'])
+
+# How often the continuous profiler thread checks for a received signal.
+_SIGNAL_POLL_SECS = 0.1
+
+
+class ContinuousProfiler(object):
+  """Profiles continuously and saves the recent past when triggered.
+
+  Profiling runs in windows of `window_secs` seconds. Each window is collected
+  as it ends, and the windows covering the last `history_secs` seconds are held
+  in memory. When triggered, the current window is cut short
+  and the held windows are written to `logdir`, so that a rare slowdown can be
+  inspected after the fact instead of being reproduced.
+
+  A dump can be triggered by:
+  - calling `dump()`, which waits for the windows to be written, or
+    `trigger()`, which does not.
+  - a step time outlier: when `step_time_factor` is set, `record_step_time()`
+    triggers a dump for steps slower than `step_time_factor` times the
+    moving average.
+  - a signal: when `signal_number` is set, e.g. to `signal.SIGUSR1`, receiving
+    it triggers a dump.
+
+  To keep the overhead low enough to leave on in production, a profiler
+  session (profiling a window and collecting it) is active for at most
+  `overhead_budget` of the wall time. With the defaults, a one second window
+  starts every 20 seconds or so, and the history holds about three windows.
+  Lower tracer levels in `options` reduce the cost of each window.
+
+  Each window is saved as `<logdir>/plugins/profile/<run>/<host>.trace.json.gz`,
+  with one run per window, which TensorBoard and chrome://tracing can show.
+
+  Example usage:
+  ```python
+  profiler = ContinuousProfiler('logdir_path', step_time_factor=3.)
+  profiler.start()
+  for step in range(num_steps):
+    start = time.time()
+    train_fn()
+    profiler.record_step_time(time.time() - start)
+  profiler.stop()
+  ```
+
+  Only one profiler session can be active at a time. `tf.profiler.experimental`
+  `start()` pauses continuous profiling, ending the current window early, until
+  `stop()` is called. Captures requested through the profiler server are not
+  coordinated: they fail with `AlreadyExistsError` if they arrive during a
+  window, and windows are skipped while they run. Only one continuous profiler
+  can run at a time.
+  """
+
+  def __init__(self,
+               logdir,
+               history_secs=60.,
+               window_secs=1.,
+               overhead_budget=0.05,
+               options=None,
+               step_time_factor=None,
+               min_steps=100,
+               signal_number=None,
+               min_trigger_interval_secs=300.):
+    """Creates a continuous profiler.
+
+    Args:
+      logdir: The log directory that dumps are written to.
+      history_secs: How many seconds of recent profiles to hold in memory.
+      window_secs: The length of each profiling window in seconds.
+      overhead_budget: The maximum fraction of wall time during which a
+        profiler session is active, i.e. profiling or collecting a window.
+      options: An optional `ProfilerOptions` for the profiler sessions.
+      step_time_factor: If set, steps slower than this many times the moving
+        average step time trigger a dump.
+      min_steps: The number of steps to record before the moving average is
+        used to detect outliers.
+      signal_number: If set, a signal that triggers a dump.
+      min_trigger_interval_secs: The minimum time between dumps requested by
+        `trigger()`, including step time outliers and signals. Requests within
+        this interval of the last dump are ignored.
+
+    Raises:
+      ValueError: If an argument is out of range.
+    """
+    if history_secs < window_secs or window_secs <= 0:
+      raise ValueError('window_secs must be positive and at most history_secs, '
+                       'but got window_secs=%s and history_secs=%s' %
+                       (window_secs, history_secs))
+    if not 0 < overhead_budget <= 1:
+      raise ValueError('overhead_budget must be in (0, 1], but got: %s' %
+                       overhead_budget)
+    if step_time_factor is not None and step_time_factor <= 1:
+      raise ValueError('step_time_factor must be greater than 1, but got: %s' %
+                       step_time_factor)
+    self._logdir = logdir
+    self._history_secs = history_secs
+    self._window_secs = window_secs
+    self._overhead_budget = overhead_budget
+    # Support for namedtuple in pybind11 is missing, so options are passed as
+    # a dict.
+    self._options = dict(options._asdict()) if options is not None else {}
+    self._step_time_factor = step_time_factor
+    self._min_steps = min_steps
+    self._signal_number = signal_number
+    self._min_trigger_interval_secs = min_trigger_interval_secs
+
+    self._windows = collections.deque()
+    self._lock = threading.Lock()
+    # Notified when the background thread releases its profiler session.
+    self._session_released = threading.Condition(self._lock)
+    self._session_active = False
+    # Set while an explicit profiling session runs, see `start()`.
+    self._paused = False
+    # Set to end the current window or pause early.
+    self._wake = threading.Event()
+    self._stopping = False
+    self._thread = None
+    self._previous_signal_handler = None
+    # The last signal received and not yet turned into a dump request. The
+    # signal handler only sets it, as it may interrupt a thread holding
+    # `self._lock` or the lock of `self._wake`.
+    self._received_signal = None
+    # Each pending dump is a (reason, done_event, result) tuple, where result
+    # is a list the written paths are appended to.
+    self._pending_dumps = []
+    self._last_dump_time = None
+    self._num_steps = 0
+    self._mean_step_time = 0.
+
+  def start(self):
+    """Starts profiling in the background."""
+    global _continuous_profiler
+    with _profiler_lock, self._lock:
+      if self._thread is not None:
+        raise errors.AlreadyExistsError(
+            None, None, 'The continuous profiler is already running.')
+      if _continuous_profiler is not None:
+        raise errors.AlreadyExistsError(
+            None, None, 'Another continuous profiler is running.')
+      _continuous_profiler = self
+      self._stopping = False
+      self._paused = _profiler is not None
+      self._wake.clear()
+      self._thread = threading.Thread(
+          target=self._run, name='ContinuousProfiler')
+      self._thread.daemon = True
+      self._thread.start()
+    if self._signal_number is not None:
+      self._previous_signal_handler = signal.signal(
+          self._signal_number, self._handle_signal)
+
+  def stop(self):
+    """Stops profiling and drops the profiles held in memory."""
+    global _continuous_profiler
+    with _profiler_lock, self._lock:
+      thread = self._thread
+      if thread is None:
+        raise errors.UnavailableError(
+            None, None, 'The continuous profiler is not running.')
+      if _continuous_profiler is self:
+        _continuous_profiler = None
+      self._stopping = True
+      self._wake.set()
+    if self._signal_number is not None:
+      signal.signal(self._signal_number,
+                    self._previous_signal_handler or signal.SIG_DFL)
+    thread.join()
+    with self._lock:
+      self._thread = None
+      self._windows.clear()
+
+  def __enter__(self):
+    self.start()
+    return self
+
+  def __exit__(self, typ, value, tb):
+    self.stop()
+
+  def dump(self, reason='requested', timeout=None):
+    """Writes the profiles of the recent past to logdir.
+
+    Args:
+      reason: A description of why the dump was requested, which is logged.
+      timeout: The maximum number of seconds to wait for the dump to be
+        written, or None to wait until it is.
+
+    Returns:
+      The paths of the written files.
+
+    Raises:
+      UnavailableError: If the profiler is not running.
+    """
+    done = threading.Event()
+    result = []
+    self._request_dump(reason, done, result)
+    done.wait(timeout)
+    return list(result)
+
+  def trigger(self, reason='triggered'):
+    """Requests a dump without waiting for it.
+
+    Requests within `min_trigger_interval_secs` of the last dump are ignored.
+
+    Args:
+      reason: A description of why the dump was requested, which is logged.
+
+    Returns:
+      Whether a dump was requested.
+    """
+    last_dump_time = self._last_dump_time
+    if (last_dump_time is not None and
+        time.time() - last_dump_time < self._min_trigger_interval_secs):
+      return False
+    try:
+      self._request_dump(reason, None, None)
+    except errors.UnavailableError:
+      return False
+    return True
+
+  def record_step_time(self, step_time):
+    """Records the time of a step, triggering a dump if it is an outlier.
+
+    Args:
+      step_time: The duration of the step in seconds.
+
+    Returns:
+      Whether a dump was requested.
+    """
+    triggered = False
+    if (self._step_time_factor is not None and
+        self._num_steps >= self._min_steps and
+        step_time > self._step_time_factor * self._mean_step_time):
+      triggered = self.trigger(
+          'step time %.6fs is over %s times the average of %.6fs' %
+          (step_time, self._step_time_factor, self._mean_step_time))
+    else:
+      # Outliers are left out of the average so a slow phase keeps triggering.
+      self._num_steps += 1
+      self._mean_step_time += (
+          (step_time - self._mean_step_time) /
+          min(self._num_steps, max(self._min_steps, 1)))
+    return triggered
+
+  def _handle_signal(self, signal_number, frame):
+    del frame  # Unused.
+    self._received_signal = signal_number
+
+  def _trigger_received_signal(self):
+    signal_number = self._received_signal
+    if signal_number is not None:
+      self._received_signal = None
+      self.trigger('received signal %d' % signal_number)
+
+  def _request_dump(self, reason, done, result):
+    with self._lock:
+      if self._thread is None or self._stopping:
+        raise errors.UnavailableError(
+            None, None, 'The continuous profiler is not running.')
+      self._pending_dumps.append((reason, done, result))
+      self._last_dump_time = time.time()
+    self._wake.set()
+
+  def _pause(self):
+    """Ends the current window and starts no new one until `_resume()`."""
+    with self._lock:
+      self._paused = True
+      self._wake.set()
+      while self._session_active:
+        self._session_released.wait()
+
+  def _resume(self):
+    with self._lock:
+      self._paused = False
+    self._wake.set()
+
+  def _release_session(self):
+    with self._lock:
+      self._session_active = False
+      self._session_released.notify_all()
+
+  def _run(self):
+    """Profiles windows until stopped, handling dump requests in between."""
+    options = self._options
+    next_start_time = time.time()
+    while True:
+      self._trigger_received_signal()
+      self._handle_dumps()
+      if self._stopping:
+        break
+      with self._lock:
+        # Wait indefinitely while paused, and otherwise until the next window
+        # is within the overhead budget.
+        delay = None if self._paused else next_start_time - time.time()
+        self._session_active = delay is not None and delay <= 0
+      if not self._session_active:
+        self._wait(delay)
+        continue
+      start_time = time.time()
+      session = _pywrap_profiler.ProfilerSession()
+      try:
+        session.start('', options)
+      except errors.AlreadyExistsError:
+        self._release_session()
+        logging.log_first_n(
+            logging.WARN, 'Another profiler session is running. Skipping '
+            'continuous profiling windows while it runs.', 1)
+        next_start_time = start_time + self._window_secs
+        continue
+      self._wait(self._window_secs)
+      end_time = time.time()
+      try:
+        trace = session.stop()
+      except Exception as e:  # pylint: disable=broad-except
+        logging.warning('Failed to collect a continuous profiling window: %s',
+                        e)
+        trace = None
+      self._release_session()
+      if trace:
+        self._add_window(_ProfileWindow(start_time, end_time, trace))
+      # The session was active from start_time until now, which may be at most
+      # overhead_budget of the time until the next window starts.
+      next_start_time = (
+          start_time + (time.time() - start_time) / self._overhead_budget)
+
+  def _wait(self, secs):
+    """Waits `secs` seconds, or indefinitely if None, or until woken up.
+
+    A received signal also ends the wait. It is polled for, as the signal
+    handler can't safely set `self._wake`.
+
+    Args:
+      secs: The number of seconds to wait, or None to wait until woken up.
+    """
+    if secs is not None and secs <= 0:
+      return
+    if self._signal_number is None:
+      self._wake.wait(secs)
+      return
+    deadline = None if secs is None else time.time() + secs
+    while self._received_signal is None:
+      timeout = _SIGNAL_POLL_SECS
+      if deadline is not None:
+        timeout = min(timeout, deadline - time.time())
+        if timeout <= 0:
+          return
+      if self._wake.wait(timeout):
+        return
+
+  def _add_window(self, window):
+    with self._lock:
+      self._windows.append(window)
+      while (self._windows and
+             self._windows[0].end_time < window.end_time - self._history_secs):
+        self._windows.popleft()
+
+  def _handle_dumps(self):
+    with self._lock:
+      self._wake.clear()
+      pending_dumps = self._pending_dumps
+      self._pending_dumps = []
+      windows = list(self._windows)
+      if self._stopping:
+        windows = []
+    if not pending_dumps:
+      return
+    reasons = '; '.join(reason for reason, _, _ in pending_dumps)
+    paths = []
+    if windows:
+      logging.info('Saving %d continuous profiling windows to %s: %s',
+                   len(windows), self._logdir, reasons)
+      try:
+        paths = [self._save_window(window) for window in windows]
+      except Exception as e:  # pylint: disable=broad-except
+        logging.error('Failed to save continuous profiling windows: %s', e)
+    for _, done, result in pending_dumps:
+      if result is not None:
+        result.extend(paths)
+      if done is not None:
+        done.set()
+
+  def _save_window(self, window):
+    """Writes `window` to logdir and returns the path of the file."""
+    run = time.strftime('%Y_%m_%d_%H_%M_%S',
+                        time.localtime(window.start_time))
+    run += '.%06d' % int((window.start_time % 1) * 1e6)
+    run_dir = os.path.join(self._logdir, 'plugins', 'profile', run)
+    path = os.path.join(run_dir, socket.gethostname() + '.trace.json.gz')
+    if not gfile.Exists(path):
+      gfile.MakeDirs(run_dir)
+      with gfile.GFile(path, 'wb') as f:
+        with gzip.GzipFile(fileobj=f, mode='wb') as gz:
+          gz.write(window.trace)
+    return path
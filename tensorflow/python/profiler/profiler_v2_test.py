@@ -19,7 +19,9 @@ from __future__ import division
 from __future__ import print_function
 
 import os
+import signal
 import socket
+import time
 
 from tensorflow.python.eager import test
 from tensorflow.python.framework import constant_op
@@ -116,5 +118,122 @@ class ProfilerTest(test_util.TensorFlowTestCase):
     self.assertEqual(len(file_list), 2)
 
 
+class ContinuousProfilerTest(test_util.TensorFlowTestCase):
+
+  def test_dump(self):
+    logdir = self.get_temp_dir()
+    with profiler.ContinuousProfiler(
+        logdir, history_secs=10., window_secs=5.) as continuous_profiler:
+      with trace.Trace('three_times_five'):
+        three = constant_op.constant(3)
+        five = constant_op.constant(5)
+        self.assertAllEqual(15, three * five)
+      paths = continuous_profiler.dump()
+    self.assertLen(paths, 1)
+    self.assertEqual(socket.gethostname() + '.trace.json.gz',
+                     os.path.basename(paths[0]))
+    self.assertTrue(gfile.Exists(paths[0]))
+    self.assertEqual(
+        os.path.join(logdir, 'plugins', 'profile'),
+        os.path.dirname(os.path.dirname(paths[0])))
+
+  def test_pauses_for_explicit_sessions(self):
+    logdir = self.get_temp_dir()
+    with profiler.ContinuousProfiler(
+        logdir, history_secs=10., window_secs=5.,
+        overhead_budget=1.) as continuous_profiler:
+      # Wait for the first window to start.
+      time.sleep(1)
+      profiler.start(logdir)
+      profiler.stop()
+      # The window cut short by start() is kept.
+      self.assertNotEmpty(continuous_profiler.dump())
+
+  def test_only_one_continuous_profiler(self):
+    with profiler.ContinuousProfiler(self.get_temp_dir()):
+      with self.assertRaises(errors.AlreadyExistsError):
+        profiler.ContinuousProfiler(self.get_temp_dir()).start()
+
+  def test_overhead_budget_limits_active_time(self):
+    active_intervals = []
+
+    class FakeSession(object):
+
+      def start(self, logdir, options):
+        del logdir, options
+        self._start_time = time.time()
+
+      def stop(self):
+        active_intervals.append((self._start_time, time.time()))
+        return '{}'
+
+    with test.mock.patch.object(profiler._pywrap_profiler, 'ProfilerSession',
+                                FakeSession):
+      start_time = time.time()
+      with profiler.ContinuousProfiler(
+          self.get_temp_dir(), history_secs=1., window_secs=0.1,
+          overhead_budget=0.25):
+        time.sleep(2)
+      wall_time = time.time() - start_time
+    active_time = sum(end - start for start, end in active_intervals)
+    self.assertGreater(len(active_intervals), 1)
+    # One window of slack, as the last window is cut short.
+    self.assertLess(active_time, 0.25 * wall_time + 0.1)
+
+  def test_step_time_outlier(self):
+    continuous_profiler = profiler.ContinuousProfiler(
+        self.get_temp_dir(), step_time_factor=2., min_steps=10)
+    with test.mock.patch.object(continuous_profiler, 'trigger',
+                                return_value=True) as trigger:
+      for _ in range(10):
+        self.assertFalse(continuous_profiler.record_step_time(1.))
+      self.assertFalse(continuous_profiler.record_step_time(1.5))
+      self.assertTrue(continuous_profiler.record_step_time(3.))
+      self.assertEqual(1, trigger.call_count)
+
+  def test_min_trigger_interval(self):
+    with profiler.ContinuousProfiler(
+        self.get_temp_dir(), window_secs=5.,
+        min_trigger_interval_secs=1000.) as continuous_profiler:
+      self.assertTrue(continuous_profiler.trigger())
+      self.assertFalse(continuous_profiler.trigger())
+    self.assertFalse(continuous_profiler.trigger())
+
+  def test_signal_does_not_take_lock(self):
+
+    class FakeSession(object):
+
+      def start(self, logdir, options):
+        del logdir, options
+
+      def stop(self):
+        return '{}'
+
+    with test.mock.patch.object(profiler._pywrap_profiler, 'ProfilerSession',
+                                FakeSession):
+      with profiler.ContinuousProfiler(
+          self.get_temp_dir(), window_secs=5.,
+          signal_number=signal.SIGUSR1) as continuous_profiler:
+        # The handler runs while the main thread holds the lock, and would
+        # deadlock if it took it.
+        with continuous_profiler._lock:
+          os.kill(os.getpid(), signal.SIGUSR1)
+          time.sleep(0.1)
+        deadline = time.time() + 10
+        while (continuous_profiler._last_dump_time is None and
+               time.time() < deadline):
+          time.sleep(0.1)
+        self.assertIsNotNone(continuous_profiler._last_dump_time)
+
+  def test_invalid_arguments(self):
+    logdir = self.get_temp_dir()
+    with self.assertRaises(ValueError):
+      profiler.ContinuousProfiler(logdir, history_secs=1., window_secs=2.)
+    with self.assertRaises(ValueError):
+      profiler.ContinuousProfiler(logdir, overhead_budget=0.)
+    with self.assertRaises(ValueError):
+      profiler.ContinuousProfiler(logdir, step_time_factor=0.5)
+
+
 if __name__ == '__main__':
   test.main()
@@ -18,13 +18,94 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import time
+
 from tensorflow.python.profiler.internal import _pywrap_traceme
 from tensorflow.python.util.tf_export import tf_export
 
 # This variable is modified by PythonHooks::Start/Stop() in C++. Such
 # arrangement will reduce the number of calls through pybind11.
+# Code on hot paths can check it before computing trace event metadata, e.g.
+#   if trace.enabled:
+#     with trace.Trace(name, shape=str(shape)): ...
 enabled = False
 
+# Maps trace event names to their _Sampler. The None key holds the sampler for
+# names without one of their own. Empty unless `set_sampling` was called, so
+# that unsampled tracing only pays for a truthiness check.
+_samplers = {}
+
+
+class _Sampler(object):
+  """Decides which trace events of a name to record.
+
+  Counters are updated without a lock, so concurrent events may occasionally
+  be sampled slightly more or less often than configured.
+  """
+
+  __slots__ = ['every_n', 'max_per_second', '_count', '_window_start',
+               '_window_count']
+
+  def __init__(self, every_n, max_per_second):
+    self.every_n = every_n
+    self.max_per_second = max_per_second
+    self._count = 0
+    self._window_start = 0.
+    self._window_count = 0
+
+  def sample(self):
+    """Returns whether the next event should be recorded."""
+    count = self._count
+    self._count = count + 1
+    if self.every_n and count % self.every_n:
+      return False
+    if self.max_per_second:
+      now = time.time()
+      if now - self._window_start >= 1.:
+        self._window_start = now
+        self._window_count = 0
+      if self._window_count >= self.max_per_second:
+        return False
+      self._window_count += 1
+    return True
+
+
+def set_sampling(name=None, every_n=None, max_per_second=None):
+  """Records only a sample of the trace events of a name.
+
+  Events that are not sampled cost about as little as when the profiler is
+  disabled: no TraceMe is created and their metadata is not formatted.
+
+  Args:
+    name: The name of the trace events to sample. If None, applies to all
+      names that have no sampling of their own.
+    every_n: If set, records one in every `every_n` events, starting with the
+      first one.
+    max_per_second: If set, records at most `max_per_second` events per
+      second. Combined with `every_n`, this limits the events sampled by it.
+
+  Raises:
+    ValueError: If `every_n` or `max_per_second` is not positive.
+  """
+  for arg_name, value in (('every_n', every_n),
+                          ('max_per_second', max_per_second)):
+    if value is not None and value <= 0:
+      raise ValueError('%s must be positive, but got: %s' % (arg_name, value))
+  if every_n is None and max_per_second is None:
+    _samplers.pop(name, None)
+  else:
+    _samplers[name] = _Sampler(every_n, max_per_second)
+
+
+def clear_sampling():
+  """Records all trace events again, undoing all `set_sampling` calls."""
+  _samplers.clear()
+
+
+def _sample(name):
+  sampler = _samplers.get(name) or _samplers.get(None)
+  return sampler is None or sampler.sample()
+
 
 @tf_export('profiler.experimental.Trace', v1=[])
 class Trace(object):
@@ -49,6 +130,8 @@ class Trace(object):
   ```
   """
 
+  __slots__ = ['_traceme']
+
   def __init__(self, name, **kwargs):
     """Creates a trace event in the profiler.
 
@@ -76,7 +159,7 @@ class Trace(object):
       The example above uses the keyword argument "step_num" to specify the
       training step being traced.
     """
-    if enabled:
+    if enabled and (not _samplers or _sample(name)):
       # Creating _pywrap_traceme.TraceMe starts the clock.
       self._traceme = _pywrap_traceme.TraceMe(name, **kwargs)
     else:
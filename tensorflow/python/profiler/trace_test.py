@@ -0,0 +1,110 @@
+# Copyright 2020 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for profiler trace events."""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import tempfile
+import time
+
+from tensorflow.python.eager import test
+from tensorflow.python.framework import test_util
+from tensorflow.python.platform import test as platform_test
+from tensorflow.python.profiler import profiler_v2 as profiler
+from tensorflow.python.profiler import trace
+
+
+def _recorded(name, num_events):
+  """Returns which of `num_events` trace events named `name` are recorded."""
+  recorded = []
+  for _ in range(num_events):
+    with trace.Trace(name, step_num=len(recorded)) as tm:
+      recorded.append(tm._traceme is not None)  # pylint: disable=protected-access
+  return recorded
+
+
+class TraceSamplingTest(test_util.TensorFlowTestCase):
+
+  def setUp(self):
+    super(TraceSamplingTest, self).setUp()
+    enabled = platform_test.mock.patch.object(trace, 'enabled', True)
+    enabled.start()
+    self.addCleanup(enabled.stop)
+    self.addCleanup(trace.clear_sampling)
+
+  def test_disabled(self):
+    with platform_test.mock.patch.object(trace, 'enabled', False):
+      self.assertEqual([False] * 3, _recorded('a', 3))
+
+  def test_every_n(self):
+    trace.set_sampling('a', every_n=3)
+    self.assertEqual([True, False, False, True, False], _recorded('a', 5))
+    # Other names are not sampled.
+    self.assertEqual([True] * 3, _recorded('b', 3))
+
+  def test_default_sampling(self):
+    trace.set_sampling(every_n=2)
+    trace.set_sampling('b', every_n=3)
+    self.assertEqual([True, False, True], _recorded('a', 3))
+    self.assertEqual([True, False, False], _recorded('b', 3))
+    trace.set_sampling('b')
+    self.assertEqual([True, False, True], _recorded('b', 3))
+    trace.clear_sampling()
+    self.assertEqual([True] * 3, _recorded('a', 3))
+
+  def test_max_per_second(self):
+    trace.set_sampling('a', max_per_second=2)
+    with platform_test.mock.patch.object(time, 'time', return_value=10.):
+      self.assertEqual([True, True, False, False], _recorded('a', 4))
+    with platform_test.mock.patch.object(time, 'time', return_value=11.):
+      self.assertEqual([True, True, False], _recorded('a', 3))
+
+  def test_invalid_sampling(self):
+    with self.assertRaisesRegexp(ValueError, 'every_n must be positive'):
+      trace.set_sampling('a', every_n=0)
+    with self.assertRaisesRegexp(ValueError, 'max_per_second must be positive'):
+      trace.set_sampling('a', max_per_second=-1)
+
+
+class TraceBenchmark(platform_test.Benchmark):
+  """Measures the cost of a trace event in the enabled and sampled states."""
+
+  def _run(self, name, num_iters=100000):
+    start = time.time()
+    for i in range(num_iters):
+      with trace.Trace('benchmark', step_num=i):
+        pass
+    wall_time = (time.time() - start) / num_iters
+    self.report_benchmark(name=name, iters=num_iters, wall_time=wall_time)
+
+  def benchmark_trace(self):
+    self._run('disabled')
+    profiler.start(tempfile.mkdtemp())
+    try:
+      self._run('enabled')
+      for every_n in 10, 100:
+        trace.set_sampling('benchmark', every_n=every_n)
+        self._run('sampled_every_%d' % every_n)
+      trace.set_sampling('benchmark', max_per_second=1000)
+      self._run('sampled_1000_per_second')
+    finally:
+      trace.clear_sampling()
+      profiler.stop()
+
+
+if __name__ == '__main__':
+  test.main()
@@ -0,0 +1,255 @@
+# Copyright 2020 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Content-addressed storage for SavedModel variables and assets.
+
+When `tf.saved_model.SaveOptions(experimental_content_store=...)` is set, each
+checkpointed tensor and each asset file is written once to a shared store under
+a name derived from the SHA-256 of its contents. The SavedModel itself only
+contains a manifest mapping checkpoint keys and asset filenames to digests, so
+re-exporting a model in which most tensors are unchanged writes only the
+tensors that changed.
+
+Store layout:
+
+  <store>/variables/<digest[:2]>/<digest>.{index,data-00000-of-00001}
+  <store>/assets/<digest[:2]>/<digest>
+
+Each variables entry is a single-tensor checkpoint whose only key is
+`_TENSOR_KEY`. Loading reads every tensor straight from its entry into the
+object it belongs to.
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import hashlib
+import json
+import os
+
+from tensorflow.core.protobuf import trackable_object_graph_pb2
+from tensorflow.python.eager import context
+from tensorflow.python.framework import dtypes
+from tensorflow.python.framework import ops
+from tensorflow.python.lib.io import file_io
+from tensorflow.python.ops import io_ops
+from tensorflow.python.saved_model import constants
+from tensorflow.python.saved_model import utils_impl
+from tensorflow.python.training.saving import saveable_hook
+from tensorflow.python.training.saving import saveable_object_util
+from tensorflow.python.training.tracking import base
+from tensorflow.python.util import compat
+
+# Written to the SavedModel's variables directory in place of a checkpoint.
+MANIFEST_FILENAME = "content_store_manifest.json"
+
+_TENSOR_KEY = "tensor"
+_READ_CHUNK_BYTES = 16 << 20
+
+
+def _tensor_digest(dtype, value):
+  """Returns the hex SHA-256 of a tensor's dtype, shape and contents."""
+  digest = hashlib.sha256()
+  digest.update(compat.as_bytes("%s%s;" % (dtype.name, list(value.shape))))
+  if dtype == dtypes.string:
+    for item in value.flat:
+      item = compat.as_bytes(item)
+      digest.update(compat.as_bytes("%d;" % len(item)))
+      digest.update(item)
+  else:
+    digest.update(value.tobytes())
+  return digest.hexdigest()
+
+
+def _file_digest(path):
+  """Returns the hex SHA-256 of a file's contents."""
+  digest = hashlib.sha256()
+  with file_io.FileIO(path, "rb") as f:
+    while True:
+      chunk = f.read(_READ_CHUNK_BYTES)
+      if not chunk:
+        break
+      digest.update(chunk)
+  return digest.hexdigest()
+
+
+def _variable_prefix(store_dir, digest):
+  return os.path.join(
+      compat.as_str(store_dir), constants.VARIABLES_DIRECTORY, digest[:2],
+      digest)
+
+
+def _asset_path(store_dir, digest):
+  return os.path.join(
+      compat.as_str(store_dir), constants.ASSETS_DIRECTORY, digest[:2], digest)
+
+
+def _manifest_path(export_dir):
+  return os.path.join(
+      compat.as_str(utils_impl.get_variables_dir(export_dir)),
+      MANIFEST_FILENAME)
+
+
+def _normalize_store_dir(store_dir):
+  store_dir = compat.as_str(store_dir)
+  # Local paths are recorded absolute so the SavedModel can be moved; paths
+  # with a filesystem scheme ("gs://", "hdfs://", ...) are kept as given.
+  if "://" not in store_dir:
+    store_dir = os.path.abspath(store_dir)
+  return store_dir
+
+
+def _write_variables(saveables, store_dir, io_device):
+  """Writes tensors missing from the store, returns their manifest entries."""
+  entries = []
+  for saveable in saveables:
+    if isinstance(saveable, saveable_hook.SaveableHook):
+      saveable.before_save()
+    for spec in saveable.specs:
+      tensor = spec.tensor
+      digest = _tensor_digest(tensor.dtype, tensor.numpy())
+      prefix = _variable_prefix(store_dir, digest)
+      if not file_io.file_exists(prefix + ".index"):
+        with ops.device(io_device):
+          io_ops.save_v2(prefix, [_TENSOR_KEY], [""], [tensor])
+      entries.append({
+          "name": spec.name,
+          "slice_spec": spec.slice_spec,
+          "dtype": tensor.dtype.name,
+          "digest": digest,
+      })
+  return entries
+
+
+def _write_assets(asset_filename_map, store_dir):
+  """Copies assets missing from the store, returns filename -> digest."""
+  digests = {}
+  for asset_basename, asset_source_filepath in asset_filename_map.items():
+    digest = _file_digest(asset_source_filepath)
+    path = _asset_path(store_dir, digest)
+    if not file_io.file_exists(path):
+      file_io.recursive_create_dir(os.path.dirname(path))
+      # Copy then rename, so a concurrent reader never sees a partial file.
+      temp_path = "%s.tmp-%s" % (path, os.getpid())
+      file_io.copy(asset_source_filepath, temp_path, overwrite=True)
+      file_io.rename(temp_path, path, overwrite=True)
+    digests[compat.as_str(asset_basename)] = digest
+  return digests
+
+
+def save(saveables, asset_filename_map, export_dir, store_dir, io_device=None):
+  """Writes variables and assets to `store_dir` and a manifest to `export_dir`.
+
+  Args:
+    saveables: A list of `SaveableObject`s, including the object graph proto.
+    asset_filename_map: A dict mapping asset filenames within the SavedModel
+      to their source paths.
+    export_dir: The SavedModel directory.
+    store_dir: The shared content store directory.
+    io_device: Device to write tensors from. Defaults to "cpu:0".
+
+  Raises:
+    ValueError: if not executing eagerly.
+  """
+  if not context.executing_eagerly():
+    raise ValueError(
+        "SaveOptions.experimental_content_store requires eager execution.")
+  store_dir = _normalize_store_dir(store_dir)
+  manifest = {
+      "store": store_dir,
+      "variables": _write_variables(saveables, store_dir,
+                                    io_device or "cpu:0"),
+      "assets": _write_assets(asset_filename_map, store_dir),
+  }
+  context.async_wait()
+  utils_impl.get_or_create_variables_dir(export_dir)
+  file_io.atomic_write_string_to_file(
+      _manifest_path(export_dir), json.dumps(manifest, sort_keys=True))
+
+
+def read_manifest(export_dir):
+  """Returns the content store manifest of a SavedModel, or None."""
+  path = _manifest_path(export_dir)
+  if not file_io.file_exists(path):
+    return None
+  return json.loads(file_io.read_file_to_string(path))
+
+
+def resolve_asset_path(manifest, filename):
+  """Returns the store path of an asset, or None if it isn't in the store."""
+  digest = manifest["assets"].get(compat.as_str(filename))
+  if digest is None:
+    return None
+  return _asset_path(manifest["store"], digest)
+
+
+def restore_variables(manifest, nodes, io_device=None):
+  """Restores the state of deserialized objects from the store.
+
+  Tensors are read one at a time from their store entries and restored into
+  their objects, so the model is never assembled into a checkpoint.
+
+  Args:
+    manifest: A manifest returned by `read_manifest`.
+    nodes: The deserialized objects, indexed by their node id in the
+      SavedModel. These are the node ids of the checkpointed object graph.
+    io_device: Device to read tensors on. Defaults to "cpu:0".
+
+  Raises:
+    ValueError: if not executing eagerly.
+  """
+  if not context.executing_eagerly():
+    raise ValueError(
+        "Loading a SavedModel saved with "
+        "SaveOptions.experimental_content_store requires eager execution.")
+  entries = {(entry["name"], entry["slice_spec"]): entry
+             for entry in manifest["variables"]}
+
+  def _read(name, slice_spec=""):
+    entry = entries[(name, slice_spec)]
+    with ops.device(io_device or "cpu:0"):
+      tensor, = io_ops.restore_v2(
+          _variable_prefix(manifest["store"], entry["digest"]), [_TENSOR_KEY],
+          [""], [dtypes.as_dtype(entry["dtype"])])
+    return tensor
+
+  object_graph = trackable_object_graph_pb2.TrackableObjectGraph()
+  object_graph.ParseFromString(_read(base.OBJECT_GRAPH_PROTO_KEY).numpy())
+  for node_id, node in enumerate(object_graph.nodes):
+    if not node.attributes or node_id >= len(nodes) or nodes[node_id] is None:
+      continue
+    # pylint: disable=protected-access
+    factories = nodes[node_id]._gather_saveables_for_checkpoint()
+    # pylint: enable=protected-access
+    for attribute in node.attributes:
+      # As when restoring a checkpoint, attributes the object no longer has
+      # are skipped.
+      factory = factories.get(attribute.name)
+      if factory is None:
+        continue
+      if callable(factory):
+        saveable = factory(name=attribute.checkpoint_key)
+      else:
+        saveable = factory
+      if isinstance(saveable, base.PythonStateSaveable):
+        saveable.python_restore(
+            [_read(spec.name).numpy() for spec in saveable.specs])
+        continue
+      for saveable in saveable_object_util.validate_and_slice_inputs(
+          {attribute.checkpoint_key: saveable}):
+        saveable.restore(
+            [_read(spec.name, spec.slice_spec) for spec in saveable.specs],
+            restored_shapes=None)
+  context.async_wait()
@@ -37,6 +37,7 @@ from tensorflow.python.ops import custom_gradient
 from tensorflow.python.ops import lookup_ops
 from tensorflow.python.ops import resource_variable_ops
 from tensorflow.python.ops import variables
+from tensorflow.python.saved_model import content_store
 from tensorflow.python.saved_model import function_deserialization
 from tensorflow.python.saved_model import load_options
 from tensorflow.python.saved_model import load_v1_in_v2
@@ -117,6 +118,7 @@ class Loader(object):
         node.name: node.attr for node in meta_graph.graph_def.node}
     self._proto = object_graph_proto
     self._export_dir = export_dir
+    self._content_store_manifest = content_store.read_manifest(export_dir)
     self._concrete_functions = (
         function_deserialization.load_function_def_library(
             meta_graph.graph_def.library))
@@ -317,6 +319,11 @@ class Loader(object):
 
   def _restore_checkpoint(self):
     """Load state from checkpoint into the deserialized objects."""
+    if self._content_store_manifest is not None:
+      content_store.restore_variables(
+          self._content_store_manifest, self._nodes,
+          self._checkpoint_options.experimental_io_device)
+      return
     variables_path = saved_model_utils.get_variables_path(self._export_dir)
     # TODO(andresp): Clean use of private methods of TrackableSaver.
     # pylint: disable=protected-access
@@ -411,9 +418,14 @@ class Loader(object):
     return _UserObject(), setattr
 
   def _recreate_asset(self, proto):
-    filename = os.path.join(
-        saved_model_utils.get_assets_dir(self._export_dir),
-        self._asset_file_def[proto.asset_file_def_index].filename)
+    asset_filename = self._asset_file_def[proto.asset_file_def_index].filename
+    filename = None
+    if self._content_store_manifest is not None:
+      filename = content_store.resolve_asset_path(
+          self._content_store_manifest, asset_filename)
+    if filename is None:
+      filename = os.path.join(
+          saved_model_utils.get_assets_dir(self._export_dir), asset_filename)
     return tracking.Asset(filename), setattr
 
   def _recreate_function(self, proto):
@@ -48,6 +48,7 @@ from tensorflow.python.module import module
 from tensorflow.python.ops import array_ops
 from tensorflow.python.ops import cond_v2
 from tensorflow.python.ops import control_flow_ops
+from tensorflow.python.ops import io_ops
 from tensorflow.python.ops import lookup_ops
 from tensorflow.python.ops import math_ops
 from tensorflow.python.ops import resource_variable_ops
@@ -58,6 +59,7 @@ from tensorflow.python.ops.ragged import ragged_tensor
 from tensorflow.python.saved_model import load
 from tensorflow.python.saved_model import load_options
 from tensorflow.python.saved_model import save
+from tensorflow.python.saved_model import save_options
 from tensorflow.python.saved_model import tag_constants
 from tensorflow.python.training import monitored_session
 from tensorflow.python.training.tracking import tracking
@@ -1843,6 +1845,55 @@ class SingleCycleTests(test.TestCase, parameterized.TestCase):
         [[-3.]],
         f(x=constant_op.constant([[-1.]]))["output_0"].numpy())
 
+  def test_content_store(self):
+    vocab_path = os.path.join(self.get_temp_dir(), "vocab.txt")
+    with open(vocab_path, "w") as f:
+      f.write("alpha\nbeta\n")
+    store_dir = os.path.join(self.get_temp_dir(), "store")
+    options = save_options.SaveOptions(experimental_content_store=store_dir)
+    root = util.Checkpoint(
+        embedding=variables.Variable([[1., 2.], [3., 4.]]),
+        head=variables.Variable(5.))
+    root.asset = tracking.Asset(vocab_path)
+    root.f = def_function.function(
+        lambda x: root.head * x,
+        input_signature=[tensor_spec.TensorSpec(None, dtypes.float32)])
+
+    def _stored_files():
+      return set(
+          os.path.join(dirpath, name)
+          for dirpath, _, names in os.walk(store_dir)
+          for name in names)
+
+    first_path = tempfile.mkdtemp(prefix=self.get_temp_dir())
+    save.save(root, first_path, options=options)
+    self.assertFalse(
+        os.path.exists(os.path.join(first_path, "variables",
+                                    "variables.index")))
+    self.assertFalse(os.path.exists(os.path.join(first_path, "assets")))
+    first_files = _stored_files()
+
+    # Re-exporting with only the head changed writes just the new head value
+    # (and the object graph, which is itself unchanged here).
+    root.head.assign(6.)
+    second_path = tempfile.mkdtemp(prefix=self.get_temp_dir())
+    save.save(root, second_path, options=options)
+    new_files = _stored_files() - first_files
+    self.assertLen(new_files, 2)  # One single-tensor checkpoint.
+
+    file_io.delete_file(vocab_path)
+    # Tensors are restored straight from the store, without assembling a
+    # checkpoint.
+    with test.mock.patch.object(
+        io_ops, "save_v2", side_effect=AssertionError("Wrote a checkpoint.")):
+      first = load.load(first_path)
+      second = load.load(second_path)
+    self.assertAllEqual([[1., 2.], [3., 4.]], first.embedding.numpy())
+    self.assertEqual(5., first.head.numpy())
+    self.assertEqual(6., second.head.numpy())
+    self.assertEqual(12., second.f(constant_op.constant(2.)).numpy())
+    with open(second.asset.asset_path.numpy(), "r") as f:
+      self.assertEqual("alpha\nbeta\n", f.read())
 
   def test_object_with_extra_dependencies(self):
 
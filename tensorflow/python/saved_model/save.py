@@ -43,6 +43,7 @@ from tensorflow.python.ops import control_flow_ops
 from tensorflow.python.ops import resource_variable_ops
 from tensorflow.python.saved_model import builder_impl
 from tensorflow.python.saved_model import constants
+from tensorflow.python.saved_model import content_store
 from tensorflow.python.saved_model import function_serialization
 from tensorflow.python.saved_model import nested_structure_coder
 from tensorflow.python.saved_model import revived_types
@@ -978,13 +979,21 @@ def save(obj, export_dir, signatures=None, options=None):
 
   # Write the checkpoint, copy assets into the assets directory, and write out
   # the SavedModel proto itself.
-  utils_impl.get_or_create_variables_dir(export_dir)
-  ckpt_options = checkpoint_options.CheckpointOptions(
-      experimental_io_device=options.experimental_io_device)
-  object_saver.save(utils_impl.get_variables_path(export_dir),
-                    options=ckpt_options)
-  builder_impl.copy_assets_to_destination_dir(asset_info.asset_filename_map,
-                                              export_dir)
+  if options.experimental_content_store:
+    # Only tensors and assets not already in the store are written; the
+    # SavedModel references them through a manifest.
+    named_saveable_objects, _, _ = object_saver._gather_saveables()  # pylint: disable=protected-access
+    content_store.save(named_saveable_objects, asset_info.asset_filename_map,
+                       export_dir, options.experimental_content_store,
+                       io_device=options.experimental_io_device)
+  else:
+    utils_impl.get_or_create_variables_dir(export_dir)
+    ckpt_options = checkpoint_options.CheckpointOptions(
+        experimental_io_device=options.experimental_io_device)
+    object_saver.save(utils_impl.get_variables_path(export_dir),
+                      options=ckpt_options)
+    builder_impl.copy_assets_to_destination_dir(asset_info.asset_filename_map,
+                                                export_dir)
   # Note that this needs to be the last file operation when saving the
   # SavedModel. Users rely on checking saved_model_dir/saved_model.pb as an
   # indication that the SavedModel is completely written.
@@ -34,13 +34,14 @@ class SaveOptions(object):
 
   # Define object attributes in __slots__ for improved memory and performance.
   __slots__ = ("namespace_whitelist", "save_debug_info", "function_aliases",
-               "experimental_io_device")
+               "experimental_io_device", "experimental_content_store")
 
   def __init__(self,
                namespace_whitelist=None,
                save_debug_info=False,
                function_aliases=None,
-               experimental_io_device=None):
+               experimental_io_device=None,
+               experimental_content_store=None):
     """Creates an object that stores options for SavedModel saving.
 
     Args:
@@ -87,12 +88,21 @@ class SaveOptions(object):
         This is for example useful if you want to save to a local directory,
         such as "/tmp" when running in a distributed setting. In that case pass
         a device for the host where the "/tmp" directory is accessible.
+      experimental_content_store: string. Path to a directory shared between
+        exports. If set, each variable tensor and asset file is stored there
+        once under the SHA-256 of its contents, and the SavedModel only holds
+        a manifest referencing them. Re-exporting a model whose weights are
+        mostly unchanged then only writes the tensors that changed. Requires
+        eager execution. SavedModels written this way can only be read with
+        `tf.saved_model.load` while the store is reachable; the C++ loader
+        and TensorFlow Serving do not understand the manifest.
     """
     self.namespace_whitelist = _validate_namespace_whitelist(
         namespace_whitelist)
     self.save_debug_info = save_debug_info
     self.function_aliases = function_aliases if function_aliases else dict()
     self.experimental_io_device = experimental_io_device
+    self.experimental_content_store = experimental_content_store
 
 
 def _validate_namespace_whitelist(namespace_whitelist):
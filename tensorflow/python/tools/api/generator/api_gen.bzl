@@ -124,7 +124,10 @@ def gen_api_init_files(
             " --compat_init_template=$(location %s)" % compat_init_template
         )
 
-    loading_flag = " --loading=default"
+    loading_flag = select({
+        "//tensorflow:lazy_api_loading": " --loading=lazy",
+        "//conditions:default": " --loading=default",
+    })
 
     native.genrule(
         name = name,
@@ -23,9 +23,15 @@ import importlib
 import os
 import sys
 
+# API generation must import every module with tf_export decorators, so the
+# packages it scans must not be loaded lazily.
+os.environ['TF_LAZY_API_LOADING'] = '0'
+
+# pylint: disable=g-import-not-at-top
 from tensorflow.python.tools.api.generator import doc_srcs
 from tensorflow.python.util import tf_decorator
 from tensorflow.python.util import tf_export
+# pylint: enable=g-import-not-at-top
 
 API_ATTRS = tf_export.API_ATTRS
 API_ATTRS_V1 = tf_export.API_ATTRS_V1
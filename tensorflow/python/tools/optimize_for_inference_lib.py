@@ -58,7 +58,8 @@ from tensorflow.core.framework import attr_value_pb2
 from tensorflow.core.framework import graph_pb2
 from tensorflow.core.framework import node_def_pb2
 from tensorflow.python.framework import dtypes
-from tensorflow.python.framework import graph_util
+from tensorflow.python.framework import graph_util_impl
+from tensorflow.python.framework import indexed_graph
 from tensorflow.python.framework import tensor_util
 from tensorflow.python.platform import flags as flags_lib
 from tensorflow.python.platform import tf_logging
@@ -113,12 +114,14 @@ def optimize_for_inference(input_graph_def, input_node_names, output_node_names,
   optimized_graph_def = strip_unused_lib.strip_unused(
       optimized_graph_def, input_node_names, output_node_names,
       placeholder_type_enum)
-  optimized_graph_def = graph_util.remove_training_nodes(
-      optimized_graph_def, output_node_names)
-  optimized_graph_def = fold_batch_norms(optimized_graph_def)
+  # strip_unused returns a fresh GraphDef, so the remaining passes share one
+  # index and rewrite it in place instead of each copying the whole graph.
+  graph = indexed_graph.IndexedGraph(optimized_graph_def, copy_on_write=False)
+  graph_util_impl.remove_training_nodes_in_place(graph, output_node_names)
+  fold_batch_norms_in_place(graph)
   if not toco_compatible:
-    optimized_graph_def = fuse_resize_and_conv(optimized_graph_def,
-                                               output_node_names)
+    fuse_resize_and_conv_in_place(graph, output_node_names)
+  optimized_graph_def = graph.to_graph_def()
   ensure_graph_is_valid(optimized_graph_def)
   return optimized_graph_def
 
@@ -228,16 +231,31 @@ def fold_batch_norms(input_graph_def):
   Raises:
     ValueError: If the graph is badly formed with duplicate node names.
   """
-  input_node_map = {}
-  for node in input_graph_def.node:
-    if node.name not in input_node_map:
-      input_node_map[node.name] = node
-    else:
-      raise ValueError("Duplicate node names detected for ", node.name)
+  graph = indexed_graph.IndexedGraph(input_graph_def)
+  fold_batch_norms_in_place(graph)
+  result_graph_def = graph_pb2.GraphDef()
+  result_graph_def.node.extend(graph.nodes())
+  result_graph_def.versions.CopyFrom(input_graph_def.versions)
+  return result_graph_def
+
+
+def fold_batch_norms_in_place(graph):
+  """Like `fold_batch_norms`, but rewrites an `IndexedGraph` in place.
+
+  Args:
+    graph: An `indexed_graph.IndexedGraph` containing a model.
+
+  Raises:
+    ValueError: If the graph is badly formed with duplicate node names.
+  """
+  if graph.duplicate_names:
+    raise ValueError("Duplicate node names detected for ",
+                     graph.duplicate_names[0])
+  input_node_map = graph
 
   nodes_to_skip = {}
   new_ops = []
-  for node in input_graph_def.node:
+  for node in list(graph.nodes()):
     if (node.op not in ("BatchNormWithGlobalNormalization", "FusedBatchNorm",
                         "FusedBatchNormV3")):
       continue
@@ -376,9 +394,11 @@ def fold_batch_norms(input_graph_def):
         attr_value_pb2.AttrValue(tensor=tensor_util.make_tensor_proto(
             scaled_weights, weights.dtype.type, weights.shape)))
     # Replace the weights node with scaled weights node
-    for i, weights_node in enumerate(conv_op.input):
-      if weights_node == weights_op.name:
-        conv_op.input[i] = scaled_weights_op.name
+    graph.set_inputs(conv_op.name, [
+        scaled_weights_op.name if weights_node == weights_op.name
+        else weights_node for weights_node in conv_op.input
+    ])
+    conv_op = graph.node(conv_op.name)
 
     new_conv_op = node_def_pb2.NodeDef()
     new_conv_op.CopyFrom(conv_op)
@@ -397,23 +417,24 @@ def fold_batch_norms(input_graph_def):
     bias_add_op.input.extend([new_conv_op.name, offset_op.name])
     new_ops.extend([scaled_weights_op, new_conv_op, offset_op, bias_add_op])
 
-  result_graph_def = graph_pb2.GraphDef()
-  for node in input_graph_def.node:
-    if node.name in nodes_to_skip:
-      continue
-    new_node = node_def_pb2.NodeDef()
-    new_node.CopyFrom(node)
-    retained_input = []
-    for input_node in new_node.input:
-      if not input_node.startswith("^") or input_node[1:] not in nodes_to_skip:
-        retained_input.append(input_node)
-    new_node.input[:] = retained_input
-
-    result_graph_def.node.extend([new_node])
-
-  result_graph_def.node.extend(new_ops)
-  result_graph_def.versions.CopyFrom(input_graph_def.versions)
-  return result_graph_def
+  # Drop control inputs on the removed nodes; only their consumers can have
+  # any.
+  for name in nodes_to_skip:
+    for consumer in graph.consumers(name):
+      if consumer in nodes_to_skip:
+        continue
+      node = graph.node(consumer)
+      retained_input = []
+      for input_node in node.input:
+        if not input_node.startswith("^") or input_node[1:] not in nodes_to_skip:
+          retained_input.append(input_node)
+      if len(retained_input) != len(node.input):
+        graph.set_inputs(consumer, retained_input)
+
+  for name in nodes_to_skip:
+    graph.remove_node(name)
+  for new_op in new_ops:
+    graph.add_node(new_op)
 
 
 def fuse_resize_and_conv(input_graph_def, output_node_names):
@@ -435,24 +456,38 @@ def fuse_resize_and_conv(input_graph_def, output_node_names):
   Raises:
     ValueError: If the graph is badly formed with duplicate node names.
   """
+  graph = indexed_graph.IndexedGraph(input_graph_def)
+  fuse_resize_and_conv_in_place(graph, output_node_names)
+  result_graph_def = graph_pb2.GraphDef()
+  result_graph_def.node.extend(graph.nodes())
+  return result_graph_def
 
-  input_node_map = {}
-  for node in input_graph_def.node:
-    if node.name not in input_node_map:
-      input_node_map[node.name] = node
-    else:
-      raise ValueError("Duplicate node names detected for ", node.name)
 
+def fuse_resize_and_conv_in_place(graph, output_node_names):
+  """Like `fuse_resize_and_conv`, but rewrites an `IndexedGraph` in place.
+
+  Args:
+    graph: An `indexed_graph.IndexedGraph` containing a model.
+    output_node_names: A list of the names of the nodes that produce the final
+      results.
+
+  Raises:
+    ValueError: If the graph is badly formed with duplicate node names.
+  """
+  if graph.duplicate_names:
+    raise ValueError("Duplicate node names detected for ",
+                     graph.duplicate_names[0])
+  input_node_map = graph
+
+  # Adjustments to the number of references to each node, on top of the
+  # graph's consumer index and the outputs.
   node_reference_count = collections.defaultdict(int)
-  for node in input_graph_def.node:
-    for input_name in node.input:
-      stripped_name = node_name_from_input(input_name)
-      node_reference_count[stripped_name] += 1
   for output_name in output_node_names:
     node_reference_count[output_name] += 1
+  replaced_names = set()
 
   new_ops = []
-  for node in input_graph_def.node:
+  for node in list(graph.nodes()):
 
     if node.op != "Conv2D":
       continue
@@ -476,7 +511,7 @@ def fuse_resize_and_conv(input_graph_def, output_node_names):
       continue
 
     # We're replacing this node, so make sure the old one is removed.
-    node_reference_count[conv_op.name] = 0
+    replaced_names.add(conv_op.name)
     if mirror_pad_op:
       node_reference_count[mirror_pad_op.name] -= 1
     if resize_op:
@@ -521,13 +556,12 @@ def fuse_resize_and_conv(input_graph_def, output_node_names):
     fused_conv_op.attr["padding"].CopyFrom(conv_op.attr["padding"])
     new_ops.extend([fused_conv_op])
 
-  result_graph_def = graph_pb2.GraphDef()
-  for node in input_graph_def.node:
-    if node_reference_count[node.name] < 1:
-      continue
-    new_node = node_def_pb2.NodeDef()
-    new_node.CopyFrom(node)
-    result_graph_def.node.extend([new_node])
-
-  result_graph_def.node.extend(new_ops)
-  return result_graph_def
+  names_to_remove = [
+      node.name for node in graph.nodes()
+      if node.name in replaced_names or
+      graph.reference_count(node.name) + node_reference_count[node.name] < 1
+  ]
+  for name in names_to_remove:
+    graph.remove_node(name)
+  for new_op in new_ops:
+    graph.add_node(new_op)
@@ -18,14 +18,13 @@
 from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
-import copy
 
 from google.protobuf import text_format
 
 from tensorflow.core.framework import attr_value_pb2
 from tensorflow.core.framework import graph_pb2
 from tensorflow.core.framework import node_def_pb2
-from tensorflow.python.framework import graph_util
+from tensorflow.python.framework import indexed_graph
 from tensorflow.python.platform import gfile
 
 
@@ -53,39 +52,42 @@ def strip_unused(input_graph_def, input_node_names, output_node_names,
       raise ValueError("Name '%s' appears to refer to a Tensor, "
                        "not a Operation." % name)
 
-  # Here we replace the nodes we're going to override as inputs with
-  # placeholders so that any unused nodes that are inputs to them are
-  # automatically stripped out by extract_sub_graph().
-  not_found = {name for name in input_node_names}
-  inputs_replaced_graph_def = graph_pb2.GraphDef()
-  for node in input_graph_def.node:
-    if node.name in input_node_names:
-      not_found.remove(node.name)
-      placeholder_node = node_def_pb2.NodeDef()
-      placeholder_node.op = "Placeholder"
-      placeholder_node.name = node.name
-      if isinstance(placeholder_type_enum, list):
-        input_node_index = input_node_names.index(node.name)
-        placeholder_node.attr["dtype"].CopyFrom(
-            attr_value_pb2.AttrValue(type=placeholder_type_enum[
-                input_node_index]))
-      else:
-        placeholder_node.attr["dtype"].CopyFrom(
-            attr_value_pb2.AttrValue(type=placeholder_type_enum))
-      if "_output_shapes" in node.attr:
-        placeholder_node.attr["_output_shapes"].CopyFrom(node.attr[
-            "_output_shapes"])
-      if "shape" in node.attr:
-        placeholder_node.attr["shape"].CopyFrom(node.attr["shape"])
-      inputs_replaced_graph_def.node.extend([placeholder_node])
-    else:
-      inputs_replaced_graph_def.node.extend([copy.deepcopy(node)])
-
+  graph = indexed_graph.IndexedGraph(input_graph_def)
+  not_found = {name for name in input_node_names if name not in graph}
   if not_found:
     raise KeyError("The following input nodes were not found: %s" % not_found)
+  for name in output_node_names:
+    assert name in graph, "%s is not in graph" % name
 
-  output_graph_def = graph_util.extract_sub_graph(inputs_replaced_graph_def,
-                                                  output_node_names)
+  # Here we replace the nodes we're going to override as inputs with
+  # placeholders, and stop the reachability search at them so that any unused
+  # nodes that are inputs to them are stripped out.
+  for name in input_node_names:
+    node = graph.node(name)
+    placeholder_node = node_def_pb2.NodeDef()
+    placeholder_node.op = "Placeholder"
+    placeholder_node.name = node.name
+    if isinstance(placeholder_type_enum, list):
+      input_node_index = input_node_names.index(node.name)
+      placeholder_node.attr["dtype"].CopyFrom(
+          attr_value_pb2.AttrValue(type=placeholder_type_enum[
+              input_node_index]))
+    else:
+      placeholder_node.attr["dtype"].CopyFrom(
+          attr_value_pb2.AttrValue(type=placeholder_type_enum))
+    if "_output_shapes" in node.attr:
+      placeholder_node.attr["_output_shapes"].CopyFrom(node.attr[
+          "_output_shapes"])
+    if "shape" in node.attr:
+      placeholder_node.attr["shape"].CopyFrom(node.attr["shape"])
+    graph.replace_node(placeholder_node)
+
+  nodes_to_keep = graph.reachable(output_node_names)
+  output_graph_def = graph_pb2.GraphDef()
+  output_graph_def.node.extend(
+      node for node in graph.nodes() if node.name in nodes_to_keep)
+  output_graph_def.library.CopyFrom(input_graph_def.library)
+  output_graph_def.versions.CopyFrom(input_graph_def.versions)
   return output_graph_def
 
 
@@ -20,6 +20,8 @@ from __future__ import print_function
 
 import os
 
+from google.protobuf import text_format
+
 from tensorflow.core.framework import graph_pb2
 from tensorflow.python.client import session
 from tensorflow.python.framework import constant_op
@@ -159,6 +161,38 @@ class StripUnusedTest(test_util.TensorFlowTestCase):
                                      input_node2: [-5.0]})
         self.assertNear(-50.0, output, 0.00001)
 
+  def testStripUnusedKeepsLibraryAndVersions(self):
+    input_graph_def = text_format.Parse(
+        """
+        node {
+          name: "input_node"
+          op: "Placeholder"
+          attr { key: "dtype" value { type: DT_FLOAT } }
+        }
+        node { name: "output_node" op: "f" input: "input_node" }
+        node { name: "unused_node" op: "f" input: "input_node" }
+        library {
+          function {
+            signature {
+              name: "f"
+              input_arg { name: "x" type: DT_FLOAT }
+              output_arg { name: "y" type: DT_FLOAT }
+            }
+            ret { key: "y" value: "x" }
+          }
+        }
+        versions { producer: 123 min_consumer: 12 }
+        """, graph_pb2.GraphDef())
+
+    output_graph_def = strip_unused_lib.strip_unused(
+        input_graph_def, ["input_node"], ["output_node"],
+        dtypes.float32.as_datatype_enum)
+
+    self.assertEqual(["input_node", "output_node"],
+                     [node.name for node in output_graph_def.node])
+    self.assertEqual(input_graph_def.library, output_graph_def.library)
+    self.assertEqual(input_graph_def.versions, output_graph_def.versions)
+
 
 if __name__ == "__main__":
   test.main()
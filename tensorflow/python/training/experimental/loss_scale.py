@@ -18,6 +18,7 @@ from __future__ import division
 from __future__ import print_function
 
 import abc
+import collections
 
 import six
 
@@ -26,6 +27,7 @@ from tensorflow.python.distribute import reduce_util
 from tensorflow.python.eager import context
 from tensorflow.python.framework import dtypes
 from tensorflow.python.framework import ops
+from tensorflow.python.ops import array_ops
 from tensorflow.python.ops import control_flow_ops
 from tensorflow.python.ops import math_ops
 from tensorflow.python.ops import variables
@@ -252,14 +254,113 @@ class FixedLossScale(LossScale):
     return {'loss_scale_value': self._loss_scale_value}
 
 
+# Whether `_is_all_finite` and `scale_gradients` process small gradients of the
+# same dtype as a single flattened tensor. Models with many variables otherwise
+# launch a few tiny kernels per gradient each step, and the per-kernel overhead
+# dominates the actual work. Gradients are only fused in graphs and functions,
+# as in eager mode the extra reshapes cost more to dispatch than they save.
+_FUSE_GRADIENTS = True
+
+# Gradients with more elements are processed on their own, since for them the
+# cost of copying into and out of the flattened tensor outweighs the per-op
+# overhead saved.
+_MAX_FUSED_NUM_ELEMENTS = 2 ** 16
+
+
+def _group_fusable_grads(grads):
+  """Groups the indices of the small dense gradients in `grads` by dtype.
+
+  Args:
+    grads: A list of gradients. Can contain None values and `IndexedSlices`.
+
+  Returns:
+    A tuple `(groups, others)`. `groups` is an OrderedDict mapping each dtype to
+    the indices of the gradients that are fused together, and has only groups
+    of two or more gradients. `others` lists the indices of the remaining
+    non-None gradients.
+  """
+  fuse = _FUSE_GRADIENTS and not context.executing_eagerly()
+  groups = collections.OrderedDict()
+  others = []
+  for i, g in enumerate(grads):
+    if g is None:
+      continue
+    num_elements = (None if isinstance(g, ops.IndexedSlices) else
+                    g.shape.num_elements())
+    if (fuse and num_elements is not None and
+        num_elements <= _MAX_FUSED_NUM_ELEMENTS):
+      groups.setdefault(g.dtype.base_dtype, []).append(i)
+    else:
+      others.append(i)
+  for dtype, indices in list(groups.items()):
+    if len(indices) == 1:
+      others.extend(indices)
+      del groups[dtype]
+  others.sort()
+  return groups, others
+
+
+def _flatten_and_concat(tensors):
+  return array_ops.concat([array_ops.reshape(t, [-1]) for t in tensors], 0)
+
+
 def _is_all_finite(grads):
   """Returns a scalar boolean tensor indicating if all gradients are finite."""
+  grads = [g if g is None or isinstance(g, ops.IndexedSlices)
+           else ops.convert_to_tensor(g) for g in grads]
+  groups, others = _group_fusable_grads(grads)
   is_finite_per_grad = [
-      math_ops.reduce_all(math_ops.is_finite(g)) for g in grads if g is not None
+      math_ops.reduce_all(math_ops.is_finite(
+          _flatten_and_concat([grads[i] for i in indices])))
+      for indices in groups.values()
   ]
+  is_finite_per_grad.extend(
+      math_ops.reduce_all(math_ops.is_finite(grads[i])) for i in others)
   return math_ops.reduce_all(is_finite_per_grad)
 
 
+def scale_gradients(grads, scale):
+  """Multiplies each gradient in `grads` by `scale`.
+
+  Small dense gradients of the same dtype are multiplied together as one
+  flattened tensor, which is split back into the original shapes.
+
+  Args:
+    grads: A list of gradients. Can contain None values, which are ignored, and
+      `IndexedSlices`, whose values are scaled.
+    scale: A scalar tensor. It is cast to the dtype of each gradient.
+
+  Returns:
+    A new list the same size as `grads`, where every non-None value in `grads`
+    is multiplied by `scale`.
+  """
+  grads = list(grads)
+  scaled_grads = [None] * len(grads)
+  scale_per_dtype = {}
+
+  def get_scale(dtype):
+    dtype = dtype.base_dtype
+    if dtype not in scale_per_dtype:
+      scale_per_dtype[dtype] = math_ops.cast(scale, dtype)
+    return scale_per_dtype[dtype]
+
+  groups, others = _group_fusable_grads(grads)
+  for dtype, indices in groups.items():
+    tensors = [grads[i] for i in indices]
+    flat = _flatten_and_concat(tensors) * get_scale(dtype)
+    parts = array_ops.split(flat, [t.shape.num_elements() for t in tensors])
+    for i, t, part in zip(indices, tensors, parts):
+      scaled_grads[i] = array_ops.reshape(part, t.shape)
+  for i in others:
+    g = grads[i]
+    if isinstance(g, ops.IndexedSlices):
+      scaled_grads[i] = ops.IndexedSlices(
+          g.values * get_scale(g.dtype), g.indices, dense_shape=g.dense_shape)
+    else:
+      scaled_grads[i] = g * get_scale(g.dtype)
+  return scaled_grads
+
+
 def _op_in_graph_mode(tensor):
   """Returns the tensor's op in graph mode, or the tensor in eager mode.
 
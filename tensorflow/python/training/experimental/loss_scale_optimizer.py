@@ -18,7 +18,6 @@ from __future__ import division
 from __future__ import print_function
 
 from tensorflow.python.distribute import distribution_strategy_context
-from tensorflow.python.framework import ops
 from tensorflow.python.framework import smart_cond
 from tensorflow.python.ops import control_flow_ops
 from tensorflow.python.ops import math_ops
@@ -138,16 +137,7 @@ class MixedPrecisionLossScaleOptimizer(optimizer.Optimizer):
   def _unscale_grads(self, grads):
     loss_scale = self._loss_scale()
     loss_scale_reciprocal = 1 / loss_scale
-    return [
-        None if g is None else self._scale_grad(g, loss_scale_reciprocal)
-        for g in grads
-    ]
-
-  def _scale_grad(self, grad, loss_scale_reciprocal):
-    if isinstance(grad, ops.IndexedSlices):
-      grad_vals = grad.values * loss_scale_reciprocal
-      return ops.IndexedSlices(grad_vals, grad.indices, grad.dense_shape)
-    return grad * loss_scale_reciprocal
+    return loss_scale_module.scale_gradients(grads, loss_scale_reciprocal)
 
   def apply_gradients(self, grads_and_vars, global_step=None, name=None):
     """Apply gradients to variables.
@@ -25,6 +25,7 @@ from tensorflow.python.distribute import distribution_strategy_context
 from tensorflow.python.distribute import mirrored_strategy
 from tensorflow.python.eager import context
 from tensorflow.python.framework import constant_op
+from tensorflow.python.framework import dtypes
 from tensorflow.python.framework import ops
 from tensorflow.python.framework import test_util
 from tensorflow.python.ops import array_ops
@@ -98,6 +99,54 @@ class FixedLossScaleTest(test.TestCase):
     self.assertEqual(repr(loss_scale), 'FixedLossScale(123.0)')
 
 
+class FusedGradientsTest(test.TestCase, parameterized.TestCase):
+
+  def _get_grads(self):
+    return [
+        constant_op.constant([[1., 2.], [3., 4.]]),
+        None,
+        constant_op.constant([5., 6., 7.], dtype=dtypes.float16),
+        constant_op.constant(8.),
+        ops.IndexedSlices(
+            constant_op.constant([[9., 10.]]), constant_op.constant([1]),
+            dense_shape=constant_op.constant([3, 2])),
+        constant_op.constant([11.], dtype=dtypes.float16),
+        # Too large to be fused
+        array_ops.ones([2 ** 16 + 1]),
+    ]
+
+  @parameterized.named_parameters(('fused', True), ('unfused', False))
+  @test_util.run_in_graph_and_eager_modes
+  def test_scale_gradients(self, fused):
+    grads = self._get_grads()
+    with test.mock.patch.object(loss_scale_module, '_FUSE_GRADIENTS', fused):
+      scaled_grads = loss_scale_module.scale_gradients(grads, 0.5)
+    self.assertLen(scaled_grads, len(grads))
+    self.assertIsNone(scaled_grads[1])
+    self.assertIsInstance(scaled_grads[4], ops.IndexedSlices)
+    for grad, scaled_grad in zip(grads, scaled_grads):
+      if grad is None:
+        continue
+      self.assertEqual(grad.dtype, scaled_grad.dtype)
+      self.assertEqual(grad.shape, scaled_grad.shape)
+      if isinstance(grad, ops.IndexedSlices):
+        grad, scaled_grad = grad.values, scaled_grad.values
+      self.assertAllEqual(self.evaluate(grad) / 2, self.evaluate(scaled_grad))
+
+  @parameterized.named_parameters(('fused', True), ('unfused', False))
+  @test_util.run_in_graph_and_eager_modes
+  def test_is_all_finite(self, fused):
+    with test.mock.patch.object(loss_scale_module, '_FUSE_GRADIENTS', fused):
+      grads = self._get_grads()
+      self.assertTrue(self.evaluate(loss_scale_module._is_all_finite(grads)))
+      for i, value in ((0, float('NaN')), (2, float('Inf')), (5, float('NaN')),
+                       (6, float('-Inf'))):
+        grads = self._get_grads()
+        grads[i] = grads[i] * value
+        self.assertFalse(
+            self.evaluate(loss_scale_module._is_all_finite(grads)))
+
+
 def _get_example_iter(inputs):
   dataset = dataset_ops.Dataset.from_tensor_slices(inputs)
   return dataset_ops.make_one_shot_iterator(dataset)
@@ -283,23 +283,20 @@ def _compute_gradients_until_finite(
 
       is_nones[:] = [g is None for g in scaled_grads]
       inv_loss_scale = 1.0 / loss_scale_val
-      grads = []  # The unscaled gradients
-      for g, initial_grad in zip(scaled_grads, initial_grads):
-        if g is not None:
-          # We call ensure_shape as shape information can be lost for certain
-          # ops, such as tf.transpose, if the op is called in a tf.function and
-          # has inputs created outside the tf.function.
-          # TODO(b/132092188): Remove ensure_shape call after this has been
-          # fixed.
-          g = array_ops.ensure_shape(g, initial_grad.shape)
-          grads.append(g * math_ops.cast(inv_loss_scale, g.dtype))
-        else:
-          # We cannot return None from a tf.while_loop, so we pass a dummy
-          # tensor instead. We use initial_grad as a dummy tensor as it has the
-          # correct shape and dtype. We replace it with None outside the while
-          # loop.
-          grads.append(initial_grad)
-      return grads
+      # We call ensure_shape as shape information can be lost for certain ops,
+      # such as tf.transpose, if the op is called in a tf.function and has
+      # inputs created outside the tf.function.
+      # TODO(b/132092188): Remove ensure_shape call after this has been fixed.
+      scaled_grads = [
+          None if g is None else array_ops.ensure_shape(g, initial_grad.shape)
+          for g, initial_grad in zip(scaled_grads, initial_grads)
+      ]
+      grads = loss_scale_module.scale_gradients(scaled_grads, inv_loss_scale)
+      # We cannot return None from a tf.while_loop, so we pass a dummy tensor
+      # instead. We use initial_grad as a dummy tensor as it has the correct
+      # shape and dtype. We replace it with None outside the while loop.
+      return [initial_grad if g is None else g
+              for g, initial_grad in zip(grads, initial_grads)]
 
     # Switch to a replica-context to compute gradients once per replica.
     grads = distribution.run(
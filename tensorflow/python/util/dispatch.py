@@ -24,6 +24,12 @@ Otherwise, the original TypeError is raised.
 By default, dispatch support is added to the generated op wrappers for any
 visible ops by default.  Ops that are implemented in Python can opt in to
 dispatch support using the `add_dispatch_support` decorator.
+
+Dispatchers may declare the argument types they handle in `dispatch_types`.
+Ops with `add_dispatch_support` check the types of their arguments (including
+elements of lists or tuples) against the types declared for them, and call
+their dispatchers before running if one matches, so these arguments do not
+pay for a failed conversion and an exception.
 """
 
 from __future__ import absolute_import
@@ -39,9 +45,15 @@ from tensorflow.python.util import tf_inspect
 DISPATCH_ATTR = "_tf_dispatchers"
 
 
+# Private function attribute used to store a `_DispatchTypeIndex`.
+DISPATCH_TYPES_ATTR = "_tf_dispatch_types"
+
 # OpDispatchers which should be used for all operations.
 _GLOBAL_DISPATCHERS = []
 
+# The `_DispatchTypeIndex` of every op with `add_dispatch_support`.
+_DISPATCH_TYPE_INDICES = []
+
 
 class OpDispatcher(object):
   """Abstract base class for TensorFlow operator dispatchers.
@@ -56,6 +68,12 @@ class OpDispatcher(object):
   # dispatcher does not support a given set of arguments.
   NOT_SUPPORTED = object()
 
+  # Argument types this dispatcher handles. If an argument, or an element of a
+  # list or tuple argument, has one of these types, the dispatcher is called
+  # before the operation runs. Dispatchers which do not declare their types
+  # are only called if the operation raises a TypeError or ValueError.
+  dispatch_types = ()
+
   def handle(self, args, kwargs):  # pylint: disable=unused-argument
     """Handle this dispatcher's operation with the specified arguments.
 
@@ -84,6 +102,8 @@ class OpDispatcher(object):
     if not hasattr(op, DISPATCH_ATTR):
       raise AssertionError("Dispatching not enabled for %s" % op)
     getattr(op, DISPATCH_ATTR).append(self)
+    if hasattr(op, DISPATCH_TYPES_ATTR):
+      getattr(op, DISPATCH_TYPES_ATTR).reset()
 
 
 class GlobalOpDispatcher(object):
@@ -91,12 +111,17 @@ class GlobalOpDispatcher(object):
 
   NOT_SUPPORTED = OpDispatcher.NOT_SUPPORTED
 
+  # Argument types this dispatcher handles; see `OpDispatcher.dispatch_types`.
+  dispatch_types = ()
+
   def handle(self, op, args, kwargs):
     """Handle the specified operation with the specified arguments."""
 
   def register(self):
     """Register this dispatcher as a handler for all ops."""
     _GLOBAL_DISPATCHERS.append(self)
+    for type_index in _DISPATCH_TYPE_INDICES:
+      type_index.reset()
 
 
 def dispatch(op, args, kwargs):
@@ -136,6 +161,7 @@ class _TypeBasedDispatcher(OpDispatcher):
   def __init__(self, override_func, types):
     self._types = types
     self._override_func = override_func
+    self.dispatch_types = types
 
   def _handles(self, args, kwargs):
     for arg in itertools.chain(args, kwargs.values()):
@@ -193,15 +219,79 @@ def add_dispatch_list(target):
   return target
 
 
+# Values of `_DispatchTypeIndex._kinds`.
+_NOT_DISPATCHED = 0
+_DISPATCHED = 1
+_SEQUENCE = 2
+
+
+class _DispatchTypeIndex(object):
+  """Caches which argument types the dispatchers of an op declared.
+
+  The declared types of the op's dispatchers and of the global dispatchers are
+  collected on first use, and the answer for each argument type is cached, so
+  checking the arguments of a call takes a dictionary lookup per argument.
+  """
+
+  __slots__ = ["_op", "_types", "_kinds"]
+
+  def __init__(self, op):
+    self._op = op
+    self.reset()
+
+  def reset(self):
+    """Forgets the cached types, after a dispatcher was registered."""
+    self._types = None
+    self._kinds = {}
+
+  def _kind(self, arg_type):
+    kind = self._kinds.get(arg_type)
+    if kind is None:
+      if issubclass(arg_type, self._types):
+        kind = _DISPATCHED
+      elif issubclass(arg_type, (list, tuple)):
+        kind = _SEQUENCE
+      else:
+        kind = _NOT_DISPATCHED
+      self._kinds[arg_type] = kind
+    return kind
+
+  def matches(self, args, kwargs):
+    """Whether an argument or list element has a declared type."""
+    if self._types is None:
+      self._types = tuple(itertools.chain.from_iterable(
+          dispatcher.dispatch_types
+          for dispatcher in itertools.chain(getattr(self._op, DISPATCH_ATTR),
+                                            _GLOBAL_DISPATCHERS)))
+    if not self._types:
+      return False
+    for arg in itertools.chain(args, kwargs.values()):
+      kind = self._kind(type(arg))
+      if kind == _DISPATCHED:
+        return True
+      if kind == _SEQUENCE:
+        for elt in arg:
+          if self._kind(type(elt)) == _DISPATCHED:
+            return True
+    return False
+
+
 def add_dispatch_support(target):
   """Decorator that adds a dispatch handling wrapper to an op."""
   def wrapper(*args, **kwargs):
     """Call target, and fall back on dispatchers if there is a TypeError."""
+    dispatched = type_index.matches(args, kwargs)
+    if dispatched:
+      result = dispatch(wrapper, args, kwargs)
+      if result is not OpDispatcher.NOT_SUPPORTED:
+        return result
     try:
       return target(*args, **kwargs)
     except (TypeError, ValueError):
       # Note: convert_to_eager_tensor currently raises a ValueError, not a
       # TypeError, when given unexpected types.  So we need to catch both.
+      if dispatched:
+        raise
       result = dispatch(wrapper, args, kwargs)
       if result is not OpDispatcher.NOT_SUPPORTED:
         return result
@@ -209,4 +299,7 @@ def add_dispatch_support(target):
         raise
 
   add_dispatch_list(wrapper)
+  type_index = _DispatchTypeIndex(wrapper)
+  setattr(wrapper, DISPATCH_TYPES_ATTR, type_index)
+  _DISPATCH_TYPE_INDICES.append(type_index)
   return tf_decorator.make_decorator(target, wrapper)
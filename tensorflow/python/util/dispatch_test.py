@@ -18,6 +18,10 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import time
+
+from tensorflow.python.eager import context
+from tensorflow.python.framework import constant_op
 from tensorflow.python.framework import ops
 from tensorflow.python.framework import test_util
 from tensorflow.python.ops import gen_math_ops
@@ -27,6 +31,7 @@ from tensorflow.python.platform import test
 from tensorflow.python.platform import tf_logging
 from tensorflow.python.util import deprecation
 from tensorflow.python.util import dispatch
+from tensorflow.python.util import nest
 from tensorflow.python.util.tf_export import tf_export
 
 
@@ -45,6 +50,31 @@ def test_op(x, y, z):
   return x + (2 * y) + (3 * z)
 
 
+@dispatch.add_dispatch_support
+def strict_test_op(x, y):
+  """A fake op which records its calls and only accepts tensors."""
+  strict_test_op.calls += 1
+  for value in nest.flatten([x, y]):
+    if isinstance(value, CustomTensor):
+      raise TypeError("strict_test_op does not accept CustomTensors.")
+  return math_ops.add_n(nest.flatten([x, y]))
+
+
+strict_test_op.calls = 0
+
+
+class UndeclaredTypeDispatcher(dispatch.OpDispatcher):
+  """Dispatcher for CustomTensor which does not declare `dispatch_types`."""
+
+  def __init__(self, override_func):
+    self._override_func = override_func
+
+  def handle(self, args, kwargs):
+    if any(isinstance(arg, CustomTensor) for arg in nest.flatten(args)):
+      return self._override_func(*args, **kwargs)
+    return self.NOT_SUPPORTED
+
+
 class TensorTracer(object):
   """An object used to trace TensorFlow graphs.
 
@@ -187,6 +217,90 @@ class DispatchTest(test_util.TensorFlowTestCase):
       # Clean up.
       dispatch._GLOBAL_DISPATCHERS = original_global_dispatchers
 
+  def testDeclaredTypesDispatchBeforeCallingOp(self):
+    original_handlers = strict_test_op._tf_dispatchers[:]
+    try:
+      @dispatch.dispatch_for_types(strict_test_op, CustomTensor)
+      def override_for_strict_test_op(x, y):  # pylint: disable=unused-variable
+        xs = x if isinstance(x, list) else [x]
+        return CustomTensor(
+            strict_test_op([elt.tensor for elt in xs], y.tensor), 1.0)
+
+      x = CustomTensor([1, 2, 3], 0.2)
+      y = CustomTensor([7, 8, 2], 0.4)
+      strict_test_op.calls = 0
+      result = strict_test_op(x, y)
+      self.assertAllEqual(self.evaluate(result.tensor), [8, 10, 5])
+      # The op only ran once, with tensors, from inside the dispatcher.
+      self.assertEqual(1, strict_test_op.calls)
+
+      strict_test_op.calls = 0
+      result = strict_test_op([x, x], y=y)
+      self.assertAllEqual(self.evaluate(result.tensor), [9, 12, 8])
+      self.assertEqual(1, strict_test_op.calls)
+
+      # Tensors and Python values still go straight to the op.
+      strict_test_op.calls = 0
+      self.assertAllEqual(
+          self.evaluate(strict_test_op([1, 2], constant_op.constant(3))), 6)
+      self.assertEqual(1, strict_test_op.calls)
+    finally:
+      strict_test_op._tf_dispatchers = original_handlers
+      strict_test_op._tf_dispatch_types.reset()
+
+  def testUndeclaredTypesDispatchAfterError(self):
+    original_handlers = strict_test_op._tf_dispatchers[:]
+    try:
+      UndeclaredTypeDispatcher(
+          lambda x, y: CustomTensor(x.tensor + y.tensor, 0.)).register(
+              strict_test_op)
+      strict_test_op.calls = 0
+      result = strict_test_op(CustomTensor([1], 0.), CustomTensor([2], 0.))
+      self.assertAllEqual(self.evaluate(result.tensor), [3])
+      self.assertEqual(1, strict_test_op.calls)
+    finally:
+      strict_test_op._tf_dispatchers = original_handlers
+      strict_test_op._tf_dispatch_types.reset()
+
+
+class DispatchBenchmark(test.Benchmark):
+  """Measures the per-call overhead of dispatching in eager mode."""
+
+  def _run(self, func, iters=10000):
+    func()
+    start = time.time()
+    for _ in range(iters):
+      func()
+    return (time.time() - start) / iters
+
+  def benchmark_dispatch_overhead(self):
+    with context.eager_mode():
+      tensor = constant_op.constant([1., 2.])
+      custom = CustomTensor(tensor, 0.)
+      override = lambda x, y: x
+      original_handlers = strict_test_op._tf_dispatchers[:]
+      try:
+        self.report_benchmark(
+            name="tensor_args", iters=10000,
+            wall_time=self._run(lambda: strict_test_op(tensor, tensor)))
+
+        UndeclaredTypeDispatcher(override).register(strict_test_op)
+        self.report_benchmark(
+            name="dispatch_after_error", iters=10000,
+            wall_time=self._run(lambda: strict_test_op(custom, custom)))
+
+        strict_test_op._tf_dispatchers = original_handlers[:]
+        dispatch.dispatch_for_types(strict_test_op, CustomTensor)(override)
+        self.report_benchmark(
+            name="dispatch_by_type", iters=10000,
+            wall_time=self._run(lambda: strict_test_op(custom, custom)))
+        self.report_benchmark(
+            name="tensor_args_with_declared_types", iters=10000,
+            wall_time=self._run(lambda: strict_test_op(tensor, tensor)))
+      finally:
+        strict_test_op._tf_dispatchers = original_handlers
+        strict_test_op._tf_dispatch_types.reset()
+
 
 if __name__ == "__main__":
   googletest.main()
@@ -20,9 +20,36 @@ from __future__ import division
 from __future__ import print_function
 
 import importlib
+import os
+import sys
 import types
 from tensorflow.python.platform import tf_logging as logging
 
+# Environment variable enabling lazy API loading; see
+# `lazy_api_loading_enabled`.
+LAZY_API_LOADING_ENV_VAR = "TF_LAZY_API_LOADING"
+
+
+def lazy_api_loading_enabled():
+  """Whether TensorFlow packages should import their submodules lazily.
+
+  Set the environment variable `TF_LAZY_API_LOADING=1` before importing
+  TensorFlow to enable it. The subpackages and symbols bound in
+  `tensorflow.python` are then imported on first attribute access, as are
+  `tf.keras` and its aliases. Programs using a few namespaces, such as
+  `tf.io` or `tf.data`, only import what these namespaces need, in particular
+  when the API modules are generated with `--define=tf_api_loading=lazy`.
+
+  Lazy loading of symbols relies on module `__getattr__`, so it is only
+  enabled on Python 3.7 and later.
+
+  Returns:
+    A boolean.
+  """
+  if sys.version_info < (3, 7):
+    return False
+  return os.environ.get(LAZY_API_LOADING_ENV_VAR, "0").lower() in ("1", "true")
+
 
 class LazyLoader(types.ModuleType):
   """Lazily import a module, mainly to avoid pulling in large dependencies.
@@ -32,10 +59,13 @@ class LazyLoader(types.ModuleType):
   """
 
   # The lint error here is incorrect.
-  def __init__(self, local_name, parent_module_globals, name, warning=None):  # pylint: disable=super-on-old-class
+  def __init__(self, local_name, parent_module_globals, name, warning=None,  # pylint: disable=super-on-old-class
+               on_load=None):
     self._local_name = local_name
     self._parent_module_globals = parent_module_globals
     self._warning = warning
+    # Optional function called with the module once it is imported.
+    self._on_load = on_load
 
     super(LazyLoader, self).__init__(name)
 
@@ -44,6 +74,9 @@ class LazyLoader(types.ModuleType):
     # Import the target module and insert it into the parent's namespace
     module = importlib.import_module(self.__name__)
     self._parent_module_globals[self._local_name] = module
+    if self._on_load:
+      on_load, self._on_load = self._on_load, None
+      on_load(module)
 
     # Emit a warning if one was specified
     if self._warning:
@@ -0,0 +1,103 @@
+# Copyright 2020 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for tensorflow.python.util.lazy_loader."""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import json
+import os
+import subprocess
+import sys
+
+from tensorflow.python.platform import test
+from tensorflow.python.util import lazy_loader
+
+
+class LazyLoaderTest(test.TestCase):
+
+  def testLoadsOnAttributeAccess(self):
+    loaded = []
+    module_globals = {}
+    module = lazy_loader.LazyLoader(
+        "json_lib", module_globals, "json", on_load=loaded.append)
+    module_globals["json_lib"] = module
+    self.assertEmpty(loaded)
+
+    self.assertEqual("[1]", module.dumps([1]))
+    self.assertEqual([json], loaded)
+    self.assertIs(json, module_globals["json_lib"])
+
+    # The callback only runs once.
+    module.loads("[]")
+    self.assertLen(loaded, 1)
+
+  def testLazyApiLoadingEnabled(self):
+    env_var = lazy_loader.LAZY_API_LOADING_ENV_VAR
+    supported = sys.version_info >= (3, 7)
+    with test.mock.patch.dict(os.environ, {env_var: "1"}):
+      self.assertEqual(supported, lazy_loader.lazy_api_loading_enabled())
+    with test.mock.patch.dict(os.environ, {env_var: "true"}):
+      self.assertEqual(supported, lazy_loader.lazy_api_loading_enabled())
+    with test.mock.patch.dict(os.environ, {env_var: "0"}):
+      self.assertFalse(lazy_loader.lazy_api_loading_enabled())
+
+
+# Runs in a subprocess and prints the import time and peak RSS as JSON.
+_IMPORT_SCRIPT = """
+import json
+import resource
+import time
+start = time.time()
+import tensorflow as tf
+%s
+wall_time = time.time() - start
+max_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({"wall_time": wall_time, "max_rss_kb": max_rss_kb}))
+"""
+
+# Statements run after `import tensorflow as tf`, for common entry points.
+_ENTRY_POINTS = {
+    "import": "",
+    "io": "tf.io.gfile.exists('.')",
+    "data": "tf.data.Dataset.range(3)",
+    "keras": "tf.keras.layers.Dense(1)",
+}
+
+
+class ImportTimeBenchmark(test.Benchmark):
+  """Measures `import tensorflow` time and memory with and without lazy API."""
+
+  def _run(self, statement, lazy):
+    env = dict(os.environ)
+    env[lazy_loader.LAZY_API_LOADING_ENV_VAR] = "1" if lazy else "0"
+    output = subprocess.check_output(
+        [sys.executable, "-c", _IMPORT_SCRIPT % statement], env=env)
+    return json.loads(output.decode("utf-8").strip().splitlines()[-1])
+
+  def benchmark_import_time(self):
+    for entry_point, statement in sorted(_ENTRY_POINTS.items()):
+      for lazy in (False, True):
+        result = self._run(statement, lazy)
+        self.report_benchmark(
+            name="%s%s" % (entry_point, "_lazy" if lazy else ""),
+            iters=1,
+            wall_time=result["wall_time"],
+            extras={"max_rss_kb": result["max_rss_kb"]})
+
+
+if __name__ == "__main__":
+  test.main()